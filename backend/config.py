@@ -58,9 +58,17 @@ class Settings:
 
     CHROMA_DB_PATH = str(_project_base / "chroma_db_interlinear")
     SBLGNT_PATH = str(_project_base / "sblgnt")
+    LXX_PATH = str(_project_base / "LXX-Swete" / "src" / "First1KGreek-LXX-RAW")
+    CORPUS_PATH = str(_project_base / "corpus_data" / "sblgnt.corpus")
+    ENGLISH_INDEX_PATH = str(_project_base / "corpus_data" / "web_english.idx")
+    SIMILARITY_PATH = str(_project_base / "corpus_data" / "sblgnt.similar")
     LEXICON_PATH = str(_project_base / "strongsgreek.xml")
     WEB_BIBLE_PATH = str(_project_base / "web_bible_json")
     ENHANCED_LEXICON_PATH = str(_project_base / "enhanced_lexicon.json")
+    LEXICON_STORE_PATH = str(_project_base / "corpus_data" / "enhanced_lexicon.lex")
+
+    # Pre-encode verse and Strong's responses at startup instead of on first request
+    WARM_RESPONSE_CACHE = os.getenv("WARM_RESPONSE_CACHE", "false").lower() == "true"
 
     # Reference texts
     THAYERS_ENABLED = os.getenv("ENABLE_THAYERS", "true").lower() == "true"
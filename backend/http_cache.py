@@ -0,0 +1,162 @@
+"""
+HTTP Caching
+============
+ETag / Cache-Control helpers for responses that never change for a given
+dataset version (scripture text, lexicon entries).
+
+The ETag is the dataset version itself: an ETag only has to be unique per
+URL, and every URL under a cached router returns the same bytes until the
+underlying data changes. URLs are not versioned, so responses are marked
+``no-cache``: clients keep them but revalidate on every use, and see a new
+ETag (and a full response) as soon as the data or the response format
+changes.
+
+Revalidation is answered by ConditionalGetMiddleware after the route has
+run, so only a resource the route actually found (a 2xx response carrying
+the ETag) is ever answered with 304; a missing verse or entry still gets
+its 404. ResponseCache keeps the encoded JSON of hot responses, so the
+route itself is a lookup and a dictionary hit.
+"""
+import hashlib
+from typing import Callable, Hashable, Optional
+
+from fastapi import Response
+from starlette.datastructures import Headers
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+
+# Bump when the JSON shape of cached responses changes, so revalidating
+# clients get a new ETag, and the new shape, after a deploy.
+RESPONSE_FORMAT_VERSION = "1"
+
+# Clients may store responses but must revalidate them (with the ETag)
+# before each use: the URLs do not change when the data does
+CACHE_CONTROL = "public, no-cache"
+
+# Response headers repeated on a 304
+_NOT_MODIFIED_HEADERS = (b"etag", b"cache-control")
+
+
+def dataset_version(*fingerprints: str) -> str:
+    """Combine data file fingerprints into a short dataset version string."""
+    digest = hashlib.sha1(RESPONSE_FORMAT_VERSION.encode())
+    for fingerprint in fingerprints:
+        digest.update(fingerprint.encode())
+    return digest.hexdigest()[:20]
+
+
+def etag_matches(if_none_match: Optional[str], etag: str) -> bool:
+    """
+    Check an If-None-Match header against an ETag (weak comparison).
+
+    Handles '*', comma-separated lists and W/ prefixes.
+    """
+    if not if_none_match:
+        return False
+
+    for candidate in if_none_match.split(","):
+        candidate = candidate.strip()
+        if candidate == "*" or candidate.removeprefix("W/") == etag:
+            return True
+    return False
+
+
+def cache_headers(version: str) -> dict[str, str]:
+    """ETag and Cache-Control headers for a response of ``version``."""
+    return {"ETag": f'"{version}"', "Cache-Control": CACHE_CONTROL}
+
+
+def set_cache_headers(response: Response, version: str):
+    """
+    Tag the response being built with the ETag of ``version``.
+
+    Error responses raised later by the route do not inherit the headers,
+    so they are never revalidated.
+    """
+    response.headers.update(cache_headers(version))
+
+
+class ConditionalGetMiddleware:
+    """
+    Answer GET/HEAD requests whose If-None-Match matches the ETag of the
+    route's successful response with an empty 304.
+
+    The check runs on the response the route produced, so a 304 always
+    stands for a resource that exists.
+    """
+
+    def __init__(self, app: ASGIApp):
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send):
+        if_none_match = None
+        if scope["type"] == "http" and scope["method"] in ("GET", "HEAD"):
+            if_none_match = Headers(scope=scope).get("if-none-match")
+        if not if_none_match:
+            await self.app(scope, receive, send)
+            return
+
+        not_modified = False
+
+        async def send_conditional(message: Message):
+            nonlocal not_modified
+            if message["type"] == "http.response.start":
+                etag = Headers(raw=message["headers"]).get("etag")
+                if 200 <= message["status"] < 300 and etag and etag_matches(if_none_match, etag):
+                    not_modified = True
+                    headers = [(name, value) for name, value in message["headers"] if name in _NOT_MODIFIED_HEADERS]
+                    await send({"type": "http.response.start", "status": 304, "headers": headers})
+                    await send({"type": "http.response.body", "body": b""})
+                    return
+            elif not_modified:
+                return  # the body of the 304'd response is dropped
+            await send(message)
+
+        await self.app(scope, receive, send_conditional)
+
+
+class ResponseCache:
+    """
+    Encoded JSON bodies of cached responses.
+
+    Entries are keyed by (dataset version, key), so a data change can never
+    serve stale bytes. Hot routes return the cached body as a raw Response,
+    skipping Pydantic model construction, validation and JSON encoding.
+    The oldest entries are dropped once ``max_entries`` is reached.
+    """
+
+    def __init__(self, max_entries: int = 20000):
+        self.max_entries = max_entries
+        self._bodies: dict[tuple[str, Hashable], bytes] = {}
+
+    def __len__(self) -> int:
+        return len(self._bodies)
+
+    def get(self, version: str, key: Hashable) -> Optional[bytes]:
+        """Get a cached body, or None."""
+        return self._bodies.get((version, key))
+
+    def put(self, version: str, key: Hashable, body: bytes) -> bytes:
+        """Store an encoded body and return it."""
+        if len(self._bodies) >= self.max_entries:
+            del self._bodies[next(iter(self._bodies))]
+        self._bodies[(version, key)] = body
+        return body
+
+    def get_or_build(self, version: str, key: Hashable, build: Callable[[], Optional[bytes]]) -> Optional[bytes]:
+        """Get a cached body, building (and caching) it on a miss; None results are not cached."""
+        body = self._bodies.get((version, key))
+        if body is None:
+            body = build()
+            if body is not None:
+                self.put(version, key, body)
+        return body
+
+    def clear(self):
+        """Drop every cached body."""
+        self._bodies.clear()
+
+
+def json_bytes_response(body: bytes, version: str) -> Response:
+    """Wrap a pre-encoded JSON body with the caching headers of ``version``."""
+    return Response(content=body, media_type="application/json", headers=cache_headers(version))
@@ -9,9 +9,13 @@ import uvicorn
 
 # Import database
 from database import init_db
+from config import settings
+from http_cache import ConditionalGetMiddleware
+from services.verse_service import get_verse_service
+from services.lexicon_service import get_lexicon_service
 
 # Import routers
-from routers import verses, lexicon, chat, auth, conversations
+from routers import verses, lexicon, search, concordance, chat, auth, conversations
 
 app = FastAPI(
     title="AI Gospel Parser API",
@@ -22,8 +26,17 @@ app = FastAPI(
 # Initialize database on startup
 @app.on_event("startup")
 async def startup_event():
-    """Initialize database tables on application startup"""
+    """Initialize database tables and the verse store on application startup"""
     init_db()
+    verse_service = get_verse_service()
+
+    if settings.WARM_RESPONSE_CACHE:
+        verses.warm_response_cache(verse_service)
+        lexicon.warm_response_cache(get_lexicon_service())
+        print(f"✓ Warmed response cache ({len(verses.response_cache) + len(lexicon.response_cache)} responses)")
+
+# 304 for revalidated verse and lexicon responses (see http_cache.py)
+app.add_middleware(ConditionalGetMiddleware)
 
 # CORS middleware for local development
 app.add_middleware(
@@ -59,6 +72,8 @@ async def health_check():
 # Mount routers
 app.include_router(verses.router, prefix="/api/verses", tags=["verses"])
 app.include_router(lexicon.router, prefix="/api/lexicon", tags=["lexicon"])
+app.include_router(search.router, prefix="/api/search", tags=["search"])
+app.include_router(concordance.router, prefix="/api/concordance", tags=["concordance"])
 app.include_router(chat.router, prefix="/api/chat", tags=["chat"])
 app.include_router(auth.router, prefix="/api/auth", tags=["auth"])
 app.include_router(conversations.router, prefix="/api/conversations", tags=["conversations"])
@@ -6,6 +6,7 @@ WebSocket endpoint for streaming AI chat responses.
 from fastapi import APIRouter, WebSocket, WebSocketDisconnect, Depends, HTTPException
 from typing import Optional
 import json
+import re
 
 from schemas.chat import ChatMessage, ChatRequest, ChatResponse
 from services.ai_service import AIService, get_ai_service
@@ -16,6 +17,9 @@ from config import settings
 
 router = APIRouter()
 
+# Two or more Greek words in a row, e.g. a quoted phrase "εν αρχη ην"
+GREEK_PHRASE_PATTERN = re.compile(r'[\u0370-\u03FF\u1F00-\u1FFF]+(?:\s+[\u0370-\u03FF\u1F00-\u1FFF]+)+')
+
 
 def extract_greek_words_from_verse(verse_text: str) -> list[str]:
     """
@@ -67,19 +71,29 @@ def build_context(
 
     # Add verse context if provided
     if verse_reference:
-        parsed = verse_service.parse_verse_reference(verse_reference)
-
-        if parsed:
-            # Handle single verse or range
-            verses_to_include = [parsed] if isinstance(parsed, dict) else parsed
+        spans = verse_service.parse_references(verse_reference)
 
-            for verse_ref in verses_to_include[:3]:  # Limit to 3 verses for context
-                text, metadata = verse_service.lookup_verse(verse_ref)
-                if text and metadata:
-                    context_parts.append(f"""
+        if spans:
+            # Single verse, range or compound reference, fetched in one batch
+            for text, metadata in verse_service.lookup_spans(spans)[:3]:  # Limit to 3 verses for context
+                context_parts.append(f"""
 {metadata['reference']}:
 Greek: {text}
-English (reference): {metadata.get('english_text', 'N/A')}
+English (reference): {metadata.get('english_text') or 'N/A'}
+""")
+
+    # Add verses containing Greek phrases quoted in the message (exact index lookup)
+    seen_references = set()
+    for phrase in GREEK_PHRASE_PATTERN.findall(message)[:2]:
+        _, _, verses = verse_service.phrase_search(phrase, limit=3)
+        for text, metadata, _highlights in verses:
+            if metadata['reference'] in seen_references:
+                continue
+            seen_references.add(metadata['reference'])
+            context_parts.append(f"""
+{metadata['reference']} (contains "{phrase}"):
+Greek: {text}
+English (reference): {metadata.get('english_text') or 'N/A'}
 """)
 
     # Add lexicon context if requested
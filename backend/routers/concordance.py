@@ -0,0 +1,95 @@
+"""
+Concordance API Router
+======================
+REST API endpoint for lemma / Strong's concordances (keyword in context).
+"""
+from fastapi import APIRouter, HTTPException, Depends, Query, Response
+from typing import Optional
+
+from schemas.search import ConcordanceResponse
+from schemas.verse import ErrorResponse
+from services.verse_service import VerseService, get_verse_service
+from services.lexicon_service import LexiconService, get_lexicon_service
+from http_cache import dataset_version, set_cache_headers
+
+
+router = APIRouter()
+
+
+@router.get(
+    "/{lemma_or_strongs}",
+    response_model=ConcordanceResponse,
+    responses={
+        404: {"model": ErrorResponse, "description": "No occurrences found"},
+        400: {"model": ErrorResponse, "description": "Invalid book"}
+    },
+    summary="Concordance of a lemma or Strong's number",
+    description="""
+    Every occurrence of a lemma in the SBLGNT, with words of context on
+    each side (keyword in context), in canonical order.
+
+    Examples:
+    - `/λόγος` - by lemma
+    - `/G3056` or `/3056` - by Strong's number
+    - `/αγαπη?context=8` - unaccented lemmas are resolved through the lexicon
+    - `/G26?book=John,1John` - restricted to books
+
+    The response also counts occurrences per book. Results are paged with
+    `offset` / `limit`.
+    """
+)
+async def get_concordance(
+    lemma_or_strongs: str,
+    response: Response,
+    context: int = Query(5, description="Words of context on each side", ge=0, le=20),
+    book: Optional[str] = Query(None, description="Book names, abbreviations or codes (e.g. 'Luke,Acts')"),
+    offset: int = Query(0, description="Number of occurrences to skip", ge=0),
+    limit: int = Query(50, description="Maximum occurrences per page", ge=1, le=500),
+    verse_service: VerseService = Depends(get_verse_service),
+    lexicon_service: LexiconService = Depends(get_lexicon_service)
+):
+    """
+    Get the concordance of a lemma or Strong's number.
+
+    Returns:
+        ConcordanceResponse with per-book counts and one page of occurrences
+    """
+    book_codes = []
+    for name in (book or "").split(","):
+        if not name.strip():
+            continue
+        code = verse_service.resolve_book(name)
+        if code is None:
+            raise HTTPException(status_code=400, detail=f"Invalid book: '{name.strip()}'")
+        book_codes.append(code)
+
+    # Occurrences only change with the corpus or the lexicon (Strong's numbers)
+    set_cache_headers(
+        response, dataset_version(verse_service.dataset_version, lexicon_service.dataset_version)
+    )
+
+    result = verse_service.concordance(
+        lemma_or_strongs,
+        lexicon_service,
+        books=book_codes or None,
+        context=context,
+        offset=offset,
+        limit=limit,
+    )
+
+    if result is None:
+        raise HTTPException(
+            status_code=404,
+            detail=f"No occurrences found for '{lemma_or_strongs}'"
+        )
+
+    return ConcordanceResponse(
+        query=lemma_or_strongs,
+        lemmas=result["lemmas"],
+        strongs=result["strongs"],
+        total_occurrences=result["total"],
+        books=result["books"],
+        offset=offset,
+        limit=limit,
+        results=result["lines"]
+    )
@@ -3,10 +3,11 @@ Lexicon API Router
 ==================
 REST API endpoints for lexicon (Strong's Greek) lookups.
 """
-from fastapi import APIRouter, HTTPException, Depends, Query
+from fastapi import APIRouter, HTTPException, Depends, Query, Response
 from typing import Optional
 
 from schemas.lexicon import (
+    CollocatesResponse,
     LexiconEntry,
     LexiconSearchResult,
     LexiconSearchResponse,
@@ -14,10 +15,26 @@ from schemas.lexicon import (
 )
 from schemas.verse import ErrorResponse
 from services.lexicon_service import LexiconService, get_lexicon_service
+from services.verse_service import VerseService, get_verse_service
+from http_cache import ResponseCache, dataset_version, json_bytes_response, set_cache_headers
 
 
 router = APIRouter()
 
+# Encoded JSON bodies of Strong's entries, keyed by (lexicon version, Strong's number)
+response_cache = ResponseCache()
+
+
+async def cache_lexicon_responses(
+    response: Response,
+    lexicon_service: LexiconService = Depends(get_lexicon_service)
+):
+    """
+    Lexicon entries never change for a lexicon version: tag responses
+    with its ETag (ConditionalGetMiddleware answers matching revalidations).
+    """
+    set_cache_headers(response, lexicon_service.dataset_version)
+
 
 def _entry_to_response(entry: dict) -> LexiconEntry:
     """Convert internal entry dict to LexiconEntry response model"""
@@ -51,9 +68,17 @@ def _entry_to_response(entry: dict) -> LexiconEntry:
     )
 
 
+def warm_response_cache(lexicon_service: LexiconService):
+    """Pre-encode every Strong's entry response (used at startup when enabled)"""
+    version = lexicon_service.dataset_version
+    for entry in lexicon_service.get_all_entries():
+        response_cache.put(version, entry.get('strongs', ''), _entry_to_response(entry).model_dump_json().encode())
+
+
 @router.get(
     "/strongs/{strongs_number}",
     response_model=LexiconEntry,
+    dependencies=[Depends(cache_lexicon_responses)],
     responses={
         404: {"model": ErrorResponse, "description": "Strong's number not found"}
     },
@@ -94,7 +119,83 @@ async def get_strongs(
             detail=f"Strong's number not found: {strongs_number}"
         )
 
-    return _entry_to_response(entry)
+    version = lexicon_service.dataset_version
+    body = response_cache.get_or_build(
+        version,
+        entry.get('strongs', ''),
+        lambda: _entry_to_response(entry).model_dump_json().encode()
+    )
+    return json_bytes_response(body, version)
+
+
+@router.get(
+    "/strongs/{strongs_number}/collocates",
+    response_model=CollocatesResponse,
+    responses={
+        400: {"model": ErrorResponse, "description": "Unknown measure"},
+        404: {"model": ErrorResponse, "description": "Strong's number does not occur in the SBLGNT"}
+    },
+    summary="Words that frequently occur with a Strong's number",
+    description="""
+    Lemmas that share verses with the word more often than chance, from the
+    verse × lemma co-occurrence matrix of the SBLGNT.
+
+    Measures:
+    - `log_likelihood` - Dunning's G² (default; reliable for rare words)
+    - `pmi` - pointwise mutual information (favours rare, exclusive pairs;
+      raise `min_count` to filter noise)
+
+    Example:
+    - `G26?limit=10` - the ten strongest collocates of ἀγάπη
+    """
+)
+async def get_collocates(
+    strongs_number: str,
+    response: Response,
+    measure: str = Query("log_likelihood", description="Sort by 'log_likelihood' or 'pmi'"),
+    min_count: int = Query(2, description="Minimum number of shared verses", ge=1),
+    limit: int = Query(20, description="Maximum results", ge=1, le=100),
+    verse_service: VerseService = Depends(get_verse_service),
+    lexicon_service: LexiconService = Depends(get_lexicon_service)
+):
+    """
+    Get the collocates of a Strong's number.
+
+    Args:
+        strongs_number: Strong's number (e.g., 'G26' or '26')
+        measure: Score to sort by
+        min_count: Minimum number of shared verses
+        limit: Maximum number of collocates
+
+    Returns:
+        CollocatesResponse with collocates, strongest first
+    """
+    # Collocations only change with the corpus or the lexicon (Strong's numbers)
+    set_cache_headers(
+        response, dataset_version(verse_service.dataset_version, lexicon_service.dataset_version)
+    )
+
+    try:
+        result = verse_service.collocates(
+            strongs_number, lexicon_service, measure=measure, min_count=min_count, limit=limit
+        )
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+
+    if result is None:
+        raise HTTPException(
+            status_code=404,
+            detail=f"Strong's number does not occur in the SBLGNT: {strongs_number}"
+        )
+
+    return CollocatesResponse(
+        strongs=result["strongs"],
+        lemmas=result["lemmas"],
+        frequency=result["frequency"],
+        total_verses=result["total_verses"],
+        measure=measure,
+        results=result["collocates"],
+    )
 
 
 @router.get(
@@ -0,0 +1,179 @@
+"""
+Search API Router
+=================
+REST API endpoints for searching the Greek corpus.
+"""
+from fastapi import APIRouter, HTTPException, Depends, Query, Response
+from typing import Optional
+
+from schemas.search import MorphSearchResponse, PhraseHit, PhraseSearchResponse
+from schemas.verse import ErrorResponse
+from services.verse_service import VerseService, get_verse_service
+from services.lexicon_service import LexiconService, get_lexicon_service
+from http_cache import dataset_version, set_cache_headers
+
+
+router = APIRouter()
+
+
+def _split(value: Optional[str]) -> list[str]:
+    """Split a comma-separated query parameter into values"""
+    if not value:
+        return []
+    return [part.strip() for part in value.split(",") if part.strip()]
+
+
+@router.get(
+    "/morph",
+    response_model=MorphSearchResponse,
+    responses={
+        400: {"model": ErrorResponse, "description": "Invalid filter value"}
+    },
+    summary="Morphological search",
+    description="""
+    Find every token of the SBLGNT matching a morphological query.
+
+    Each filter accepts comma-separated values, which are ORed; different
+    filters are ANDed. Values are labels or MorphGNT codes, case-insensitive.
+
+    Examples:
+    - `?lemma=λέγω&tense=aorist&voice=passive&mood=participle&book=John`
+    - `?case=genitive&mood=participle&book=Luke,Acts` - genitive participles
+      (genitive absolute candidates) in Luke-Acts
+    - `?strongs=G25&tense=present`
+    - `?pos=verb&mood=optative`
+
+    Hits are returned in corpus order and paged with `offset` / `limit`.
+    """
+)
+async def search_morph(
+    response: Response,
+    pos: Optional[str] = Query(None, description="Part of speech (e.g. 'verb', 'noun', 'RA')"),
+    person: Optional[str] = Query(None, description="Person (1, 2, 3)"),
+    tense: Optional[str] = Query(None, description="Tense (present, imperfect, future, aorist, perfect, pluperfect)"),
+    voice: Optional[str] = Query(None, description="Voice (active, middle, passive)"),
+    mood: Optional[str] = Query(None, description="Mood (indicative, imperative, subjunctive, optative, infinitive, participle)"),
+    case: Optional[str] = Query(None, description="Case (nominative, genitive, dative, accusative, vocative)"),
+    number: Optional[str] = Query(None, description="Number (singular, plural)"),
+    gender: Optional[str] = Query(None, description="Gender (masculine, feminine, neuter)"),
+    degree: Optional[str] = Query(None, description="Degree (comparative, superlative)"),
+    lemma: Optional[str] = Query(None, description="Lemma (e.g. 'λέγω')"),
+    strongs: Optional[str] = Query(None, description="Strong's number (e.g. 'G3004')"),
+    book: Optional[str] = Query(None, description="Book name, abbreviation or code (e.g. 'Luke,Acts')"),
+    offset: int = Query(0, description="Number of hits to skip", ge=0),
+    limit: int = Query(50, description="Maximum hits per page", ge=1, le=500),
+    verse_service: VerseService = Depends(get_verse_service),
+    lexicon_service: LexiconService = Depends(get_lexicon_service)
+):
+    """
+    Search the corpus by morphology, lemma and book.
+
+    Returns:
+        MorphSearchResponse with the total hit count and one page of tokens
+    """
+    query = {
+        name: values
+        for name, values in {
+            "pos": _split(pos), "person": _split(person), "tense": _split(tense),
+            "voice": _split(voice), "mood": _split(mood), "case": _split(case),
+            "number": _split(number), "gender": _split(gender), "degree": _split(degree),
+            "lemma": _split(lemma), "strongs": _split(strongs), "book": _split(book),
+        }.items()
+        if values
+    }
+
+    if not query:
+        raise HTTPException(status_code=400, detail="Give at least one search filter")
+
+    book_codes = []
+    for name in query.get("book", []):
+        code = verse_service.resolve_book(name)
+        if code is None:
+            raise HTTPException(status_code=400, detail=f"Invalid book: '{name}'")
+        book_codes.append(code)
+
+    # Results only change with the corpus or the lexicon (Strong's numbers)
+    set_cache_headers(
+        response, dataset_version(verse_service.dataset_version, lexicon_service.dataset_version)
+    )
+
+    features = {name: values for name, values in query.items() if name not in ("lemma", "strongs", "book")}
+    try:
+        total, words = verse_service.search_morph(
+            features,
+            lexicon_service,
+            lemmas=query.get("lemma"),
+            strongs=query.get("strongs"),
+            books=book_codes or None,
+            offset=offset,
+            limit=limit,
+        )
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+
+    return MorphSearchResponse(
+        query=query,
+        total_results=total,
+        offset=offset,
+        limit=limit,
+        results=words
+    )
+
+
+@router.get(
+    "/phrase",
+    response_model=PhraseSearchResponse,
+    summary="Greek phrase search",
+    description="""
+    Find verses containing a Greek phrase, word for word.
+
+    By default accents, breathings and iota subscripts are ignored, so
+    `εν αρχη ην` finds Ἐν ἀρχῇ ἦν (John 1:1). Set `accents=true` to match
+    accents exactly. Each hit carries the character offsets of every match
+    in `greek_text` for highlighting. Phrases do not match across verses.
+
+    This is an exact lookup next to the semantic (vector) search used by
+    the chat; it is answered from a positional n-gram index.
+    """
+)
+async def search_phrase(
+    response: Response,
+    q: str = Query(..., description="Greek phrase", min_length=1),
+    accents: bool = Query(False, description="Match accents exactly"),
+    offset: int = Query(0, description="Number of verses to skip", ge=0),
+    limit: int = Query(20, description="Maximum verses per page", ge=1, le=200),
+    verse_service: VerseService = Depends(get_verse_service)
+):
+    """
+    Search for a Greek phrase.
+
+    Returns:
+        PhraseSearchResponse with match counts and one page of verses
+    """
+    set_cache_headers(response, verse_service.dataset_version)
+
+    total_matches, total_verses, verses = verse_service.phrase_search(
+        q, accent_sensitive=accents, offset=offset, limit=limit
+    )
+
+    return PhraseSearchResponse(
+        query=q,
+        accent_sensitive=accents,
+        total_matches=total_matches,
+        total_verses=total_verses,
+        offset=offset,
+        limit=limit,
+        results=[
+            PhraseHit(
+                greek_text=text,
+                english_text=metadata.get('english_text'),
+                book=metadata['book'],
+                chapter=metadata['chapter'],
+                verse=metadata['verse'],
+                reference=metadata['reference'],
+                reference_id=metadata['reference_id'],
+                highlights=highlights
+            )
+            for text, metadata, highlights in verses
+        ]
+    )
@@ -3,14 +3,83 @@ Verse API Router
 ================
 REST API endpoints for verse lookups.
 """
-from fastapi import APIRouter, HTTPException, Depends
-from typing import Union
+from fastapi import APIRouter, HTTPException, Depends, Query, Response
+from fastapi.responses import StreamingResponse
+from pydantic import TypeAdapter
+from typing import Iterator, Optional, Union
 
-from schemas.verse import VerseResponse, VerseRangeResponse, BookInfo, ErrorResponse
+from schemas.verse import (
+    VerseResponse, VerseRangeResponse, VerseWordsResponse, SimilarVersesResponse, BookInfo, ErrorResponse
+)
 from services.verse_service import VerseService, get_verse_service
+from services.lexicon_service import LexiconService, get_lexicon_service
+from http_cache import (
+    ResponseCache, cache_headers, dataset_version, json_bytes_response, set_cache_headers
+)
+
+# Encoded JSON bodies of verse responses, keyed by (dataset version, key)
+response_cache = ResponseCache()
+_BOOK_LIST = TypeAdapter(list[BookInfo])
+
+
+async def cache_verse_responses(
+    response: Response,
+    verse_service: VerseService = Depends(get_verse_service)
+):
+    """
+    Verse responses never change for a dataset version: tag responses
+    with its ETag (ConditionalGetMiddleware answers matching revalidations).
+    """
+    set_cache_headers(response, verse_service.dataset_version)
+
+
+router = APIRouter(dependencies=[Depends(cache_verse_responses)])
+
+
+def _to_verse_response(text: str, metadata: dict) -> VerseResponse:
+    """Convert verse text + metadata from VerseService to a VerseResponse"""
+    return VerseResponse(
+        greek_text=text,
+        english_text=metadata.get('english_text'),
+        book=metadata['book'],
+        chapter=metadata['chapter'],
+        verse=metadata['verse'],
+        reference=metadata['reference'],
+        reference_id=metadata['reference_id']
+    )
 
 
-router = APIRouter()
+def _verse_body(verse_service: VerseService, book: int, chapter: int, verse: int) -> Optional[bytes]:
+    """Encoded VerseResponse for one verse, from the response cache (None if not found)"""
+    def build() -> Optional[bytes]:
+        text, metadata = verse_service.lookup_verse({"book": book, "chapter": chapter, "verse": verse})
+        if text is None:
+            return None
+        return _to_verse_response(text, metadata).model_dump_json().encode()
+
+    return response_cache.get_or_build(verse_service.dataset_version, ("verse", book, chapter, verse), build)
+
+
+def _verse_range_body(verses: list[tuple[str, dict]], reference: str) -> Optional[bytes]:
+    """Encoded VerseRangeResponse for looked-up verses (None if there are none)"""
+    if not verses:
+        return None
+    return VerseRangeResponse(
+        verses=[_to_verse_response(text, metadata) for text, metadata in verses],
+        reference=reference
+    ).model_dump_json().encode()
+
+
+def warm_response_cache(verse_service: VerseService):
+    """Pre-encode every single-verse response (used at startup when enabled)"""
+    version = verse_service.dataset_version
+    for book_code in verse_service.CODE_TO_BOOK:
+        for text, metadata in verse_service.iter_book(book_code):
+            response_cache.put(
+                version,
+                ("verse", book_code, metadata['chapter'], metadata['verse']),
+                _to_verse_response(text, metadata).model_dump_json().encode()
+            )
 
 
 @router.get(
@@ -27,6 +96,8 @@ router = APIRouter()
     Examples:
     - `John 3:16` - Single verse
     - `John 3:16-18` - Verse range
+    - `John 3:16-4:2` - Range across chapters
+    - `John 3:16; Rom 5:8, 12` - Several references at once
     - `1 John 4:8` - Numbered books
     - `Matt 5:1` - Abbreviations work too
 
@@ -41,77 +112,186 @@ async def get_verse(
     Look up a verse by reference string.
 
     Args:
-        reference: Verse reference (e.g., "John 3:16", "Matt 5:1-10")
+        reference: Verse reference (e.g., "John 3:16", "Matt 5:1-10", "John 3:16; Rom 5:8")
         verse_service: Injected verse service
 
     Returns:
         VerseResponse or VerseRangeResponse with Greek + English text
     """
-    # Parse the reference
-    parsed = verse_service.parse_verse_reference(reference)
+    # Parse the reference (single verse, range or compound reference)
+    spans = verse_service.parse_references(reference)
 
-    if parsed is None:
+    if spans is None:
         raise HTTPException(
             status_code=400,
             detail=f"Invalid verse reference: '{reference}'. Use format like 'John 3:16'"
         )
 
+    version = verse_service.dataset_version
+
     # Handle single verse
-    if isinstance(parsed, dict):
-        text, metadata = verse_service.lookup_verse(parsed)
+    if len(spans) == 1 and spans[0].is_single_verse:
+        span = spans[0]
+        body = _verse_body(verse_service, span.book, span.start_chapter, span.start_verse)
 
-        if text is None:
+        if body is None:
             raise HTTPException(
                 status_code=404,
                 detail=f"Verse not found: {reference}"
             )
 
-        return VerseResponse(
-            greek_text=text,
-            english_text=metadata.get('english_text', ''),
-            book=metadata['book'],
-            chapter=metadata['chapter'],
-            verse=metadata['verse'],
-            reference=metadata['reference'],
-            reference_id=metadata['reference_id']
+        return json_bytes_response(body, version)
+
+    # Handle ranges and compound references: every span in one batched lookup,
+    # cached under the canonical reference string
+    canonical = verse_service.format_references(spans)
+    body = response_cache.get_or_build(
+        version,
+        ("range", canonical),
+        lambda: _verse_range_body(verse_service.lookup_spans(spans), canonical)
+    )
+
+    if body is None:
+        raise HTTPException(
+            status_code=404,
+            detail=f"No verses found in range: {reference}"
         )
 
-    # Handle verse range
-    else:  # parsed is a list
-        verses = []
-        for verse_ref in parsed:
-            text, metadata = verse_service.lookup_verse(verse_ref)
-
-            if text is None:
-                # Skip missing verses in range (shouldn't happen, but be defensive)
-                continue
-
-            verses.append(VerseResponse(
-                greek_text=text,
-                english_text=metadata.get('english_text', ''),
-                book=metadata['book'],
-                chapter=metadata['chapter'],
-                verse=metadata['verse'],
-                reference=metadata['reference'],
-                reference_id=metadata['reference_id']
-            ))
-
-        if not verses:
-            raise HTTPException(
-                status_code=404,
-                detail=f"No verses found in range: {reference}"
-            )
+    return json_bytes_response(body, version)
+
+
+@router.get(
+    "/{reference}/words",
+    response_model=VerseWordsResponse,
+    responses={
+        404: {"model": ErrorResponse, "description": "Verse not found"},
+        400: {"model": ErrorResponse, "description": "Invalid verse reference"}
+    },
+    summary="Word-by-word interlinear data for a reference",
+    description="""
+    Get every Greek word of a verse, range or compound reference with its
+    lemma, Strong's number, normalized form and decoded parse
+    (person, tense, voice, mood, case, number, gender, degree).
+
+    Examples:
+    - `/John 3:16/words`
+    - `/John 3/words` - a whole chapter
+    """
+)
+async def get_verse_words(
+    reference: str,
+    response: Response,
+    verse_service: VerseService = Depends(get_verse_service),
+    lexicon_service: LexiconService = Depends(get_lexicon_service)
+):
+    """
+    Get word-level morphology for a reference.
+
+    Args:
+        reference: Verse reference (e.g., "John 3:16", "John 3")
+
+    Returns:
+        VerseWordsResponse with one WordToken per Greek word
+    """
+    spans = verse_service.parse_references(reference)
+
+    if spans is None:
+        raise HTTPException(
+            status_code=400,
+            detail=f"Invalid verse reference: '{reference}'. Use format like 'John 3:16'"
+        )
+
+    # Strong's numbers come from the lexicon, so both datasets version this response
+    version = dataset_version(verse_service.dataset_version, lexicon_service.dataset_version)
+    set_cache_headers(response, version)
+
+    canonical = verse_service.format_references(spans)
+
+    def build() -> Optional[bytes]:
+        words = verse_service.lookup_words(spans, lexicon_service)
+        if not words:
+            return None
+        return VerseWordsResponse(reference=canonical, words=words).model_dump_json().encode()
+
+    body = response_cache.get_or_build(version, ("words", canonical), build)
+
+    if body is None:
+        raise HTTPException(
+            status_code=404,
+            detail=f"Verse not found: {reference}"
+        )
+
+    return json_bytes_response(body, version)
+
+
+@router.get(
+    "/{reference}/similar",
+    response_model=SimilarVersesResponse,
+    responses={
+        404: {"model": ErrorResponse, "description": "Verse not found"},
+        400: {"model": ErrorResponse, "description": "Invalid or multi-verse reference"}
+    },
+    summary="Verses similar to a verse",
+    description="""
+    "More like this": the verses sharing the most (and the most distinctive)
+    lemmas with a verse, by cosine similarity of lemma TF-IDF vectors.
+
+    Neighbours are precomputed for every verse, so this is a table read;
+    it works without an embedding model or the vector database.
+
+    Example:
+    - `/John 3:16/similar?limit=5`
+    """
+)
+async def get_similar_verses(
+    reference: str,
+    limit: int = Query(10, description="Maximum verses", ge=1, le=20),
+    verse_service: VerseService = Depends(get_verse_service)
+):
+    """
+    Get the verses most similar to a single verse.
+
+    Args:
+        reference: Single verse reference (e.g., "John 3:16")
+        limit: Maximum number of verses (default 10, max 20)
+
+    Returns:
+        SimilarVersesResponse, most similar first
+    """
+    spans = verse_service.parse_references(reference)
 
-        # Format range reference
-        first = parsed[0]
-        last = parsed[-1]
-        range_ref = f"{first['book_name']} {first['chapter']}:{first['verse']}-{last['verse']}"
+    if spans is None or len(spans) != 1 or not spans[0].is_single_verse:
+        raise HTTPException(
+            status_code=400,
+            detail=f"Invalid verse reference: '{reference}'. Use a single verse like 'John 3:16'"
+        )
 
-        return VerseRangeResponse(
-            verses=verses,
-            reference=range_ref
+    span = spans[0]
+    canonical = verse_service.format_references(spans)
+
+    def build() -> Optional[bytes]:
+        verses = verse_service.similar_verses(span.book, span.start_chapter, span.start_verse, limit)
+        if verses is None:
+            return None
+        return SimilarVersesResponse(
+            reference=canonical,
+            verses=[
+                {**_to_verse_response(text, metadata).model_dump(), "similarity": round(score, 4)}
+                for text, metadata, score in verses
+            ]
+        ).model_dump_json().encode()
+
+    version = verse_service.dataset_version
+    body = response_cache.get_or_build(version, ("similar", canonical, limit), build)
+
+    if body is None:
+        raise HTTPException(
+            status_code=404,
+            detail=f"Verse not found: {reference}"
         )
 
+    return json_bytes_response(body, version)
+
 
 @router.get(
     "/book/{book_code}/{chapter}/{verse}",
@@ -156,40 +336,134 @@ async def get_verse_by_code(
             detail=f"Invalid book code: {book_code}. Use /books to see valid codes."
         )
 
-    # Build verse reference
-    verse_ref = {
-        "book": book_code,
-        "book_name": verse_service.CODE_TO_BOOK[book_code],
-        "chapter": chapter,
-        "verse": verse
-    }
+    # Look up verse (shares cache entries with /{reference})
+    body = _verse_body(verse_service, book_code, chapter, verse)
 
-    # Look up verse
-    text, metadata = verse_service.lookup_verse(verse_ref)
-
-    if text is None:
+    if body is None:
         raise HTTPException(
             status_code=404,
             detail=f"Verse not found: {verse_service.CODE_TO_BOOK[book_code]} {chapter}:{verse}"
         )
 
-    return VerseResponse(
-        greek_text=text,
-        english_text=metadata.get('english_text', ''),
-        book=metadata['book'],
-        chapter=metadata['chapter'],
-        verse=metadata['verse'],
-        reference=metadata['reference'],
-        reference_id=metadata['reference_id']
+    return json_bytes_response(body, verse_service.dataset_version)
+
+
+@router.get(
+    "/chapter/{book}/{chapter}",
+    response_model=VerseRangeResponse,
+    responses={
+        404: {"model": ErrorResponse, "description": "Chapter not found"},
+        400: {"model": ErrorResponse, "description": "Invalid book"}
+    },
+    summary="Get a full chapter",
+    description="""
+    Get every verse of a chapter.
+
+    The book may be a name, abbreviation or numeric code:
+    - `/chapter/John/3`
+    - `/chapter/jn/3`
+    - `/chapter/64/3`
+    """
+)
+async def get_chapter(
+    book: str,
+    chapter: int,
+    verse_service: VerseService = Depends(get_verse_service)
+):
+    """
+    Get all verses of a chapter.
+
+    Args:
+        book: Book name, abbreviation or SBLGNT code
+        chapter: Chapter number
+
+    Returns:
+        VerseRangeResponse with every verse in the chapter
+    """
+    book_code = verse_service.resolve_book(book)
+
+    if book_code is None:
+        raise HTTPException(
+            status_code=400,
+            detail=f"Invalid book: '{book}'. Use /books/list to see valid books."
+        )
+
+    version = verse_service.dataset_version
+    body = response_cache.get_or_build(
+        version,
+        ("chapter", book_code, chapter),
+        lambda: _verse_range_body(
+            verse_service.lookup_chapter(book_code, chapter),
+            f"{verse_service.CODE_TO_BOOK[book_code]} {chapter}"
+        )
+    )
+
+    if body is None:
+        raise HTTPException(
+            status_code=404,
+            detail=f"Chapter not found: {verse_service.CODE_TO_BOOK[book_code]} {chapter}"
+        )
+
+    return json_bytes_response(body, version)
+
+
+@router.get(
+    "/book/{book_code}/stream",
+    response_class=StreamingResponse,
+    responses={
+        200: {
+            "content": {"application/x-ndjson": {}},
+            "description": "One VerseResponse JSON object per line"
+        },
+        400: {"model": ErrorResponse, "description": "Invalid book code"}
+    },
+    summary="Stream a whole book as NDJSON",
+    description="""
+    Stream every verse of a book as newline-delimited JSON.
+
+    Each line is one VerseResponse object. Verses are produced by a generator,
+    so clients get the first verses immediately and server memory stays
+    bounded regardless of book length.
+    """
+)
+async def stream_book(
+    book_code: int,
+    verse_service: VerseService = Depends(get_verse_service)
+):
+    """
+    Stream all verses of a book as NDJSON.
+
+    Args:
+        book_code: SBLGNT book code (61-87 for NT)
+
+    Returns:
+        StreamingResponse of newline-delimited VerseResponse JSON
+    """
+    if book_code not in verse_service.CODE_TO_BOOK:
+        raise HTTPException(
+            status_code=400,
+            detail=f"Invalid book code: {book_code}. Use /books to see valid codes."
+        )
+
+    def generate_lines() -> Iterator[str]:
+        for text, metadata in verse_service.iter_book(book_code):
+            yield _to_verse_response(text, metadata).model_dump_json() + "\n"
+
+    return StreamingResponse(
+        generate_lines(),
+        media_type="application/x-ndjson",
+        headers=cache_headers(verse_service.dataset_version)
     )
 
 
 @router.get(
     "/books/list",
     response_model=list[BookInfo],
-    summary="List all Bible books",
+    summary="List available Bible books",
     description="""
-    Get a list of all New Testament books with their codes and abbreviations.
+    Get the books that have verses loaded (the New Testament, plus the
+    Septuagint books when the LXX is loaded) with their codes and
+    abbreviations.
 
     Useful for:
     - Autocomplete in search boxes
@@ -201,18 +475,21 @@ async def list_books(
     verse_service: VerseService = Depends(get_verse_service)
 ):
     """
-    Get list of all NT books.
+    Get the list of books with verses loaded.
 
     Returns:
         List of BookInfo objects with name, code, and abbreviations
     """
-    books = verse_service.get_all_books()
+    def build() -> bytes:
+        books = verse_service.get_all_books()
+        return _BOOK_LIST.dump_json([
+            BookInfo(
+                name=book["name"],
+                code=book["code"],
+                abbreviations=book["abbreviations"]
+            )
+            for book in books
+        ])
 
-    return [
-        BookInfo(
-            name=book["name"],
-            code=book["code"],
-            abbreviations=book["abbreviations"]
-        )
-        for book in books
-    ]
+    version = verse_service.dataset_version
+    return json_bytes_response(response_cache.get_or_build(version, ("books",), build), version)
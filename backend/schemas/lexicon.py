@@ -108,3 +108,44 @@ class LexiconSearchResponse(BaseModel):
                 "total_results": 2
             }
         }
+
+
+class Collocate(BaseModel):
+    """A lemma that co-occurs with the requested word"""
+    lemma: str = Field(..., description="Greek lemma")
+    strongs: Optional[str] = Field(None, description="Strong's number of the lemma")
+    count: int = Field(..., description="Verses containing both words")
+    frequency: int = Field(..., description="Verses containing this lemma")
+    pmi: float = Field(..., description="Pointwise mutual information (log2)")
+    log_likelihood: float = Field(..., description="Dunning log-likelihood ratio (G²); negative if less frequent than chance")
+
+
+class CollocatesResponse(BaseModel):
+    """Response for collocates of a Strong's number"""
+    strongs: str = Field(..., description="Requested Strong's number")
+    lemmas: list[str] = Field(..., description="SBLGNT lemmas of the Strong's number")
+    frequency: int = Field(..., description="Verses containing the word")
+    total_verses: int = Field(..., description="Verses in the corpus")
+    measure: str = Field(..., description="Measure the results are sorted by")
+    results: list[Collocate] = Field(..., description="Collocates, strongest first")
+
+    class Config:
+        json_schema_extra = {
+            "example": {
+                "strongs": "G26",
+                "lemmas": ["ἀγάπη"],
+                "frequency": 106,
+                "total_verses": 7939,
+                "measure": "log_likelihood",
+                "results": [
+                    {
+                        "lemma": "θεός",
+                        "strongs": "G2316",
+                        "count": 31,
+                        "frequency": 1186,
+                        "pmi": 0.97,
+                        "log_likelihood": 18.4
+                    }
+                ]
+            }
+        }
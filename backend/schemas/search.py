@@ -0,0 +1,90 @@
+"""
+Search API Schemas
+==================
+Pydantic models for corpus search requests and responses.
+"""
+from pydantic import BaseModel, Field
+
+from schemas.verse import VerseResponse, WordToken
+
+
+class MorphSearchResponse(BaseModel):
+    """Response for a morphological corpus search"""
+    query: dict[str, list[str]] = Field(..., description="Filters applied (values ORed, filters ANDed)")
+    total_results: int = Field(..., description="Total number of matching tokens")
+    offset: int = Field(..., description="Number of hits skipped")
+    limit: int = Field(..., description="Maximum hits per page")
+    results: list[WordToken] = Field(..., description="Matching tokens for this page, in corpus order")
+
+    class Config:
+        json_schema_extra = {
+            "example": {
+                "query": {"lemma": ["λέγω"], "tense": ["aorist"], "voice": ["passive"],
+                          "mood": ["participle"], "book": ["Matthew"]},
+                "total_results": 1,
+                "offset": 0,
+                "limit": 50,
+                "results": []
+            }
+        }
+
+
+class ConcordanceLine(WordToken):
+    """One occurrence of a lemma with keyword-in-context text"""
+    left: str = Field(..., description="Words before the occurrence")
+    right: str = Field(..., description="Words after the occurrence")
+
+
+class ConcordanceResponse(BaseModel):
+    """Response for a lemma / Strong's concordance"""
+    query: str = Field(..., description="Lemma or Strong's number searched for")
+    lemmas: list[str] = Field(..., description="Corpus lemmas matched")
+    strongs: list[str] = Field(..., description="Strong's numbers of the matched lemmas")
+    total_occurrences: int = Field(..., description="Total number of occurrences")
+    books: dict[str, int] = Field(..., description="Occurrences per book")
+    offset: int = Field(..., description="Number of occurrences skipped")
+    limit: int = Field(..., description="Maximum occurrences per page")
+    results: list[ConcordanceLine] = Field(..., description="Occurrences for this page, in corpus order")
+
+    class Config:
+        json_schema_extra = {
+            "example": {
+                "query": "G26",
+                "lemmas": ["ἀγάπη"],
+                "strongs": ["G26"],
+                "total_occurrences": 116,
+                "books": {"Matthew": 1, "Luke": 1, "John": 7},
+                "offset": 0,
+                "limit": 50,
+                "results": []
+            }
+        }
+
+
+class PhraseHit(VerseResponse):
+    """A verse containing the searched phrase"""
+    highlights: list[tuple[int, int]] = Field(..., description="[start, end) character offsets of each match in greek_text")
+
+
+class PhraseSearchResponse(BaseModel):
+    """Response for a Greek phrase search"""
+    query: str = Field(..., description="Phrase searched for")
+    accent_sensitive: bool = Field(..., description="Whether accents had to match exactly")
+    total_matches: int = Field(..., description="Total number of phrase occurrences")
+    total_verses: int = Field(..., description="Total number of verses containing the phrase")
+    offset: int = Field(..., description="Number of verses skipped")
+    limit: int = Field(..., description="Maximum verses per page")
+    results: list[PhraseHit] = Field(..., description="Matching verses for this page, in canonical order")
+
+    class Config:
+        json_schema_extra = {
+            "example": {
+                "query": "εν αρχη ην",
+                "accent_sensitive": False,
+                "total_matches": 1,
+                "total_verses": 1,
+                "offset": 0,
+                "limit": 20,
+                "results": []
+            }
+        }
@@ -10,7 +10,10 @@ from typing import Optional
 class VerseResponse(BaseModel):
     """Response model for verse lookup"""
     greek_text: str = Field(..., description="Original Greek text from SBLGNT")
-    english_text: str = Field(..., description="English translation (WEB) for reference")
+    english_text: Optional[str] = Field(
+        ..., description="English translation (WEB) for reference; null for Septuagint verses, "
+                         "whose numbering differs from the WEB's"
+    )
     book: str = Field(..., description="Book name (e.g., 'John')")
     chapter: int = Field(..., description="Chapter number")
     verse: int = Field(..., description="Verse number")
@@ -37,6 +40,69 @@ class VerseRangeResponse(BaseModel):
     reference: str = Field(..., description="Human-readable range (e.g., 'John 3:16-18')")
 
 
+class SimilarVerse(VerseResponse):
+    """A verse similar to the requested one"""
+    similarity: float = Field(..., description="Cosine similarity of lemma TF-IDF vectors (0-1)")
+
+
+class SimilarVersesResponse(BaseModel):
+    """Response model for similar verses"""
+    reference: str = Field(..., description="Requested verse (e.g., 'John 3:16')")
+    verses: list[SimilarVerse] = Field(..., description="Most similar verses first")
+
+
+class WordToken(BaseModel):
+    """One Greek word of a verse with its lemma and decoded morphology"""
+    reference: str = Field(..., description="Verse reference (e.g., 'John 3:16')")
+    reference_id: str = Field(..., description="Internal verse ID (e.g., '64-03-16')")
+    position: int = Field(..., description="1-based position of the word in its verse")
+    word: str = Field(..., description="Surface form as printed, with punctuation")
+    normalized: str = Field(..., description="Normalized form without punctuation")
+    lemma: str = Field(..., description="Dictionary form (e.g., 'ἀγαπάω')")
+    strongs: Optional[str] = Field(None, description="Strong's number of the lemma (e.g., 'G25')")
+    pos: str = Field(..., description="MorphGNT part-of-speech code (e.g., 'V-')")
+    part_of_speech: Optional[str] = Field(None, description="Part of speech (e.g., 'Verb')")
+    parse_code: str = Field(..., description="MorphGNT parse code (e.g., '3AAI-S--')")
+    person: Optional[str] = None
+    tense: Optional[str] = None
+    voice: Optional[str] = None
+    mood: Optional[str] = None
+    case: Optional[str] = None
+    number: Optional[str] = None
+    gender: Optional[str] = None
+    degree: Optional[str] = None
+
+    class Config:
+        json_schema_extra = {
+            "example": {
+                "reference": "John 3:16",
+                "reference_id": "64-03-16",
+                "position": 3,
+                "word": "ἠγάπησεν",
+                "normalized": "ἠγάπησε(ν)",
+                "lemma": "ἀγαπάω",
+                "strongs": "G25",
+                "pos": "V-",
+                "part_of_speech": "Verb",
+                "parse_code": "3AAI-S--",
+                "person": "3rd",
+                "tense": "Aorist",
+                "voice": "Active",
+                "mood": "Indicative",
+                "case": None,
+                "number": "Singular",
+                "gender": None,
+                "degree": None
+            }
+        }
+
+
+class VerseWordsResponse(BaseModel):
+    """Response model for word-level (interlinear) verse lookup"""
+    reference: str = Field(..., description="Canonical reference (e.g., 'John 3:16-18')")
+    words: list[WordToken]
+
+
 class BookInfo(BaseModel):
     """Information about a Bible book"""
     name: str = Field(..., description="Full book name (e.g., 'John')")
@@ -3,85 +3,64 @@ Lexicon Lookup Service
 ======================
 Provides access to Thayer's Greek Lexicon with enhanced morphology data.
 """
-import json
 import os
-from pathlib import Path
+from itertools import islice
 from typing import Optional
 import unicodedata
 
 from config import settings
+from greek_text import fold_greek
+from http_cache import dataset_version
+from lexicon_search import LexiconSearchIndex
+from lexicon_store import LexiconStore
 
 
 class LexiconService:
     """
     Service for lexicon lookups using enhanced_lexicon.json.
 
-    Loads the entire lexicon into memory on startup for fast O(1) lookups.
+    Maps the compiled lexicon store (see lexicon_store.py), whose entries
+    and lemma/transliteration indexes are shared by every worker through
+    the page cache, and decodes entries on access.
     """
 
     def __init__(self):
-        """Initialize lexicon from JSON file"""
-        self.entries = {}  # strongs -> entry
-        self.greek_index = {}  # normalized greek -> list of strongs
-        self.transliteration_index = {}  # transliteration -> list of strongs
+        """Initialize lexicon from the compiled store (or the JSON file)"""
+        self.entries = {}  # strongs -> entry (a LexiconStore once loaded)
+        self.dataset_version = dataset_version()  # ETag for cached responses
+        self._stats = None
+        self.search_index = LexiconSearchIndex(())  # BM25 index over self.entries
         self._load_lexicon()
 
     def _normalize_greek(self, text: str) -> str:
-        """Normalize Greek text for consistent matching"""
-        if not text:
-            return ""
-        # Strip punctuation
-        text = text.strip('.,;:·⸀')
-        # Unicode normalization (NFD to decompose, then NFC to recompose)
-        # This handles different accent representations
-        normalized = unicodedata.normalize('NFD', text)
-        # Strip combining diacriticals (accents) for broader matching
-        stripped = ''.join(
-            char for char in normalized
-            if unicodedata.category(char) != 'Mn'  # Mn = Mark, Nonspacing
-        )
-        # Normalize back to NFC and lowercase
-        normalized = unicodedata.normalize('NFC', stripped)
-        return normalized.lower().strip()
+        """Normalize Greek text for consistent matching (accents and case removed)"""
+        return fold_greek(text)
 
     def _load_lexicon(self):
-        """Load enhanced lexicon from JSON file"""
+        """Map the compiled lexicon, compiling enhanced_lexicon.json in memory if needed"""
         lexicon_path = settings.ENHANCED_LEXICON_PATH
+        store_path = settings.LEXICON_STORE_PATH
 
-        if not os.path.exists(lexicon_path):
+        if not os.path.exists(lexicon_path) and not os.path.exists(store_path):
             print(f"⚠ Enhanced lexicon not found at: {lexicon_path}")
             print(f"   Run 'python build_enhanced_lexicon.py' to create it")
             return
 
         try:
-            with open(lexicon_path, 'r', encoding='utf-8') as f:
-                data = json.load(f)
-
-            # Build indexes
-            for strongs, entry in data.items():
-                self.entries[strongs] = entry
-
-                # Greek lemma index
-                lemma = entry.get('lemma', '')
-                if lemma:
-                    normalized = self._normalize_greek(lemma)
-                    if normalized not in self.greek_index:
-                        self.greek_index[normalized] = []
-                    self.greek_index[normalized].append(strongs)
-
-                # Transliteration index
-                translit = entry.get('transliteration', '')
-                if translit:
-                    translit_key = translit.lower().strip()
-                    if translit_key not in self.transliteration_index:
-                        self.transliteration_index[translit_key] = []
-                    self.transliteration_index[translit_key].append(strongs)
-
+            self.entries = LexiconStore.load(store_path, lexicon_path)
+            self.dataset_version = dataset_version(self.entries.source_sha1)
+            self.search_index = self.entries.search_index()
             print(f"✓ Loaded lexicon ({len(self.entries)} entries)")
 
         except Exception as e:
             print(f"⚠ Error loading lexicon: {e}")
 
+    def _index_keys(self, index: str, key: str) -> list[str]:
+        """Strong's numbers under ``key`` in one of the store's indexes"""
+        if not isinstance(self.entries, LexiconStore):
+            return []
+        return self.entries.lookup_keys(index, key)
+
     def lookup_by_strongs(self, strongs_number: str) -> Optional[dict]:
         """
         Look up entry by Strong's number.
@@ -109,14 +88,24 @@ class LexiconService:
         Returns:
             List of matching entries (may be multiple for same lemma)
         """
-        normalized = self._normalize_greek(greek_word)
-        strongs_numbers = self.greek_index.get(normalized, [])
+        strongs_numbers = self._index_keys("greek", self._normalize_greek(greek_word))
+        return [self.entries[strongs] for strongs in strongs_numbers]
 
-        return [
-            self.entries[strongs]
-            for strongs in strongs_numbers
-            if strongs in self.entries
-        ]
+    def strongs_for_lemma(self, lemma: str) -> Optional[str]:
+        """
+        Get the Strong's number for an SBLGNT lemma.
+
+        Tries the exact lemma first, then the accent-insensitive index.
+
+        Args:
+            lemma: Greek lemma (e.g., 'ἀγαπάω')
+
+        Returns:
+            Strong's number (e.g., 'G25') or None if not in the lexicon
+        """
+        candidates = (self._index_keys("lemma", unicodedata.normalize('NFC', lemma))
+                      or self._index_keys("greek", self._normalize_greek(lemma)))
+        return candidates[0] if candidates else None
 
     def lookup_by_transliteration(self, transliteration: str) -> list[dict]:
         """
@@ -128,19 +117,17 @@ class LexiconService:
         Returns:
             List of matching entries
         """
-        translit_key = transliteration.lower().strip()
-        strongs_numbers = self.transliteration_index.get(translit_key, [])
-
-        return [
-            self.entries[strongs]
-            for strongs in strongs_numbers
-            if strongs in self.entries
-        ]
+        strongs_numbers = self._index_keys("translit", transliteration.lower().strip())
+        return [self.entries[strongs] for strongs in strongs_numbers]
 
     def search(self, query: str, limit: int = 20) -> list[tuple[dict, float]]:
         """
         Full-text search across lexicon entries.
 
+        Scored with field-weighted BM25 over lemma, transliteration,
+        definitions and derivation (see lexicon_search.py); a Strong's
+        number query returns that entry first.
+
         Args:
             query: Search query string
             limit: Maximum number of results
@@ -148,48 +135,10 @@ class LexiconService:
         Returns:
             List of (entry, relevance_score) tuples, sorted by relevance
         """
-        query_lower = query.lower().strip()
-        results = []
-
-        for strongs, entry in self.entries.items():
-            score = 0.0
-
-            # Check Strong's number (exact match = highest score)
-            if strongs.lower() == f"g{query_lower}" or strongs.lower() == query_lower:
-                score += 100.0
-
-            # Check lemma (high score for exact match)
-            lemma = entry.get('lemma', '')
-            if lemma and query_lower in self._normalize_greek(lemma):
-                score += 50.0
-
-            # Check transliteration (high score)
-            translit = entry.get('transliteration', '')
-            if translit and query_lower in translit.lower():
-                score += 40.0
-
-            # Check definitions (medium score)
-            definition_strongs = entry.get('definition_strongs', '')
-            if definition_strongs and query_lower in definition_strongs.lower():
-                score += 20.0
-
-            definition_kjv = entry.get('definition_kjv', '')
-            if definition_kjv and query_lower in definition_kjv.lower():
-                score += 15.0
-
-            # Check derivation (low score)
-            derivation = entry.get('derivation', '')
-            if derivation and query_lower in derivation.lower():
-                score += 5.0
-
-            if score > 0:
-                results.append((entry, score))
-
-        # Sort by relevance score (descending)
-        results.sort(key=lambda x: x[1], reverse=True)
-
-        # Return top results
-        return results[:limit]
+        return [
+            (self.entries[strongs], score)
+            for strongs, score in self.search_index.search(query, limit)
+        ]
 
     def get_all_entries(self, limit: Optional[int] = None) -> list[dict]:
         """
@@ -201,11 +150,7 @@ class LexiconService:
         Returns:
             List of all entries (or first N if limited)
         """
-        entries = list(self.entries.values())
-
-        if limit:
-            return entries[:limit]
-        return entries
+        return list(islice(self.entries.values(), limit or None))
 
     def get_stats(self) -> dict:
         """
@@ -214,6 +159,12 @@ class LexiconService:
         Returns:
             Dict with stats (total entries, etc.)
         """
+        if self._stats is None:
+            self._stats = self._compute_stats()
+        return self._stats
+
+    def _compute_stats(self) -> dict:
+        """Stats over every entry (decodes the whole lexicon once)"""
         return {
             "total_entries": len(self.entries),
             "entries_with_morphology": sum(
@@ -6,64 +6,132 @@ Wraps existing gospel_parser_interlinear.py logic for API use.
 import sys
 import os
 from pathlib import Path
-from typing import Optional
+from typing import Iterator, Optional
 import chromadb
+import numpy as np
 
 # Add parent directory to path to import existing code
 project_root = Path(__file__).parent.parent.parent
 sys.path.insert(0, str(project_root))
 
 from config import settings
+from http_cache import dataset_version
+from bible_references import (
+    BIBLE_BOOKS, CODE_TO_BOOK, FIRST_NT_BOOK, VerseSpan, format_references, parse_references,
+    parse_verse_reference, resolve_book
+)
+from collocations import CollocationIndex
+from corpus import Corpus
+from english_index import EnglishIndex
+from morphology import MorphIndex, MorphologyColumns
+from phrase_index import PhraseIndex
+from verse_similarity import SimilarityTable
+from verse_store import VerseStore, BOOK_STRIDE, CHAPTER_STRIDE, pack_key, unpack_key
 
 
 class VerseService:
     """
-    Service for verse lookups using existing ChromaDB and SBLGNT data.
+    Service for verse lookups using SBLGNT data.
 
     This wraps the logic from gospel_parser_interlinear.py in a reusable service.
+    Exact lookups are served from an in-memory VerseStore; ChromaDB is only
+    needed for semantic search.
     """
 
-    # Bible book mapping (from gospel_parser_interlinear.py)
-    BIBLE_BOOKS = {
-        # New Testament
-        "matthew": {"code": 61, "abbrev": ["mt", "matt", "mat"]},
-        "mark": {"code": 62, "abbrev": ["mk", "mar"]},
-        "luke": {"code": 63, "abbrev": ["lk", "luk", "lu"]},
-        "john": {"code": 64, "abbrev": ["jn", "joh"]},
-        "acts": {"code": 65, "abbrev": ["ac", "act"]},
-        "romans": {"code": 66, "abbrev": ["ro", "rom", "rm"]},
-        "1 corinthians": {"code": 67, "abbrev": ["1co", "1cor", "1 cor"]},
-        "2 corinthians": {"code": 68, "abbrev": ["2co", "2cor", "2 cor"]},
-        "galatians": {"code": 69, "abbrev": ["ga", "gal"]},
-        "ephesians": {"code": 70, "abbrev": ["eph", "ephes"]},
-        "philippians": {"code": 71, "abbrev": ["php", "phil", "pp"]},
-        "colossians": {"code": 72, "abbrev": ["col"]},
-        "1 thessalonians": {"code": 73, "abbrev": ["1th", "1thes", "1thess", "1 thess", "1 th"]},
-        "2 thessalonians": {"code": 74, "abbrev": ["2th", "2thes", "2thess", "2 thess", "2 th"]},
-        "1 timothy": {"code": 75, "abbrev": ["1ti", "1tim", "1 tim", "1 ti"]},
-        "2 timothy": {"code": 76, "abbrev": ["2ti", "2tim", "2 tim", "2 ti"]},
-        "titus": {"code": 77, "abbrev": ["tit", "ti"]},
-        "philemon": {"code": 78, "abbrev": ["phm", "philem", "pm"]},
-        "hebrews": {"code": 79, "abbrev": ["heb", "he"]},
-        "james": {"code": 80, "abbrev": ["jas", "jam", "jm"]},
-        "1 peter": {"code": 81, "abbrev": ["1pe", "1pet", "1pt", "1 pet", "1 pe"]},
-        "2 peter": {"code": 82, "abbrev": ["2pe", "2pet", "2pt", "2 pet", "2 pe"]},
-        "1 john": {"code": 83, "abbrev": ["1jn", "1jo", "1j", "1 joh", "1 john"]},
-        "2 john": {"code": 84, "abbrev": ["2jn", "2jo", "2j", "2 joh", "2 john"]},
-        "3 john": {"code": 85, "abbrev": ["3jn", "3jo", "3j", "3 joh", "3 john"]},
-        "jude": {"code": 86, "abbrev": ["jud", "jd"]},
-        "revelation": {"code": 87, "abbrev": ["re", "rev", "rv"]},
-    }
+    # Bible book mapping (shared with gospel_parser_interlinear.py)
+    BIBLE_BOOKS = BIBLE_BOOKS
 
     # Reverse lookup: code to book name
-    CODE_TO_BOOK = {info["code"]: name.title() for name, info in BIBLE_BOOKS.items()}
+    CODE_TO_BOOK = CODE_TO_BOOK
 
     def __init__(self):
-        """Initialize ChromaDB connection (singleton pattern)"""
+        """Load the verse store (singleton pattern)"""
         self.chroma_client = None
         self.collection = None
-        self.web_bible_cache = {}  # Cache for WEB Bible JSON
-        self._initialize_db()
+        self.corpus = self._open_corpus()
+        self.morphology = MorphologyColumns(self.corpus) if self.corpus is not None else None
+        self._morph_index = None  # bitmap indexes, built on the first morphology search
+        self._phrase_index = None  # n-gram indexes, built on the first phrase search
+        self._collocations = None  # verse x lemma matrix, built on the first collocation query
+        self._similarity = None  # neighbour table, loaded on the first similar-verses lookup
+        self.verse_store = self._load_verse_store()
+        self.english_index = self._load_english_index()
+        # Versions every cached verse response (ETag); changes only with the data
+        self.dataset_version = dataset_version(
+            self.verse_store.fingerprint(), self.english_index.fingerprint()
+        )
+
+    def _open_corpus(self) -> Optional[Corpus]:
+        """
+        Open the binary corpus (SBLGNT tokens with full morphology, plus the
+        Swete LXX text when its submodule is checked out).
+
+        Maps the file built by build_corpus.py when present; otherwise
+        compiles it once in memory from the SBLGNT morphgnt and LXX files.
+
+        Returns:
+            Open Corpus, or None if no SBLGNT data is available
+        """
+        try:
+            corpus = Corpus.load(
+                settings.CORPUS_PATH, settings.SBLGNT_PATH, self.CODE_TO_BOOK, settings.LXX_PATH
+            )
+        except (OSError, ValueError) as e:
+            print(f"⚠ Could not open corpus at {settings.CORPUS_PATH}: {e}")
+            return None
+
+        if not corpus.n_tokens:
+            corpus.close()
+            return None
+
+        print(f"✓ Opened corpus ({corpus.n_tokens} tokens, {corpus.n_verses} verses from {corpus.path})")
+        return corpus
+
+    def _load_english_index(self) -> EnglishIndex:
+        """
+        Load the WEB English index, keyed like the verse store.
+
+        Maps the prebuilt index from build_corpus.py when present; otherwise
+        compiles it once from the WEB JSON files, so no request ever pays
+        for reading a book's JSON.
+        """
+        try:
+            english_index = EnglishIndex.load(settings.ENGLISH_INDEX_PATH, settings.WEB_BIBLE_PATH)
+        except (OSError, ValueError) as e:
+            print(f"⚠ Could not load WEB English index: {e}")
+            return EnglishIndex.from_web_json("")
+
+        if not len(english_index):
+            print(f"⚠ WEB Bible not found at: {settings.WEB_BIBLE_PATH}")
+        return english_index
+
+    def _load_verse_store(self) -> VerseStore:
+        """
+        Load all verses into a VerseStore.
+
+        Built from the corpus (prebuilt file or SBLGNT). If neither is
+        available, falls back to a single bulk read of the ChromaDB
+        collection.
+        """
+        if self.corpus is not None:
+            store = VerseStore.from_corpus(self.corpus, self.CODE_TO_BOOK)
+            print(f"✓ Loaded verse store ({len(store)} verses from corpus)")
+            return store
+
+        store = VerseStore()
+        try:
+            store = VerseStore.from_collection(self.get_collection())
+            print(f"✓ Loaded verse store ({len(store)} verses from ChromaDB)")
+        except Exception as e:
+            print(f"⚠ Verse store is empty: {e}")
+            print(f"   Make sure SBLGNT exists at: {settings.SBLGNT_PATH}")
+        return store
+
+    def get_collection(self):
+        """Get the ChromaDB collection, connecting on first use (semantic search only)"""
+        if self.collection is None:
+            self._initialize_db()
+        return self.collection
 
     def _initialize_db(self):
         """Initialize ChromaDB client and collection"""
@@ -92,51 +160,22 @@ class VerseService:
 
         Returns: dict or list of dicts with verse info, or None if invalid
         """
-        import re
-
-        ref_string = ref_string.strip().lower()
-
-        # Pattern: (optional number + space) + book name + chapter:verse(-verse)?
-        pattern = r'^(\d+\s+)?([a-z]+)\s+(\d+):(\d+)(?:-(\d+))?$'
-        match = re.match(pattern, ref_string)
-
-        if not match:
-            return None
+        return parse_verse_reference(ref_string)
 
-        num_prefix, book_name, chapter, start_verse, end_verse = match.groups()
-
-        # Build full book name
-        full_book_name = f"{num_prefix.strip()} {book_name}" if num_prefix else book_name
-        full_book_name = full_book_name.strip()
+    def parse_references(self, ref_string: str) -> Optional[tuple[VerseSpan, ...]]:
+        """
+        Parse a (possibly compound) reference into verse spans.
 
-        # Find book code
-        book_code = None
-        for book, info in self.BIBLE_BOOKS.items():
-            if book == full_book_name or full_book_name in info["abbrev"]:
-                book_code = info["code"]
-                break
+        Handles 'John 3:16', 'John 3:16-4:2', 'John 3' and
+        'John 3:16-4:2; Rom 5:8, 12'. Results are cached by normalised input.
 
-        if not book_code:
-            return None
-
-        chapter = int(chapter)
-        start_verse = int(start_verse)
+        Returns: Tuple of VerseSpan, or None if invalid
+        """
+        return parse_references(ref_string)
 
-        # Handle verse range
-        if end_verse:
-            end_verse = int(end_verse)
-            return [
-                {"book": book_code, "book_name": self.CODE_TO_BOOK[book_code],
-                 "chapter": chapter, "verse": v}
-                for v in range(start_verse, end_verse + 1)
-            ]
-        else:
-            return {
-                "book": book_code,
-                "book_name": self.CODE_TO_BOOK[book_code],
-                "chapter": chapter,
-                "verse": start_verse
-            }
+    def format_references(self, spans) -> str:
+        """Format parsed spans as a canonical reference, e.g. 'John 3:16-4:2; Romans 5:8'"""
+        return format_references(spans)
 
     def format_reference_id(self, book: int, chapter: int, verse: int) -> str:
         """Formats a reference ID like '64-03-16' for John 3:16"""
@@ -144,7 +183,7 @@ class VerseService:
 
     def get_english_text(self, book: int, chapter: int, verse: int) -> str:
         """
-        Get English text from WEB Bible JSON files.
+        Get English text from the WEB English index.
 
         Args:
             book: SBLGNT book code (61-87)
@@ -154,56 +193,23 @@ class VerseService:
         Returns:
             English text or empty string if not found
         """
-        # Map SBLGNT codes (61-87) to WEB codes (40-66)
-        # SBLGNT NT: 61-87, WEB NT: 40-66
-        web_book_code = book - 21  # 61 → 40, 64 → 43, etc.
-
-        # Load WEB Bible JSON if not cached
-        if web_book_code not in self.web_bible_cache:
-            web_bible_path = Path(settings.WEB_BIBLE_PATH)
-
-            try:
-                import glob
-                import json
-
-                # Find JSON file for this book
-                files = glob.glob(str(web_bible_path / f"{web_book_code}-*.json"))
-                if files:
-                    with open(files[0], 'r', encoding='utf-8') as f:
-                        data = json.load(f)
-                        # Build verse lookup dict: (chapter, verse) -> text
-                        verse_dict = {}
-                        for item in data:
-                            if item.get('type') == 'paragraph text':
-                                ch = item.get('chapterNumber')
-                                vs = item.get('verseNumber')
-                                text = item.get('value', '').strip()
-                                if ch and vs and text:
-                                    verse_dict[(ch, vs)] = text
-                        self.web_bible_cache[web_book_code] = verse_dict
-                else:
-                    print(f"⚠ WEB Bible JSON not found for book {web_book_code}")
-                    self.web_bible_cache[web_book_code] = {}
-                    return ""
-            except Exception as e:
-                print(f"⚠ Error loading WEB Bible JSON: {e}")
-                self.web_bible_cache[web_book_code] = {}
-                return ""
-
-        # Look up verse from cache
-        verse_dict = self.web_bible_cache.get(web_book_code, {})
-        return verse_dict.get((chapter, verse), "")
-
-        # Look up verse
-        book_data = self.web_bible_cache.get(web_book_code, {})
-        chapters = book_data.get('chapters', [])
-
-        if chapter <= len(chapters):
-            chapter_data = chapters[chapter - 1]
-            if verse <= len(chapter_data):
-                return chapter_data[verse - 1]
-
-        return ""
+        return self.english_index.get(pack_key(book, chapter, verse))
+
+    def _verse_metadata(self, row: int) -> dict:
+        """Build the verse metadata dict for a verse store row"""
+        key = self.verse_store.keys[row]
+        book, chapter, verse = unpack_key(key)
+
+        return {
+            "source": "SBLGNT" if book >= FIRST_NT_BOOK else "LXX (Swete)",
+            "book": self.CODE_TO_BOOK[book],
+            "chapter": chapter,
+            "verse": verse,
+            "reference": self.verse_store.reference_at(row),
+            "reference_id": self.format_reference_id(book, chapter, verse),
+            "english_text": self.english_index.get_parallel(key),
+            "type": "verse"
+        }
 
     def lookup_verse(self, verse_ref: dict) -> Optional[tuple[str, dict]]:
         """
@@ -215,43 +221,456 @@ class VerseService:
         Returns:
             Tuple of (text, metadata) or (None, None) if not found
         """
-        ref_id = self.format_reference_id(
-            verse_ref['book'],
-            verse_ref['chapter'],
-            verse_ref['verse']
-        )
+        book = verse_ref['book']
+        row = self.verse_store.row_of(pack_key(book, verse_ref['chapter'], verse_ref['verse']))
+        if row is None:
+            return None, None
 
-        try:
-            results = self.collection.get(where={"reference_id": ref_id})
+        # Add English text from WEB Bible
+        metadata = self._verse_metadata(row)
+        return self.verse_store.text_at(row), metadata
 
-            if results['documents']:
-                metadata = results['metadatas'][0]
+    def lookup_range(self, book: int, chapter: int, start: int, end: int) -> list[tuple[str, dict]]:
+        """
+        Look up a verse range in one operation.
+
+        Args:
+            book: SBLGNT book code
+            chapter: Chapter number
+            start: First verse number
+            end: Last verse number (inclusive)
+
+        Returns:
+            List of (text, metadata) tuples in verse order (missing verses are skipped)
+        """
+        return self.lookup_spans([VerseSpan(book, chapter, start, chapter, end)])
+
+    def lookup_spans(self, spans) -> list[tuple[str, dict]]:
+        """
+        Look up every verse of parsed reference spans in one batch.
+
+        Each span (including one that crosses chapters) is a contiguous
+        slice of the sorted verse store, and the English text of each book
+        is fetched once and joined in bulk.
+
+        Args:
+            spans: VerseSpan sequence from parse_references
+
+        Returns:
+            List of (text, metadata) tuples in query order; verses repeated
+            across spans are returned once
+        """
+        verses = []
+        seen_rows = set()
+
+        for span in spans:
+            for row in self.verse_store.span(span.start_key, span.end_key):
+                if row in seen_rows:
+                    continue
+                seen_rows.add(row)
+                verses.append((self.verse_store.text_at(row), self._verse_metadata(row)))
+
+        return verses
+
+    def lookup_words(self, spans, lexicon_service) -> list[dict]:
+        """
+        Get every token of parsed reference spans with its morphology.
+
+        Each span is one slice of the columnar morphology arrays; Strong's
+        numbers come from a lemma -> Strong's table built once per lexicon
+        version.
 
-                # Add English text from WEB Bible
-                english_text = self.get_english_text(
-                    verse_ref['book'],
-                    verse_ref['chapter'],
-                    verse_ref['verse']
+        Args:
+            spans: VerseSpan sequence from parse_references
+            lexicon_service: LexiconService used to resolve lemmas
+
+        Returns:
+            List of word dicts in query order (see MorphologyColumns.decode),
+            each with 'reference' and 'reference_id'; verses repeated across
+            spans are returned once
+        """
+        if self.morphology is None:
+            return []
+
+        strongs = self.morphology.strongs_table(
+            lexicon_service.dataset_version, lexicon_service.strongs_for_lemma
+        )
+
+        words = []
+        seen_keys = set()
+
+        for span in spans:
+            start, stop = self.morphology.token_range(span.start_key, span.end_key)
+            span_words = [
+                word for word in self.morphology.decode(start, stop, strongs)
+                if word["key"] not in seen_keys
+            ]
+            seen_keys.update(word["key"] for word in span_words)
+            words.extend(span_words)
+
+        return self._add_word_references(words)
+
+    def _add_word_references(self, words: list[dict]) -> list[dict]:
+        """Replace the packed 'key' of decoded words with 'reference' and 'reference_id'"""
+        references = {}
+        for word in words:
+            key = word.pop("key")
+            if key not in references:
+                book, chapter, verse = unpack_key(key)
+                references[key] = (
+                    f"{self.CODE_TO_BOOK[book]} {chapter}:{verse}",
+                    self.format_reference_id(book, chapter, verse),
                 )
-                metadata['english_text'] = english_text
+            word["reference"], word["reference_id"] = references[key]
+        return words
+
+    def _lemma_ids(self, lemmas: list[str], strongs: list[str], strongs_table) -> list[int]:
+        """Corpus string ids of the given exact lemmas and of every lemma of the given Strong's numbers"""
+        lemma_ids = [self.corpus.string_id(lemma) for lemma in lemmas]
+        lemma_ids = [lemma_id for lemma_id in lemma_ids if lemma_id is not None]
+        for number in strongs:
+            number = number.strip().upper()
+            number = number if number.startswith("G") else f"G{number}"
+            lemma_ids.extend(np.flatnonzero(strongs_table == number).tolist())
+        return list(dict.fromkeys(lemma_ids))
+
+    def _book_ranges(self, books: Optional[list[int]]) -> Optional[list[tuple[int, int]]]:
+        """Inclusive packed key range of each book, or None for no book filter"""
+        if not books:
+            return None
+        return [(pack_key(book, 0, 0), pack_key(book + 1, 0, 0) - 1) for book in books]
+
+    def search_morph(
+        self,
+        features: dict[str, list[str]],
+        lexicon_service,
+        lemmas: Optional[list[str]] = None,
+        strongs: Optional[list[str]] = None,
+        books: Optional[list[int]] = None,
+        offset: int = 0,
+        limit: int = 50,
+    ) -> tuple[int, list[dict]]:
+        """
+        Morphological search over every token of the corpus.
 
-                return results['documents'][0], metadata
-            return None, None
-        except Exception as e:
-            print(f"Error looking up verse {ref_id}: {e}")
-            return None, None
+        Values of one filter are ORed, filters are ANDed, e.g. tense=aorist,
+        voice=passive, mood=participle, lemmas=['λέγω'], books=[64].
+        Answered from the bitmap indexes (MorphIndex); only the requested
+        page of hits is decoded.
+
+        Args:
+            features: Morphology feature -> accepted labels or codes
+                (pos, person, tense, voice, mood, case, number, gender, degree)
+            lexicon_service: LexiconService for Strong's numbers
+            lemmas: Accepted lemmas (exact SBLGNT lemma)
+            strongs: Accepted Strong's numbers (e.g. 'G3004')
+            books: Accepted SBLGNT book codes
+            offset: Number of hits to skip
+            limit: Maximum number of hits to return
+
+        Returns:
+            Tuple of (total hit count, word dicts for the page in corpus order)
+
+        Raises:
+            ValueError: If a feature or value is unknown
+        """
+        if self.morphology is None:
+            return 0, []
+
+        if self._morph_index is None:
+            self._morph_index = MorphIndex(self.morphology)
+
+        strongs_table = self.morphology.strongs_table(
+            lexicon_service.dataset_version, lexicon_service.strongs_for_lemma
+        )
+
+        lemma_ids = None
+        if lemmas or strongs:
+            lemma_ids = self._lemma_ids(lemmas or [], strongs or [], strongs_table)
+
+        hits = self._morph_index.query(features, lemma_ids, self._book_ranges(books))
+        page = self.morphology.decode_tokens(hits[offset:offset + limit], strongs_table)
+        return len(hits), self._add_word_references(page)
+
+    def concordance(
+        self,
+        query: str,
+        lexicon_service,
+        books: Optional[list[int]] = None,
+        context: int = 5,
+        offset: int = 0,
+        limit: int = 50,
+    ) -> Optional[dict]:
+        """
+        Every occurrence of a lemma or Strong's number, with context (KWIC).
+
+        Occurrences come from the inverted lemma index, so the cost is the
+        number of hits, not the size of the corpus. A lemma that is not in
+        the corpus as spelled (e.g. without accents) is resolved through
+        the lexicon to its Strong's number.
+
+        Args:
+            query: Lemma (e.g. 'λόγος') or Strong's number (e.g. 'G3056', '3056')
+            lexicon_service: LexiconService for Strong's numbers
+            books: Optional SBLGNT book codes to restrict to
+            context: Words of context on each side
+            offset: Number of occurrences to skip
+            limit: Maximum number of occurrences to return
+
+        Returns:
+            Dict with 'lemmas', 'strongs', 'total', 'books' (occurrences per
+            book name) and 'lines' (word dicts with 'left' and 'right'
+            context), or None if nothing matches
+        """
+        if self.morphology is None:
+            return None
+
+        strongs_table = self.morphology.strongs_table(
+            lexicon_service.dataset_version, lexicon_service.strongs_for_lemma
+        )
+
+        query = query.strip()
+        if query.upper().lstrip("G").isdigit():
+            lemma_ids = self._lemma_ids([], [query], strongs_table)
+        else:
+            lemma_ids = self._lemma_ids([query], [], strongs_table)
+            if not lemma_ids:
+                strongs = lexicon_service.strongs_for_lemma(query)
+                lemma_ids = self._lemma_ids([], [strongs], strongs_table) if strongs else []
+
+        hits = self.morphology.occurrences(lemma_ids)
+        ranges = self._book_ranges(books)
+        if ranges is not None:
+            keys = self.morphology.keys[hits]
+            in_books = np.zeros(len(hits), dtype=bool)
+            for start_key, end_key in ranges:
+                in_books |= (keys >= start_key) & (keys <= end_key)
+            hits = hits[in_books]
+
+        if not len(hits):
+            return None
+
+        book_codes, counts = np.unique(self.morphology.keys[hits] // BOOK_STRIDE, return_counts=True)
+
+        page = hits[offset:offset + limit]
+        lines = self.morphology.decode_tokens(page, strongs_table)
+        left, right = self.morphology.context(page, context)
+        for line, before, after in zip(lines, left, right):
+            line["left"], line["right"] = before, after
+
+        return {
+            "lemmas": [self.corpus.string(lemma_id) for lemma_id in lemma_ids],
+            "strongs": sorted({strongs_table[lemma_id] for lemma_id in lemma_ids} - {None}),
+            "total": len(hits),
+            "books": {self.CODE_TO_BOOK[code]: count for code, count in zip(book_codes.tolist(), counts.tolist())},
+            "lines": self._add_word_references(lines),
+        }
+
+    def phrase_search(
+        self,
+        phrase: str,
+        accent_sensitive: bool = False,
+        offset: int = 0,
+        limit: int = 20,
+    ) -> tuple[int, int, list[tuple[str, dict, list[tuple[int, int]]]]]:
+        """
+        Find a Greek phrase in the SBLGNT (exact or accent-insensitive).
+
+        Served from the positional n-gram index (PhraseIndex) over the
+        normalised word column; verse text is never scanned.
+
+        Args:
+            phrase: Greek words, e.g. 'εν αρχη ην'
+            accent_sensitive: Match accents exactly instead of ignoring them
+            offset: Number of matching verses to skip
+            limit: Maximum number of verses to return
+
+        Returns:
+            Tuple of (match count, verse count, page of (text, metadata,
+            highlights)) where highlights are [start, end) character offsets
+            of each match in the verse text
+        """
+        if self.morphology is None:
+            return 0, 0, []
+
+        if self._phrase_index is None:
+            self._phrase_index = PhraseIndex(self.morphology)
+
+        positions, length = self._phrase_index.search(phrase, accent_sensitive)
+        if not len(positions):
+            return 0, 0, []
+
+        verse_keys, first_match = np.unique(self.morphology.keys[positions], return_index=True)
+        page_ends = np.append(first_match, len(positions))
+
+        verses = []
+        for i in range(offset, min(offset + limit, len(verse_keys))):
+            row = self.verse_store.row_of(int(verse_keys[i]))
+            if row is None:
+                continue
+            highlights = [
+                self._phrase_index.highlight(position, length)
+                for position in positions[page_ends[i]:page_ends[i + 1]].tolist()
+            ]
+            verses.append((self.verse_store.text_at(row), self._verse_metadata(row), highlights))
+
+        return len(positions), len(verse_keys), verses
+
+    def collocates(
+        self,
+        strongs: str,
+        lexicon_service,
+        measure: str = "log_likelihood",
+        min_count: int = 2,
+        limit: int = 20,
+    ) -> Optional[dict]:
+        """
+        Lemmas that occur in the same verses as a Strong's number more often than chance.
+
+        Scored from the sparse verse x lemma matrix (CollocationIndex);
+        results are cached per lemma there.
+
+        Args:
+            strongs: Strong's number (e.g. 'G26' or '26')
+            lexicon_service: LexiconService for Strong's numbers
+            measure: 'log_likelihood' or 'pmi' (sort order)
+            min_count: Minimum number of shared verses
+            limit: Maximum number of collocates
+
+        Returns:
+            Dict with 'strongs', 'lemmas', 'frequency' (verses containing
+            the target), 'total_verses' and 'collocates' (dicts with lemma,
+            strongs, count, frequency, pmi, log_likelihood), or None if the
+            Strong's number does not occur in the corpus
+
+        Raises:
+            ValueError: If the measure is unknown
+        """
+        if self.morphology is None:
+            return None
+
+        if self._collocations is None:
+            self._collocations = CollocationIndex(self.morphology)
+
+        strongs_table = self.morphology.strongs_table(
+            lexicon_service.dataset_version, lexicon_service.strongs_for_lemma
+        )
+        lemma_ids = self._lemma_ids([], [strongs], strongs_table)
+        if not lemma_ids:
+            return None
+
+        collocates = self._collocations.collocates(lemma_ids, measure, min_count, limit)
+        return {
+            "strongs": strongs_table[lemma_ids[0]],
+            "lemmas": [self.corpus.string(lemma_id) for lemma_id in lemma_ids],
+            "frequency": len(self._collocations.verses_of(lemma_ids)),
+            "total_verses": self._collocations.n_verses,
+            "collocates": [
+                {
+                    "lemma": self.corpus.string(collocate.lemma_id),
+                    "strongs": strongs_table[collocate.lemma_id],
+                    "count": collocate.count,
+                    "frequency": collocate.frequency,
+                    "pmi": round(collocate.pmi, 4),
+                    "log_likelihood": round(collocate.log_likelihood, 4),
+                }
+                for collocate in collocates
+            ],
+        }
+
+    def similar_verses(self, book: int, chapter: int, verse: int, limit: int = 10) -> Optional[list[tuple[str, dict, float]]]:
+        """
+        Verses most similar to a verse by shared lemmas (TF-IDF cosine).
+
+        Read from the precomputed neighbour table (corpus_data/sblgnt.similar,
+        built by build_corpus.py); without it the table is computed in
+        memory on first use. No embedding model is needed.
+
+        Args:
+            book: SBLGNT book code
+            chapter: Chapter number
+            verse: Verse number
+            limit: Maximum number of verses
+
+        Returns:
+            List of (text, metadata, similarity), most similar first, or
+            None if the verse does not exist
+        """
+        if self.morphology is None:
+            return None
+
+        if self._similarity is None:
+            self._similarity = SimilarityTable.load(settings.SIMILARITY_PATH, self.morphology)
+
+        neighbours = self._similarity.similar(pack_key(book, chapter, verse), limit)
+        if neighbours is None:
+            return None
+
+        verses = []
+        for key, score in neighbours:
+            row = self.verse_store.row_of(key)
+            if row is not None:
+                verses.append((self.verse_store.text_at(row), self._verse_metadata(row), score))
+        return verses
+
+    def lookup_chapter(self, book: int, chapter: int) -> list[tuple[str, dict]]:
+        """
+        Look up every verse of a chapter.
+
+        Args:
+            book: SBLGNT book code
+            chapter: Chapter number
+
+        Returns:
+            List of (text, metadata) tuples in verse order
+        """
+        return self.lookup_range(book, chapter, 1, CHAPTER_STRIDE - 1)
+
+    def iter_book(self, book: int) -> Iterator[tuple[str, dict]]:
+        """
+        Lazily yield every verse of a book in order.
+
+        Only one verse is materialized at a time, so callers can stream a
+        whole book without building the full response in memory.
+
+        Args:
+            book: SBLGNT book code
+
+        Yields:
+            (text, metadata) tuples in verse order
+        """
+        rows = self.verse_store.span(pack_key(book, 0, 0), pack_key(book + 1, 0, 0) - 1)
+
+        for row in rows:
+            yield self.verse_store.text_at(row), self._verse_metadata(row)
+
+    def resolve_book(self, book: str) -> Optional[int]:
+        """
+        Resolve a book name, abbreviation or numeric code to a book code.
+
+        Args:
+            book: e.g. 'John', 'jn' or '64'
+
+        Returns:
+            SBLGNT book code or None if unknown
+        """
+        return resolve_book(book)
 
     def get_all_books(self) -> list[dict]:
         """
-        Get list of all Bible books.
+        Get the books that have verses loaded (the NT, plus the LXX books
+        when the Septuagint is loaded).
 
         Returns:
             List of dicts with book info (name, code, abbreviations)
         """
+        loaded = set(self.verse_store.book_codes())
         books = []
         for name, info in sorted(self.BIBLE_BOOKS.items(), key=lambda x: x[1]["code"]):
+            if info["code"] not in loaded:
+                continue
             books.append({
-                "name": name.title(),
+                "name": self.CODE_TO_BOOK[info["code"]],
                 "code": info["code"],
                 "abbreviations": info["abbrev"]
             })
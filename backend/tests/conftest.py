@@ -4,14 +4,18 @@ Pytest Configuration and Fixtures
 Shared test fixtures for backend tests.
 """
 import pytest
+from pathlib import Path
 from fastapi.testclient import TestClient
 from sqlalchemy import create_engine
 from sqlalchemy.orm import sessionmaker
 from sqlalchemy.pool import StaticPool
 
 from main import app
+from config import settings
 from database import Base, get_db
 from services.auth_service import AuthService
+from services.verse_service import VerseService, get_verse_service
+from services.lexicon_service import LexiconService, get_lexicon_service
 
 
 # Create in-memory SQLite database for testing
@@ -80,3 +84,51 @@ def auth_token(test_user):
 def auth_headers(auth_token):
     """Get authorization headers with token"""
     return {"Authorization": f"Bearer {auth_token}"}
+
+
+FIXTURES_DIR = Path(__file__).parent / "fixtures"
+
+
+@pytest.fixture
+def lxx_path(tmp_path):
+    """LXX directory read by verse_service (none by default; see test_septuagint.py)"""
+    return str(tmp_path / "missing-lxx")
+
+
+@pytest.fixture
+def verse_service(monkeypatch, tmp_path, lxx_path):
+    """VerseService loaded from the small SBLGNT/WEB fixtures in tests/fixtures"""
+    monkeypatch.setattr(settings, "SBLGNT_PATH", str(FIXTURES_DIR / "sblgnt"))
+    monkeypatch.setattr(settings, "LXX_PATH", lxx_path)
+    monkeypatch.setattr(settings, "WEB_BIBLE_PATH", str(FIXTURES_DIR / "web_bible_json"))
+    monkeypatch.setattr(settings, "CHROMA_DB_PATH", str(tmp_path / "chroma"))
+    monkeypatch.setattr(settings, "CORPUS_PATH", str(tmp_path / "missing.corpus"))
+    monkeypatch.setattr(settings, "ENGLISH_INDEX_PATH", str(tmp_path / "missing.idx"))
+    monkeypatch.setattr(settings, "SIMILARITY_PATH", str(tmp_path / "missing.similar"))
+
+    service = VerseService()
+    app.dependency_overrides[get_verse_service] = lambda: service
+    yield service
+    app.dependency_overrides.pop(get_verse_service, None)
+
+
+@pytest.fixture
+def corpus_path(tmp_path):
+    """Binary corpus compiled from the SBLGNT fixtures"""
+    from corpus import build_corpus
+
+    path = tmp_path / "sblgnt.corpus"
+    build_corpus(str(FIXTURES_DIR / "sblgnt"), str(path), VerseService.CODE_TO_BOOK)
+    return str(path)
+
+
+@pytest.fixture
+def lexicon_service(monkeypatch, tmp_path):
+    """LexiconService loaded from tests/fixtures/enhanced_lexicon.json"""
+    monkeypatch.setattr(settings, "ENHANCED_LEXICON_PATH", str(FIXTURES_DIR / "enhanced_lexicon.json"))
+    monkeypatch.setattr(settings, "LEXICON_STORE_PATH", str(tmp_path / "enhanced_lexicon.lex"))
+
+    service = LexiconService()
+    app.dependency_overrides[get_lexicon_service] = lambda: service
+    yield service
+    app.dependency_overrides.pop(get_lexicon_service, None)
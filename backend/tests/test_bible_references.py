@@ -0,0 +1,57 @@
+"""
+Reference Parser Tests
+======================
+Tests for the shared verse reference parser.
+"""
+import pytest
+
+from bible_references import (
+    VerseSpan, format_references, parse_references, parse_verse_reference, resolve_book
+)
+
+
+@pytest.mark.parametrize("reference,expected", [
+    ("John 3:16", "John 3:16"),
+    ("  john   3:16-18 ", "John 3:16-18"),
+    ("John 3:16-4:2", "John 3:16-4:2"),
+    ("John 3", "John 3"),
+    ("1jn 2:1", "1 John 2:1"),
+    ("Rom. 5:8", "Romans 5:8"),
+    ("John 3:16-4:2; Rom 5:8, 12", "John 3:16-4:2; Romans 5:8; Romans 5:12"),
+    ("John 3:16; 4:2", "John 3:16; John 4:2"),
+])
+def test_parse_references(reference, expected):
+    """Test single, range, cross-chapter and compound references"""
+    assert format_references(parse_references(reference)) == expected
+
+
+@pytest.mark.parametrize("reference", ["", "John", "Foo 1:1", "John 3:18-16", "1 3:16", "John 3:16; Foo 1:1"])
+def test_parse_references_invalid(reference):
+    """Test invalid references return None"""
+    assert parse_references(reference) is None
+
+
+def test_cross_chapter_span_keys():
+    """Test cross-chapter spans carry packed start/end keys"""
+    (span,) = parse_references("John 3:16-4:2")
+
+    assert span == VerseSpan(64, 3, 16, 4, 2)
+    assert (span.start_key, span.end_key) == (64003016, 64004002)
+
+
+def test_parse_verse_reference_compat():
+    """Test the legacy dict / list-of-dicts interface"""
+    assert parse_verse_reference("John 3:16") == {
+        "book": 64, "book_name": "John", "chapter": 3, "verse": 16
+    }
+    assert [v["verse"] for v in parse_verse_reference("John 3:16-18")] == [16, 17, 18]
+    assert parse_verse_reference("John 3:16; Rom 5:8") is None
+
+
+def test_resolve_book():
+    """Test book names, abbreviations and codes resolve through the alias table"""
+    assert resolve_book("John") == 64
+    assert resolve_book("1 Jn") == 83
+    assert resolve_book("1john") == 83
+    assert resolve_book("64") == 64
+    assert resolve_book("Nowhere") is None
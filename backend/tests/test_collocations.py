@@ -0,0 +1,87 @@
+"""
+Collocation Tests
+=================
+Tests for the sparse verse x lemma co-occurrence matrix, its PMI and
+log-likelihood scores and the collocates endpoint.
+"""
+import math
+
+import numpy as np
+import pytest
+
+from collocations import CollocationIndex, log_likelihood
+from corpus import Corpus
+from morphology import MorphologyColumns
+
+
+def test_counts_match_verse_sets(corpus_path):
+    """Test co-occurrence counts equal the number of verses shared by two lemmas"""
+    with Corpus(corpus_path) as corpus:
+        index = CollocationIndex(MorphologyColumns(corpus))
+        verses = {}
+        for token in corpus.iter_tokens():
+            verses.setdefault(token.lemma_id, set()).add(token.key)
+        n = len({key for keys in verses.values() for key in keys})
+        assert index.n_verses == n
+
+        target = corpus.string_id("θεός")
+        collocates = index.collocates([target], min_count=1, limit=1000)
+        assert {c.lemma_id for c in collocates} == {
+            lemma_id for lemma_id, keys in verses.items()
+            if lemma_id != target and keys & verses[target]
+        }
+
+        for c in collocates:
+            shared = len(verses[c.lemma_id] & verses[target])
+            assert (c.count, c.frequency) == (shared, len(verses[c.lemma_id]))
+            assert c.pmi == pytest.approx(math.log2(shared * n / (len(verses[target]) * c.frequency)))
+
+
+def test_log_likelihood_matches_contingency_table():
+    """Test the vectorised G² against the 2x2 table formula"""
+    a, f_target, f_other, n = 10, 40, 30, 1000
+    table = [a, f_target - a, f_other - a, n - f_target - f_other + a]
+    rows = [f_target, n - f_target]
+    cols = [f_other, n - f_other]
+    expected = 2 * sum(
+        k * math.log(k / (rows[i // 2] * cols[i % 2] / n)) for i, k in enumerate(table) if k
+    )
+    assert log_likelihood(np.array([a]), f_target, np.array([f_other]), n)[0] == pytest.approx(expected)
+
+
+def test_collocates_ranking_and_cache(verse_service):
+    """Test results are sorted by the measure, filtered by min_count and cached"""
+    index = CollocationIndex(verse_service.morphology)
+    target = [verse_service.corpus.string_id("θεός")]
+
+    by_llr = index.collocates(target, min_count=1, limit=50)
+    assert [c.log_likelihood for c in by_llr] == sorted((c.log_likelihood for c in by_llr), reverse=True)
+    by_pmi = index.collocates(target, measure="pmi", min_count=2, limit=50)
+    assert all(c.count >= 2 for c in by_pmi)
+    assert [c.pmi for c in by_pmi] == sorted((c.pmi for c in by_pmi), reverse=True)
+    assert len(index._cache) == 1
+
+    with pytest.raises(ValueError):
+        index.collocates(target, measure="bogus")
+
+
+def test_collocates_endpoint(client, verse_service, lexicon_service):
+    """Test /api/lexicon/strongs/{n}/collocates"""
+    response = client.get("/api/lexicon/strongs/G2316/collocates", params={"min_count": 1, "limit": 5})
+    assert response.status_code == 200
+    data = response.json()
+    assert data["strongs"] == "G2316"
+    assert data["lemmas"] == ["θεός"]
+    assert data["total_verses"] == 6
+    assert len(data["results"]) == 5
+    assert all(r["lemma"] != "θεός" for r in data["results"])
+
+    etag = response.headers["etag"]
+    assert client.get(
+        "/api/lexicon/strongs/G2316/collocates", params={"min_count": 1, "limit": 5},
+        headers={"If-None-Match": etag}
+    ).status_code == 304
+
+    assert client.get("/api/lexicon/strongs/2316/collocates").json()["strongs"] == "G2316"
+    assert client.get("/api/lexicon/strongs/G26/collocates").status_code == 404
+    assert client.get("/api/lexicon/strongs/G2316/collocates", params={"measure": "bogus"}).status_code == 400
@@ -0,0 +1,156 @@
+"""
+Corpus Tests
+============
+Tests for the memory-mapped binary corpus built from the morphgnt files.
+"""
+import os
+import shutil
+
+import pytest
+
+from bible_references import parse_references
+from config import settings
+from corpus import Corpus, build_corpus
+from services.verse_service import VerseService
+from verse_store import pack_key
+
+from .conftest import FIXTURES_DIR
+
+
+def test_corpus_counts(corpus_path):
+    """Test token and verse counts match the fixtures"""
+    with Corpus(corpus_path) as corpus:
+        assert len(corpus) == 91
+        assert corpus.n_verses == 6
+        assert list(corpus.verse_keys) == sorted(corpus.verse_keys)
+
+
+def test_corpus_token_records(corpus_path):
+    """Test token records keep reference, morphology, form and lemma"""
+    with Corpus(corpus_path) as corpus:
+        verse = corpus.find_verse(pack_key(64, 1, 1))
+        first = corpus.token(corpus.verse_tokens(verse)[0])
+
+        assert first.key == 64001001
+        assert first.pos == "P-"
+        assert first.parse == "--------"
+        assert corpus.string(first.form_id) == "Ἐν"
+        assert corpus.string(first.lemma_id) == "ἐν"
+
+        verb = corpus.token(corpus.verse_tokens(verse)[2])
+        assert (verb.pos, verb.parse) == ("V-", "3IAI-S--")
+        assert corpus.string(verb.lemma_id) == "εἰμί"
+        assert corpus.string_id("εἰμί") == verb.lemma_id
+
+
+def test_corpus_verse_words(corpus_path):
+    """Test verse text round-trips with punctuation"""
+    with Corpus(corpus_path) as corpus:
+        verse = corpus.find_verse(pack_key(64, 1, 1))
+        assert " ".join(corpus.verse_words(verse)).endswith("θεὸς ἦν ὁ λόγος.")
+        assert corpus.find_verse(pack_key(64, 2, 1)) is None
+
+
+def test_corpus_rejects_other_files(tmp_path):
+    """Test opening a file that is not a corpus raises ValueError"""
+    path = tmp_path / "bogus.corpus"
+    path.write_bytes(b"NOPE" + bytes(64))
+
+    with pytest.raises(ValueError):
+        Corpus(str(path))
+
+
+def test_load_ignores_stale_corpus(tmp_path):
+    """Test a corpus compiled before a morphgnt file changed is not used"""
+    gnt_path = tmp_path / "sblgnt"
+    shutil.copytree(FIXTURES_DIR / "sblgnt", gnt_path)
+    corpus_path = str(tmp_path / "sblgnt.corpus")
+    build_corpus(str(gnt_path), corpus_path, VerseService.CODE_TO_BOOK)
+
+    # Touched but unchanged: the mapped file is still used
+    john_path = gnt_path / "64-Jn-morphgnt.txt"
+    os.utime(john_path, ns=(0, 0))
+    with Corpus.load(corpus_path, str(gnt_path), VerseService.CODE_TO_BOOK) as corpus:
+        assert corpus.path == corpus_path
+        assert corpus.changed_books(str(gnt_path), VerseService.CODE_TO_BOOK) == []
+
+    # Shipped without its sources: trusted
+    with Corpus.load(corpus_path, str(tmp_path / "missing"), VerseService.CODE_TO_BOOK) as corpus:
+        assert corpus.path == corpus_path
+
+    lines = john_path.read_text(encoding="utf-8").splitlines(keepends=True)
+    john_path.write_text("".join(line for line in lines if not line.startswith("040317")), encoding="utf-8")
+    with Corpus(corpus_path) as corpus:
+        assert corpus.changed_books(str(gnt_path), VerseService.CODE_TO_BOOK) == [64]
+    with Corpus.load(corpus_path, str(gnt_path), VerseService.CODE_TO_BOOK) as corpus:
+        assert corpus.path == "<memory>"
+        assert corpus.find_verse(pack_key(64, 3, 17)) is None
+
+
+def test_verse_service_loads_from_corpus(verse_service, corpus_path, monkeypatch):
+    """Test VerseService prefers the corpus when it has been built"""
+    monkeypatch.setattr(settings, "SBLGNT_PATH", "/nonexistent")
+    monkeypatch.setattr(settings, "CORPUS_PATH", corpus_path)
+
+    service = VerseService()
+    text, metadata = service.lookup_verse({"book": 64, "chapter": 3, "verse": 16})
+
+    assert service.corpus is not None
+    assert text.startswith("Οὕτως γὰρ ἠγάπησεν")
+    assert metadata["reference"] == "John 3:16"
+
+
+class RecordingCollection:
+    """Collection stand-in that records get() filters and finds every ID"""
+
+    def __init__(self):
+        self.filters = []
+
+    def get(self, where):
+        self.filters.append(where)
+        ids = where["reference_id"]["$in"]
+        return {
+            "documents": [f"text of {ref_id}" for ref_id in ids],
+            "metadatas": [{"reference_id": ref_id} for ref_id in ids],
+        }
+
+
+def test_cli_spans_query_existing_verses(corpus_path):
+    """Test CLI chapter lookups ask Chroma for the corpus's verses only, in one query"""
+    from gospel_parser_interlinear import lookup_spans
+
+    with Corpus(corpus_path) as corpus:
+        assert list(corpus.verses_between(pack_key(64, 1, 1), pack_key(64, 4, 999))) == [1, 2, 3, 4, 5]
+
+        collection = RecordingCollection()
+        verses = lookup_spans(collection, parse_references("John 1-3; Matthew 1"), corpus)
+
+        assert collection.filters == [{"reference_id": {"$in": ["64-01-01", "64-01-02", "64-03-16", "64-03-17"]}}]
+        assert [metadata["reference_id"] for _, metadata in verses] == ["64-01-01", "64-01-02", "64-03-16", "64-03-17"]
+        assert lookup_spans(collection, parse_references("Matthew 1"), corpus) == []
+        assert len(collection.filters) == 1
+
+
+def test_cli_spans_without_corpus_file_filter_chapters(monkeypatch):
+    """Test CLI lookups without a built corpus query chapters and never compile one"""
+    import chromadb
+
+    import gospel_parser_interlinear as cli
+
+    monkeypatch.setattr(cli, "load_corpus_file", lambda: None)
+    monkeypatch.setattr(cli, "load_corpus", lambda: pytest.fail("compiled the corpus"))
+
+    collection = chromadb.EphemeralClient().create_collection("spans_without_corpus")
+    positions = [("John", 64, 1, 1), ("John", 64, 1, 2), ("John", 64, 2, 1), ("John", 64, 3, 16),
+                 ("John", 64, 4, 1), ("Mark", 62, 1, 1)]
+    collection.add(
+        ids=[f"{code}-{chapter:02d}-{verse:02d}" for _, code, chapter, verse in positions],
+        documents=[f"{book} {chapter}:{verse}" for book, _, chapter, verse in positions],
+        embeddings=[[0.0, 1.0]] * len(positions),
+        metadatas=[{"book": book, "chapter": chapter, "verse": verse, "type": "verse"}
+                   for book, _, chapter, verse in positions],
+    )
+
+    verses = cli.lookup_spans(collection, parse_references("John 1:2-3:16; Mark 1"))
+    assert [text for text, _ in verses] == ["John 1:2", "John 2:1", "John 3:16", "Mark 1:1"]
+    assert cli.lookup_spans(collection, parse_references("Matthew 1")) == []
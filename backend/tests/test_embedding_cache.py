@@ -0,0 +1,89 @@
+"""
+Embedding Cache Tests
+=====================
+Tests for the on-disk embedding cache and its use when (re)building
+ChromaDB collections.
+"""
+import uuid
+
+import chromadb
+import numpy as np
+from chromadb.api.types import EmbeddingFunction
+
+from bible_references import CODE_TO_BOOK
+from embedding_cache import DEFAULT_MODEL, CachedEmbedder, EmbeddingCache, embedding_model_name
+from seeding import seed_tasks, sync_collection
+
+from .conftest import FIXTURES_DIR
+
+
+class CountingEmbedding(EmbeddingFunction):
+    """Deterministic embedding that records every text it embeds"""
+
+    def __init__(self):
+        self.embedded = []
+
+    def __call__(self, input):
+        self.embedded.extend(input)
+        return [np.array([len(text), text.count(" "), 1.0], dtype=np.float32) for text in input]
+
+
+def test_cache_round_trip_per_model(tmp_path):
+    """Test vectors are stored per model and survive reopening"""
+    path = str(tmp_path / "cache.sqlite")
+    with EmbeddingCache(path) as cache:
+        cache.put_many("model-a", ["λόγος", "θεός"], [[1.0, 2.0], [3.0, 4.0]])
+        assert cache.get_many("model-b", ["λόγος"]) == [None]
+
+    with EmbeddingCache(path) as cache:
+        assert len(cache) == 2
+        vectors = cache.get_many("model-a", ["θεός", "ἀγάπη", "λόγος"])
+        assert vectors[1] is None
+        np.testing.assert_array_equal(vectors[0], [3.0, 4.0])
+        np.testing.assert_array_equal(vectors[2], [1.0, 2.0])
+
+
+def test_embedder_only_embeds_misses(tmp_path):
+    """Test cached texts (and repeats within a batch) are not re-embedded"""
+    embedding = CountingEmbedding()
+    with EmbeddingCache(str(tmp_path / "cache.sqlite")) as cache:
+        embedder = CachedEmbedder(embedding, cache, model="counting")
+        first = embedder.embed(["a b", "c"])
+        second = embedder.embed(["c", "d e f", "d e f"])
+
+    assert embedding.embedded == ["a b", "c", "d e f"]
+    np.testing.assert_array_equal(second[0], first[1])
+    assert (embedder.hits, embedder.misses) == (1, 3)
+
+
+def test_model_name():
+    """Test the cache key model name of Chroma's default embedding function"""
+    from chromadb.utils.embedding_functions import DefaultEmbeddingFunction
+
+    assert embedding_model_name(DefaultEmbeddingFunction()) == DEFAULT_MODEL
+    assert embedding_model_name(CountingEmbedding()).endswith("CountingEmbedding")
+
+
+def test_rebuilt_collection_reuses_embeddings(tmp_path):
+    """Test a collection rebuilt from scratch gets every vector from the cache"""
+    client = chromadb.EphemeralClient()
+    tasks = seed_tasks("missing.xml", str(tmp_path / "missing.corpus"), str(FIXTURES_DIR / "sblgnt"),
+                       CODE_TO_BOOK, web_path=str(FIXTURES_DIR / "web_bible_json"))
+    web_path = str(FIXTURES_DIR / "web_bible_json")
+
+    with EmbeddingCache(str(tmp_path / "cache.sqlite")) as cache:
+        results = []
+        for attempt in range(2):
+            embedding = CountingEmbedding()
+            collection = client.create_collection(f"seed-{uuid.uuid4().hex}", embedding_function=embedding)
+            embedder = CachedEmbedder(embedding, cache, model="counting")
+            _, total = sync_collection(collection, tasks, str(tmp_path / f"manifest{attempt}.json"),
+                                       web_path=web_path, workers=1, embedder=embedder)
+            results.append((total, list(embedding.embedded), collection.get(include=["embeddings"])))
+            client.delete_collection(collection.name)
+
+    (total, embedded, first), (_, reembedded, second) = results
+    assert len(embedded) == total
+    assert reembedded == []
+    assert first["ids"] == second["ids"]
+    np.testing.assert_array_equal(first["embeddings"], second["embeddings"])
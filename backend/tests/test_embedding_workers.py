@@ -0,0 +1,70 @@
+"""
+Embedding Worker Tests
+======================
+Tests for sharding embeddings across worker processes.
+"""
+import os
+
+import numpy as np
+
+from embedding_cache import DEFAULT_MODEL, CachedEmbedder, EmbeddingCache, embedding_model_name
+import embedding_workers
+from embedding_workers import ParallelEmbedder, threads_per_worker
+
+
+def text_embedding(text):
+    return [float(len(text)), float(text.count(" ")), float(sum(map(ord, text)) % 97)]
+
+
+def worker_embedding(threads):
+    """Picklable factory: a deterministic embedding tagged with the worker's thread settings"""
+    def embed(texts):
+        return [text_embedding(text) + [float(threads), float(os.environ["OMP_NUM_THREADS"])] for text in texts]
+    return embed
+
+
+def test_sharded_embeddings_keep_order():
+    """Test vectors come back in input order across shards and workers"""
+    texts = [f"ἐν ἀρχῇ ἦν ὁ λόγος {i}" * (i % 4 + 1) for i in range(50)]
+    with ParallelEmbedder(workers=2, threads=3, factory=worker_embedding, shard_size=7) as embed:
+        vectors = embed(texts)
+        assert embed([]) == []
+
+    assert len(vectors) == len(texts)
+    np.testing.assert_array_equal(vectors, [text_embedding(text) + [3.0, 3.0] for text in texts])
+
+
+def test_parallel_embedder_through_cache(tmp_path):
+    """Test the embedder plugs into the embedding cache under the default model name"""
+    texts = ["λόγος", "θεός", "λόγος"]
+    with EmbeddingCache(str(tmp_path / "cache.sqlite")) as cache, \
+            ParallelEmbedder(workers=1, factory=worker_embedding) as embed:
+        assert embedding_model_name(embed) == DEFAULT_MODEL
+        embedder = CachedEmbedder(embed, cache, model="test")
+        first = embedder.embed(texts)
+        second = embedder.embed(texts)
+
+    assert (embedder.hits, embedder.misses) == (3, 2)
+    np.testing.assert_array_equal(first, second)
+
+
+def test_threads_per_worker():
+    """Test worker threads split the CPUs without going below one"""
+    cpus = os.cpu_count() or 1
+    assert threads_per_worker(1) == cpus
+    assert threads_per_worker(cpus * 2) == 1
+
+
+def test_default_model_downloaded_once_before_pool(monkeypatch):
+    """Test the parent fetches the default model before starting workers, and only for that model"""
+    downloads = []
+    monkeypatch.setattr(embedding_workers, "download_default_model", lambda: downloads.append(1))
+
+    with ParallelEmbedder(workers=2) as embed:
+        embed._executor()
+        embed._executor()
+    assert downloads == [1]
+
+    with ParallelEmbedder(workers=1, factory=worker_embedding) as embed:
+        embed([""])
+    assert downloads == [1]
@@ -0,0 +1,91 @@
+"""
+English Index Tests
+===================
+Tests for the compact WEB English index shared by the CLI and backend.
+"""
+import json
+import shutil
+
+import pytest
+from pathlib import Path
+
+from config import settings
+from english_index import EnglishIndex, build_english_index
+from services.verse_service import VerseService
+from verse_store import pack_key
+
+
+WEB_FIXTURES = str(Path(__file__).parent / "fixtures" / "web_bible_json")
+
+
+def test_keys_use_sblgnt_codes():
+    """Test WEB book numbers are mapped onto the Greek packed keys"""
+    index = EnglishIndex.from_web_json(WEB_FIXTURES)
+
+    assert len(index) == 6
+    assert index.get(pack_key(64, 3, 16)).startswith("For God so loved the world")
+    assert index.get(pack_key(43, 3, 16)) == ""  # WEB numbering is not used
+
+
+def test_line_text_sections_are_joined():
+    """Test poetry verses keep every 'line text' section"""
+    index = EnglishIndex.from_web_json(WEB_FIXTURES)
+
+    assert index.get(pack_key(61, 5, 3)) == (
+        "“Blessed are the poor in spirit, for theirs is the Kingdom of Heaven."
+    )
+
+
+def test_prebuilt_index_matches_json(tmp_path):
+    """Test the memory-mapped file gives identical results to the JSON build"""
+    path = str(tmp_path / "web_english.idx")
+    assert build_english_index(WEB_FIXTURES, path) == 6
+
+    mapped = EnglishIndex.open(path)
+    built = EnglishIndex.from_web_json(WEB_FIXTURES)
+    assert list(mapped.keys) == list(built.keys)
+    assert [mapped.text_at(i) for i in range(len(mapped))] == [built.text_at(i) for i in range(len(built))]
+
+
+def test_load_ignores_stale_index(tmp_path):
+    """Test an index built before a WEB JSON file changed is not used"""
+    web_path = tmp_path / "web"
+    shutil.copytree(WEB_FIXTURES, web_path)
+    path = str(tmp_path / "web_english.idx")
+    build_english_index(str(web_path), path)
+    assert EnglishIndex.load(path, str(web_path)).changed_books(str(web_path)) == []
+
+    john_path = web_path / "43-john.json"
+    data = json.loads(john_path.read_text(encoding="utf-8"))
+    for item in data:
+        if item.get("chapterNumber") == 3 and item.get("verseNumber") == 16:
+            item["value"] = "For God so loved the world."
+    john_path.write_text(json.dumps(data), encoding="utf-8")
+
+    assert EnglishIndex.open(path).changed_books(str(web_path)) == [64]
+    index = EnglishIndex.load(path, str(web_path))
+    assert index.get(pack_key(64, 3, 16)) == "For God so loved the world."
+    assert index.fingerprint() != EnglishIndex.open(path).fingerprint()
+
+
+def test_rejects_other_files(tmp_path):
+    """Test opening a file that is not an English index raises ValueError"""
+    path = tmp_path / "bogus.idx"
+    path.write_bytes(b"NOPE" + bytes(64))
+
+    with pytest.raises(ValueError):
+        EnglishIndex.open(str(path))
+
+
+def test_verse_service_uses_prebuilt_index(verse_service, tmp_path, monkeypatch):
+    """Test VerseService joins English through the prebuilt index"""
+    path = str(tmp_path / "web_english.idx")
+    build_english_index(WEB_FIXTURES, path)
+    monkeypatch.setattr(settings, "WEB_BIBLE_PATH", "/nonexistent")
+    monkeypatch.setattr(settings, "ENGLISH_INDEX_PATH", path)
+
+    service = VerseService()
+    _, metadata = service.lookup_verse({"book": 61, "chapter": 5, "verse": 3})
+
+    assert metadata["english_text"].endswith("for theirs is the Kingdom of Heaven.")
+    assert service.get_english_text(64, 1, 1).startswith("In the beginning was the Word")
@@ -0,0 +1,51 @@
+"""
+Greek Text Tests
+================
+Tests for the translate-table Greek normalisers against their unicodedata
+reference forms.
+"""
+import json
+
+from corpus import iter_morphgnt_tokens, sblgnt_book_files
+from greek_text import (
+    TABLE_RANGES, fold_greek, grave_to_acute, grave_to_acute_reference, strip_accents, strip_accents_reference,
+)
+
+from .conftest import FIXTURES_DIR
+
+
+def _fixture_words():
+    words = [
+        text for path in sblgnt_book_files(str(FIXTURES_DIR / "sblgnt")).values()
+        for token in iter_morphgnt_tokens(path) for text in (token.form, token.norm, token.lemma)
+    ]
+    lexicon = json.loads((FIXTURES_DIR / "enhanced_lexicon.json").read_text(encoding="utf-8"))
+    for entry in lexicon.values():
+        words.extend(value for value in entry.values() if isinstance(value, str))
+    return words
+
+
+def test_tables_match_reference_for_every_character():
+    """Test every table character, alone and after a letter, matches unicodedata"""
+    for start, stop in TABLE_RANGES:
+        for codepoint in range(start, stop):
+            for text in (chr(codepoint), "α" + chr(codepoint), chr(codepoint) + "\u0301"):
+                assert strip_accents(text) == strip_accents_reference(text), repr(text)
+                assert grave_to_acute(text) == grave_to_acute_reference(text), repr(text)
+
+
+def test_fixture_words_match_reference():
+    """Test SBLGNT and lexicon text normalise exactly as through unicodedata"""
+    for word in _fixture_words():
+        assert strip_accents(word) == strip_accents_reference(word)
+        assert grave_to_acute(word) == grave_to_acute_reference(word)
+
+
+def test_uncovered_text_falls_back():
+    """Test text outside the tables (Hebrew points, compatibility forms) still normalises"""
+    assert strip_accents("\u05d1\u05bc\u05b0") == "\u05d1"  # Hebrew points
+    assert strip_accents("\u2126\u0301") == "\u03a9"  # OHM SIGN, acute
+    assert fold_greek("Ἀγάπη,") == "αγαπη"
+    assert fold_greek("agápē") == "agape"
+    assert grave_to_acute("θεὸς") == "θεός"
+    assert fold_greek("") == ""
@@ -0,0 +1,122 @@
+"""
+HTTP Caching Tests
+==================
+Tests for ETag / Cache-Control / 304 handling on scripture and lexicon routes.
+"""
+import pytest
+
+from http_cache import CACHE_CONTROL, etag_matches
+
+
+def test_etag_matches():
+    """Test If-None-Match parsing"""
+    assert etag_matches('"abc"', '"abc"')
+    assert etag_matches('W/"abc"', '"abc"')
+    assert etag_matches('"old", "abc"', '"abc"')
+    assert etag_matches('*', '"abc"')
+    assert not etag_matches('"old"', '"abc"')
+    assert not etag_matches(None, '"abc"')
+
+
+def test_verse_response_is_revalidated(client, verse_service):
+    """Test verse responses carry the dataset ETag and must be revalidated"""
+    response = client.get("/api/verses/John%203:16")
+
+    assert response.status_code == 200
+    assert response.headers["etag"] == f'"{verse_service.dataset_version}"'
+    assert response.headers["cache-control"] == CACHE_CONTROL
+
+
+def test_verse_revalidation_returns_304(client, verse_service):
+    """Test a matching If-None-Match short-circuits with an empty 304"""
+    etag = client.get("/api/verses/John%203:16").headers["etag"]
+
+    response = client.get("/api/verses/John%203:16", headers={"If-None-Match": etag})
+
+    assert response.status_code == 304
+    assert response.content == b""
+    assert response.headers["etag"] == etag
+
+
+def test_missing_verse_is_not_revalidated(client, verse_service):
+    """Test a current ETag never turns a nonexistent reference into a 304"""
+    etag = client.get("/api/verses/John%203:16").headers["etag"]
+
+    response = client.get("/api/verses/John%2099:1", headers={"If-None-Match": etag})
+    assert response.status_code == 404
+
+    response = client.get("/api/lexicon/strongs/G99999", headers={"If-None-Match": "*"})
+    assert response.status_code == 404
+
+
+def test_stale_etag_gets_full_response(client, verse_service):
+    """Test an ETag from another dataset version is not honoured"""
+    response = client.get("/api/verses/John%203:16", headers={"If-None-Match": '"stale"'})
+
+    assert response.status_code == 200
+    assert response.json()["reference"] == "John 3:16"
+
+
+def test_errors_are_not_cached(client, verse_service):
+    """Test 4xx responses do not get caching headers"""
+    response = client.get("/api/verses/John%2099:1")
+
+    assert response.status_code == 404
+    assert "cache-control" not in response.headers
+
+
+def test_strongs_revalidation(client, lexicon_service):
+    """Test Strong's lookups are cached by lexicon version"""
+    response = client.get("/api/lexicon/strongs/G25")
+
+    assert response.status_code == 200
+    assert response.json()["lemma"] == "ἀγαπάω"
+    assert response.headers["cache-control"] == CACHE_CONTROL
+
+    revalidated = client.get("/api/lexicon/strongs/G25", headers={"If-None-Match": response.headers["etag"]})
+    assert revalidated.status_code == 304
+
+
+def test_response_cache_serves_encoded_bytes(client, verse_service, monkeypatch):
+    """Test repeat requests are served from the encoded-body cache"""
+    from routers import verses
+
+    first = client.get("/api/verses/John%203:16")
+
+    # Any further model construction would now fail
+    monkeypatch.setattr(verses, "_to_verse_response", None)
+    second = client.get("/api/verses/book/64/3/16")
+
+    assert second.status_code == 200
+    assert second.content == first.content
+    assert second.headers["content-type"] == "application/json"
+    assert second.headers["cache-control"] == CACHE_CONTROL
+
+
+def test_response_cache_keys_include_version():
+    """Test a new dataset version never sees old bodies"""
+    from http_cache import ResponseCache
+
+    cache = ResponseCache(max_entries=2)
+    cache.put("v1", "G25", b"old")
+
+    assert cache.get("v2", "G25") is None
+    assert cache.get_or_build("v2", "G25", lambda: b"new") == b"new"
+    assert cache.get_or_build("v2", "G26", lambda: None) is None
+
+    cache.put("v2", "G26", b"x")
+    assert len(cache) == 2
+    assert cache.get("v1", "G25") is None  # oldest entry evicted
+
+
+def test_warmed_strongs_response(client, lexicon_service):
+    """Test warming pre-encodes Strong's entries identical to lazy encoding"""
+    from routers import lexicon
+
+    lexicon.response_cache.clear()
+    lazy = client.get("/api/lexicon/strongs/g26").content
+
+    lexicon.response_cache.clear()
+    lexicon.warm_response_cache(lexicon_service)
+    assert len(lexicon.response_cache) == 3
+    assert client.get("/api/lexicon/strongs/26").content == lazy
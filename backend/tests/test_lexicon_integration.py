@@ -0,0 +1,63 @@
+"""
+Lexicon Integration Tests
+=========================
+Tests for building the enhanced lexicon from the Strong's XML and the
+SBLGNT morphgnt files.
+"""
+import json
+from collections import Counter
+
+from config import settings
+from corpus import iter_morphgnt_tokens, sblgnt_book_files
+from lexicon_integration import build_enhanced_lexicon
+from schemas.lexicon import LexiconEntry
+from services.lexicon_service import LexiconService
+
+from .conftest import FIXTURES_DIR
+
+LEXICON_XML = str(FIXTURES_DIR / "strongsgreek.xml")
+SBLGNT = str(FIXTURES_DIR / "sblgnt")
+
+
+def test_parallel_build_matches_serial():
+    """Test per-book workers produce the same lexicon as an in-process count"""
+    assert build_enhanced_lexicon(LEXICON_XML, SBLGNT, workers=2) == build_enhanced_lexicon(LEXICON_XML, SBLGNT, workers=1)
+
+
+def test_entry_fields_and_morphology():
+    """Test Thayer fields and morphology aggregates against a direct token count"""
+    lexicon = build_enhanced_lexicon(LEXICON_XML, SBLGNT, workers=1)
+    assert list(lexicon) == ["G25", "G26", "G3056"]
+
+    agapao = lexicon["G25"]
+    assert agapao["definition_kjv"] == "(be-)love(-ed)"
+    assert agapao["derivation"] == "perhaps from ἄγαν (much) (or compare G5689)"
+    assert agapao["cross_refs"] == ["G5689", "G5368"]
+    assert "morphology" not in lexicon["G26"]
+
+    tokens = [
+        token for path in sblgnt_book_files(SBLGNT).values()
+        for token in iter_morphgnt_tokens(path) if token.lemma == "λόγος"
+    ]
+    logos = lexicon["G3056"]
+    assert logos["part_of_speech"] == "Noun"
+    assert logos["morphology"]["total_occurrences"] == len(tokens)
+    assert logos["morphology"]["cases"] == {"Nominative": sum(token.parse[4] == "N" for token in tokens)}
+    assert logos["morphology"]["sample_forms"] == [
+        {"form": form, "pos": "N-", "parse": "----NSM-", "count": count}
+        for form, count in Counter(token.norm for token in tokens).most_common()
+    ]
+
+
+def test_built_lexicon_loads_in_service(monkeypatch, tmp_path):
+    """Test the built JSON serves lookups and validates against the API schema"""
+    path = tmp_path / "enhanced_lexicon.json"
+    path.write_text(json.dumps(build_enhanced_lexicon(LEXICON_XML, SBLGNT, workers=1), ensure_ascii=False),
+                    encoding="utf-8")
+    monkeypatch.setattr(settings, "ENHANCED_LEXICON_PATH", str(path))
+
+    service = LexiconService()
+    assert service.strongs_for_lemma("ἀγαπάω") == "G25"
+    entry = LexiconEntry(**service.lookup_by_strongs("G25"))
+    assert entry.morphology.tenses == {"Aorist": 1}
+    assert entry.morphology.persons == {"3rd": 1}
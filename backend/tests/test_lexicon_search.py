@@ -0,0 +1,53 @@
+"""
+Lexicon Search Tests
+====================
+Tests for BM25 full-text search over the lexicon.
+"""
+from lexicon_search import LexiconSearchIndex, tokenize
+
+
+ENTRIES = {
+    "G1": {"lemma": "λόγος", "transliteration": "lógos", "definition_strongs": "something said",
+           "definition_kjv": "word, saying"},
+    "G2": {"lemma": "λέγω", "transliteration": "légō", "definition_strongs": "to say, speak",
+           "definition_kjv": "say, speak, tell", "derivation": "a primary verb"},
+    "G3": {"lemma": "ῥῆμα", "transliteration": "rhēma", "definition_strongs": "an utterance; a word, a saying",
+           "derivation": "from G2"},
+}
+
+
+def test_tokenize_folds_accents_case_and_sigma():
+    """Test Greek and transliterated words fold to the same terms as queries"""
+    assert tokenize("Λόγος, (be-)love(-ed)") == ["λογοσ", "be", "love", "ed"]
+    assert tokenize("agápē") == ["agape"]
+
+
+def test_field_weighted_ranking():
+    """Test lemma matches outrank definition matches and prefixes expand"""
+    index = LexiconSearchIndex(ENTRIES.items())
+    assert [strongs for strongs, _ in index.search("λογος")] == ["G1"]
+    # Strong's definition outweighs the KJV glosses
+    assert [strongs for strongs, _ in index.search("word")] == ["G3", "G1"]
+    assert [strongs for strongs, _ in index.search("legō")] == ["G2"]
+    assert [strongs for strongs, _ in index.search("sa", limit=2)] == ["G2", "G1"]
+    assert index.search("unrelated") == []
+
+
+def test_strongs_number_query_comes_first():
+    """Test a Strong's number query returns that entry first"""
+    index = LexiconSearchIndex(ENTRIES.items())
+    results = index.search("g2")
+    assert results[0][0] == "G2"
+    assert results[0][1] >= 100.0
+
+
+def test_search_endpoint(client, lexicon_service):
+    """Test /api/lexicon/search ranks entries from the index built at load"""
+    assert len(lexicon_service.search_index) == len(lexicon_service.entries)
+    response = client.get("/api/lexicon/search", params={"q": "agape"})
+    assert response.status_code == 200
+    results = response.json()["results"]
+    assert results[0]["strongs"] == "G26"
+
+    response = client.get("/api/lexicon/search", params={"q": "love", "limit": 1})
+    assert response.json()["total_results"] == 1
@@ -0,0 +1,110 @@
+"""
+Lexicon Store Tests
+===================
+Tests for the compiled, memory-mapped enhanced lexicon shared by
+LexiconService, ThayersLexicon and EnhancedLexiconHelper.
+"""
+import hashlib
+import json
+import os
+import shutil
+
+import pytest
+
+from config import settings
+from enhanced_lexicon_helper import EnhancedLexiconHelper
+from http_cache import dataset_version
+from lexicon_helper import ThayersLexicon
+from lexicon_search import LexiconSearchIndex
+from lexicon_store import LexiconStore, build_lexicon_store, fold_greek
+from services.lexicon_service import LexiconService
+
+from .conftest import FIXTURES_DIR
+
+
+@pytest.fixture
+def lexicon_json(tmp_path):
+    """Writable copy of tests/fixtures/enhanced_lexicon.json"""
+    path = tmp_path / "enhanced_lexicon.json"
+    shutil.copy(FIXTURES_DIR / "enhanced_lexicon.json", path)
+    return path
+
+
+def test_store_matches_json(lexicon_json, tmp_path):
+    """Test the store decodes every entry, in order, and serves its indexes"""
+    expected = json.loads(lexicon_json.read_text(encoding="utf-8"))
+    store_path = str(tmp_path / "lexicon.lex")
+    assert build_lexicon_store(str(lexicon_json), store_path) == len(expected)
+
+    with LexiconStore(store_path) as store:
+        assert list(store.items()) == list(expected.items())
+        assert store["G2316"] == expected["G2316"]
+        assert "G99999" not in store and "G25" in store
+        assert store.lookup_keys("lemma", "ἀγάπη") == ["G26"]
+        assert store.lookup_keys("greek", fold_greek("ΘΕΟΣ")) == ["G2316"]
+        assert store.lookup_keys("translit", "agápē") == ["G26"]
+        assert store.lookup("greek", "λογος") == []
+
+
+def test_store_search_postings_match_built_index(lexicon_json, tmp_path):
+    """Test the stored BM25 postings rank exactly like an index built from the JSON"""
+    expected = LexiconSearchIndex(json.loads(lexicon_json.read_text(encoding="utf-8")).items())
+    store_path = str(tmp_path / "lexicon.lex")
+    build_lexicon_store(str(lexicon_json), store_path)
+
+    with LexiconStore(store_path) as store:
+        index = store.search_index()
+        assert len(index) == len(expected)
+        for query in ("love", "agape", "ἀγάπη", "sa", "G25", "25", "god word", "nothing"):
+            assert index.search(query) == expected.search(query)
+
+
+def test_load_ignores_stale_store(lexicon_json, tmp_path):
+    """Test a store compiled from another version of the JSON is not used"""
+    store_path = str(tmp_path / "lexicon.lex")
+    build_lexicon_store(str(lexicon_json), store_path)
+
+    # Touched but unchanged: the mapped file is still used
+    os.utime(lexicon_json, ns=(0, 0))
+    with LexiconStore.load(store_path, str(lexicon_json)) as store:
+        assert store.path == store_path
+
+    data = json.loads(lexicon_json.read_text(encoding="utf-8"))
+    data["G25"]["definition_kjv"] = "love"
+    lexicon_json.write_text(json.dumps(data, ensure_ascii=False), encoding="utf-8")
+    with LexiconStore.load(store_path, str(lexicon_json)) as store:
+        assert store.path == "<memory>"
+        assert store["G25"]["definition_kjv"] == "love"
+
+
+def test_readers_share_compiled_store(monkeypatch, lexicon_json, tmp_path):
+    """Test LexiconService and ThayersLexicon map the same compiled file"""
+    store_path = str(tmp_path / "lexicon.lex")
+    build_lexicon_store(str(lexicon_json), store_path)
+    monkeypatch.setattr(settings, "ENHANCED_LEXICON_PATH", str(lexicon_json))
+    monkeypatch.setattr(settings, "LEXICON_STORE_PATH", store_path)
+
+    service = LexiconService()
+    assert service.entries.path == store_path
+    assert service.dataset_version == dataset_version(hashlib.sha1(lexicon_json.read_bytes()).hexdigest())
+    assert service.strongs_for_lemma("θεὸς") == "G2316"
+    assert [entry["strongs"] for entry in service.lookup_by_transliteration("AGÁPĒ")] == ["G26"]
+    assert service.get_all_entries(limit=2) == [service.lookup_by_strongs("25"), service.lookup_by_strongs("G26")]
+
+    lexicon = ThayersLexicon(str(lexicon_json), store_path)
+    assert lexicon.entries.path == store_path
+    assert [entry["strongs"] for entry in lexicon.lookup_by_greek("ἀγαπάω")] == ["G25"]
+    assert [entry["strongs"] for entry in lexicon.lookup_by_transliteration("theós")] == ["G2316"]
+    assert [entry["strongs"] for entry in lexicon.get_cross_references("G26")] == ["G25"]
+
+
+def test_enhanced_helper_loads_compiled_store(monkeypatch, lexicon_json, tmp_path):
+    """Test EnhancedLexiconHelper serves Thayer's entries from the compiled store"""
+    monkeypatch.chdir(tmp_path)
+    build_lexicon_store("enhanced_lexicon.json", "corpus_data/enhanced_lexicon.lex")
+
+    helper = EnhancedLexiconHelper()
+    assert helper.thayers is not None
+    assert helper.thayers.path == "corpus_data/enhanced_lexicon.lex"
+    assert helper.lookup_strongs("G25")["thayers"]["lemma"] == "ἀγαπάω"
+    assert helper.lookup_strongs("26")["thayers"]["strongs"] == "G26"
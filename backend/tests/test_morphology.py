@@ -0,0 +1,181 @@
+"""
+Morphology Column Tests
+=======================
+Tests for the NumPy token columns, the bitmap query engine and the
+word-level verse and morphology search endpoints.
+"""
+import pytest
+
+from corpus import Corpus
+from morphology import MorphIndex, MorphologyColumns
+from verse_store import pack_key
+
+
+def test_columns_match_token_records(corpus_path):
+    """Test the columns are the corpus token records, field for field"""
+    with Corpus(corpus_path) as corpus:
+        columns = MorphologyColumns(corpus)
+
+        assert len(columns) == corpus.n_tokens
+        for i, token in enumerate(corpus.iter_tokens()):
+            assert columns.keys[i] == token.key
+            assert columns.lemma_ids[i] == token.lemma_id
+            assert columns.pos_codes[columns.pos_ids[i]] == token.pos
+            assert bytes(columns.parse[i]).decode("ascii") == token.parse
+
+
+def test_decode_verb_and_article(verse_service):
+    """Test parse codes decode into named morphology fields"""
+    columns = verse_service.morphology
+    start, stop = columns.token_range(pack_key(64, 3, 16), pack_key(64, 3, 16))
+    words = columns.decode(start, stop)
+
+    verb = words[2]
+    assert (verb["word"], verb["lemma"], verb["parse_code"]) == ("ἠγάπησεν", "ἀγαπάω", "3AAI-S--")
+    assert (verb["person"], verb["tense"], verb["voice"], verb["mood"]) == ("3rd", "Aorist", "Active", "Indicative")
+    assert verb["number"] == "Singular"
+    assert verb["case"] is None and verb["gender"] is None
+    assert verb["part_of_speech"] == "Verb"
+
+    article = words[3]
+    assert (article["case"], article["number"], article["gender"]) == ("Nominative", "Singular", "Masculine")
+    assert article["part_of_speech"] == "Definite Article"
+
+
+def test_token_range_covers_chapter(verse_service):
+    """Test a whole chapter is one contiguous token slice"""
+    columns = verse_service.morphology
+    start, stop = columns.token_range(pack_key(64, 3, 1), pack_key(64, 3, 99))
+    assert {int(key) for key in columns.keys[start:stop]} == {pack_key(64, 3, 16), pack_key(64, 3, 17)}
+
+    start, stop = columns.token_range(pack_key(64, 9, 1), pack_key(64, 9, 99))
+    assert start == stop
+
+
+def test_verse_words_endpoint(client, verse_service, lexicon_service):
+    """Test /{reference}/words returns tokens with Strong's numbers"""
+    response = client.get("/api/verses/John%203:16/words")
+    assert response.status_code == 200
+
+    data = response.json()
+    assert data["reference"] == "John 3:16"
+    assert [w["position"] for w in data["words"]] == list(range(1, len(data["words"]) + 1))
+
+    by_lemma = {w["lemma"]: w for w in data["words"]}
+    assert by_lemma["ἀγαπάω"]["strongs"] == "G25"
+    assert by_lemma["θεός"]["strongs"] == "G2316"
+    assert by_lemma["ἀγαπάω"]["reference_id"] == "64-03-16"
+    assert by_lemma["γάρ"]["strongs"] is None
+
+    etag = response.headers["etag"]
+    assert client.get("/api/verses/John%203:16/words", headers={"If-None-Match": etag}).status_code == 304
+
+
+def test_verse_words_endpoint_ranges_and_errors(client, verse_service, lexicon_service):
+    """Test chapters and compound references, and the 400/404 cases"""
+    chapter = client.get("/api/verses/John%203/words").json()
+    assert {w["reference"] for w in chapter["words"]} == {"John 3:16", "John 3:17"}
+
+    compound = client.get("/api/verses/John%203:16;%20John%203:16-17/words").json()
+    assert len(compound["words"]) == len(chapter["words"])
+
+    assert client.get("/api/verses/Nowhere%201:1/words").status_code == 400
+    assert client.get("/api/verses/John%209:9/words").status_code == 404
+
+
+def test_morph_index_matches_full_scan(corpus_path):
+    """Test bitmap queries return exactly the tokens a full scan finds"""
+    with Corpus(corpus_path) as corpus:
+        index = MorphIndex(MorphologyColumns(corpus))
+        tokens = list(corpus.iter_tokens())
+
+        def scan(predicate):
+            return [i for i, token in enumerate(tokens) if predicate(token)]
+
+        assert index.query({"mood": ["subjunctive"]}).tolist() == scan(lambda t: t.parse[3] == "S")
+        assert index.query({"pos": ["verb"], "tense": ["aorist", "imperfect"]}).tolist() == \
+            scan(lambda t: t.pos == "V-" and t.parse[1] in "AI")
+        assert index.query({"voice": ["P"], "mood": ["Subjunctive"]}).tolist() == \
+            scan(lambda t: t.parse[2] == "P" and t.parse[3] == "S")
+
+        eimi = [corpus.string_id("εἰμί")]
+        john = [(pack_key(64, 0, 0), pack_key(65, 0, 0) - 1)]
+        assert len(index.query({"tense": ["imperfect"]}, lemma_ids=eimi, key_ranges=john)) == 4
+        assert len(index.query({}, lemma_ids=eimi, key_ranges=[(pack_key(61, 0, 0), pack_key(62, 0, 0) - 1)])) == 1
+
+
+def test_morph_index_rejects_unknown_values(verse_service):
+    """Test unknown features and values raise ValueError"""
+    index = MorphIndex(verse_service.morphology)
+    with pytest.raises(ValueError):
+        index.query({"tense": ["bogus"]})
+    with pytest.raises(ValueError):
+        index.query({"colour": ["red"]})
+
+
+def test_search_morph_endpoint(client, verse_service, lexicon_service):
+    """Test /api/search/morph filters, Strong's lookup and paging"""
+    response = client.get("/api/search/morph", params={"mood": "participle", "book": "John"})
+    assert response.status_code == 200
+    data = response.json()
+    assert data["total_results"] == 1
+    assert data["results"][0]["lemma"] == "πιστεύω"
+    assert data["results"][0]["reference"] == "John 3:16"
+
+    data = client.get("/api/search/morph", params={"strongs": "G25"}).json()
+    assert [w["word"] for w in data["results"]] == ["ἠγάπησεν"]
+
+    data = client.get("/api/search/morph", params={"pos": "verb", "offset": 10, "limit": 5}).json()
+    assert data["total_results"] == 14
+    assert len(data["results"]) == 4
+
+    # A valid part of speech that the corpus never uses matches nothing
+    response = client.get("/api/search/morph", params={"pos": "interjection"})
+    assert response.status_code == 200
+    assert response.json()["total_results"] == 0
+
+    assert client.get("/api/search/morph", params={"tense": "bogus"}).status_code == 400
+    assert client.get("/api/search/morph", params={"book": "Nowhere"}).status_code == 400
+    assert client.get("/api/search/morph").status_code == 400
+
+
+def test_lemma_postings_are_sorted_occurrences(corpus_path):
+    """Test the inverted index lists every occurrence of a lemma in order"""
+    with Corpus(corpus_path) as corpus:
+        columns = MorphologyColumns(corpus)
+        tokens = list(corpus.iter_tokens())
+
+        for lemma in ("εἰμί", "ὁ", "θεός"):
+            lemma_id = corpus.string_id(lemma)
+            expected = [i for i, token in enumerate(tokens) if token.lemma_id == lemma_id]
+            assert columns.occurrences([lemma_id]).tolist() == expected
+
+        both = columns.occurrences([corpus.string_id("θεός"), corpus.string_id("λόγος")]).tolist()
+        assert both == sorted(both)
+
+
+def test_concordance_endpoint(client, verse_service, lexicon_service):
+    """Test /api/concordance by lemma and Strong's number, with context and paging"""
+    response = client.get("/api/concordance/θεός", params={"context": 2})
+    assert response.status_code == 200
+    data = response.json()
+    assert data["strongs"] == ["G2316"]
+    assert data["books"] == {"John": data["total_occurrences"]}
+    first = data["results"][0]
+    assert first["reference"] == "John 1:1"
+    assert first["left"].split()[-1] == "τὸν"
+    assert len(first["right"].split()) == 2
+
+    by_strongs = client.get("/api/concordance/G2316").json()
+    assert by_strongs["total_occurrences"] == data["total_occurrences"]
+
+    unaccented = client.get("/api/concordance/θεος").json()
+    assert unaccented["lemmas"] == ["θεός"]
+
+    page = client.get("/api/concordance/ὁ", params={"offset": 1, "limit": 2}).json()
+    assert len(page["results"]) == 2
+    assert page["total_occurrences"] > 3
+
+    assert client.get("/api/concordance/εἰμί", params={"book": "Matt"}).json()["total_occurrences"] == 1
+    assert client.get("/api/concordance/ἀγάπη").status_code == 404
+    assert client.get("/api/concordance/θεός", params={"book": "Nowhere"}).status_code == 400
@@ -0,0 +1,69 @@
+"""
+Phrase Index Tests
+==================
+Tests for Greek phrase search and the /api/search/phrase endpoint.
+"""
+from phrase_index import PhraseIndex, normalize_word, split_phrase
+from routers.chat import build_context
+
+
+def test_normalize_word_folds_accents():
+    """Test accent folding, final sigma and grave -> acute in exact mode"""
+    assert normalize_word("ἀρχῇ") == "αρχη"
+    assert normalize_word("Λόγος,") == "λογοσ"
+    assert normalize_word("θεὸς", accent_sensitive=True) == normalize_word("θεός", accent_sensitive=True)
+    assert normalize_word("ἀρχῇ", accent_sensitive=True) != normalize_word("ἀρχή", accent_sensitive=True)
+    assert split_phrase("find 'εν αρχη ην' please") == ["εν", "αρχη", "ην"]
+
+
+def test_phrase_index_finds_phrases(verse_service):
+    """Test exact and accent-insensitive lookups, and verse boundaries"""
+    index = PhraseIndex(verse_service.morphology)
+    keys = verse_service.morphology.keys
+
+    positions, length = index.search("εν αρχη ην")
+    assert length == 3
+    assert [int(keys[p]) for p in positions] == [64001001]
+
+    assert len(index.search("Ἐν ἀρχῇ ἦν", accent_sensitive=True)[0]) == 1
+    assert len(index.search("εν αρχη ην", accent_sensitive=True)[0]) == 0
+
+    # Longer than the largest n-gram: verified word by word
+    assert len(index.search("και θεος ην ο λογος")[0]) == 1
+    assert len(index.search("και θεος ην ο θεος")[0]) == 0
+
+    # John 1:1 ends with λόγος and John 1:2 starts with Οὗτος
+    assert len(index.search("λογος ουτος")[0]) == 0
+
+
+def test_phrase_highlights(verse_service):
+    """Test highlight offsets point at the phrase in the verse text"""
+    index = PhraseIndex(verse_service.morphology)
+    text, _ = verse_service.lookup_verse({"book": 64, "chapter": 3, "verse": 16})
+
+    positions, length = index.search("ηγαπησεν ο θεος")
+    start, end = index.highlight(int(positions[0]), length)
+    assert text[start:end] == "ἠγάπησεν ὁ θεὸς"
+
+
+def test_search_phrase_endpoint(client, verse_service):
+    """Test /api/search/phrase groups matches by verse with highlights"""
+    response = client.get("/api/search/phrase", params={"q": "ο λογος"})
+    assert response.status_code == 200
+    data = response.json()
+    assert data["total_matches"] == 3
+    assert data["total_verses"] == 1
+
+    hit = data["results"][0]
+    assert hit["reference"] == "John 1:1"
+    assert [hit["greek_text"][start:end].rstrip(",.") for start, end in hit["highlights"]] == ["ὁ λόγος"] * 3
+
+    assert client.get("/api/search/phrase", params={"q": "ο λογος", "offset": 1}).json()["results"] == []
+    assert client.get("/api/search/phrase", params={"q": "ουδεις λογος"}).json()["total_matches"] == 0
+
+
+def test_chat_context_includes_phrase_matches(verse_service, lexicon_service):
+    """Test Greek phrases in a chat message pull in the verses that contain them"""
+    context = build_context(None, "What does εν αρχη ην mean?", False, verse_service, lexicon_service)
+    assert "John 1:1" in context
+    assert "Ἐν ἀρχῇ ἦν" in context
@@ -0,0 +1,198 @@
+"""
+Seeding Tests
+=============
+Tests for the process-pool seeding pipeline (parse workers -> bounded
+queue -> batching writer) and incremental reseeding from the manifest.
+"""
+import json
+import shutil
+import uuid
+
+import chromadb
+import pytest
+from chromadb.api.types import EmbeddingFunction
+
+from bible_references import CODE_TO_BOOK
+from corpus import build_corpus
+from english_index import build_english_index
+from seeding import (
+    BatchWriter, parse_sblgnt_corpus, parse_sblgnt_file, seed_collection, seed_tasks, sync_collection,
+    write_batches
+)
+
+from .conftest import FIXTURES_DIR
+
+
+class LengthEmbedding(EmbeddingFunction):
+    """Cheap deterministic embedding that counts the texts it embeds"""
+
+    def __init__(self):
+        self.embedded = []
+
+    def __call__(self, input):
+        self.embedded.extend(input)
+        return [[float(len(text)), 1.0] for text in input]
+
+
+@pytest.fixture
+def collection():
+    embedding = LengthEmbedding()
+    client = chromadb.EphemeralClient()
+    collection = client.create_collection(f"seed-{uuid.uuid4().hex}", embedding_function=embedding)
+    collection.embedding = embedding
+    yield collection
+    client.delete_collection(collection.name)
+
+
+@pytest.fixture
+def sources(tmp_path):
+    """Writable copies of the SBLGNT and WEB fixtures"""
+    shutil.copytree(FIXTURES_DIR / "sblgnt", tmp_path / "sblgnt")
+    shutil.copytree(FIXTURES_DIR / "web_bible_json", tmp_path / "web")
+    return tmp_path
+
+
+class RecordingCollection:
+    """Keeps every upsert call; fails on the call after ``fail_after``"""
+
+    def __init__(self, fail_after=None):
+        self.batches = []
+        self.fail_after = fail_after
+
+    def upsert(self, documents, metadatas, ids):
+        if self.fail_after is not None and len(self.batches) == self.fail_after:
+            raise RuntimeError("insert failed")
+        self.batches.append((documents, metadatas, ids))
+
+
+def test_parallel_seed_matches_serial_parse(corpus_path):
+    """Test pooled seeding writes the same documents, in order and under stable IDs, as a serial parse"""
+    expected = list(parse_sblgnt_corpus(corpus_path))
+    tasks = seed_tasks(str(FIXTURES_DIR / "missing.xml"), corpus_path, "", CODE_TO_BOOK)
+    assert [task.key for task in tasks] == ["lexicon", "book:61", "book:64"]
+
+    collection = RecordingCollection()
+    written = seed_collection(collection, tasks, corpus_path, None, None, workers=2, batch_size=4, queue_size=1)
+    assert written == len(expected)
+
+    assert all(len(documents) <= 4 for documents, _, _ in collection.batches)
+    documents = [doc for batch, _, _ in collection.batches for doc in batch]
+    metadatas = [meta for _, batch, _ in collection.batches for meta in batch]
+    ids = [i for _, _, batch in collection.batches for i in batch]
+    assert documents == [doc["text"] for doc in expected]
+    assert metadatas == [doc["metadata"] for doc in expected]
+    assert ids == [doc["metadata"]["reference_id"] for doc in expected]
+
+
+
+def test_reseed_only_changed_book(collection, sources):
+    """Test a corrected morphgnt file re-embeds only that book"""
+    manifest = str(sources / "manifest.json")
+
+    def sync():
+        tasks = seed_tasks("missing.xml", str(sources / "missing.corpus"), str(sources / "sblgnt"),
+                           CODE_TO_BOOK, web_path=str(sources / "web"))
+        collection.embedding.embedded.clear()
+        return sync_collection(collection, tasks, manifest, None, None, str(sources / "web"), workers=2)
+
+    reseeded, total = sync()
+    assert reseeded == 3
+    assert collection.count() == total
+    john = collection.get(ids=["64-03-16"])
+    assert john["metadatas"][0]["english_text"].startswith("For God so loved")
+
+    assert sync() == (0, 0)
+    assert collection.embedding.embedded == []
+
+    # Correct John and drop its last verse: only John is re-embedded, 3:17 is deleted
+    john_path = sources / "sblgnt" / "64-Jn-morphgnt.txt"
+    lines = john_path.read_text(encoding="utf-8").splitlines(keepends=True)
+    john_path.write_text("".join(line for line in lines if not line.startswith("040317")), encoding="utf-8")
+
+    reseeded, _ = sync()
+    assert reseeded == 1
+    expected = list(parse_sblgnt_file(str(john_path), 64, "John"))
+    assert collection.embedding.embedded == [doc["text"] for doc in expected]
+    assert collection.get(ids=["64-03-17"])["ids"] == []
+    assert collection.count() == total - 1
+
+
+def test_reseed_from_rebuilt_corpus(collection, sources):
+    """Test an out-of-date prebuilt corpus or English index is never seeded from"""
+    manifest = str(sources / "manifest.json")
+    corpus_path = str(sources / "sblgnt.corpus")
+    english_path = str(sources / "web_english.idx")
+    build_corpus(str(sources / "sblgnt"), corpus_path, CODE_TO_BOOK)
+    build_english_index(str(sources / "web"), english_path)
+
+    def sync():
+        tasks = seed_tasks("missing.xml", corpus_path, str(sources / "sblgnt"), CODE_TO_BOOK,
+                           web_path=str(sources / "web"))
+        collection.embedding.embedded.clear()
+        kinds = [task.kind for task in tasks[1:]]
+        return kinds, sync_collection(collection, tasks, manifest, corpus_path, english_path,
+                                      str(sources / "web"), workers=2)
+
+    kinds, (reseeded, total) = sync()
+    assert kinds == ["corpus", "corpus"]
+    assert reseeded == 3
+
+    # John changes but the corpus is stale: John is parsed from its morphgnt file
+    john_path = sources / "sblgnt" / "64-Jn-morphgnt.txt"
+    lines = john_path.read_text(encoding="utf-8").splitlines(keepends=True)
+    john_path.write_text("".join(line for line in lines if not line.startswith("040317")), encoding="utf-8")
+
+    kinds, (reseeded, _) = sync()
+    assert kinds == ["morphgnt", "morphgnt"]
+    assert reseeded == 1
+    assert collection.get(ids=["64-03-17"])["ids"] == []
+    assert collection.count() == total - 1
+
+    # The rebuilt corpus gives the same documents: nothing to reseed
+    build_corpus(str(sources / "sblgnt"), corpus_path, CODE_TO_BOOK)
+    kinds, result = sync()
+    assert kinds == ["corpus", "corpus"]
+    assert result == (0, 0)
+
+    # A changed WEB file is joined from the JSON until the index is rebuilt
+    web_john = sources / "web" / "43-john.json"
+    data = json.loads(web_john.read_text(encoding="utf-8"))
+    for item in data:
+        if item.get("chapterNumber") == 3 and item.get("verseNumber") == 16:
+            item["value"] = "For God so loved the world."
+    web_john.write_text(json.dumps(data), encoding="utf-8")
+
+    _, (reseeded, _) = sync()
+    assert reseeded == 1
+    assert collection.get(ids=["64-03-16"])["metadatas"][0]["english_text"] == "For God so loved the world."
+
+
+def test_write_batches_consumes_stream_lazily():
+    """Test documents are pulled from the generator one batch at a time"""
+    pulled = []
+
+    def documents():
+        for i in range(10):
+            pulled.append(i)
+            yield {"id": f"G{i}", "text": "λόγος", "metadata": {"type": "lexicon"}}
+
+    class Collection(RecordingCollection):
+        def upsert(self, documents, metadatas, ids):
+            assert len(pulled) <= len(self.batches) * 4 + 4
+            super().upsert(documents, metadatas, ids)
+
+    collection = Collection()
+    assert write_batches(collection, documents(), batch_size=4) == 10
+    assert [len(ids) for _, _, ids in collection.batches] == [4, 4, 2]
+
+
+def test_writer_error_is_raised_on_close():
+    """Test a failing insert stops the writer without blocking the producer"""
+    writer = BatchWriter(RecordingCollection(fail_after=1), batch_size=2, queue_size=1)
+    writer.start()
+    for i in range(5):
+        writer.put([{"id": f"G{i}-{j}", "text": "λόγος", "metadata": {}} for j in range(2)])
+
+    with pytest.raises(RuntimeError):
+        writer.close()
+    assert writer.written == 2
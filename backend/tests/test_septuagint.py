@@ -0,0 +1,126 @@
+"""
+Septuagint Tests
+================
+Tests for streaming the Swete LXX TEI files into the corpus and verse store.
+"""
+import json
+import shutil
+
+import pytest
+
+from bible_references import CODE_TO_BOOK, parse_verse_reference
+from config import settings
+from corpus import Corpus
+from english_index import EnglishIndex
+from septuagint import iter_lxx_books, iter_tei_verses, normalize_form
+from main import app
+from services.verse_service import VerseService, get_verse_service
+from verse_store import pack_key
+
+from .conftest import FIXTURES_DIR
+
+LXX_DIR = FIXTURES_DIR / "lxx"
+
+
+@pytest.fixture
+def lxx_path():
+    """Read the LXX fixtures in every verse_service of this module"""
+    return str(LXX_DIR)
+
+
+def test_tei_verses_stream_in_small_chunks():
+    """Test verses are the same however the file is chunked, with notes skipped"""
+    path = str(LXX_DIR / "tlg0527.tlg001.1st1K-grc1.xml")
+    verses = list(iter_tei_verses(path))
+
+    assert [(chapter, verse) for chapter, verse, _ in verses] == [(1, 1), (1, 2), (1, 3)]
+    assert verses[0][2][:3] == ["ἘΝ", "ἀρχῇ", "ἐποίησεν"]
+    assert "om." not in verses[1][2]
+    assert list(iter_tei_verses(path, chunk_size=7)) == verses
+
+
+def test_books_from_milestones_and_split():
+    """Test milestone numbering, lettered verses and the Ezra/Nehemiah split"""
+    books = dict(iter_lxx_books(str(LXX_DIR)))
+
+    assert sorted(books) == [1, 15, 16, 19]
+    psalms = books[19]
+    assert [(chapter, verse) for chapter, verse, _ in psalms] == [(118, 176), (151, 1)]
+    assert psalms[0][2][-1] == "ἐπελαθόμην."  # 176a folded into 176
+    assert books[16] == [(1, 1, ["Λόγοι", "Νεεμία", "υἱοῦ", "Ἀχαλία."])]
+
+    assert sorted(dict(iter_lxx_books(str(LXX_DIR), {1: "Genesis"}))) == [1]
+
+
+def test_lxx_verses_get_no_web_english(client, verse_service, tmp_path, monkeypatch):
+    """Test WEB English (MT numbering) is never joined to Swete-numbered verses"""
+    web_path = tmp_path / "web"
+    shutil.copytree(FIXTURES_DIR / "web_bible_json", web_path)
+    (web_path / "19-psalms.json").write_text(json.dumps([
+        {"type": "paragraph text", "chapterNumber": 118, "verseNumber": 176,
+         "value": "Whatever the WEB numbers Psalm 118:176"},
+        {"type": "paragraph text", "chapterNumber": 119, "verseNumber": 176,
+         "value": "I have gone astray like a lost sheep. Seek your servant, for I don't forget your commandments."},
+    ]), encoding="utf-8")
+    monkeypatch.setattr(settings, "WEB_BIBLE_PATH", str(web_path))
+
+    english = EnglishIndex.from_web_json(str(web_path))
+    assert english.get(pack_key(19, 118, 176)).startswith("Whatever the WEB")
+    assert english.get_parallel(pack_key(19, 118, 176)) is None
+    assert english.get_parallel(pack_key(64, 3, 16)).startswith("For God so loved")
+
+    service = VerseService()
+    _, metadata = service.lookup_verse({"book": 19, "chapter": 118, "verse": 176})
+    assert metadata["english_text"] is None
+
+    app.dependency_overrides[get_verse_service] = lambda: service
+    response = client.get("/api/verses/Ps%20118:176")
+    assert response.status_code == 200
+    assert response.json()["english_text"] is None
+    assert client.get("/api/verses/John%203:16").json()["english_text"].startswith("For God so loved")
+
+
+def test_normalize_form():
+    """Test punctuation is stripped from printed forms"""
+    assert normalize_form("ἀβύσσου·") == "ἀβύσσου"
+    assert normalize_form("γῆν.") == "γῆν"
+
+
+def test_corpus_includes_lxx_before_nt():
+    """Test the LXX is compiled into the corpus with wide keys ahead of the NT"""
+    with Corpus.from_sblgnt(str(FIXTURES_DIR / "sblgnt"), CODE_TO_BOOK, str(LXX_DIR)) as corpus:
+        keys = list(corpus.verse_keys)
+        assert keys == sorted(keys)
+        assert keys[0] == pack_key(1, 1, 1)
+        assert corpus.find_verse(pack_key(19, 118, 176)) is not None
+        assert corpus.find_verse(pack_key(64, 3, 16)) is not None
+
+        token = next(corpus.iter_tokens())
+        assert (token.pos, corpus.string(token.lemma_id)) == ("--", "")
+
+
+def test_parse_septuagint_references():
+    """Test Septuagint book names and three-digit chapters/verses"""
+    assert parse_verse_reference("Ps 118:176") == {"book": 19, "book_name": "Psalms", "chapter": 118, "verse": 176}
+    assert parse_verse_reference("1 Maccabees 1:1")["book"] == 43
+    assert CODE_TO_BOOK[22] == "Song of Songs"
+
+
+def test_lxx_verse_endpoint(client, verse_service, lexicon_service):
+    """Test LXX verses are served like NT verses, labelled with their source"""
+    response = client.get("/api/verses/Genesis%201:1")
+    assert response.status_code == 200
+    assert response.json()["greek_text"].startswith("ἘΝ ἀρχῇ")
+
+    _, metadata = verse_service.lookup_verse({"book": 19, "chapter": 151, "verse": 1})
+    assert metadata["source"] == "LXX (Swete)"
+    _, metadata = verse_service.lookup_verse({"book": 64, "chapter": 3, "verse": 16})
+    assert metadata["source"] == "SBLGNT"
+
+    books = client.get("/api/verses/books/list").json()
+    assert [book["code"] for book in books] == [1, 15, 16, 19, 61, 64]
+
+    # Unlemmatised LXX tokens are not a collocate and their verses are not counted
+    data = client.get("/api/lexicon/strongs/G2316/collocates", params={"min_count": 1, "limit": 50}).json()
+    assert data["total_verses"] == 6
+    assert all(r["lemma"] for r in data["results"])
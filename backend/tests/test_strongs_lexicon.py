@@ -0,0 +1,40 @@
+"""
+Strong's Lexicon Tests
+======================
+Tests for the streaming Strong's/Thayer XML reader and the lexicon seed
+documents built from it.
+"""
+import unicodedata
+
+from seeding import parse_lexicon
+from strongs_lexicon import iter_strongs_entries
+
+from .conftest import FIXTURES_DIR
+
+LEXICON_XML = str(FIXTURES_DIR / "strongsgreek.xml")
+
+
+def test_entries_are_streamed_in_order():
+    """Test entry fields, including mixed-content definitions"""
+    entries = list(iter_strongs_entries(LEXICON_XML))
+    assert [entry.strongs for entry in entries] == ["G25", "G26", "G3056"]
+
+    agapao = entries[0]
+    assert (agapao.key, unicodedata.normalize("NFC", agapao.lemma), agapao.translit, agapao.pronunciation) == (
+        "00025", "ἀγαπάω", "agapáō", "ag-ap-ah'-o"
+    )
+    assert agapao.strongs_def == "to love (in a social or\n moral sense)"
+    assert agapao.derivation == "perhaps from (much) (or compare );"
+    assert agapao.kjv_def == ":--(be-)love(-ed)."
+    assert agapao.see == ("5689", "5368")
+
+
+def test_lexicon_documents():
+    """Test seed documents keep their IDs and text format"""
+    documents = list(parse_lexicon(LEXICON_XML))
+    assert [doc["id"] for doc in documents] == ["G00025", "G00026", "G03056"]
+    assert unicodedata.normalize("NFC", documents[1]["text"]) == (
+        "G00026 ἀγάπη: KJV: :--(feast of) charity(-ably), dear, love.. "
+        "Thayer: love, i.e. affection or benevolence; specially (plural) a\n love-feast"
+    )
+    assert documents[2]["metadata"] == {"source": "Thayer", "strongs": "G03056", "book": "Lexicon", "type": "lexicon"}
@@ -0,0 +1,89 @@
+"""
+Similar Verses Tests
+====================
+Tests for the precomputed TF-IDF neighbour table and the
+/api/verses/{reference}/similar endpoint.
+"""
+import numpy as np
+import pytest
+
+import verse_similarity
+from corpus import Corpus
+from morphology import MorphologyColumns
+from verse_similarity import SimilarityTable, build_similarity_table, nearest_neighbours, tfidf_vectors
+from verse_store import pack_key
+
+
+def brute_force_similarity(columns):
+    """Dense cosine similarity matrix of the TF-IDF vectors, self-similarity excluded"""
+    _keys, starts, lemmas, weights = tfidf_vectors(columns)
+    vectors = np.zeros((len(starts) - 1, columns.corpus.n_strings))
+    for row in range(len(starts) - 1):
+        vectors[row, lemmas[starts[row]:starts[row + 1]]] = weights[starts[row]:starts[row + 1]]
+    similarity = vectors @ vectors.T
+    np.fill_diagonal(similarity, -1)
+    return similarity
+
+
+@pytest.mark.parametrize("dense_lemmas", [1024, 4, 0])
+def test_neighbours_match_brute_force(corpus_path, monkeypatch, dense_lemmas):
+    """Test the blocked dense + sparse product finds the exact top-k neighbours"""
+    monkeypatch.setattr(verse_similarity, "DENSE_LEMMAS", dense_lemmas)
+    with Corpus(corpus_path) as corpus:
+        columns = MorphologyColumns(corpus)
+        expected = brute_force_similarity(columns)
+        _keys, neighbours, scores = nearest_neighbours(columns, k=3, block_size=4)
+
+        for row in range(len(expected)):
+            found = neighbours[row] >= 0
+            assert row not in neighbours[row]
+            np.testing.assert_allclose(scores[row][found], expected[row, neighbours[row][found]], atol=1e-6)
+            top = np.sort(expected[row][expected[row] > 0])[::-1][:3]
+            np.testing.assert_allclose(scores[row][found], top, atol=1e-6)
+
+
+def test_table_file_round_trip(corpus_path, tmp_path):
+    """Test the written table is mapped back as-is and rebuilt when stale"""
+    path = str(tmp_path / "sblgnt.similar")
+    with Corpus(corpus_path) as corpus:
+        columns = MorphologyColumns(corpus)
+        assert build_similarity_table(columns, path, k=5) == corpus.n_verses
+
+        with SimilarityTable.load(path, columns, k=5) as table:
+            assert table.path == path
+            assert table.k == 5
+            similar = table.similar(pack_key(64, 3, 16))
+            assert similar[0][0] == pack_key(64, 3, 17)
+            assert similar == SimilarityTable.from_columns(columns, k=5).similar(pack_key(64, 3, 16))
+            assert table.similar(pack_key(64, 9, 9)) is None
+
+        # Another neighbour count: computed in memory with the requested k
+        with SimilarityTable.load(path, columns, k=3) as table:
+            assert (table.path, table.k) == ("<memory>", 3)
+
+        # Older format versions and truncated files are not fatal
+        data = open(path, 'rb').read()
+        for broken in (data[:4] + bytes([verse_similarity.VERSION + 1]) + data[5:], data[:-8]):
+            with open(path, 'wb') as f:
+                f.write(broken)
+            with pytest.raises(ValueError):
+                SimilarityTable(path)
+            assert SimilarityTable.load(path, columns, k=5).path == "<memory>"
+
+    with Corpus.from_sblgnt(str(tmp_path / "nowhere")) as empty:
+        assert SimilarityTable.load(path, MorphologyColumns(empty)).path == "<memory>"
+
+
+def test_similar_verses_endpoint(client, verse_service):
+    """Test /{reference}/similar returns neighbours with text and scores"""
+    response = client.get("/api/verses/John%201:1/similar", params={"limit": 2})
+    assert response.status_code == 200
+    data = response.json()
+    assert data["reference"] == "John 1:1"
+    assert len(data["verses"]) == 2
+    assert data["verses"][0]["reference"] == "John 1:2"
+    assert data["verses"][0]["greek_text"]
+    assert data["verses"][0]["similarity"] >= data["verses"][1]["similarity"] > 0
+
+    assert client.get("/api/verses/John%203:16-17/similar").status_code == 400
+    assert client.get("/api/verses/John%209:9/similar").status_code == 404
@@ -0,0 +1,106 @@
+"""
+Verse Store Tests
+=================
+Tests for the in-memory verse store used for exact verse lookups.
+"""
+import json
+
+import pytest
+
+from verse_store import VerseStore, pack_key, unpack_key, key_from_reference_id
+
+
+def test_pack_key_round_trip():
+    """Test packing and unpacking verse keys"""
+    assert pack_key(64, 3, 16) == 64003016
+    assert unpack_key(64003016) == (64, 3, 16)
+    assert key_from_reference_id("64-03-16") == 64003016
+
+
+def test_store_keeps_keys_sorted():
+    """Test rows are sorted by key regardless of input order"""
+    store = VerseStore([
+        (64003016, "John 3:16", "Οὕτως γὰρ"),
+        (64001001, "John 1:1", "Ἐν ἀρχῇ"),
+    ])
+
+    assert list(store.keys) == [64001001, 64003016]
+    assert store.get(64001001) == ("Ἐν ἀρχῇ", "John 1:1")
+    assert store.get(640102) is None
+
+
+def test_lookup_verse_uses_store(verse_service):
+    """Test VerseService.lookup_verse is served from the verse store"""
+    text, metadata = verse_service.lookup_verse({"book": 64, "chapter": 3, "verse": 16})
+
+    assert text.startswith("Οὕτως γὰρ ἠγάπησεν")
+    assert metadata["reference"] == "John 3:16"
+    assert metadata["reference_id"] == "64-03-16"
+    assert metadata["english_text"].startswith("For God so loved the world")
+    assert verse_service.collection is None  # ChromaDB never touched
+
+
+def test_get_verse_endpoint(client, verse_service):
+    """Test the verse endpoint returns text from the store"""
+    response = client.get("/api/verses/John%201:1")
+
+    assert response.status_code == 200
+    data = response.json()
+    assert data["reference"] == "John 1:1"
+    assert data["greek_text"].endswith("θεὸς ἦν ὁ λόγος.")
+
+
+def test_lookup_range_is_one_slice(verse_service):
+    """Test lookup_range returns the whole range in verse order"""
+    verses = verse_service.lookup_range(64, 3, 1, 36)
+
+    assert [metadata["reference"] for _, metadata in verses] == ["John 3:16", "John 3:17"]
+    assert verses[1][1]["english_text"].startswith("For God didn't send his Son")
+
+
+def test_get_verse_range_endpoint(client, verse_service):
+    """Test the verse endpoint resolves ranges through lookup_range"""
+    response = client.get("/api/verses/John%201:1-2")
+
+    assert response.status_code == 200
+    data = response.json()
+    assert data["reference"] == "John 1:1-2"
+    assert [v["verse"] for v in data["verses"]] == [1, 2]
+
+
+def test_get_chapter_endpoint(client, verse_service):
+    """Test the chapter endpoint accepts book names and codes"""
+    for book in ("John", "64"):
+        response = client.get(f"/api/verses/chapter/{book}/3")
+
+        assert response.status_code == 200
+        data = response.json()
+        assert data["reference"] == "John 3"
+        assert [v["verse"] for v in data["verses"]] == [16, 17]
+
+    assert client.get("/api/verses/chapter/Nowhere/3").status_code == 400
+    assert client.get("/api/verses/chapter/John/99").status_code == 404
+
+
+def test_stream_book_endpoint(client, verse_service):
+    """Test the book stream yields one JSON verse per line in order"""
+    response = client.get("/api/verses/book/64/stream")
+
+    assert response.status_code == 200
+    assert response.headers["content-type"].startswith("application/x-ndjson")
+    lines = [json.loads(line) for line in response.text.splitlines()]
+    assert [v["reference"] for v in lines] == [
+        "John 1:1", "John 1:2", "John 3:16", "John 3:17", "John 4:2"
+    ]
+
+
+def test_compound_reference_endpoint(client, verse_service):
+    """Test cross-chapter and compound references resolve in one request"""
+    response = client.get("/api/verses/John%203:16-4:2;%20Matt%205:3")
+
+    assert response.status_code == 200
+    data = response.json()
+    assert data["reference"] == "John 3:16-4:2; Matthew 5:3"
+    assert [v["reference"] for v in data["verses"]] == [
+        "John 3:16", "John 3:17", "John 4:2", "Matthew 5:3"
+    ]
@@ -34,11 +34,11 @@ def test_get_verse_by_book_code(client):
     assert "greek_text" in data
 
 
-def test_list_books(client):
-    """Test listing all NT books"""
+def test_list_books(client, verse_service):
+    """Test listing the books with verses loaded (the Matthew and John fixtures)"""
     response = client.get("/api/verses/books/list")
 
     assert response.status_code == 200
     data = response.json()
-    assert "books" in data
-    assert len(data["books"]) == 27  # NT has 27 books
+    assert [(book["code"], book["name"]) for book in data] == [(61, "Matthew"), (64, "John")]
+    assert "jn" in data[1]["abbreviations"]
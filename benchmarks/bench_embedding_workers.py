@@ -0,0 +1,103 @@
+#!/usr/bin/env python3
+"""
+Benchmark: Embedding Throughput per Worker Count
+================================================
+Embeds the verse documents of the seed corpus with ParallelEmbedder at
+several worker counts (1, 2, 4, ... up to the CPU count) and reports
+docs/sec for each, to size machines for collection builds. The embedding
+cache is not used, so every document is embedded.
+
+Each row is timed after a warm-up batch, so model loading in the workers
+is not counted.
+
+Usage (from the project root, with the Chroma ONNX model downloaded):
+    python benchmarks/bench_embedding_workers.py [--docs 2000] [--workers 1,2,4] [--markdown report.md]
+"""
+
+import argparse
+import os
+import sys
+import time
+from itertools import islice
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from embedding_workers import SHARD_SIZE, ParallelEmbedder, threads_per_worker
+from gospel_parser_interlinear import CODE_TO_BOOK, CORPUS_PATH, GNT_PATH, LEXICON_PATH, LXX_PATH
+from seeding import iter_task_documents, seed_tasks
+
+
+def worker_counts(cpus: int):
+    """1, 2, 4, ... up to (and including) ``cpus``."""
+    counts = []
+    count = 1
+    while count < cpus:
+        counts.append(count)
+        count *= 2
+    return counts + [cpus]
+
+
+def load_texts(limit: int):
+    """Texts of the first ``limit`` verse documents of the seed corpus."""
+    from corpus import Corpus
+
+    corpus = Corpus.load(CORPUS_PATH, GNT_PATH, CODE_TO_BOOK, lxx_path=LXX_PATH)
+    tasks = [task for task in seed_tasks(LEXICON_PATH, CORPUS_PATH, GNT_PATH, CODE_TO_BOOK, LXX_PATH)
+             if task.kind != "lexicon"]
+    documents = (doc for task in tasks for doc in iter_task_documents(task, corpus, None))
+    return [doc["text"] for doc in islice(documents, limit)]
+
+
+def time_workers(texts, workers, threads, shard_size):
+    """Seconds to embed ``texts`` with ``workers`` processes (after a warm-up)."""
+    with ParallelEmbedder(workers, threads, shard_size=shard_size) as embed:
+        embed(texts[:shard_size * workers])
+        start = time.perf_counter()
+        embed(texts)
+        return time.perf_counter() - start
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--docs", type=int, default=2000, help="Number of documents to embed per run")
+    parser.add_argument("--workers", help="Comma-separated worker counts (default: 1, 2, 4, ... CPUs)")
+    parser.add_argument("--threads", type=int, help="Intra-op threads per worker (default: CPUs / workers)")
+    parser.add_argument("--shard-size", type=int, default=SHARD_SIZE, help="Texts per worker task")
+    parser.add_argument("--markdown", help="Also write the report as a markdown table to this file")
+    args = parser.parse_args()
+
+    texts = load_texts(args.docs)
+    if not texts:
+        print(f"No documents found in {CORPUS_PATH} or {GNT_PATH}. Is the sblgnt submodule checked out?")
+        return 1
+
+    cpus = os.cpu_count() or 1
+    counts = [int(n) for n in args.workers.split(",")] if args.workers else worker_counts(cpus)
+    print(f"Embedding {len(texts)} documents on {cpus} CPUs (shard size {args.shard_size}):\n")
+
+    rows = []
+    baseline = None
+    for workers in counts:
+        threads = args.threads or threads_per_worker(workers)
+        elapsed = time_workers(texts, workers, threads, args.shard_size)
+        rate = len(texts) / elapsed
+        baseline = baseline or rate
+        rows.append((workers, threads, rate, rate / baseline))
+        print(f"  {workers:>3} workers x {threads:>2} threads   {rate:10.1f} docs/sec   ({rate / baseline:.2f}x)")
+
+    if args.markdown:
+        lines = [
+            f"Embedding throughput, {len(texts)} documents, {cpus} CPUs",
+            "",
+            "| Workers | Threads/worker | Docs/sec | Speedup |",
+            "|--------:|---------------:|---------:|--------:|",
+        ]
+        lines += [f"| {w} | {t} | {rate:.1f} | {speedup:.2f}x |" for w, t, rate, speedup in rows]
+        Path(args.markdown).write_text("\n".join(lines) + "\n", encoding="utf-8")
+        print(f"\nWrote {args.markdown}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,116 @@
+#!/usr/bin/env python3
+"""
+Benchmark: Greek Normalisation
+==============================
+Checks the translate-table normalisers of greek_text (strip_accents,
+grave_to_acute, fold_greek) against their unicodedata reference forms on
+every word of the enhanced lexicon and the SBLGNT, then times both.
+
+Exits with status 1 if any word normalises differently.
+
+Usage (from the project root, with the sblgnt submodule checked out):
+    python benchmarks/bench_greek_normalization.py [--lexicon enhanced_lexicon.json] [--repeat 5]
+"""
+
+import argparse
+import json
+import os
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from corpus import iter_morphgnt_tokens, sblgnt_book_files
+from gospel_parser_interlinear import CODE_TO_BOOK, GNT_PATH
+from greek_text import (
+    FOLD_STRIP, fold_greek, grave_to_acute, grave_to_acute_reference, strip_accents, strip_accents_reference,
+)
+from lexicon_store import LEXICON_JSON_PATH
+
+LEXICON_FIELDS = ("lemma", "transliteration", "definition_strongs", "definition_kjv", "derivation")
+
+
+def fold_greek_reference(text: str) -> str:
+    """fold_greek through strip_accents_reference."""
+    return strip_accents_reference(text.strip(FOLD_STRIP)).lower().strip() if text else ""
+
+
+def lexicon_words(path):
+    """Every field value of the lexicon, and every word in them."""
+    if not os.path.exists(path):
+        return []
+    with open(path, "r", encoding="utf-8") as f:
+        lexicon = json.load(f)
+    words = []
+    for entry in lexicon.values():
+        for field in LEXICON_FIELDS:
+            value = entry.get(field) or ""
+            words.append(value)
+            words.extend(value.split())
+    return words
+
+
+def sblgnt_words(gnt_path):
+    """FORM, NORM and LEMMA of every SBLGNT token."""
+    words = []
+    for path in sblgnt_book_files(gnt_path, CODE_TO_BOOK).values():
+        for token in iter_morphgnt_tokens(path):
+            words.extend((token.form, token.norm, token.lemma))
+    return words
+
+
+def check(label, convert, reference, words):
+    """Number of distinct words ``convert`` and ``reference`` disagree on."""
+    mismatches = [word for word in set(words) if convert(word) != reference(word)]
+    for word in mismatches[:5]:
+        print(f"  {label}: {word!r} -> {convert(word)!r}, expected {reference(word)!r}")
+    return len(mismatches)
+
+
+def time_per_word(convert, words, repeat):
+    """Best microseconds per word over ``repeat`` passes."""
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        for word in words:
+            convert(word)
+        best = min(best, time.perf_counter() - start)
+    return best * 1e6 / len(words)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--lexicon", default=LEXICON_JSON_PATH, help="Enhanced lexicon JSON")
+    parser.add_argument("--sblgnt", default=GNT_PATH, help="Directory of SBLGNT morphgnt files")
+    parser.add_argument("--repeat", type=int, default=5, help="Timing passes (the best is reported)")
+    args = parser.parse_args()
+
+    corpora = {"lexicon": lexicon_words(args.lexicon), "SBLGNT": sblgnt_words(args.sblgnt)}
+    corpora = {name: words for name, words in corpora.items() if words}
+    if not corpora:
+        print(f"Neither {args.lexicon} nor {args.sblgnt} found.")
+        return 1
+
+    pairs = (
+        ("strip_accents", strip_accents, strip_accents_reference),
+        ("grave_to_acute", grave_to_acute, grave_to_acute_reference),
+        ("fold_greek", fold_greek, fold_greek_reference),
+    )
+
+    failed = False
+    for name, words in corpora.items():
+        print(f"\n{name}: {len(words)} words ({len(set(words))} distinct)")
+        for label, convert, reference in pairs:
+            mismatches = check(label, convert, reference, words)
+            failed |= bool(mismatches)
+            reference_us = time_per_word(reference, words, args.repeat)
+            table_us = time_per_word(convert, words, args.repeat)
+            print(f"  {label:<15} {reference_us:8.3f} -> {table_us:8.3f} us/word  "
+                  f"({reference_us / table_us:5.1f}x, {mismatches} mismatches)")
+
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
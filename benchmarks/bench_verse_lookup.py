@@ -0,0 +1,74 @@
+#!/usr/bin/env python3
+"""
+Benchmark: Verse Lookup Paths
+=============================
+Compares exact verse lookups through a ChromaDB metadata filter
+(``collection.get(where={"reference_id": ...})``) against the in-memory
+VerseStore.
+
+Usage (from the project root, after seeding chroma_db_interlinear):
+    python benchmarks/bench_verse_lookup.py [--samples 500]
+"""
+
+import argparse
+import random
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+import chromadb
+
+from gospel_parser_interlinear import CHROMA_DB_PATH, COLLECTION_NAME, CODE_TO_BOOK, GNT_PATH
+from verse_store import VerseStore, unpack_key
+
+
+def time_lookups(label, lookup, keys):
+    """Run ``lookup`` over every key and print per-lookup timings."""
+    start = time.perf_counter()
+    found = sum(1 for key in keys if lookup(key))
+    elapsed = time.perf_counter() - start
+    print(f"  {label:<28} {elapsed * 1000 / len(keys):10.4f} ms/lookup   ({found}/{len(keys)} found)")
+    return elapsed
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--samples", type=int, default=500, help="Number of random verses to look up")
+    parser.add_argument("--seed", type=int, default=0, help="Random seed for verse sampling")
+    args = parser.parse_args()
+
+    start = time.perf_counter()
+    store = VerseStore.from_sblgnt(GNT_PATH, CODE_TO_BOOK)
+    load_ms = (time.perf_counter() - start) * 1000
+    if not len(store):
+        print(f"No verses found in {GNT_PATH}. Is the sblgnt submodule checked out?")
+        return 1
+
+    print(f"VerseStore: {len(store)} verses loaded in {load_ms:.1f} ms")
+
+    random.seed(args.seed)
+    keys = random.choices(list(store.keys), k=args.samples)
+
+    print(f"\nLooking up {len(keys)} random verses:")
+    store_time = time_lookups("VerseStore.get", store.get, keys)
+
+    try:
+        collection = chromadb.PersistentClient(path=CHROMA_DB_PATH).get_collection(name=COLLECTION_NAME)
+    except Exception as e:
+        print(f"  ChromaDB collection unavailable ({e}); skipping ChromaDB path")
+        return 0
+
+    def chroma_lookup(key):
+        book, chapter, verse = unpack_key(key)
+        results = collection.get(where={"reference_id": f"{book:02d}-{chapter:02d}-{verse:02d}"})
+        return bool(results["documents"])
+
+    chroma_time = time_lookups("collection.get(where=...)", chroma_lookup, keys)
+    print(f"\nSpeed-up: {chroma_time / store_time:,.0f}x")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,335 @@
+#!/usr/bin/env python3
+"""
+Bible References - Shared Verse Reference Parser
+=================================================
+Single reference parser for the CLI and the backend.
+
+Book names and abbreviations are resolved through one precomputed
+alias -> code dict instead of a scan over BIBLE_BOOKS, the regular
+expressions are compiled once at import, and parsed results are cached
+(``lru_cache``) by normalised input string, so repeated references cost a
+dict lookup.
+
+Besides single verses and ranges, compound references are supported:
+
+    John 3:16               single verse
+    John 3:16-18            range within a chapter
+    John 3:16-4:2           range across chapters
+    John 3                  whole chapter
+    John 3:16; Rom 5:8, 12  several references; ', N' continues the chapter
+    John 3:16; 4:2          the book carries over to the next group
+
+Each reference resolves to a VerseSpan whose start/end keys are packed
+verse keys (see verse_store.py), so a whole compound query can be served by
+slicing the sorted verse store once per span.
+
+Usage:
+    from bible_references import parse_references, format_references
+
+    spans = parse_references("John 3:16-4:2; Rom 5:8, 12")
+    if spans:
+        print(format_references(spans))
+"""
+
+import re
+from functools import lru_cache
+from typing import Dict, List, NamedTuple, Optional, Tuple, Union
+
+from verse_store import CHAPTER_STRIDE, pack_key
+
+# --- BIBLE BOOK MAPPING ---
+# Maps book names to numeric codes: 1-39 Old Testament (WEB numbering),
+# 40-54 books only in the Septuagint, 61-87 New Testament (SBLGNT numbering)
+BIBLE_BOOKS = {
+    # Old Testament (Septuagint)
+    "genesis": {"code": 1, "abbrev": ["ge", "gen", "gn"]},
+    "exodus": {"code": 2, "abbrev": ["ex", "exo", "exod"]},
+    "leviticus": {"code": 3, "abbrev": ["le", "lev", "lv"]},
+    "numbers": {"code": 4, "abbrev": ["nu", "num", "nm"]},
+    "deuteronomy": {"code": 5, "abbrev": ["dt", "deu", "deut"]},
+    "joshua": {"code": 6, "abbrev": ["jos", "josh"]},
+    "judges": {"code": 7, "abbrev": ["jdg", "judg", "jg"]},
+    "ruth": {"code": 8, "abbrev": ["ru", "rut", "rth"]},
+    "1 samuel": {"code": 9, "abbrev": ["1sa", "1sam", "1 sam", "1 sa", "1 kingdoms", "1 kgdms"]},
+    "2 samuel": {"code": 10, "abbrev": ["2sa", "2sam", "2 sam", "2 sa", "2 kingdoms", "2 kgdms"]},
+    "1 kings": {"code": 11, "abbrev": ["1ki", "1kgs", "1 kgs", "1 ki", "3 kingdoms", "3 kgdms"]},
+    "2 kings": {"code": 12, "abbrev": ["2ki", "2kgs", "2 kgs", "2 ki", "4 kingdoms", "4 kgdms"]},
+    "1 chronicles": {"code": 13, "abbrev": ["1ch", "1chr", "1 chr", "1 chron", "1 paralipomenon"]},
+    "2 chronicles": {"code": 14, "abbrev": ["2ch", "2chr", "2 chr", "2 chron", "2 paralipomenon"]},
+    "ezra": {"code": 15, "abbrev": ["ezr", "2 esdras", "2esd", "2 esd"]},
+    "nehemiah": {"code": 16, "abbrev": ["ne", "neh"]},
+    "esther": {"code": 17, "abbrev": ["es", "est", "esth"]},
+    "job": {"code": 18, "abbrev": ["jb"]},
+    "psalms": {"code": 19, "abbrev": ["ps", "psa", "psalm", "pss"]},
+    "proverbs": {"code": 20, "abbrev": ["pr", "pro", "prov", "prv"]},
+    "ecclesiastes": {"code": 21, "abbrev": ["ec", "ecc", "eccl", "qoh"]},
+    "song of songs": {"code": 22, "abbrev": ["song", "sng", "sos", "song of solomon", "canticles"]},
+    "isaiah": {"code": 23, "abbrev": ["is", "isa"]},
+    "jeremiah": {"code": 24, "abbrev": ["je", "jer"]},
+    "lamentations": {"code": 25, "abbrev": ["la", "lam"]},
+    "ezekiel": {"code": 26, "abbrev": ["eze", "ezek", "ezk"]},
+    "daniel": {"code": 27, "abbrev": ["da", "dan", "dn"]},
+    "hosea": {"code": 28, "abbrev": ["ho", "hos"]},
+    "joel": {"code": 29, "abbrev": ["jl", "joe"]},
+    "amos": {"code": 30, "abbrev": ["am", "amo"]},
+    "obadiah": {"code": 31, "abbrev": ["ob", "oba", "obad"]},
+    "jonah": {"code": 32, "abbrev": ["jon", "jnh"]},
+    "micah": {"code": 33, "abbrev": ["mi", "mic"]},
+    "nahum": {"code": 34, "abbrev": ["na", "nah"]},
+    "habakkuk": {"code": 35, "abbrev": ["hab", "hb"]},
+    "zephaniah": {"code": 36, "abbrev": ["zep", "zeph"]},
+    "haggai": {"code": 37, "abbrev": ["hag", "hg"]},
+    "zechariah": {"code": 38, "abbrev": ["zec", "zech"]},
+    "malachi": {"code": 39, "abbrev": ["mal", "ml"]},
+    # Septuagint only
+    "1 esdras": {"code": 40, "abbrev": ["1esd", "1 esd"]},
+    "tobit": {"code": 41, "abbrev": ["tob", "tb"]},
+    "judith": {"code": 42, "abbrev": ["jdt", "jth"]},
+    "1 maccabees": {"code": 43, "abbrev": ["1ma", "1mac", "1macc", "1 mac", "1 macc"]},
+    "2 maccabees": {"code": 44, "abbrev": ["2ma", "2mac", "2macc", "2 mac", "2 macc"]},
+    "3 maccabees": {"code": 45, "abbrev": ["3ma", "3mac", "3macc", "3 mac", "3 macc"]},
+    "4 maccabees": {"code": 46, "abbrev": ["4ma", "4mac", "4macc", "4 mac", "4 macc"]},
+    "odes": {"code": 47, "abbrev": ["ode", "odes of solomon"]},
+    "wisdom": {"code": 48, "abbrev": ["wis", "wisd", "wisdom of solomon"]},
+    "sirach": {"code": 49, "abbrev": ["sir", "ecclus", "ecclesiasticus"]},
+    "psalms of solomon": {"code": 50, "abbrev": ["pssol", "pss sol", "ps sol"]},
+    "baruch": {"code": 51, "abbrev": ["bar"]},
+    "epistle of jeremiah": {"code": 52, "abbrev": ["epjer", "ep jer", "letter of jeremiah"]},
+    "susanna": {"code": 53, "abbrev": ["sus"]},
+    "bel and the dragon": {"code": 54, "abbrev": ["bel"]},
+    # New Testament
+    "matthew": {"code": 61, "abbrev": ["mt", "matt", "mat"]},
+    "mark": {"code": 62, "abbrev": ["mk", "mar"]},
+    "luke": {"code": 63, "abbrev": ["lk", "luk", "lu"]},
+    "john": {"code": 64, "abbrev": ["jn", "joh"]},
+    "acts": {"code": 65, "abbrev": ["ac", "act"]},
+    "romans": {"code": 66, "abbrev": ["ro", "rom", "rm"]},
+    "1 corinthians": {"code": 67, "abbrev": ["1co", "1cor", "1 cor"]},
+    "2 corinthians": {"code": 68, "abbrev": ["2co", "2cor", "2 cor"]},
+    "galatians": {"code": 69, "abbrev": ["ga", "gal"]},
+    "ephesians": {"code": 70, "abbrev": ["eph", "ephes"]},
+    "philippians": {"code": 71, "abbrev": ["php", "phil", "pp"]},
+    "colossians": {"code": 72, "abbrev": ["col"]},
+    "1 thessalonians": {"code": 73, "abbrev": ["1th", "1thes", "1thess", "1 thess", "1 th"]},
+    "2 thessalonians": {"code": 74, "abbrev": ["2th", "2thes", "2thess", "2 thess", "2 th"]},
+    "1 timothy": {"code": 75, "abbrev": ["1ti", "1tim", "1 tim", "1 ti"]},
+    "2 timothy": {"code": 76, "abbrev": ["2ti", "2tim", "2 tim", "2 ti"]},
+    "titus": {"code": 77, "abbrev": ["tit", "ti"]},
+    "philemon": {"code": 78, "abbrev": ["phm", "philem", "pm"]},
+    "hebrews": {"code": 79, "abbrev": ["heb", "he"]},
+    "james": {"code": 80, "abbrev": ["jas", "jam", "jm"]},
+    "1 peter": {"code": 81, "abbrev": ["1pe", "1pet", "1pt", "1 pet", "1 pe"]},
+    "2 peter": {"code": 82, "abbrev": ["2pe", "2pet", "2pt", "2 pet", "2 pe"]},
+    "1 john": {"code": 83, "abbrev": ["1jn", "1jo", "1j", "1 joh", "1 john"]},
+    "2 john": {"code": 84, "abbrev": ["2jn", "2jo", "2j", "2 joh", "2 john"]},
+    "3 john": {"code": 85, "abbrev": ["3jn", "3jo", "3j", "3 joh", "3 john"]},
+    "jude": {"code": 86, "abbrev": ["jud", "jd"]},
+    "revelation": {"code": 87, "abbrev": ["re", "rev", "rv"]},
+}
+
+_LOWERCASE_WORDS = {"of", "and", "the"}
+
+
+def _display_name(name: str) -> str:
+    """'song of songs' -> 'Song of Songs', '1 john' -> '1 John'."""
+    return " ".join(word if word in _LOWERCASE_WORDS else word.capitalize() for word in name.split())
+
+
+# Reverse lookup: code to book name
+CODE_TO_BOOK = {info["code"]: _display_name(name) for name, info in BIBLE_BOOKS.items()}
+
+# Codes below this are Septuagint books
+FIRST_NT_BOOK = 61
+
+LAST_VERSE = CHAPTER_STRIDE - 1
+
+
+def _build_alias_table(books: Dict[str, dict]) -> Dict[str, int]:
+    """
+    Map every book name and abbreviation to its code.
+
+    Numbered books are registered with and without the space after the
+    number ('1 john', '1john'), so either spelling is a single dict hit.
+    """
+    aliases: Dict[str, int] = {}
+    for name, info in books.items():
+        for alias in [name, *info["abbrev"]]:
+            variants = {alias, alias.replace(" ", "")}
+            match = re.match(r'^(\d)\s*(\D.*)$', alias)
+            if match:
+                variants.add(f"{match.group(1)} {match.group(2)}")
+            for variant in variants:
+                aliases.setdefault(variant, info["code"])
+    return aliases
+
+
+BOOK_ALIASES = _build_alias_table(BIBLE_BOOKS)
+
+# Optional book (possibly numbered), then the chapter/verse part
+_GROUP_RE = re.compile(r'^(?:(?P<book>(?:\d\s*)?[a-z][a-z .]*?)\.?\s+)?(?P<refs>\d[\d\s:,\-–]*)$')
+# [C:]V[-[C:]V] or C[-C]
+_PIECE_RE = re.compile(r'^(?:(\d+):)?(\d+)(?:[-–](?:(\d+):)?(\d+))?$')
+_SPACES_RE = re.compile(r'\s+')
+_PUNCT_SPACES_RE = re.compile(r'\s*([:\-–])\s*')
+
+
+class VerseSpan(NamedTuple):
+    """An inclusive verse range within one book."""
+    book: int
+    start_chapter: int
+    start_verse: int
+    end_chapter: int
+    end_verse: int
+
+    @property
+    def start_key(self) -> int:
+        return pack_key(self.book, self.start_chapter, self.start_verse)
+
+    @property
+    def end_key(self) -> int:
+        return pack_key(self.book, self.end_chapter, self.end_verse)
+
+    @property
+    def book_name(self) -> str:
+        return CODE_TO_BOOK[self.book]
+
+    @property
+    def is_single_verse(self) -> bool:
+        return self.start_key == self.end_key
+
+
+def normalize_reference(ref_string: str) -> str:
+    """Lowercase, trim and collapse whitespace (the lru_cache key)."""
+    return _SPACES_RE.sub(" ", ref_string.strip().lower())
+
+
+def resolve_book(book: str) -> Optional[int]:
+    """
+    Resolve a book name, abbreviation or numeric code to a book code.
+
+    Args:
+        book: e.g. 'John', 'jn', '1 Jn', 'Rom.' or '64'
+
+    Returns:
+        SBLGNT book code or None if unknown
+    """
+    book = normalize_reference(book).rstrip(".")
+    if book.isdigit():
+        code = int(book)
+        return code if code in CODE_TO_BOOK else None
+    return BOOK_ALIASES.get(book)
+
+
+def _valid(chapter: int, verse: int) -> bool:
+    return 1 <= chapter <= LAST_VERSE and 1 <= verse <= LAST_VERSE
+
+
+@lru_cache(maxsize=4096)
+def _parse_normalized(ref_string: str) -> Optional[Tuple[VerseSpan, ...]]:
+    """Parse a normalised reference string into spans (cached)."""
+    spans: List[VerseSpan] = []
+    book = None
+
+    for group in ref_string.split(";"):
+        match = _GROUP_RE.match(group.strip())
+        if not match:
+            return None
+
+        if match.group("book"):
+            book = BOOK_ALIASES.get(match.group("book").strip())
+        if book is None:
+            return None
+
+        chapter = None
+        for piece in match.group("refs").split(","):
+            piece_match = _PIECE_RE.match(_PUNCT_SPACES_RE.sub(r"\1", piece.strip()))
+            if not piece_match:
+                return None
+            start_ch, start_v, end_ch, end_v = piece_match.groups()
+
+            if start_ch is not None:
+                # C:V, C:V-V or C:V-C:V
+                chapter = int(start_ch)
+                span = VerseSpan(
+                    book, chapter, int(start_v),
+                    int(end_ch) if end_ch else chapter,
+                    int(end_v) if end_v else int(start_v),
+                )
+            elif chapter is not None:
+                # ", V" or ", V-V" continues the current chapter
+                if end_ch is not None:
+                    return None
+                span = VerseSpan(book, chapter, int(start_v), chapter, int(end_v or start_v))
+            else:
+                # Whole chapter(s): C or C-C
+                if end_ch is not None:
+                    return None
+                span = VerseSpan(book, int(start_v), 1, int(end_v or start_v), LAST_VERSE)
+
+            if not (_valid(span.start_chapter, span.start_verse)
+                    and _valid(span.end_chapter, span.end_verse)
+                    and span.start_key <= span.end_key):
+                return None
+            spans.append(span)
+
+    return tuple(spans) if spans else None
+
+
+def parse_references(ref_string: str) -> Optional[Tuple[VerseSpan, ...]]:
+    """
+    Parse a (possibly compound) reference string into verse spans.
+
+    Args:
+        ref_string: e.g. 'John 3:16', 'John 3:16-4:2; Rom 5:8, 12'
+
+    Returns:
+        Tuple of VerseSpan in query order, or None if anything is invalid
+    """
+    return _parse_normalized(normalize_reference(ref_string))
+
+
+def parse_verse_reference(ref_string: str) -> Optional[Union[dict, List[dict]]]:
+    """
+    Parses verse references like:
+    - 'John 3:16' → {'book': 64, 'chapter': 3, 'verse': 16}
+    - 'John 3:16-18' → [{'book': 64, 'chapter': 3, 'verse': 16}, ...]
+    - '1 John 2:1' → {'book': 83, 'chapter': 2, 'verse': 1}
+
+    Compound and cross-chapter references cannot be expanded without the
+    verse data and return None here; use ``parse_references`` for those.
+
+    Returns: dict or list of dicts with verse info, or None if invalid
+    """
+    spans = parse_references(ref_string)
+    if not spans or len(spans) > 1:
+        return None
+
+    span = spans[0]
+    if span.start_chapter != span.end_chapter or span.end_verse == LAST_VERSE:
+        return None
+
+    verses = [
+        {"book": span.book, "book_name": span.book_name, "chapter": span.start_chapter, "verse": v}
+        for v in range(span.start_verse, span.end_verse + 1)
+    ]
+    return verses[0] if len(verses) == 1 and "-" not in ref_string else verses
+
+
+def format_span(span: VerseSpan) -> str:
+    """Format a span as 'John 3:16', 'John 3:16-18', 'John 3:16-4:2' or 'John 3'."""
+    if span.start_verse == 1 and span.end_verse == LAST_VERSE:
+        if span.start_chapter == span.end_chapter:
+            return f"{span.book_name} {span.start_chapter}"
+        return f"{span.book_name} {span.start_chapter}-{span.end_chapter}"
+
+    start = f"{span.book_name} {span.start_chapter}:{span.start_verse}"
+    if span.is_single_verse:
+        return start
+    if span.start_chapter == span.end_chapter:
+        return f"{start}-{span.end_verse}"
+    return f"{start}-{span.end_chapter}:{span.end_verse}"
+
+
+def format_references(spans: Tuple[VerseSpan, ...]) -> str:
+    """Format parsed spans back into a canonical reference string."""
+    return "; ".join(format_span(span) for span in spans)
@@ -0,0 +1,95 @@
+#!/usr/bin/env python3
+"""
+Compiles the SBLGNT morphgnt text files (and the Swete LXX TEI files, when
+the LXX-Swete submodule is checked out) into the binary corpus file, the
+similar-verses neighbour table computed from it, and the WEB JSON files into
+the English verse index, and enhanced_lexicon.json into the lexicon store,
+all read by the backend and the CLI (see corpus.py, verse_similarity.py,
+english_index.py and lexicon_store.py).
+
+Run once after cloning/updating the sblgnt or LXX-Swete submodules or downloading the WEB:
+    python build_corpus.py [--sblgnt sblgnt/] [--lxx LXX-Swete/src/First1KGreek-LXX-RAW/]
+                           [--output corpus_data/sblgnt.corpus]
+                           [--similar-output corpus_data/sblgnt.similar]
+                           [--web web_bible_json/] [--english-output corpus_data/web_english.idx]
+                           [--lexicon enhanced_lexicon.json] [--lexicon-output corpus_data/enhanced_lexicon.lex]
+"""
+
+import argparse
+import os
+import sys
+import time
+
+from corpus import Corpus, build_corpus
+from english_index import build_english_index
+from lexicon_store import LEXICON_JSON_PATH, LEXICON_STORE_PATH, build_lexicon_store
+from gospel_parser_interlinear import (
+    CODE_TO_BOOK, CORPUS_PATH, ENGLISH_INDEX_PATH, GNT_PATH, LXX_PATH, SIMILARITY_PATH, WEB_BIBLE_PATH
+)
+from morphology import MorphologyColumns
+from verse_similarity import build_similarity_table
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Build the binary SBLGNT corpus, similar-verses table, WEB English index and lexicon store")
+    parser.add_argument("--sblgnt", default=GNT_PATH, help="Directory containing *-morphgnt.txt files")
+    parser.add_argument("--lxx", default=LXX_PATH, help="Directory containing the Swete LXX TEI files (optional)")
+    parser.add_argument("--output", default=CORPUS_PATH, help="Corpus file to write")
+    parser.add_argument("--similar-output", default=SIMILARITY_PATH, help="Similar-verses table to write")
+    parser.add_argument("--web", default=WEB_BIBLE_PATH, help="Directory containing the WEB JSON files")
+    parser.add_argument("--english-output", default=ENGLISH_INDEX_PATH, help="English index file to write")
+    parser.add_argument("--lexicon", default=LEXICON_JSON_PATH, help="Enhanced lexicon JSON to compile")
+    parser.add_argument("--lexicon-output", default=LEXICON_STORE_PATH, help="Lexicon store file to write")
+    args = parser.parse_args()
+
+    print("=" * 60)
+    print("SBLGNT Corpus + WEB English Index Builder")
+    print("=" * 60)
+
+    if not os.path.isdir(args.sblgnt):
+        print(f"✗ SBLGNT directory not found at {args.sblgnt}")
+        return 1
+
+    if not os.path.isdir(args.lxx):
+        print(f"⚠ LXX not found at {args.lxx} - building the New Testament only")
+        print("  Run 'git submodule update --init LXX-Swete' to include the Septuagint")
+
+    start = time.perf_counter()
+    n_tokens, n_verses = build_corpus(args.sblgnt, args.output, CODE_TO_BOOK, args.lxx)
+    elapsed = time.perf_counter() - start
+
+    with Corpus(args.output) as corpus:
+        n_strings = corpus.n_strings
+
+    print(f"✓ {n_tokens} tokens, {n_verses} verses, {n_strings} strings in {elapsed:.2f}s")
+    print(f"✓ Wrote {os.path.abspath(args.output)} ({os.path.getsize(args.output) / 1024:.0f} KB)")
+
+    start = time.perf_counter()
+    with Corpus(args.output) as corpus:
+        build_similarity_table(MorphologyColumns(corpus), args.similar_output)
+    elapsed = time.perf_counter() - start
+
+    print(f"✓ Similar-verses neighbour table in {elapsed:.2f}s")
+    print(f"✓ Wrote {os.path.abspath(args.similar_output)} ({os.path.getsize(args.similar_output) / 1024:.0f} KB)")
+
+    if not os.path.isdir(args.web):
+        print(f"⚠ WEB Bible not found at {args.web} - skipping English index")
+        print("  Run 'python download_web_bible.py' to download it")
+    else:
+        n_english = build_english_index(args.web, args.english_output)
+        print(f"✓ {n_english} English verses")
+        print(f"✓ Wrote {os.path.abspath(args.english_output)} ({os.path.getsize(args.english_output) / 1024:.0f} KB)")
+
+    if not os.path.exists(args.lexicon):
+        print(f"⚠ Enhanced lexicon not found at {args.lexicon} - skipping lexicon store")
+        print("  Run 'python build_enhanced_lexicon.py' to build it")
+        return 0
+
+    n_entries = build_lexicon_store(args.lexicon, args.lexicon_output)
+    print(f"✓ {n_entries} lexicon entries")
+    print(f"✓ Wrote {os.path.abspath(args.lexicon_output)} ({os.path.getsize(args.lexicon_output) / 1024:.0f} KB)")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -10,13 +10,19 @@ Usage:
 Output:
     - ChromaDB collection: lexicon_enhanced
     - JSON backup: enhanced_lexicon.json
+    - Compiled lexicon store: corpus_data/enhanced_lexicon.lex
 """
 
 import json
 import sys
 import chromadb
 from chromadb.config import Settings
+from chromadb.utils.embedding_functions import DefaultEmbeddingFunction
+from embedding_cache import CachedEmbedder, EmbeddingCache
+from embedding_workers import ParallelEmbedder
+from lexicon_store import LEXICON_STORE_PATH, build_lexicon_store
 from lexicon_integration import build_enhanced_lexicon
+from seeding import write_batches
 
 
 # Configuration
@@ -25,6 +31,7 @@ SBLGNT_PATH = "sblgnt"
 CHROMA_DB_PATH = "chroma_db_interlinear"
 COLLECTION_NAME = "lexicon_enhanced"
 JSON_BACKUP = "enhanced_lexicon.json"
+EMBEDDING_CACHE_PATH = "corpus_data/embedding_cache.sqlite"
 
 
 def format_lexicon_text(entry):
@@ -65,46 +72,14 @@ def format_lexicon_text(entry):
     return "\n".join(parts)
 
 
-def build_chromadb_collection(enhanced_lexicon):
+def iter_lexicon_documents(enhanced_lexicon):
     """
-    Store enhanced lexicon in ChromaDB for semantic search.
-
-    Creates collection with:
+    Yield one ChromaDB document per lexicon entry:
     - Text: Formatted lexicon entry (for embedding)
     - Metadata: Strong's number, lemma, POS, occurrence count, etc.
     - ID: Strong's number (G1, G2, etc.)
     """
-    print(f"\n{'='*60}")
-    print("STORING IN CHROMADB")
-    print(f"{'='*60}")
-
-    # Initialize ChromaDB
-    client = chromadb.PersistentClient(path=CHROMA_DB_PATH)
-
-    # Delete existing collection if it exists
-    try:
-        client.delete_collection(name=COLLECTION_NAME)
-        print(f"Deleted existing collection: {COLLECTION_NAME}")
-    except:
-        pass
-
-    # Create new collection
-    collection = client.create_collection(
-        name=COLLECTION_NAME,
-        metadata={"description": "Enhanced Thayer's Greek Lexicon with SBLGNT morphology"}
-    )
-
-    print(f"Created collection: {COLLECTION_NAME}")
-
-    # Prepare data for batch insertion
-    documents = []
-    metadatas = []
-    ids = []
-
     for strongs_id, entry in enhanced_lexicon.items():
-        # Format text for embedding
-        text = format_lexicon_text(entry)
-
         # Prepare metadata (ChromaDB requires simple types, no nested dicts)
         metadata = {
             "strongs": entry['strongs'],
@@ -131,27 +106,53 @@ def build_chromadb_collection(enhanced_lexicon):
                 top_case = max(morph['cases'].items(), key=lambda x: x[1])
                 metadata["top_case"] = top_case[0]
 
-        documents.append(text)
-        metadatas.append(metadata)
-        ids.append(strongs_id)
+        # Format text for embedding
+        yield {"id": strongs_id, "text": format_lexicon_text(entry), "metadata": metadata}
 
-    # Batch insert (ChromaDB has batch size limits)
-    print(f"Inserting {len(documents)} lexicon entries...")
-    BATCH_SIZE = 1000  # Safe batch size
-    total_inserted = 0
 
-    for i in range(0, len(documents), BATCH_SIZE):
-        batch_docs = documents[i:i+BATCH_SIZE]
-        batch_metas = metadatas[i:i+BATCH_SIZE]
-        batch_ids = ids[i:i+BATCH_SIZE]
+def build_chromadb_collection(enhanced_lexicon):
+    """
+    Store enhanced lexicon in ChromaDB for semantic search.
 
-        collection.add(
-            documents=batch_docs,
-            metadatas=batch_metas,
-            ids=batch_ids
+    Creates collection with:
+    - Text: Formatted lexicon entry (for embedding)
+    - Metadata: Strong's number, lemma, POS, occurrence count, etc.
+    - ID: Strong's number (G1, G2, etc.)
+    """
+    print(f"\n{'='*60}")
+    print("STORING IN CHROMADB")
+    print(f"{'='*60}")
+
+    # Initialize ChromaDB
+    client = chromadb.PersistentClient(path=CHROMA_DB_PATH)
+
+    # Delete existing collection if it exists
+    try:
+        client.delete_collection(name=COLLECTION_NAME)
+        print(f"Deleted existing collection: {COLLECTION_NAME}")
+    except:
+        pass
+
+    # Create new collection
+    embedding_function = DefaultEmbeddingFunction()
+    collection = client.create_collection(
+        name=COLLECTION_NAME,
+        metadata={"description": "Enhanced Thayer's Greek Lexicon with SBLGNT morphology"},
+        embedding_function=embedding_function
+    )
+
+    print(f"Created collection: {COLLECTION_NAME}")
+
+    # Documents are generated per entry and inserted in batches (ChromaDB has batch size limits)
+    print(f"Inserting {len(enhanced_lexicon)} lexicon entries...")
+    # Entries embedded by an earlier build are reused from the embedding cache
+    # Missing entries are embedded in parallel worker processes
+    with EmbeddingCache(EMBEDDING_CACHE_PATH) as cache, ParallelEmbedder() as embed:
+        embedder = CachedEmbedder(embed, cache)
+        total_inserted = write_batches(
+            collection, iter_lexicon_documents(enhanced_lexicon), upsert=False, embedder=embedder
         )
-        total_inserted += len(batch_docs)
-        print(f"  Inserted batch {i//BATCH_SIZE + 1}: {total_inserted}/{len(documents)}")
+    print(f"   Embedding cache: {embedder.hits} reused, {embedder.misses} embedded")
 
     print(f"✅ Successfully inserted {total_inserted} entries into ChromaDB")
     print(f"   Collection: {COLLECTION_NAME}")
@@ -169,6 +170,10 @@ def save_json_backup(enhanced_lexicon):
 
     print(f"✅ Saved {len(enhanced_lexicon)} entries to {JSON_BACKUP}")
 
+    # Compiled store mapped by ThayersLexicon, EnhancedLexiconHelper and the backend
+    build_lexicon_store(JSON_BACKUP, LEXICON_STORE_PATH)
+    print(f"✅ Compiled {LEXICON_STORE_PATH}")
+
 
 def main():
     """Main execution function."""
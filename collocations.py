@@ -0,0 +1,181 @@
+#!/usr/bin/env python3
+"""
+Collocations - Lemma Co-occurrence Statistics
+=============================================
+Which lemmas occur in the same verses as a given lemma more often than
+chance, scored by pointwise mutual information (PMI) and Dunning's
+log-likelihood ratio (G²).
+
+The verse × lemma incidence matrix of the corpus is kept as a sparse binary
+matrix in both CSR (verse -> lemmas) and CSC (lemma -> verses) form, built
+from the morphology columns with NumPy. The co-occurrence counts of one
+lemma with every other lemma are a sparse matrix-vector product: gather the
+rows of the lemma's verses and ``bincount`` their lemma ids. Scores for all
+candidates are then computed as whole arrays. Results are cached per lemma.
+
+Usage:
+    from collocations import CollocationIndex
+
+    index = CollocationIndex(MorphologyColumns(corpus))
+    for collocate in index.collocates([corpus.string_id("ἀγάπη")], limit=10):
+        print(corpus.string(collocate.lemma_id), collocate.log_likelihood)
+"""
+
+from collections import OrderedDict
+from typing import List, NamedTuple, Sequence, Tuple
+
+import numpy as np
+
+from morphology import MorphologyColumns
+
+MEASURES = ("log_likelihood", "pmi")
+
+
+class Collocate(NamedTuple):
+    """One lemma co-occurring with the target lemma."""
+    lemma_id: int
+    count: int          # verses containing both lemmas
+    frequency: int      # verses containing the collocate
+    pmi: float
+    log_likelihood: float
+
+
+def _xlogx_ratio(observed: np.ndarray, expected: np.ndarray) -> np.ndarray:
+    """observed * ln(observed / expected), with 0 * ln(0) = 0."""
+    with np.errstate(divide="ignore", invalid="ignore"):
+        terms = observed * np.log(observed / expected)
+    return np.where(observed > 0, terms, 0.0)
+
+
+def log_likelihood(a: np.ndarray, f_target: int, f_other: np.ndarray, n: int) -> np.ndarray:
+    """
+    Dunning's G² for 2x2 contingency tables, vectorised over collocates.
+
+    Args:
+        a: Contexts containing both lemmas
+        f_target: Contexts containing the target lemma
+        f_other: Contexts containing each collocate
+        n: Total number of contexts
+    """
+    a = a.astype(np.float64)
+    f_other = f_other.astype(np.float64)
+    observed = (a, f_target - a, f_other - a, n - f_target - f_other + a)
+    expected = (
+        f_target * f_other / n,
+        f_target * (n - f_other) / n,
+        (n - f_target) * f_other / n,
+        (n - f_target) * (n - f_other) / n,
+    )
+    return 2.0 * sum(_xlogx_ratio(o, e) for o, e in zip(observed, expected))
+
+
+class CollocationIndex:
+    """
+    Sparse verse × lemma incidence matrix with co-occurrence scoring.
+
+    A lemma counts once per verse however often it occurs there. Tokens
+    without a lemma (the unparsed LXX text) are left out, and so are verses
+    with no lemmatised token at all.
+    """
+
+    def __init__(self, columns: MorphologyColumns, cache_size: int = 1024):
+        self.columns = columns
+        n_lemmas = columns.corpus.n_strings
+
+        lemmatised = columns.lemma_ids != columns.corpus.string_id("")
+        lemma_ids = columns.lemma_ids[lemmatised]
+        _verse_keys, verse_of_token = np.unique(columns.keys[lemmatised], return_inverse=True)
+        self.n_verses = len(_verse_keys)
+
+        # Unique (verse, lemma) pairs, sorted by verse then lemma: the CSR layout
+        pairs = np.unique(verse_of_token.astype(np.int64) * n_lemmas + lemma_ids)
+        rows = pairs // n_lemmas
+        self.row_lemmas = pairs % n_lemmas
+        self.row_starts = np.searchsorted(rows, np.arange(self.n_verses + 1))
+
+        # The same matrix by lemma (CSC): lemma i occurs in verses
+        # col_verses[col_starts[i]:col_starts[i + 1]]
+        order = np.argsort(self.row_lemmas, kind="stable")
+        self.col_verses = rows[order]
+        self.lemma_frequency = np.bincount(self.row_lemmas, minlength=n_lemmas)
+        self.col_starts = np.zeros(n_lemmas + 1, dtype=np.int64)
+        np.cumsum(self.lemma_frequency, out=self.col_starts[1:])
+
+        self._cache: "OrderedDict[Tuple[int, ...], Tuple[np.ndarray, ...]]" = OrderedDict()
+        self._cache_size = cache_size
+
+    def verses_of(self, lemma_ids: Sequence[int]) -> np.ndarray:
+        """Sorted verse indexes containing any of ``lemma_ids``."""
+        verses = [self.col_verses[self.col_starts[i]:self.col_starts[i + 1]] for i in lemma_ids]
+        if not verses:
+            return np.empty(0, dtype=np.int64)
+        return np.unique(np.concatenate(verses))
+
+    def _scores(self, lemma_ids: Tuple[int, ...]) -> Tuple[np.ndarray, ...]:
+        """Candidate lemma ids, co-occurrence counts, PMI and G² for a target (cached)."""
+        cached = self._cache.get(lemma_ids)
+        if cached is not None:
+            self._cache.move_to_end(lemma_ids)
+            return cached
+
+        verses = self.verses_of(lemma_ids)
+        f_target = len(verses)
+
+        # Sparse matrix-vector product: gather the CSR rows of the target's verses
+        starts = self.row_starts[verses]
+        lengths = self.row_starts[verses + 1] - starts
+        gather = np.repeat(starts - np.cumsum(lengths) + lengths, lengths) + np.arange(lengths.sum())
+        counts = np.bincount(self.row_lemmas[gather], minlength=len(self.lemma_frequency))
+        counts[list(lemma_ids)] = 0
+
+        candidates = np.flatnonzero(counts)
+        a = counts[candidates]
+        f_other = self.lemma_frequency[candidates]
+        n = self.n_verses
+
+        pmi = np.log2(a * n / (f_target * f_other.astype(np.float64)))
+        llr = log_likelihood(a, f_target, f_other, n)
+        # Only positive association counts as a collocation
+        llr = np.where(a * n >= f_target * f_other, llr, -llr)
+
+        result = (candidates, a, f_other, pmi, llr)
+        self._cache[lemma_ids] = result
+        if len(self._cache) > self._cache_size:
+            self._cache.popitem(last=False)
+        return result
+
+    def collocates(self, lemma_ids: Sequence[int], measure: str = "log_likelihood",
+                   min_count: int = 2, limit: int = 20) -> List[Collocate]:
+        """
+        Strongest collocates of a lemma (or of several lemmas as one target).
+
+        Args:
+            lemma_ids: Corpus string ids of the target lemma(s)
+            measure: 'log_likelihood' or 'pmi'
+            min_count: Minimum number of shared verses (PMI overrates rare pairs)
+            limit: Maximum number of collocates
+
+        Returns:
+            Collocates sorted by the chosen measure, strongest first
+
+        Raises:
+            ValueError: If the measure is unknown
+        """
+        if measure not in MEASURES:
+            raise ValueError(f"Unknown measure: '{measure}' (use one of {', '.join(MEASURES)})")
+
+        lemma_ids = tuple(sorted(set(int(i) for i in lemma_ids)))
+        if not lemma_ids:
+            return []
+
+        candidates, a, f_other, pmi, llr = self._scores(lemma_ids)
+        keep = a >= min_count
+        score = (llr if measure == "log_likelihood" else pmi)[keep]
+        top = np.argsort(-score, kind="stable")[:limit]
+
+        return [
+            Collocate(int(lemma_id), int(count), int(frequency), float(p), float(g))
+            for lemma_id, count, frequency, p, g in zip(
+                candidates[keep][top], a[keep][top], f_other[keep][top], pmi[keep][top], llr[keep][top]
+            )
+        ]
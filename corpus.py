@@ -0,0 +1,543 @@
+#!/usr/bin/env python3
+"""
+Corpus - Memory-Mapped Binary SBLGNT Corpus
+============================================
+Compiles the SBLGNT ``*-morphgnt.txt`` files, and optionally the Septuagint
+(see septuagint.py), into a single binary file and reads it back through
+``mmap``. Opening the corpus costs a header read, and
+worker processes that open the same file share its pages through the OS page
+cache instead of each holding a parsed copy.
+
+File layout (all integers little-endian):
+
+    header        MAGIC, version, counts and section offsets (HEADER)
+    tokens        n_tokens fixed-width records (TOKEN_RECORD):
+                  verse key, lemma id, form id, norm id, POS, parse code
+    verse keys    n_verses uint32 packed verse keys, sorted
+    verse starts  n_verses + 1 uint32 token indexes (verse i owns tokens
+                  verse_starts[i]:verse_starts[i + 1])
+    string offs   n_strings + 1 uint32 byte offsets into the string blob
+    string blob   UTF-8 forms, normalized forms and lemmas, deduplicated
+    sources       n_sources records (SOURCE_RECORD): book code, total size,
+                  newest mtime and SHA-1 of the files the book was compiled from
+
+Septuagint words are not lemmatised or parsed: their lemma is the empty
+string, POS ``--`` and parse code ``--------`` (see UNPARSED_POS).
+
+Usage:
+    from corpus import Corpus, build_corpus
+
+    build_corpus("sblgnt/", "corpus_data/sblgnt.corpus",
+                 lxx_path="LXX-Swete/src/First1KGreek-LXX-RAW/")
+
+    with Corpus("corpus_data/sblgnt.corpus") as corpus:
+        verse = corpus.find_verse(pack_key(64, 3, 16))
+        for i in corpus.verse_tokens(verse):
+            token = corpus.token(i)
+            print(corpus.string(token.form_id), token.pos, token.parse)
+
+    # Same data, compiled in memory when the file has not been built
+    # or a morphgnt/LXX file has changed since
+    corpus = Corpus.load("corpus_data/sblgnt.corpus", "sblgnt/")
+"""
+
+import hashlib
+import itertools
+import mmap
+import os
+import struct
+import sys
+from array import array
+from bisect import bisect_left, bisect_right
+from typing import Dict, Iterator, List, NamedTuple, Optional, Tuple, Union
+
+from septuagint import iter_lxx_books, lxx_source_files, normalize_form
+from verse_store import pack_key
+
+# --- FILE FORMAT ---
+
+MAGIC = b"GNTC"
+VERSION = 3  # 2: three-digit chapter/verse fields in packed keys; 3: source records
+
+# magic, version, reserved, n_tokens, n_verses, n_strings, n_sources, then byte
+# offsets of: tokens, verse keys, verse starts, string offsets, string blob, sources
+HEADER = struct.Struct("<4sHHIIII6Q")
+
+# verse key, lemma id, form id, norm id, POS (2 chars), parse code (8 chars), padding
+TOKEN_RECORD = struct.Struct("<IIII2s8s2x")
+
+# book code, total size and newest mtime (ns) of its source files, SHA-1 of their contents
+SOURCE_RECORD = struct.Struct("<IQq20s")
+
+# POS and parse code of words without morphology (the Septuagint)
+UNPARSED_POS = "--"
+UNPARSED_PARSE = "--------"
+
+
+class Token(NamedTuple):
+    """One word of the corpus, as stored in a token record."""
+    key: int
+    lemma_id: int
+    form_id: int
+    norm_id: int
+    pos: str
+    parse: str
+
+
+class SourceInfo(NamedTuple):
+    """Fingerprint of the files one book was compiled from, as stored in a source record."""
+    size: int
+    mtime_ns: int
+    sha1: bytes
+
+
+class MorphToken(NamedTuple):
+    """One parsed line of a morphgnt file."""
+    chapter: int
+    verse: int
+    pos: str
+    parse: str
+    form: str
+    norm: str
+    lemma: str
+
+
+# --- MORPHGNT READER ---
+
+def iter_morphgnt_tokens(file_path: str) -> Iterator[MorphToken]:
+    """
+    Yield one MorphToken per word of a morphgnt file.
+
+    Format: BBCCVV POS PARSE TEXT WORD NORM LEMMA. ``form`` is TEXT (with
+    punctuation), matching the verse text stored by ``seeding.parse_sblgnt_file``.
+    """
+    with open(file_path, 'r', encoding='utf-8') as f:
+        for line in f:
+            parts = line.split()
+            if len(parts) < 7:
+                continue
+
+            ref_id = parts[0]
+            try:
+                chapter = int(ref_id[2:4])
+                verse = int(ref_id[4:6])
+            except ValueError:
+                continue
+
+            yield MorphToken(chapter, verse, parts[1], parts[2], parts[3], parts[5], parts[6])
+
+
+# --- SOURCE RECORDS ---
+
+def _stat_sources(paths: List[str]) -> Tuple[int, int]:
+    """Total size and newest mtime (ns) of a book's source files."""
+    size = mtime_ns = 0
+    for path in paths:
+        stat = os.stat(path)
+        size += stat.st_size
+        mtime_ns = max(mtime_ns, stat.st_mtime_ns)
+    return size, mtime_ns
+
+
+def source_info(paths: List[str]) -> SourceInfo:
+    """Fingerprint of a book's source files: total size, newest mtime and SHA-1 of their contents."""
+    digest = hashlib.sha1()
+    for path in paths:
+        with open(path, 'rb') as f:
+            for chunk in iter(lambda: f.read(1 << 20), b""):
+                digest.update(chunk)
+    return SourceInfo(*_stat_sources(paths), digest.digest())
+
+
+def pack_source_records(book_files: Dict[int, List[str]]) -> bytes:
+    """Source records of every book in ``book_files`` (book code -> source paths), in book order."""
+    return b"".join(SOURCE_RECORD.pack(code, *source_info(paths)) for code, paths in sorted(book_files.items()))
+
+
+def read_source_records(view: memoryview, offset: int, count: int) -> Dict[int, SourceInfo]:
+    """Decode ``count`` source records starting at ``offset``, by book code."""
+    records = {}
+    for i in range(count):
+        code, size, mtime_ns, sha1 = SOURCE_RECORD.unpack_from(view, offset + i * SOURCE_RECORD.size)
+        records[code] = SourceInfo(size, mtime_ns, sha1)
+    return records
+
+
+def changed_books(records: Dict[int, SourceInfo], book_files: Dict[int, List[str]]) -> List[int]:
+    """
+    Codes of the books in ``book_files`` whose source files no longer match
+    ``records`` (or that were never compiled), in book order.
+
+    Like ``LexiconStore.matches``, files with the recorded size and mtime are
+    trusted without being read. Books whose source files are not present are
+    not checked, so compiled files can be shipped without their sources.
+    """
+    changed = []
+    for code, paths in sorted(book_files.items()):
+        record = records.get(code)
+        if record is None:
+            changed.append(code)
+            continue
+        size, mtime_ns = _stat_sources(paths)
+        if size != record.size:
+            changed.append(code)
+        elif mtime_ns != record.mtime_ns and source_info(paths).sha1 != record.sha1:
+            # Same size, touched or copied since: compare contents
+            changed.append(code)
+    return changed
+
+
+# --- BUILDER ---
+
+def sblgnt_book_files(gnt_path: str, book_codes: Optional[Dict[int, str]] = None) -> Dict[int, str]:
+    """Path of every ``*-morphgnt.txt`` file by book code, in book order."""
+    files = {}
+    filenames = sorted(os.listdir(gnt_path)) if os.path.isdir(gnt_path) else []
+    for filename in filenames:
+        if not filename.endswith("-morphgnt.txt"):
+            continue
+        try:
+            book_code = int(filename.split("-")[0])
+        except ValueError:
+            continue
+        if book_codes is not None and book_code not in book_codes:
+            continue
+        files[book_code] = os.path.join(gnt_path, filename)
+    return files
+
+
+def corpus_source_files(gnt_path: str, book_codes: Optional[Dict[int, str]] = None,
+                        lxx_path: Optional[str] = None) -> Dict[int, List[str]]:
+    """Paths of the morphgnt or LXX files each book of the corpus is compiled from, by book code."""
+    files = {}
+    if lxx_path:
+        files.update((code, paths) for code, paths in lxx_source_files(lxx_path).items()
+                     if book_codes is None or code in book_codes)
+    files.update((code, [path]) for code, path in sblgnt_book_files(gnt_path, book_codes).items())
+    return files
+
+
+def iter_sblgnt_books(gnt_path: str, book_codes: Optional[Dict[int, str]] = None) -> Iterator[Tuple[int, Iterator[MorphToken]]]:
+    """Yield (book code, tokens) for every ``*-morphgnt.txt`` file, in book order."""
+    for book_code, file_path in sblgnt_book_files(gnt_path, book_codes).items():
+        yield book_code, iter_morphgnt_tokens(file_path)
+
+
+def iter_lxx_tokens(lxx_path: str, book_codes: Optional[Dict[int, str]] = None) -> Iterator[Tuple[int, Iterator[MorphToken]]]:
+    """Yield (book code, tokens) for every Septuagint book, unparsed (see UNPARSED_POS)."""
+    for book_code, verses in iter_lxx_books(lxx_path, book_codes):
+        yield book_code, (
+            MorphToken(chapter, verse, UNPARSED_POS, UNPARSED_PARSE, word, normalize_form(word), "")
+            for chapter, verse, words in verses
+            for word in words
+        )
+
+
+def build_corpus_bytes(gnt_path: str, book_codes: Optional[Dict[int, str]] = None,
+                       lxx_path: Optional[str] = None) -> bytes:
+    """
+    Compile every ``*-morphgnt.txt`` file in ``gnt_path`` (and every LXX
+    book in ``lxx_path``) into the corpus file format, in memory.
+
+    Sources are read one book at a time; only the compiled records are
+    accumulated. The size, mtime and SHA-1 of each book's files are recorded
+    so that ``Corpus.changed_books`` can tell when the file is out of date.
+
+    Args:
+        gnt_path: Directory containing the SBLGNT morphgnt files
+        book_codes: Optional mapping of book code -> name; other books are skipped
+        lxx_path: Optional directory of the LXX-Swete TEI files
+    """
+    string_ids: Dict[str, int] = {}
+    string_blob = bytearray()
+    string_offsets = array('I', [0])
+
+    def intern(value: str) -> int:
+        string_id = string_ids.get(value)
+        if string_id is None:
+            string_id = string_ids[value] = len(string_ids)
+            string_blob.extend(value.encode('utf-8'))
+            string_offsets.append(len(string_blob))
+        return string_id
+
+    tokens = bytearray()
+    verse_keys = array('I')
+    verse_starts = array('I')
+    n_tokens = 0
+
+    # Septuagint books (codes 1-54) sort before the NT (61-87), so keys stay sorted
+    books = iter_lxx_tokens(lxx_path, book_codes) if lxx_path else iter(())
+    for book_code, book_tokens in itertools.chain(books, iter_sblgnt_books(gnt_path, book_codes)):
+        for token in book_tokens:
+            key = pack_key(book_code, token.chapter, token.verse)
+            if not verse_keys or verse_keys[-1] != key:
+                verse_keys.append(key)
+                verse_starts.append(n_tokens)
+
+            tokens += TOKEN_RECORD.pack(
+                key,
+                intern(token.lemma),
+                intern(token.form),
+                intern(token.norm),
+                token.pos.encode('ascii'),
+                token.parse.encode('ascii'),
+            )
+            n_tokens += 1
+
+    verse_starts.append(n_tokens)
+    n_verses = len(verse_keys)
+
+    if sys.byteorder != "little":
+        for column in (verse_keys, verse_starts, string_offsets):
+            column.byteswap()
+
+    tokens_offset = HEADER.size
+    verse_keys_offset = tokens_offset + len(tokens)
+    verse_starts_offset = verse_keys_offset + n_verses * 4
+    string_offsets_offset = verse_starts_offset + len(verse_starts) * 4
+    string_blob_offset = string_offsets_offset + len(string_offsets) * 4
+    sources_offset = string_blob_offset + len(string_blob)
+
+    source_files = corpus_source_files(gnt_path, book_codes, lxx_path)
+
+    return b"".join([
+        HEADER.pack(
+            MAGIC, VERSION, 0,
+            n_tokens, n_verses, len(string_ids), len(source_files),
+            tokens_offset, verse_keys_offset, verse_starts_offset,
+            string_offsets_offset, string_blob_offset, sources_offset,
+        ),
+        bytes(tokens),
+        verse_keys.tobytes(),
+        verse_starts.tobytes(),
+        string_offsets.tobytes(),
+        bytes(string_blob),
+        pack_source_records(source_files),
+    ])
+
+
+def build_corpus(gnt_path: str, output_path: str, book_codes: Optional[Dict[int, str]] = None,
+                 lxx_path: Optional[str] = None) -> Tuple[int, int]:
+    """
+    Compile every ``*-morphgnt.txt`` file in ``gnt_path`` (and the LXX
+    books in ``lxx_path``) into one corpus file.
+
+    The file is written next to ``output_path`` and moved into place
+    atomically, so processes that already have the old corpus mapped keep a
+    valid view.
+
+    Args:
+        gnt_path: Directory containing the SBLGNT morphgnt files
+        output_path: Path of the corpus file to write
+        book_codes: Optional mapping of book code -> name; other books are skipped
+        lxx_path: Optional directory of the LXX-Swete TEI files
+
+    Returns:
+        Tuple of (token count, verse count)
+    """
+    data = build_corpus_bytes(gnt_path, book_codes, lxx_path)
+
+    output_dir = os.path.dirname(output_path)
+    if output_dir:
+        os.makedirs(output_dir, exist_ok=True)
+
+    tmp_path = output_path + ".tmp"
+    with open(tmp_path, 'wb') as f:
+        f.write(data)
+    os.replace(tmp_path, output_path)
+
+    _magic, _version, _reserved, n_tokens, n_verses = HEADER.unpack_from(data, 0)[:5]
+    return n_tokens, n_verses
+
+
+# --- READER ---
+
+def u32_column(view: memoryview, offset: int, count: int):
+    """
+    View ``count`` little-endian uint32 values starting at ``offset``.
+
+    Zero-copy on little-endian hosts; elsewhere the column is copied and
+    byte-swapped into an ``array``.
+    """
+    raw = view[offset:offset + count * 4]
+    if sys.byteorder == "little":
+        return raw.cast('I')
+    column = array('I', raw.tobytes())
+    column.byteswap()
+    return column
+
+
+class Corpus:
+    """
+    Read-only view of a compiled corpus, memory-mapped from a file or
+    wrapping an in-memory buffer.
+
+    Nothing is parsed up front: token records, verse index entries and
+    strings are decoded from the buffer on access.
+    """
+
+    def __init__(self, source: Union[str, bytes]):
+        """
+        Map a corpus file built by ``build_corpus``, or wrap the bytes
+        returned by ``build_corpus_bytes``.
+
+        Raises:
+            ValueError: If the data is not a corpus of a supported version
+        """
+        if isinstance(source, str):
+            self.path = path = source
+            with open(path, 'rb') as f:
+                self._buffer = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        else:
+            self.path = path = "<memory>"
+            self._buffer = source
+        self._view = memoryview(self._buffer)
+
+        if len(self._buffer) < HEADER.size:
+            self.close()
+            raise ValueError(f"Not a corpus file: {path}")
+
+        (magic, version, _reserved,
+         self.n_tokens, self.n_verses, self.n_strings, n_sources,
+         self._tokens_offset, verse_keys_offset, verse_starts_offset,
+         string_offsets_offset, self._blob_offset, sources_offset) = HEADER.unpack_from(self._buffer, 0)
+
+        if magic != MAGIC or version != VERSION:
+            self.close()
+            raise ValueError(f"Unsupported corpus file (magic={magic!r}, version={version}): {path}")
+
+        self.verse_keys = u32_column(self._view, verse_keys_offset, self.n_verses)
+        self.verse_starts = u32_column(self._view, verse_starts_offset, self.n_verses + 1)
+        self._string_offsets = u32_column(self._view, string_offsets_offset, self.n_strings + 1)
+        self._string_ids: Optional[Dict[str, int]] = None
+        self.sources = read_source_records(self._view, sources_offset, n_sources)
+
+    @classmethod
+    def from_sblgnt(cls, gnt_path: str, book_codes: Optional[Dict[int, str]] = None,
+                    lxx_path: Optional[str] = None) -> "Corpus":
+        """Build the corpus in memory straight from the morphgnt (and LXX) files."""
+        return cls(build_corpus_bytes(gnt_path, book_codes, lxx_path))
+
+    @classmethod
+    def load(cls, corpus_path: Optional[str], gnt_path: str,
+             book_codes: Optional[Dict[int, str]] = None, lxx_path: Optional[str] = None) -> "Corpus":
+        """
+        Map the prebuilt corpus if it exists and is current, otherwise build
+        it from SBLGNT (and the LXX).
+
+        Either way the result is identical, so callers never need to care
+        whether ``build_corpus.py`` has been run. A file from an older
+        format version, or one compiled before a morphgnt or LXX file
+        changed, is ignored the same way.
+        """
+        if corpus_path and os.path.exists(corpus_path):
+            try:
+                corpus = cls(corpus_path)
+            except ValueError as e:
+                print(f"[!] {e} - rebuilding in memory (run build_corpus.py to update it)")
+            else:
+                changed = corpus.changed_books(gnt_path, book_codes, lxx_path)
+                if not changed:
+                    return corpus
+                print(f"[!] {corpus_path} is out of date ({len(changed)} changed books) - "
+                      f"rebuilding in memory (run build_corpus.py to update it)")
+                corpus.close()
+        return cls.from_sblgnt(gnt_path, book_codes, lxx_path)
+
+    def changed_books(self, gnt_path: str, book_codes: Optional[Dict[int, str]] = None,
+                      lxx_path: Optional[str] = None) -> List[int]:
+        """Codes of the books whose morphgnt or LXX files changed since the corpus was compiled."""
+        return changed_books(self.sources, corpus_source_files(gnt_path, book_codes, lxx_path))
+
+    def close(self):
+        """Release the memory mapping."""
+        for name in ("verse_keys", "verse_starts", "_string_offsets"):
+            column = getattr(self, name, None)
+            if isinstance(column, memoryview):
+                column.release()
+        self._view.release()
+        if isinstance(self._buffer, mmap.mmap):
+            self._buffer.close()
+
+    def __enter__(self) -> "Corpus":
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    def __len__(self) -> int:
+        return self.n_tokens
+
+    @property
+    def buffer(self) -> memoryview:
+        """The raw corpus bytes, e.g. for ``numpy.frombuffer``."""
+        return self._view
+
+    @property
+    def tokens_offset(self) -> int:
+        """Byte offset of the first token record."""
+        return self._tokens_offset
+
+    # --- Tokens ---
+
+    def token(self, index: int) -> Token:
+        """Decode the token record at ``index``."""
+        key, lemma_id, form_id, norm_id, pos, parse = TOKEN_RECORD.unpack_from(
+            self._view, self._tokens_offset + index * TOKEN_RECORD.size
+        )
+        return Token(key, lemma_id, form_id, norm_id, pos.decode('ascii'), parse.decode('ascii'))
+
+    def iter_tokens(self, start: int = 0, stop: Optional[int] = None) -> Iterator[Token]:
+        """Yield token records ``start:stop`` in corpus order."""
+        stop = self.n_tokens if stop is None else stop
+        offset = self._tokens_offset + start * TOKEN_RECORD.size
+        for key, lemma_id, form_id, norm_id, pos, parse in TOKEN_RECORD.iter_unpack(
+            self._view[offset:self._tokens_offset + stop * TOKEN_RECORD.size]
+        ):
+            yield Token(key, lemma_id, form_id, norm_id, pos.decode('ascii'), parse.decode('ascii'))
+
+    # --- Strings ---
+
+    def string(self, string_id: int) -> str:
+        """Decode a string (form, normalized form or lemma) by id."""
+        start = self._blob_offset + self._string_offsets[string_id]
+        end = self._blob_offset + self._string_offsets[string_id + 1]
+        return str(self._view[start:end], 'utf-8')
+
+    def string_id(self, value: str) -> Optional[int]:
+        """
+        Look up the id of a string, or None if it is not in the corpus.
+
+        The reverse index is built on first use.
+        """
+        if self._string_ids is None:
+            self._string_ids = {self.string(i): i for i in range(self.n_strings)}
+        return self._string_ids.get(value)
+
+    # --- Verses ---
+
+    def find_verse(self, key: int) -> Optional[int]:
+        """Get the verse index for a packed verse key, or None if absent."""
+        index = bisect_left(self.verse_keys, key)
+        if index < self.n_verses and self.verse_keys[index] == key:
+            return index
+        return None
+
+    def verses_between(self, start_key: int, end_key: int) -> range:
+        """Indexes of the verses whose keys fall within [start_key, end_key]."""
+        return range(bisect_left(self.verse_keys, start_key), bisect_right(self.verse_keys, end_key))
+
+    def verse_tokens(self, verse_index: int) -> range:
+        """Token indexes belonging to the verse at ``verse_index``."""
+        return range(self.verse_starts[verse_index], self.verse_starts[verse_index + 1])
+
+    def verse_words(self, verse_index: int) -> List[str]:
+        """Word forms (with punctuation) of the verse at ``verse_index``."""
+        return [self.string(token.form_id) for token in self.iter_tokens(
+            self.verse_starts[verse_index], self.verse_starts[verse_index + 1]
+        )]
+
+    def iter_verses(self) -> Iterator[Tuple[int, List[str]]]:
+        """Yield (packed key, words) for every verse in order."""
+        for verse_index in range(self.n_verses):
+            yield self.verse_keys[verse_index], self.verse_words(verse_index)
@@ -0,0 +1,158 @@
+#!/usr/bin/env python3
+"""
+Embedding Cache - Persistent Text Embeddings for Collection Builds
+==================================================================
+Stores document embeddings on disk, keyed by the SHA-256 of the embedding
+model name and the document text, so rebuilding a ChromaDB collection
+(a deleted ``chroma_db_interlinear``, or ``build_enhanced_lexicon.py``
+recreating ``lexicon_enhanced``) only embeds texts that were never
+embedded with that model before. Cached vectors are passed to Chroma as
+precomputed ``embeddings=``, so Chroma's embedding function never runs
+for them.
+
+The store is one SQLite table of (key, float32 vector) rows, outside the
+Chroma directory so it survives deleting the database.
+
+Usage:
+    from embedding_cache import CachedEmbedder, EmbeddingCache
+
+    with EmbeddingCache("corpus_data/embedding_cache.sqlite") as cache:
+        embedder = CachedEmbedder(DefaultEmbeddingFunction(), cache)
+        collection.upsert(ids=ids, documents=texts, embeddings=embedder.embed(texts))
+"""
+
+import hashlib
+import json
+import os
+import sqlite3
+import threading
+from typing import Dict, List, Optional, Sequence
+
+import numpy as np
+
+# Keys looked up per SQL statement (below SQLite's bound-parameter limit)
+LOOKUP_CHUNK = 500
+
+# Chroma's default embedding function delegates to this ONNX model
+DEFAULT_MODEL = "onnx/all-MiniLM-L6-v2"
+
+
+def embedding_model_name(embedding_function) -> str:
+    """
+    Name identifying what an embedding function computes, for cache keys.
+
+    Uses Chroma's ``name()`` and ``get_config()`` when the function has
+    them, otherwise its class name.
+    """
+    try:
+        name = embedding_function.name()
+    except (AttributeError, NotImplementedError, TypeError):
+        name = NotImplemented
+    if not isinstance(name, str):
+        return f"{type(embedding_function).__module__}.{type(embedding_function).__qualname__}"
+    if name == "default":
+        return DEFAULT_MODEL
+
+    try:
+        config = embedding_function.get_config()
+    except (AttributeError, NotImplementedError, TypeError):
+        config = None
+    if not isinstance(config, dict) or not config:
+        return name
+    return f"{name}:{json.dumps(config, sort_keys=True, default=str)}"
+
+
+def text_key(model: str, text: str) -> bytes:
+    """Cache key of a text embedded with ``model``."""
+    return hashlib.sha256(f"{model}\0{text}".encode('utf-8')).digest()
+
+
+class EmbeddingCache:
+    """
+    On-disk map of (model, text) -> embedding vector.
+
+    Safe to share between threads (one connection behind a lock), e.g. the
+    seeding writer thread and the main thread.
+    """
+
+    def __init__(self, path: str):
+        self.path = path
+        cache_dir = os.path.dirname(path)
+        if cache_dir:
+            os.makedirs(cache_dir, exist_ok=True)
+
+        self._lock = threading.Lock()
+        self._connection = sqlite3.connect(path, check_same_thread=False)
+        self._connection.execute("PRAGMA journal_mode=WAL")
+        self._connection.execute(
+            "CREATE TABLE IF NOT EXISTS embeddings (key BLOB PRIMARY KEY, vector BLOB NOT NULL) WITHOUT ROWID"
+        )
+        self._connection.commit()
+
+    def close(self):
+        """Close the database."""
+        with self._lock:
+            self._connection.close()
+
+    def __enter__(self) -> "EmbeddingCache":
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    def __len__(self) -> int:
+        with self._lock:
+            return self._connection.execute("SELECT COUNT(*) FROM embeddings").fetchone()[0]
+
+    def get_many(self, model: str, texts: Sequence[str]) -> List[Optional[np.ndarray]]:
+        """Cached vectors of ``texts`` (None where not cached), in order."""
+        keys = [text_key(model, text) for text in texts]
+        found: Dict[bytes, np.ndarray] = {}
+        with self._lock:
+            for start in range(0, len(keys), LOOKUP_CHUNK):
+                chunk = keys[start:start + LOOKUP_CHUNK]
+                rows = self._connection.execute(
+                    f"SELECT key, vector FROM embeddings WHERE key IN ({','.join('?' * len(chunk))})", chunk
+                )
+                for key, vector in rows:
+                    found[key] = np.frombuffer(vector, dtype="<f4")
+        return [found.get(key) for key in keys]
+
+    def put_many(self, model: str, texts: Sequence[str], vectors: Sequence[Sequence[float]]):
+        """Store the vectors of ``texts``."""
+        rows = [
+            (text_key(model, text), np.asarray(vector, dtype="<f4").tobytes())
+            for text, vector in zip(texts, vectors)
+        ]
+        with self._lock:
+            self._connection.executemany("INSERT OR REPLACE INTO embeddings VALUES (?, ?)", rows)
+            self._connection.commit()
+
+
+class CachedEmbedder:
+    """
+    Embeds texts through a cache: only texts missing from the cache are
+    passed to ``embedding_function`` (once per distinct text), and their
+    vectors are stored for next time.
+    """
+
+    def __init__(self, embedding_function, cache: EmbeddingCache, model: Optional[str] = None):
+        self.embedding_function = embedding_function
+        self.cache = cache
+        self.model = model or embedding_model_name(embedding_function)
+        self.hits = 0
+        self.misses = 0
+
+    def embed(self, texts: Sequence[str]) -> List[np.ndarray]:
+        """Embeddings of ``texts``, in order."""
+        vectors = self.cache.get_many(self.model, texts)
+        missing = list(dict.fromkeys(text for text, vector in zip(texts, vectors) if vector is None))
+        self.hits += len(texts) - sum(vector is None for vector in vectors)
+
+        if missing:
+            computed = [np.asarray(vector, dtype=np.float32) for vector in self.embedding_function(missing)]
+            self.cache.put_many(self.model, missing, computed)
+            self.misses += len(missing)
+            by_text = dict(zip(missing, computed))
+            vectors = [by_text[text] if vector is None else vector for text, vector in zip(texts, vectors)]
+        return vectors
@@ -0,0 +1,170 @@
+#!/usr/bin/env python3
+"""
+Embedding Workers - Multi-Process Embedding for Collection Builds
+=================================================================
+Chroma's default embedding function runs the all-MiniLM-L6-v2 ONNX model
+in the calling process, so a cold collection build embeds every document
+in one place. ``ParallelEmbedder`` shards each batch of texts across a pool
+of worker processes, each holding its own ONNX Runtime session, and
+returns the vectors in order. It is a drop-in embedding function: wrap it
+in embedding_cache.CachedEmbedder and the seeding writer passes its
+vectors to Chroma as ``embeddings=``.
+
+Each worker gets ``threads`` intra-op threads (default: the CPU count
+divided by the number of workers), so the pool never oversubscribes the
+machine. A session that runs one small-batch inference with as many
+threads as there are cores spends much of its time synchronising;
+several narrower sessions keep every core busy.
+
+The model is downloaded once, in the parent, before the pool starts:
+workers that found an empty model cache would otherwise all download and
+extract into the same directory at once. ``ThreadLimitedMiniLM`` relies on
+internals of chromadb's ONNX embedding function (its ``model`` property and
+download paths), so chromadb is pinned in requirements.txt.
+``benchmarks/bench_embedding_workers.py`` reports docs/sec per worker
+count.
+
+Usage:
+    from embedding_workers import ParallelEmbedder
+
+    with ParallelEmbedder(workers=4) as embed:
+        vectors = embed(texts)
+"""
+
+import os
+from concurrent.futures import ProcessPoolExecutor
+from functools import cached_property
+from typing import Callable, List, Optional, Sequence
+
+import numpy as np
+from chromadb.utils.embedding_functions.onnx_mini_lm_l6_v2 import ONNXMiniLM_L6_V2
+
+# Texts per task sent to a worker
+SHARD_SIZE = 64
+
+# Environment variables limiting the thread pools of numerical libraries
+THREAD_ENV_VARS = ("OMP_NUM_THREADS", "MKL_NUM_THREADS", "OPENBLAS_NUM_THREADS")
+
+
+def default_workers() -> int:
+    """Worker processes for the machine: one per two cores (at least one)."""
+    return max(1, (os.cpu_count() or 1) // 2)
+
+
+def threads_per_worker(workers: int) -> int:
+    """Intra-op threads per worker that together use every core once."""
+    return max(1, (os.cpu_count() or 1) // max(1, workers))
+
+
+class ThreadLimitedMiniLM(ONNXMiniLM_L6_V2):
+    """
+    Chroma's default model (ONNX all-MiniLM-L6-v2) in a CPU session limited
+    to ``threads`` intra-op threads and one inter-op thread.
+    """
+
+    def __init__(self, threads: int):
+        super().__init__()
+        self.threads = threads
+
+    @cached_property
+    def model(self):
+        options = self.ort.SessionOptions()
+        options.log_severity_level = 3
+        options.graph_optimization_level = self.ort.GraphOptimizationLevel.ORT_ENABLE_ALL
+        options.intra_op_num_threads = self.threads
+        options.inter_op_num_threads = 1
+        return self.ort.InferenceSession(
+            os.path.join(self.DOWNLOAD_PATH, self.EXTRACTED_FOLDER_NAME, "model.onnx"),
+            providers=["CPUExecutionProvider"],
+            sess_options=options,
+        )
+
+
+def default_embedding_function(threads: int) -> ThreadLimitedMiniLM:
+    """Chroma's default model limited to ``threads`` intra-op threads (see ThreadLimitedMiniLM)."""
+    return ThreadLimitedMiniLM(threads)
+
+
+def download_default_model():
+    """Download and extract Chroma's default model into its cache, if not there yet."""
+    ThreadLimitedMiniLM(1)._download_model_if_not_exists()
+
+
+# Per-process embedding function, created once by _init_worker
+_worker_function = None
+
+
+def _init_worker(factory: Callable[[int], Callable], threads: int):
+    """Limit the worker's thread pools, then create its own embedding function (and session)."""
+    global _worker_function
+    for name in THREAD_ENV_VARS:
+        os.environ[name] = str(threads)
+    _worker_function = factory(threads)
+
+
+def _embed_shard(texts: List[str]) -> np.ndarray:
+    """Embed one shard in a worker; returned as one float32 array to keep pickling cheap."""
+    return np.asarray(_worker_function(texts), dtype=np.float32)
+
+
+class ParallelEmbedder:
+    """
+    Embedding function (texts -> vectors) backed by a pool of worker
+    processes, each with its own model session.
+
+    The pool starts on first use. Every worker loads the model, so with
+    ``workers`` processes the model's memory is held ``workers`` times.
+    """
+
+    def __init__(self, workers: Optional[int] = None, threads: Optional[int] = None,
+                 factory: Callable[[int], Callable] = default_embedding_function,
+                 shard_size: int = SHARD_SIZE, model_name: str = "default"):
+        """
+        Args:
+            workers: Worker processes (default: ``default_workers()``)
+            threads: Intra-op threads per worker (default: ``threads_per_worker(workers)``)
+            factory: Picklable callable creating a worker's embedding function from its thread count
+            shard_size: Texts per task
+            model_name: Name reported to embedding_cache (``"default"`` is Chroma's default model)
+        """
+        self.workers = workers or default_workers()
+        self.threads = threads or threads_per_worker(self.workers)
+        self.factory = factory
+        self.shard_size = shard_size
+        self.model_name = model_name
+        self._pool: Optional[ProcessPoolExecutor] = None
+
+    def name(self) -> str:
+        """Model name (Chroma embedding function protocol, used for cache keys)."""
+        return self.model_name
+
+    def get_config(self) -> dict:
+        return {}
+
+    def _executor(self) -> ProcessPoolExecutor:
+        if self._pool is None:
+            if self.factory is default_embedding_function:
+                download_default_model()
+            self._pool = ProcessPoolExecutor(
+                max_workers=self.workers, initializer=_init_worker, initargs=(self.factory, self.threads)
+            )
+        return self._pool
+
+    def __call__(self, input: Sequence[str]) -> List[np.ndarray]:
+        texts = list(input)
+        if not texts:
+            return []
+        shards = [texts[i:i + self.shard_size] for i in range(0, len(texts), self.shard_size)]
+        return [vector for shard in self._executor().map(_embed_shard, shards) for vector in shard]
+
+    def close(self):
+        """Shut the worker pool down."""
+        if self._pool is not None:
+            self._pool.shutdown()
+            self._pool = None
+
+    def __enter__(self) -> "ParallelEmbedder":
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
@@ -0,0 +1,287 @@
+#!/usr/bin/env python3
+"""
+English Index - Compact WEB Verse Index
+=======================================
+Compiles the ``web_bible_json/NN-*.json`` files into one index file keyed
+by the same packed verse key as the Greek verse store (SBLGNT book codes,
+see verse_store.py), and reads it back through ``mmap``.
+
+Both the CLI and the backend join English text through this index, so a
+verse gets identical English everywhere: every ``paragraph text`` and
+``line text`` section of a verse, in file order, joined with a space.
+
+File layout (all integers little-endian):
+
+    header      MAGIC, version, verse count and section offsets (HEADER)
+    keys        n uint32 packed verse keys, sorted
+    offsets     n + 1 uint32 byte offsets into the text blob
+    text blob   UTF-8 English text
+    sources     n_sources records (corpus.SOURCE_RECORD), one per WEB JSON file
+
+Usage:
+    from english_index import EnglishIndex, build_english_index
+
+    build_english_index("web_bible_json/", "corpus_data/web_english.idx")
+
+    english = EnglishIndex.load("corpus_data/web_english.idx", "web_bible_json/")
+    english.get(pack_key(64, 3, 16))
+    english.get_parallel(pack_key(19, 22, 1))  # None: LXX numbering (see FIRST_PARALLEL_KEY)
+"""
+
+import hashlib
+import json
+import mmap
+import os
+import struct
+import sys
+from array import array
+from bisect import bisect_left
+from typing import Dict, Iterator, List, Optional, Tuple
+
+from corpus import SourceInfo, changed_books, pack_source_records, read_source_records, u32_column
+from verse_store import pack_key
+
+# --- FILE FORMAT ---
+
+MAGIC = b"WEBX"
+VERSION = 3  # 2: three-digit chapter/verse fields in packed keys; 3: source records
+
+# magic, version, reserved, n_verses, n_sources, then byte offsets of:
+# keys, text offsets, text blob, sources
+HEADER = struct.Struct("<4sHHII4Q")
+
+# WEB files are numbered 1-39 for the OT (same as our codes) and 40-66
+# for the NT; SBLGNT codes are 61-87
+WEB_FIRST_NT_BOOK = 40
+WEB_TO_SBLGNT = 21
+
+WEB_TEXT_TYPES = ("paragraph text", "line text")
+
+# The WEB follows the English (Masoretic) versification and the Swete LXX
+# its own: Psalms 10-147 are numbered one behind, psalm titles shift verse
+# numbers, Jeremiah's chapters are reordered and chapter breaks move in many
+# other books. Without a versification map a Septuagint key would find the
+# English of another verse, so only New Testament keys are joined.
+FIRST_PARALLEL_KEY = pack_key(WEB_FIRST_NT_BOOK + WEB_TO_SBLGNT, 0, 0)
+
+
+# --- WEB JSON READER ---
+
+def web_book_files(web_path: str) -> Dict[int, str]:
+    """Path of the WEB JSON file of every book, by book code (SBLGNT codes for the NT)."""
+    if not os.path.isdir(web_path):
+        return {}
+
+    files = {}
+    for filename in sorted(os.listdir(web_path)):
+        if not filename.endswith(".json"):
+            continue
+
+        # Extract book code from filename: "43-john.json" → 43 → 64
+        try:
+            book_code = int(filename.split("-")[0])
+        except ValueError:
+            continue
+        if book_code >= WEB_FIRST_NT_BOOK:
+            book_code += WEB_TO_SBLGNT
+        files[book_code] = os.path.join(web_path, filename)
+    return files
+
+
+def iter_web_verses(web_path: str) -> Iterator[Tuple[int, str]]:
+    """
+    Yield (packed key, English text) for every verse in the WEB JSON files.
+
+    Sections of the same verse (poetry lines, paragraph breaks) are
+    concatenated in file order. Keys use SBLGNT book codes.
+    """
+    for book_code, file_path in sorted(web_book_files(web_path).items()):
+        with open(file_path, 'r', encoding='utf-8') as f:
+            data = json.load(f)
+
+        verses: Dict[int, str] = {}
+        for item in data:
+            if item.get("type") in WEB_TEXT_TYPES:
+                chapter = item.get("chapterNumber")
+                verse = item.get("verseNumber")
+                value = item.get("value", "").strip()
+
+                if chapter and verse and value:
+                    key = pack_key(book_code, chapter, verse)
+                    verses[key] = f"{verses[key]} {value}" if key in verses else value
+
+        yield from verses.items()
+
+
+# --- BUILDER ---
+
+def web_source_files(web_path: str) -> Dict[int, List[str]]:
+    """The WEB JSON file of every book as a source file list, by book code (see corpus.changed_books)."""
+    return {code: [path] for code, path in web_book_files(web_path).items()}
+
+
+def build_english_index_bytes(web_path: str) -> bytes:
+    """Compile the WEB JSON files into the index file format, in memory."""
+    verses = dict(iter_web_verses(web_path))
+
+    keys = array('I', sorted(verses))
+    offsets = array('I', [0])
+    blob = bytearray()
+    for key in keys:
+        blob += verses[key].encode('utf-8')
+        offsets.append(len(blob))
+
+    if sys.byteorder != "little":
+        keys.byteswap()
+        offsets.byteswap()
+
+    keys_offset = HEADER.size
+    offsets_offset = keys_offset + len(keys) * 4
+    blob_offset = offsets_offset + len(offsets) * 4
+    sources_offset = blob_offset + len(blob)
+
+    source_files = web_source_files(web_path)
+
+    return b"".join([
+        HEADER.pack(MAGIC, VERSION, 0, len(keys), len(source_files),
+                    keys_offset, offsets_offset, blob_offset, sources_offset),
+        keys.tobytes(),
+        offsets.tobytes(),
+        bytes(blob),
+        pack_source_records(source_files),
+    ])
+
+
+def build_english_index(web_path: str, output_path: str) -> int:
+    """
+    Compile the WEB JSON files into one index file.
+
+    Args:
+        web_path: Directory containing the WEB ``NN-book.json`` files
+        output_path: Path of the index file to write
+
+    Returns:
+        Number of verses indexed
+    """
+    data = build_english_index_bytes(web_path)
+
+    output_dir = os.path.dirname(output_path)
+    if output_dir:
+        os.makedirs(output_dir, exist_ok=True)
+
+    tmp_path = output_path + ".tmp"
+    with open(tmp_path, 'wb') as f:
+        f.write(data)
+    os.replace(tmp_path, output_path)
+
+    return HEADER.unpack_from(data, 0)[3]
+
+
+# --- READER ---
+
+class EnglishIndex:
+    """
+    Read-only English verse index over a buffer in the index file format.
+
+    Lookups are a bisect over the sorted key column plus one slice of the
+    text blob; nothing is decoded until a verse is asked for.
+    """
+
+    def __init__(self, buffer):
+        """
+        Wrap a buffer (mmap or bytes) holding an index file.
+
+        Raises:
+            ValueError: If the buffer is not an English index of a supported version
+        """
+        self._buffer = buffer
+        self._view = memoryview(buffer)
+
+        if len(buffer) < HEADER.size:
+            raise ValueError("Not an English index file")
+
+        (magic, version, _reserved, self.n_verses, n_sources,
+         self._keys_offset, offsets_offset, self._blob_offset, self._sources_offset) = HEADER.unpack_from(buffer, 0)
+        if magic != MAGIC or version != VERSION:
+            raise ValueError(f"Unsupported English index (magic={magic!r}, version={version})")
+
+        self.keys = u32_column(self._view, self._keys_offset, self.n_verses)
+        self._offsets = u32_column(self._view, offsets_offset, self.n_verses + 1)
+        self.sources: Dict[int, SourceInfo] = read_source_records(self._view, self._sources_offset, n_sources)
+
+    @classmethod
+    def open(cls, path: str) -> "EnglishIndex":
+        """Memory-map an index file built by ``build_english_index``."""
+        with open(path, 'rb') as f:
+            return cls(mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ))
+
+    @classmethod
+    def from_web_json(cls, web_path: str) -> "EnglishIndex":
+        """Build the index in memory straight from the WEB JSON files."""
+        return cls(build_english_index_bytes(web_path))
+
+    @classmethod
+    def load(cls, index_path: Optional[str], web_path: str) -> "EnglishIndex":
+        """
+        Open the prebuilt index if it exists and is current, otherwise build
+        it from the JSON.
+
+        Either way the result is identical, so callers never need to care
+        whether ``build_corpus.py`` has been run. An index from an older
+        format version, or one built before a WEB JSON file changed, is
+        ignored the same way.
+        """
+        if index_path and os.path.exists(index_path):
+            try:
+                index = cls.open(index_path)
+            except ValueError as e:
+                print(f"[!] {e} - rebuilding in memory (run build_corpus.py to update it)")
+            else:
+                changed = index.changed_books(web_path)
+                if not changed:
+                    return index
+                print(f"[!] {index_path} is out of date ({len(changed)} changed books) - "
+                      f"rebuilding in memory (run build_corpus.py to update it)")
+        return cls.from_web_json(web_path)
+
+    def changed_books(self, web_path: str) -> List[int]:
+        """Codes of the books whose WEB JSON file changed since the index was built."""
+        return changed_books(self.sources, web_source_files(web_path))
+
+    def __len__(self) -> int:
+        return self.n_verses
+
+    def fingerprint(self) -> str:
+        """Content hash of the indexed verses (keys and text, not the source records)."""
+        return hashlib.sha1(self._view[self._keys_offset:self._sources_offset]).hexdigest()
+
+    def __contains__(self, key: int) -> bool:
+        return self._index_of(key) is not None
+
+    def _index_of(self, key: int) -> Optional[int]:
+        index = bisect_left(self.keys, key)
+        if index < self.n_verses and self.keys[index] == key:
+            return index
+        return None
+
+    def text_at(self, index: int) -> str:
+        """English text stored at ``index``."""
+        start = self._blob_offset + self._offsets[index]
+        end = self._blob_offset + self._offsets[index + 1]
+        return str(self._view[start:end], 'utf-8')
+
+    def get(self, key: int, default: str = "") -> str:
+        """English text for a packed verse key, or ``default`` if missing."""
+        index = self._index_of(key)
+        return default if index is None else self.text_at(index)
+
+    def get_parallel(self, key: int) -> Optional[str]:
+        """
+        English text to show next to the Greek of a verse.
+
+        None for Septuagint verses, whose numbering does not match the
+        WEB's (see FIRST_PARALLEL_KEY); otherwise as ``get``.
+        """
+        if key < FIRST_PARALLEL_KEY:
+            return None
+        return self.get(key)
@@ -36,6 +36,7 @@ import sys
 # Add project root to path for imports
 sys.path.insert(0, str(Path(__file__).parent))
 
+from lexicon_store import LEXICON_STORE_PATH, LexiconStore
 from reference_config import ReferenceTextConfig
 
 
@@ -73,9 +74,9 @@ class EnhancedLexiconHelper:
         if self.config.THAYERS_ENABLED:
             try:
                 thayers_path = "enhanced_lexicon.json"
-                if os.path.exists(thayers_path):
-                    with open(thayers_path, 'r', encoding='utf-8') as f:
-                        self.thayers = json.load(f)
+                if os.path.exists(thayers_path) or os.path.exists(LEXICON_STORE_PATH):
+                    # Compiled store shared with ThayersLexicon and the backend
+                    self.thayers = LexiconStore.load(LEXICON_STORE_PATH, thayers_path)
                     print(f"✓ Loaded Thayer's Lexicon ({len(self.thayers)} entries)")
                 else:
                     print(f"⚠ Thayer's lexicon not found at {thayers_path}")
@@ -141,10 +141,12 @@ const VerseDisplay = ({ onWordClick, onVerseLoaded }: VerseDisplayProps) => {
           </div>
 
           {/* English Text */}
-          <div>
-            <h4 className="text-sm font-medium text-gray-700 mb-2">English (WEB)</h4>
-            <p className="text-gray-800">{verse.english_text}</p>
-          </div>
+          {verse.english_text !== null && (
+            <div>
+              <h4 className="text-sm font-medium text-gray-700 mb-2">English (WEB)</h4>
+              <p className="text-gray-800">{verse.english_text}</p>
+            </div>
+          )}
 
           {/* Word Count Info */}
           {verse.words && verse.words.length > 0 && (
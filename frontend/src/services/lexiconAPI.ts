@@ -1,5 +1,5 @@
 import api from './api';
-import type { LexiconEntry, LexiconSearchResult } from '../types/lexicon';
+import type { Collocates, Concordance, LexiconEntry, LexiconSearchResult } from '../types/lexicon';
 
 export const lexiconAPI = {
   // Get lexicon entry by Strong's number
@@ -26,6 +26,24 @@ export const lexiconAPI = {
     return response.data;
   },
 
+  // Lemmas that frequently occur in the same verses as a Strong's number
+  getCollocates: async (
+    number: string,
+    params: { measure?: 'log_likelihood' | 'pmi'; min_count?: number; limit?: number } = {}
+  ): Promise<Collocates> => {
+    const response = await api.get(`/lexicon/strongs/${number}/collocates`, { params });
+    return response.data;
+  },
+
+  // Every occurrence of a lemma or Strong's number, with context
+  getConcordance: async (
+    lemmaOrStrongs: string,
+    params: { context?: number; book?: string; offset?: number; limit?: number } = {}
+  ): Promise<Concordance> => {
+    const response = await api.get(`/concordance/${encodeURIComponent(lemmaOrStrongs)}`, { params });
+    return response.data;
+  },
+
   // Get lexicon statistics
   getStats: async (): Promise<any> => {
     const response = await api.get('/lexicon/stats');
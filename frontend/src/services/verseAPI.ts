@@ -1,5 +1,5 @@
 import api from './api';
-import type { Verse, Book } from '../types/verse';
+import type { Verse, Book, SimilarVerses } from '../types/verse';
 
 export const verseAPI = {
   // Get verse by reference (e.g., "John 3:16")
@@ -8,6 +8,12 @@ export const verseAPI = {
     return response.data;
   },
 
+  // Verses sharing the most distinctive lemmas with a verse ("more like this")
+  getSimilar: async (reference: string, limit = 10): Promise<SimilarVerses> => {
+    const response = await api.get(`/verses/${encodeURIComponent(reference)}/similar`, { params: { limit } });
+    return response.data;
+  },
+
   // Get verse by book code, chapter, and verse number
   getByBookCode: async (code: string, chapter: number, verse: number): Promise<Verse> => {
     const response = await api.get(`/verses/book/${code}/${chapter}/${verse}`);
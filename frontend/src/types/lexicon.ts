@@ -24,3 +24,44 @@ export interface LexiconSearchResult {
   entries: LexiconEntry[];
   total: number;
 }
+
+export interface ConcordanceLine {
+  reference: string;
+  reference_id: string;
+  position: number;
+  word: string;
+  lemma: string;
+  strongs?: string;
+  parse_code: string;
+  left: string;
+  right: string;
+}
+
+export interface Concordance {
+  query: string;
+  lemmas: string[];
+  strongs: string[];
+  total_occurrences: number;
+  books: Record<string, number>;
+  offset: number;
+  limit: number;
+  results: ConcordanceLine[];
+}
+
+export interface Collocate {
+  lemma: string;
+  strongs?: string;
+  count: number;
+  frequency: number;
+  pmi: number;
+  log_likelihood: number;
+}
+
+export interface Collocates {
+  strongs: string;
+  lemmas: string[];
+  frequency: number;
+  total_verses: number;
+  measure: string;
+  results: Collocate[];
+}
@@ -12,10 +12,19 @@ export interface Verse {
   chapter: number;
   verse: number;
   greek_text: string;
-  english_text: string;
+  english_text: string | null;  // null for Septuagint verses (numbering differs from the WEB)
   words?: VerseWord[];
 }
 
+export interface SimilarVerse extends Verse {
+  similarity: number;
+}
+
+export interface SimilarVerses {
+  reference: string;
+  verses: SimilarVerse[];
+}
+
 export interface Book {
   code: string;
   name: string;
@@ -1,10 +1,10 @@
 
 import os
-import json
-import xml.etree.ElementTree as ET
 import chromadb
+from chromadb.utils.embedding_functions import DefaultEmbeddingFunction
 import re
 import sys
+from functools import lru_cache
 from pathlib import Path
 
 # Load environment variables
@@ -17,6 +17,19 @@ except ImportError:
 # Import AI provider system
 from ai_providers import get_provider, get_ollama_host
 
+# Binary SBLGNT corpus and indexes (built by build_corpus.py), parallel seeding
+from collocations import CollocationIndex
+from embedding_cache import CachedEmbedder, EmbeddingCache
+from embedding_workers import ParallelEmbedder
+from corpus import Corpus
+from morphology import MorphologyColumns
+from phrase_index import PhraseIndex
+from seeding import format_reference_id, open_current_corpus, seed_tasks, sync_collection
+from verse_store import unpack_key
+
+# Book mapping and verse reference parsing (shared with the backend)
+from bible_references import CODE_TO_BOOK, VerseSpan, format_references, parse_references
+
 # Import lexicon helper for enhanced definitions
 try:
     from lexicon_helper import ThayersLexicon
@@ -28,10 +41,21 @@ except ImportError:
 # --- CONFIGURATION ---
 LXX_PATH = "LXX-Swete/src/First1KGreek-LXX-RAW/"
 GNT_PATH = "sblgnt/"
+CORPUS_PATH = "corpus_data/sblgnt.corpus"
 LEXICON_PATH = "strongsgreek.xml"
 WEB_BIBLE_PATH = "web_bible_json/"
+ENGLISH_INDEX_PATH = "corpus_data/web_english.idx"
+SIMILARITY_PATH = "corpus_data/sblgnt.similar"
 CHROMA_DB_PATH = "chroma_db_interlinear"
 COLLECTION_NAME = "gospel_interlinear"
+SEED_MANIFEST_PATH = os.path.join(CHROMA_DB_PATH, "seed_manifest.json")
+# Outside the Chroma directory so deleting the database keeps the vectors
+EMBEDDING_CACHE_PATH = "corpus_data/embedding_cache.sqlite"
+
+# Parse processes used when seeding (default: one per CPU)
+SEED_WORKERS = int(os.getenv("SEED_WORKERS", "0")) or None
+# Embedding processes, each with its own ONNX session (default: one per two CPUs)
+EMBED_WORKERS = int(os.getenv("EMBED_WORKERS", "0")) or None
 
 # AI Provider Configuration (from .env or defaults)
 AI_PROVIDER_TYPE = os.getenv("AI_PROVIDER", "ollama").lower()
@@ -39,361 +63,238 @@ OLLAMA_MODEL = os.getenv("OLLAMA_MODEL", "mixtral")
 OLLAMA_HOST = get_ollama_host()
 GEMINI_MODEL = os.getenv("GEMINI_MODEL", "gemini-pro")
 
-# --- BIBLE BOOK MAPPING ---
-# Maps book names to SBLGNT numeric codes
-BIBLE_BOOKS = {
-    # New Testament
-    "matthew": {"code": 61, "abbrev": ["mt", "matt", "mat"]},
-    "mark": {"code": 62, "abbrev": ["mk", "mar"]},
-    "luke": {"code": 63, "abbrev": ["lk", "luk", "lu"]},
-    "john": {"code": 64, "abbrev": ["jn", "joh"]},
-    "acts": {"code": 65, "abbrev": ["ac", "act"]},
-    "romans": {"code": 66, "abbrev": ["ro", "rom", "rm"]},
-    "1 corinthians": {"code": 67, "abbrev": ["1co", "1cor", "1 cor"]},
-    "2 corinthians": {"code": 68, "abbrev": ["2co", "2cor", "2 cor"]},
-    "galatians": {"code": 69, "abbrev": ["ga", "gal"]},
-    "ephesians": {"code": 70, "abbrev": ["eph", "ephes"]},
-    "philippians": {"code": 71, "abbrev": ["php", "phil", "pp"]},
-    "colossians": {"code": 72, "abbrev": ["col"]},
-    "1 thessalonians": {"code": 73, "abbrev": ["1th", "1thes", "1thess", "1 thess", "1 th"]},
-    "2 thessalonians": {"code": 74, "abbrev": ["2th", "2thes", "2thess", "2 thess", "2 th"]},
-    "1 timothy": {"code": 75, "abbrev": ["1ti", "1tim", "1 tim", "1 ti"]},
-    "2 timothy": {"code": 76, "abbrev": ["2ti", "2tim", "2 tim", "2 ti"]},
-    "titus": {"code": 77, "abbrev": ["tit", "ti"]},
-    "philemon": {"code": 78, "abbrev": ["phm", "philem", "pm"]},
-    "hebrews": {"code": 79, "abbrev": ["heb", "he"]},
-    "james": {"code": 80, "abbrev": ["jas", "jam", "jm"]},
-    "1 peter": {"code": 81, "abbrev": ["1pe", "1pet", "1pt", "1 pet", "1 pe"]},
-    "2 peter": {"code": 82, "abbrev": ["2pe", "2pet", "2pt", "2 pet", "2 pe"]},
-    "1 john": {"code": 83, "abbrev": ["1jn", "1jo", "1j", "1 joh", "1 john"]},
-    "2 john": {"code": 84, "abbrev": ["2jn", "2jo", "2j", "2 joh", "2 john"]},
-    "3 john": {"code": 85, "abbrev": ["3jn", "3jo", "3j", "3 joh", "3 john"]},
-    "jude": {"code": 86, "abbrev": ["jud", "jd"]},
-    "revelation": {"code": 87, "abbrev": ["re", "rev", "rv"]},
-}
-
-# Reverse lookup: code to book name
-CODE_TO_BOOK = {info["code"]: name.title() for name, info in BIBLE_BOOKS.items()}
-
-# --- VERSE REFERENCE PARSER ---
-
-def parse_verse_reference(ref_string):
-    """
-    Parses verse references like:
-    - 'John 3:16' → {'book': 43, 'chapter': 3, 'verse': 16}
-    - 'John 3:16-18' → [{'book': 43, 'chapter': 3, 'verse': 16}, ...]
-    - '1 John 2:1' → {'book': 62, 'chapter': 2, 'verse': 1}
+# --- DATABASE SEEDING ---
 
-    Returns: dict or list of dicts with verse info, or None if invalid
+def seed_database(client):
+    """
+    Seeds the ChromaDB database, reparsing and re-embedding only the
+    sources that changed since the last seed (see seeding.py).
     """
-    ref_string = ref_string.strip().lower()
+    print("--- Seeding Database ---")
 
-    # Pattern: (optional number + space) + book name + chapter:verse(-verse)?
-    pattern = r'^(\d+\s+)?([a-z]+)\s+(\d+):(\d+)(?:-(\d+))?$'
-    match = re.match(pattern, ref_string)
+    embedding_function = DefaultEmbeddingFunction()
+    collection = client.get_or_create_collection(name=COLLECTION_NAME, embedding_function=embedding_function)
 
-    if not match:
-        return None
+    if not os.path.exists(ENGLISH_INDEX_PATH) and not os.path.exists(WEB_BIBLE_PATH):
+        print(f"  [!] WEB Bible directory not found at {WEB_BIBLE_PATH}")
+        print(f"  [!] Run 'python download_web_bible.py' to download it")
 
-    num_prefix, book_name, chapter, start_verse, end_verse = match.groups()
+    # Lexicon and one task per book, parsed in a process pool while a
+    # writer thread embeds (through the embedding cache, in a pool of
+    # embedding processes) and upserts
+    tasks = seed_tasks(LEXICON_PATH, CORPUS_PATH, GNT_PATH, CODE_TO_BOOK, LXX_PATH, WEB_BIBLE_PATH)
+    print(f"Checking {len(tasks)} sources against {SEED_MANIFEST_PATH}...")
+    with EmbeddingCache(EMBEDDING_CACHE_PATH) as cache, ParallelEmbedder(EMBED_WORKERS) as embed:
+        embedder = CachedEmbedder(embed, cache)
+        reseeded, total = sync_collection(
+            collection, tasks, SEED_MANIFEST_PATH, CORPUS_PATH, ENGLISH_INDEX_PATH, WEB_BIBLE_PATH,
+            workers=SEED_WORKERS, embedder=embedder
+        )
 
-    # Build full book name
-    full_book_name = f"{num_prefix.strip()} {book_name}" if num_prefix else book_name
-    full_book_name = full_book_name.strip()
+    if not reseeded and not total:
+        print("Database already up to date. Skipping.")
+        return collection
+    print(f"\nReseeded {reseeded} changed sources ({total} documents)")
+    print(f"Embedding cache: {embedder.hits} reused, {embedder.misses} embedded")
 
-    # Find book code
-    book_code = None
-    for book, info in BIBLE_BOOKS.items():
-        if book == full_book_name or full_book_name in info["abbrev"]:
-            book_code = info["code"]
-            break
+    print("--- Database Seeding Complete ---")
+    return collection
 
-    if not book_code:
-        return None
+# --- QUERY ENGINE ---
 
-    chapter = int(chapter)
-    start_verse = int(start_verse)
-
-    # Handle verse range
-    if end_verse:
-        end_verse = int(end_verse)
-        return [
-            {"book": book_code, "book_name": CODE_TO_BOOK[book_code],
-             "chapter": chapter, "verse": v}
-            for v in range(start_verse, end_verse + 1)
-        ]
-    else:
-        return {
-            "book": book_code,
-            "book_name": CODE_TO_BOOK[book_code],
-            "chapter": chapter,
-            "verse": start_verse
-        }
+def lookup_verse(collection, verse_ref):
+    """
+    Looks up a specific verse by reference.
+    verse_ref: dict with 'book', 'chapter', 'verse' keys
+    """
+    ref_id = format_reference_id(
+        verse_ref['book'],
+        verse_ref['chapter'],
+        verse_ref['verse']
+    )
 
-def format_reference_id(book, chapter, verse):
-    """Formats a reference ID like '40-01-01' for Matthew 1:1"""
-    return f"{book:02d}-{chapter:02d}-{verse:02d}"
+    results = collection.get(
+        where={"reference_id": ref_id}
+    )
 
-# --- DATABASE SEEDING ---
+    if results['documents']:
+        return results['documents'][0], results['metadatas'][0]
+    return None, None
 
-def parse_lexicon(file_path):
-    """Parses the Thayer's Lexicon XML file."""
-    print(f"Parsing lexicon: {file_path}")
-    if not os.path.exists(file_path):
-        print(f"  [!] Lexicon file not found at {file_path}")
-        return []
 
-    tree = ET.parse(file_path)
-    root = tree.getroot()
-    entries = []
-    for entry in root.findall(".//entry"):
-        strongs_num = entry.get("strongs")
-        greek_node = entry.find("greek")
-        if greek_node is not None:
-            greek_word = greek_node.get("unicode", "")
-        else:
-            greek_word = ""
-
-        # Extract definitions
-        kjv_def_node = entry.find("kjv_def")
-        kjv_def = (kjv_def_node.text or "").strip() if kjv_def_node is not None else ""
-
-        strongs_def_node = entry.find("strongs_def")
-        strongs_def_parts = [
-            (t or "").strip() for t in strongs_def_node.itertext()
-        ] if strongs_def_node is not None else []
-        strongs_def = " ".join(filter(None, strongs_def_parts))
-
-        full_def = f"G{strongs_num} {greek_word}: KJV: {kjv_def}. Thayer: {strongs_def}"
-
-        entries.append({
-            "text": full_def,
-            "metadata": {
-                "source": "Thayer",
-                "strongs": f"G{strongs_num}",
-                "book": "Lexicon",
-                "type": "lexicon"
-            }
-        })
-    print(f"  -> Parsed {len(entries)} lexicon entries.")
-    return entries
-
-def load_web_bible():
+def lookup_range(collection, book, chapter, start_verse, end_verse):
     """
-    Loads World English Bible (WEB) JSON files and creates a lookup dictionary.
-    Returns: dict with (book_code, chapter, verse) -> english_text
+    Looks up a verse range with a single batched query.
+    Returns: list of (text, metadata) tuples in verse order
     """
-    print("Loading World English Bible (WEB)...")
+    return lookup_spans(collection, [VerseSpan(book, chapter, start_verse, chapter, end_verse)])
 
-    if not os.path.exists(WEB_BIBLE_PATH):
-        print(f"  [!] WEB Bible directory not found at {WEB_BIBLE_PATH}")
-        print(f"  [!] Run 'python download_web_bible.py' to download it")
-        return {}
 
-    english_lookup = {}
+def lookup_spans(collection, spans, corpus=None):
+    """
+    Looks up every verse of the parsed reference spans with a single batched
+    query (spans may cross chapters). With a built corpus file only the
+    verses that exist in it are queried, so whole chapters ask for their
+    real verses, not every verse number up to 999; without one the spans'
+    chapters are filtered on the verse metadata instead.
+    Returns: list of (text, metadata) tuples in query order
+    """
+    if corpus is None:
+        corpus = load_corpus_file()
+        if corpus is None:
+            return lookup_spans_by_chapter(collection, spans)
+
+    ref_ids = []
+    for span in spans:
+        for verse_index in corpus.verses_between(span.start_key, span.end_key):
+            ref_ids.append(format_reference_id(*unpack_key(corpus.verse_keys[verse_index])))
+    if not ref_ids:
+        return []
 
-    for filename in sorted(os.listdir(WEB_BIBLE_PATH)):
-        if not filename.endswith(".json"):
-            continue
+    results = collection.get(
+        where={"reference_id": {"$in": ref_ids}}
+    )
+
+    found = {
+        metadata['reference_id']: (text, metadata)
+        for text, metadata in zip(results['documents'], results['metadatas'])
+    }
+    return [found[ref_id] for ref_id in dict.fromkeys(ref_ids) if ref_id in found]
 
-        # Extract book code from filename: "43-john.json" → 43
-        try:
-            book_code = int(filename.split("-")[0])
-        except:
-            continue
 
-        file_path = os.path.join(WEB_BIBLE_PATH, filename)
+def lookup_spans_by_chapter(collection, spans):
+    """
+    Looks up the verses of reference spans without a corpus: one query for
+    the verse documents of the spans' chapters, trimmed to the spans'
+    first and last verses.
+    Returns: list of (text, metadata) tuples in query order
+    """
+    filters = [
+        {"$and": [
+            {"book": span.book_name},
+            {"chapter": {"$gte": span.start_chapter}},
+            {"chapter": {"$lte": span.end_chapter}},
+        ]}
+        for span in spans
+    ]
+    if not filters:
+        return []
 
-        with open(file_path, 'r', encoding='utf-8') as f:
-            data = json.load(f)
+    results = collection.get(
+        where={"$and": [{"type": "verse"}, filters[0] if len(filters) == 1 else {"$or": filters}]}
+    )
 
-        # Parse verses from JSON
-        for item in data:
-            if item.get("type") in ["paragraph text", "line text"]:
-                chapter = item.get("chapterNumber")
-                verse = item.get("verseNumber")
-                value = item.get("value", "").strip()
+    by_position = {
+        (metadata['book'], metadata['chapter'], metadata['verse']): (text, metadata)
+        for text, metadata in zip(results['documents'], results['metadatas'])
+    }
+    verses = {}
+    for span in spans:
+        in_span = sorted(
+            position for position in by_position
+            if position[0] == span.book_name
+            and (span.start_chapter, span.start_verse) <= position[1:] <= (span.end_chapter, span.end_verse)
+        )
+        for position in in_span:
+            verses.setdefault(position, by_position[position])
+    return list(verses.values())
 
-                if chapter and verse and value:
-                    key = (book_code, chapter, verse)
-                    # Some verses have multiple sections, concatenate them
-                    if key in english_lookup:
-                        english_lookup[key] += " " + value
-                    else:
-                        english_lookup[key] = value
 
-    print(f"  -> Loaded {len(english_lookup)} English verses.")
-    return english_lookup
+@lru_cache(maxsize=None)
+def load_corpus_file():
+    """
+    Open the prebuilt corpus file, once, if it is current.
 
-def parse_sblgnt_file(file_path, book_code, book_name, english_lookup=None):
+    Returns: Corpus, or None if corpus_data/sblgnt.corpus is missing or out
+    of date (nothing is compiled in memory)
     """
-    Parses SBLGNT morphology files like '64-Jn-morphgnt.txt'
-    Format: BBCCVV POS MORPH WORD NORM LEMMA LEMMA_FULL
+    return open_current_corpus(CORPUS_PATH, GNT_PATH, CODE_TO_BOOK, LXX_PATH)
+
+
+@lru_cache(maxsize=None)
+def load_corpus():
+    """Open the corpus (prebuilt file or SBLGNT + LXX), once."""
+    return Corpus.load(CORPUS_PATH, GNT_PATH, CODE_TO_BOOK, LXX_PATH)
+
+
+@lru_cache(maxsize=None)
+def load_morphology():
     """
-    print(f"  Parsing {book_name}...")
+    Open the corpus as morphology columns, once.
 
-    if not os.path.exists(file_path):
-        print(f"    [!] File not found: {file_path}")
-        return []
+    Returns: MorphologyColumns, or None if no SBLGNT data is available
+    """
+    corpus = load_corpus()
+    if not corpus.n_tokens:
+        return None
+    return MorphologyColumns(corpus)
 
-    documents = []
-    current_verse = None
-    verse_words = []
-
-    with open(file_path, 'r', encoding='utf-8') as f:
-        for line in f:
-            line = line.strip()
-            if not line:
-                continue
-
-            parts = line.split()
-            if len(parts) < 7:
-                continue
-
-            # Parse reference: BBCCVV
-            ref_id = parts[0]
-            try:
-                chapter = int(ref_id[2:4])
-                verse = int(ref_id[4:6])
-            except:
-                continue
-
-            # Word is at index 3 (with punctuation)
-            word = parts[3]
-
-            verse_ref = (chapter, verse)
-
-            # If we're starting a new verse, save the previous one
-            if current_verse != verse_ref and verse_words:
-                prev_chapter, prev_verse = current_verse
-                greek_text = " ".join(verse_words)
-
-                # Get English text if available
-                english_text = ""
-                if english_lookup:
-                    english_key = (book_code, prev_chapter, prev_verse)
-                    english_text = english_lookup.get(english_key, "")
-
-                documents.append({
-                    "text": greek_text,
-                    "metadata": {
-                        "source": "SBLGNT",
-                        "book": book_name,
-                        "chapter": prev_chapter,
-                        "verse": prev_verse,
-                        "reference": f"{book_name} {prev_chapter}:{prev_verse}",
-                        "reference_id": format_reference_id(book_code, prev_chapter, prev_verse),
-                        "english_text": english_text,
-                        "type": "verse"
-                    }
-                })
-                verse_words = []
-
-            current_verse = verse_ref
-            verse_words.append(word)
-
-    # Don't forget the last verse
-    if verse_words and current_verse:
-        chapter, verse = current_verse
-        greek_text = " ".join(verse_words)
-
-        # Get English text if available
-        english_text = ""
-        if english_lookup:
-            english_key = (book_code, chapter, verse)
-            english_text = english_lookup.get(english_key, "")
-
-        documents.append({
-            "text": greek_text,
-            "metadata": {
-                "source": "SBLGNT",
-                "book": book_name,
-                "chapter": chapter,
-                "verse": verse,
-                "reference": f"{book_name} {chapter}:{verse}",
-                "reference_id": format_reference_id(book_code, chapter, verse),
-                "english_text": english_text,
-                "type": "verse"
-            }
-        })
-
-    return documents
 
-def seed_database(client):
-    """Parses all source files and seeds the ChromaDB database."""
-    print("--- Seeding Database ---")
+def load_phrase_index():
+    """
+    Build the Greek phrase index over the corpus.
 
-    # Check if collection exists and has documents
-    try:
-        collection = client.get_collection(name=COLLECTION_NAME)
-        if collection.count() > 0:
-            print("Database already seeded. Skipping.")
-            return collection
-    except Exception:
-        print(f"Creating new collection: '{COLLECTION_NAME}'")
-        collection = client.create_collection(name=COLLECTION_NAME)
-
-    documents = []
-
-    # 1. Load World English Bible (WEB) for reference
-    english_lookup = load_web_bible()
-
-    # 2. Parse Lexicon
-    documents.extend(parse_lexicon(LEXICON_PATH))
-
-    # 3. Parse SBLGNT New Testament
-    print("Parsing Greek New Testament (SBLGNT)...")
-    if os.path.exists(GNT_PATH):
-        for filename in sorted(os.listdir(GNT_PATH)):
-            if filename.endswith("-morphgnt.txt"):
-                # Extract book code from filename: "64-Jn-morphgnt.txt" → 64
-                try:
-                    book_code = int(filename.split("-")[0])
-                    if book_code in CODE_TO_BOOK:
-                        book_name = CODE_TO_BOOK[book_code]
-                        file_path = os.path.join(GNT_PATH, filename)
-                        documents.extend(parse_sblgnt_file(file_path, book_code, book_name, english_lookup))
-                except:
-                    continue
-    else:
-        print(f"  [!] SBLGNT directory not found at {GNT_PATH}")
-
-    # Add to ChromaDB in batches
-    print(f"\nAdding {len(documents)} total documents to ChromaDB...")
-    batch_size = 1000
-    for i in range(0, len(documents), batch_size):
-        batch = documents[i:i+batch_size]
-
-        collection.add(
-            documents=[doc["text"] for doc in batch],
-            metadatas=[doc["metadata"] for doc in batch],
-            ids=[f"doc_{i+j}" for j in range(len(batch))]
-        )
-        print(f"  Added batch {i//batch_size + 1}/{(len(documents)-1)//batch_size + 1}")
+    Returns: PhraseIndex, or None if no SBLGNT data is available
+    """
+    columns = load_morphology()
+    return PhraseIndex(columns) if columns is not None else None
 
-    print("--- Database Seeding Complete ---")
-    return collection
 
-# --- QUERY ENGINE ---
+def load_collocations():
+    """
+    Build the lemma co-occurrence index over the corpus.
 
-def lookup_verse(collection, verse_ref):
+    Returns: CollocationIndex, or None if no SBLGNT data is available
     """
-    Looks up a specific verse by reference.
-    verse_ref: dict with 'book', 'chapter', 'verse' keys
+    columns = load_morphology()
+    return CollocationIndex(columns) if columns is not None else None
+
+
+def frequent_collocates(strongs_id, collocations, lexicon, limit=5):
     """
-    ref_id = format_reference_id(
-        verse_ref['book'],
-        verse_ref['chapter'],
-        verse_ref['verse']
-    )
+    Lemmas that share verses with a Strong's number more often than chance.
 
-    results = collection.get(
-        where={"reference_id": ref_id}
-    )
+    Args:
+        strongs_id: Strong's number (e.g., 'G26')
+        collocations: CollocationIndex
+        lexicon: ThayersLexicon (maps corpus lemmas to Strong's numbers)
+        limit: Maximum number of collocates
 
-    if results['documents']:
-        return results['documents'][0], results['metadatas'][0]
-    return None, None
+    Returns:
+        List of (lemma, Strong's number or None, shared verse count)
+    """
+    def resolve(lemma):
+        entries = lexicon.lookup_by_greek(lemma)
+        return entries[0]['strongs'] if entries else None
+
+    columns = collocations.columns
+    strongs_table = columns.strongs_table("thayers", resolve)
+    lemma_ids = (strongs_table == strongs_id).nonzero()[0]
+    return [
+        (columns.corpus.string(collocate.lemma_id), strongs_table[collocate.lemma_id], collocate.count)
+        for collocate in collocations.collocates(lemma_ids, limit=limit)
+    ]
+
+
+def print_phrase_matches(phrase_index, phrase, limit=20):
+    """Print the verses containing a Greek phrase (accents ignored), with the match marked"""
+    positions, length = phrase_index.search(phrase)
+    if not len(positions):
+        print("No matches.")
+        return
+
+    columns = phrase_index.columns
+    corpus = columns.corpus
+    print(f"\n--- {len(positions)} match(es) for '{phrase}' ---")
+    for position in positions[:limit].tolist():
+        key = int(columns.keys[position])
+        book, chapter, verse = unpack_key(key)
+        text = " ".join(corpus.verse_words(corpus.find_verse(key)))
+        start, end = phrase_index.highlight(position, length)
+        print(f"\n{CODE_TO_BOOK[book]} {chapter}:{verse}")
+        print(f"Greek:   {text[:start]}[{text[start:end]}]{text[end:]}")
+    if len(positions) > limit:
+        print(f"\n... {len(positions) - limit} more")
 
 
 def extract_greek_words_and_lookup(text, lexicon):
@@ -434,13 +335,15 @@ def extract_greek_words_and_lookup(text, lexicon):
     return list(strongs_numbers)
 
 
-def build_lexicon_context(strongs_numbers, lexicon):
+def build_lexicon_context(strongs_numbers, lexicon, collocations=None):
     """
     Build rich lexicon context from Strong's numbers.
 
     Args:
         strongs_numbers: List of Strong's numbers (e.g., ['G25', 'G26'])
         lexicon: ThayersLexicon instance
+        collocations: Optional CollocationIndex, adds each word's frequent
+            companions in the NT
 
     Returns:
         Formatted lexicon context string
@@ -496,6 +399,16 @@ def build_lexicon_context(strongs_numbers, lexicon):
             cross_ref_str = ', '.join(refs)
             parts.append(f"  Related: {cross_ref_str}")
 
+        # Words it frequently occurs with (same verse, more often than chance)
+        if collocations is not None:
+            companions = frequent_collocates(strongs_id, collocations, lexicon)
+            if companions:
+                companions_str = ', '.join(
+                    f"{lemma} ({strongs}, {count} verses)" if strongs else f"{lemma} ({count} verses)"
+                    for lemma, strongs, count in companions
+                )
+                parts.append(f"  Frequently occurs with: {companions_str}")
+
         lexicon_parts.append('\n'.join(parts))
         lexicon_parts.append("")  # Blank line between entries
 
@@ -553,10 +466,14 @@ def main():
             print("    Continuing without enhanced definitions...")
             lexicon = None
 
+    # Co-occurrence statistics for the lexicon context ("frequently occurs with")
+    collocations = load_collocations() if lexicon else None
+
     print(f"\nReady to answer questions.")
     print("\nCommands:")
     print("  - Ask questions: 'What does agape mean?'")
     print("  - Look up verses: 'John 3:16' or 'Show me Romans 8:28'")
+    print("  - Find a Greek phrase: 'phrase: εν αρχη ην' (accents optional)")
     print("  - Type 'quit' to exit, 'clear' to clear conversation history")
     print("\nNote: English text (WEB) shown for reference, but AI analyzes GREEK ONLY.")
     if lexicon:
@@ -566,6 +483,7 @@ def main():
 
     # Initialize conversation history
     conversation_history = []
+    phrase_index = None  # built on the first phrase search
 
     # Updated system message - focuses on Greek only
     system_message = """You are an expert research assistant specializing in the Greek Bible.
@@ -596,23 +514,34 @@ Always cite Greek text and references. Be scholarly and precise."""
             print("Conversation history cleared.")
             continue
 
+        # Exact phrase search (next to the semantic search below)
+        if question.lower().startswith('phrase:'):
+            if phrase_index is None:
+                phrase_index = load_phrase_index()
+            if phrase_index is None:
+                print(f"SBLGNT not found at {GNT_PATH}")
+            else:
+                print_phrase_matches(phrase_index, question.split(':', 1)[1].strip())
+            continue
+
         # Check if this is a verse reference lookup
-        verse_ref = parse_verse_reference(question)
+        spans = parse_references(question)
 
-        if verse_ref:
+        if spans:
             # Direct verse lookup
-            if isinstance(verse_ref, list):
-                # Multiple verses (range)
-                print(f"\n--- {verse_ref[0]['book_name']} {verse_ref[0]['chapter']}:{verse_ref[0]['verse']}-{verse_ref[-1]['verse']} ---")
-                for ref in verse_ref:
-                    text, metadata = lookup_verse(collection, ref)
-                    if text:
-                        print(f"\n{metadata['reference']}")
-                        print(f"Greek:   {text}")
-                        if metadata.get('english_text'):
-                            print(f"English: {metadata['english_text']}")
+            if len(spans) > 1 or not spans[0].is_single_verse:
+                # Multiple verses (ranges, chapters or compound references)
+                print(f"\n--- {format_references(spans)} ---")
+                verses = lookup_spans(collection, spans)
+                for text, metadata in verses:
+                    print(f"\n{metadata['reference']}")
+                    print(f"Greek:   {text}")
+                    if metadata.get('english_text'):
+                        print(f"English: {metadata['english_text']}")
             else:
                 # Single verse
+                span = spans[0]
+                verse_ref = {"book": span.book, "chapter": span.start_chapter, "verse": span.start_verse}
                 text, metadata = lookup_verse(collection, verse_ref)
                 if text:
                     print(f"\n--- {metadata['reference']} ---")
@@ -647,7 +576,7 @@ Always cite Greek text and references. Be scholarly and precise."""
             strongs_numbers = extract_greek_words_and_lookup(context + " " + question, lexicon)
             if strongs_numbers:
                 print(f"...enriching with lexicon data ({len(strongs_numbers)} entries)...")
-                lexicon_context = build_lexicon_context(strongs_numbers, lexicon)
+                lexicon_context = build_lexicon_context(strongs_numbers, lexicon, collocations)
 
         # Construct messages for Ollama
         messages = [{'role': 'system', 'content': system_message}]
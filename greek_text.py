@@ -0,0 +1,107 @@
+#!/usr/bin/env python3
+"""
+Greek Text - Shared Greek Normalisation
+=======================================
+Accent stripping and folding of Greek (and transliterated) words, shared by
+the lexicon store and service, lexicon search and the phrase index.
+
+Removing accents by decomposing to NFD and filtering combining marks one
+character at a time through ``unicodedata`` is slow on hot paths (search,
+lexicon lookups, chat lexicon extraction). Instead every precomposed
+codepoint of the Greek, Greek Extended and Latin blocks is mapped to its
+unaccented form once, at import, in a ``str.translate`` table. Text with
+characters outside those blocks (Hebrew points, compatibility characters,
+...) falls back to the ``unicodedata`` form, so the result is always the
+same as ``strip_accents_reference``.
+
+Usage:
+    from greek_text import fold_greek, strip_accents
+
+    strip_accents("ἀγάπη")  # "αγαπη"
+    fold_greek("Θεός,")     # "θεος"
+"""
+
+import re
+import unicodedata
+from typing import Iterable, List
+
+# Blocks whose characters the tables map: Basic Latin and Latin-1, Latin
+# Extended-A/B, combining diacritical marks, Greek and Coptic, Latin
+# Extended Additional and Greek Extended
+TABLE_RANGES = ((0x0000, 0x0250), (0x0300, 0x0370), (0x0370, 0x0400), (0x1E00, 0x2000))
+COMBINING_RANGE = (0x0300, 0x0370)
+
+
+def _outside(ranges) -> "re.Pattern":
+    """Pattern matching any character outside ``ranges``."""
+    return re.compile("[^" + "".join(f"\\u{start:04x}-\\u{stop - 1:04x}" for start, stop in ranges) + "]")
+
+
+# Text the tables cannot translate on their own: characters outside
+# TABLE_RANGES and, for grave_to_acute, loose combining marks (which NFC
+# composes with the preceding letter)
+_UNCOVERED_RE = _outside(TABLE_RANGES)
+_UNCOVERED_OR_COMBINING_RE = _outside(r for r in TABLE_RANGES if r != COMBINING_RANGE)
+
+# Punctuation and critical signs stripped from the ends of a folded word
+FOLD_STRIP = '.,;:\u00b7\u2e00'
+
+
+def strip_accents_reference(text: str) -> str:
+    """Text with every combining mark removed, via NFD (the reference form)."""
+    decomposed = unicodedata.normalize('NFD', text)
+    return unicodedata.normalize('NFC', ''.join(char for char in decomposed if unicodedata.category(char) != 'Mn'))
+
+
+def grave_to_acute_reference(text: str) -> str:
+    """NFC text with every grave accent written acute, via NFD (the reference form)."""
+    return unicodedata.normalize('NFC', unicodedata.normalize('NFD', text).replace('\u0300', '\u0301'))
+
+
+def _codepoints() -> Iterable[str]:
+    for start, stop in TABLE_RANGES:
+        for codepoint in range(start, stop):
+            yield chr(codepoint)
+
+
+def _build_table(convert) -> List[str]:
+    """
+    Translate table (indexed by codepoint, up to the last TABLE_RANGES
+    block) of ``convert`` applied to each TABLE_RANGES character.
+    """
+    table = [chr(codepoint) for codepoint in range(TABLE_RANGES[-1][1])]
+    for char in _codepoints():
+        table[ord(char)] = convert(char)
+    return table
+
+
+_STRIP_ACCENTS = _build_table(strip_accents_reference)
+_GRAVE_TO_ACUTE = _build_table(grave_to_acute_reference)
+
+
+def strip_accents(text: str) -> str:
+    """Text with accents, breathings and other combining marks removed."""
+    if text.isascii():
+        return text
+    if _UNCOVERED_RE.search(text):
+        return strip_accents_reference(text)
+    return text.translate(_STRIP_ACCENTS)
+
+
+def grave_to_acute(text: str) -> str:
+    """NFC text with grave accents written acute (as in the SBLGNT NORM column)."""
+    if text.isascii():
+        return text
+    if _UNCOVERED_OR_COMBINING_RE.search(text):
+        return grave_to_acute_reference(text)
+    return text.translate(_GRAVE_TO_ACUTE)
+
+
+def fold_greek(text: str) -> str:
+    """
+    Accent- and case-insensitive key of a Greek word: punctuation stripped
+    from the ends, combining marks removed, lowercased.
+    """
+    if not text:
+        return ""
+    return strip_accents(text.strip(FOLD_STRIP)).lower().strip()
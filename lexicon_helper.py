@@ -2,7 +2,7 @@
 """
 Lexicon Helper - Fast In-Memory Lookups
 ========================================
-Provides instant O(1) access to enhanced Thayer's lexicon without ChromaDB queries.
+Provides instant access to enhanced Thayer's lexicon without ChromaDB queries.
 
 Usage:
     from lexicon_helper import ThayersLexicon
@@ -17,31 +17,35 @@ Author: AI Gospel Parser Project
 Date: 2026-01-18
 """
 
-import json
 import os
 import unicodedata
-from typing import Dict, List, Optional, Union
+from typing import List, Optional
+
+from lexicon_store import LEXICON_JSON_PATH, LEXICON_STORE_PATH, LexiconStore
 
 
 class ThayersLexicon:
     """
-    Fast in-memory access to enhanced Thayer's Greek Lexicon.
+    Fast access to enhanced Thayer's Greek Lexicon.
 
-    Loads enhanced lexicon JSON into memory for instant lookups.
+    Maps the compiled lexicon store (see lexicon_store.py), shared with the
+    backend, and decodes entries on access; its prebuilt indexes serve the
+    Greek and transliteration lookups.
     Provides multiple access methods: by Strong's number, by Greek lemma, etc.
     """
 
-    def __init__(self, json_path: str = "enhanced_lexicon.json"):
+    def __init__(self, json_path: str = LEXICON_JSON_PATH, store_path: str = LEXICON_STORE_PATH):
         """
-        Initialize lexicon from JSON file.
+        Initialize lexicon from the compiled store (or the JSON file).
 
         Args:
             json_path: Path to enhanced_lexicon.json file
+            store_path: Path to the compiled store (compiled in memory from
+                the JSON when missing or out of date)
         """
         self.json_path = json_path
-        self.entries: Dict[str, dict] = {}  # strongs -> entry
-        self.greek_index: Dict[str, List[str]] = {}  # lemma -> [strongs_ids]
-        self.translit_index: Dict[str, List[str]] = {}  # transliteration -> [strongs_ids]
+        self.store_path = store_path
+        self.entries: LexiconStore  # strongs -> entry
 
         self._load_lexicon()
 
@@ -51,38 +55,16 @@ class ThayersLexicon:
         return unicodedata.normalize('NFC', text) if text else ''
 
     def _load_lexicon(self):
-        """Load lexicon from JSON and build indices."""
-        if not os.path.exists(self.json_path):
+        """Map the compiled lexicon."""
+        if not os.path.exists(self.json_path) and not os.path.exists(self.store_path):
             raise FileNotFoundError(
                 f"Enhanced lexicon not found at {self.json_path}. "
                 f"Run build_enhanced_lexicon.py first."
             )
 
         print(f"Loading enhanced lexicon from {self.json_path}...")
-
-        with open(self.json_path, 'r', encoding='utf-8') as f:
-            data = json.load(f)
-
-        self.entries = data
-
-        # Build Greek index (with normalization)
-        for strongs_id, entry in self.entries.items():
-            lemma = self.normalize_greek(entry.get('lemma', ''))
-            if lemma:
-                if lemma not in self.greek_index:
-                    self.greek_index[lemma] = []
-                self.greek_index[lemma].append(strongs_id)
-
-            # Build transliteration index
-            translit = entry.get('transliteration', '')
-            if translit:
-                if translit not in self.translit_index:
-                    self.translit_index[translit] = []
-                self.translit_index[translit].append(strongs_id)
-
+        self.entries = LexiconStore.load(self.store_path, self.json_path)
         print(f"  -> Loaded {len(self.entries)} entries")
-        print(f"  -> Indexed {len(self.greek_index)} Greek lemmas")
-        print(f"  -> Indexed {len(self.translit_index)} transliterations")
 
     def lookup_by_strongs(self, strongs_id: str) -> Optional[dict]:
         """
@@ -112,9 +94,7 @@ class ThayersLexicon:
         Returns:
             List of lexicon entries (usually 1, sometimes multiple for homographs)
         """
-        normalized_lemma = self.normalize_greek(lemma)
-        strongs_ids = self.greek_index.get(normalized_lemma, [])
-        return [self.entries[sid] for sid in strongs_ids]
+        return self.entries.lookup("lemma", self.normalize_greek(lemma))
 
     def lookup_by_transliteration(self, translit: str) -> List[dict]:
         """
@@ -126,8 +106,9 @@ class ThayersLexicon:
         Returns:
             List of lexicon entries
         """
-        strongs_ids = self.translit_index.get(translit, [])
-        return [self.entries[sid] for sid in strongs_ids]
+        # The index is case-insensitive; keep exact matches
+        candidates = self.entries.lookup("translit", translit.lower().strip())
+        return [entry for entry in candidates if entry.get('transliteration') == translit]
 
     def get_definition(
         self,
@@ -0,0 +1,212 @@
+#!/usr/bin/env python3
+"""
+Lexicon Integration - Thayer's Lexicon Enriched with SBLGNT Morphology
+======================================================================
+Builds ``enhanced_lexicon.json``: every entry of the Strong's/Thayer XML
+with the morphology of its lemma across the SBLGNT (occurrences, tense,
+voice, mood, case, number, gender and person distributions, part of
+speech and the most frequent forms).
+
+The morphgnt files are read in a single pass, one book per worker
+process. Each worker returns a ``Counter`` of (lemma, POS, parse code,
+form) for its book; the reduce step merges the counters, maps SBLGNT
+lemmas to Strong's numbers and turns each lemma's parse codes into the
+per-feature distributions. Every aggregate is a sum over books, so the
+result does not depend on the number of workers.
+
+Usage:
+    from lexicon_integration import build_enhanced_lexicon
+
+    lexicon = build_enhanced_lexicon("strongsgreek.xml", "sblgnt")
+    lexicon["G25"]["morphology"]["tenses"]  # {"Present": ..., "Aorist": ...}
+"""
+
+import os
+import time
+import unicodedata
+import xml.etree.ElementTree as ET
+from collections import Counter, defaultdict
+from concurrent.futures import ProcessPoolExecutor
+from typing import Dict, Iterable, List, Optional, Tuple
+
+from bible_references import CODE_TO_BOOK
+from corpus import iter_morphgnt_tokens, sblgnt_book_files
+from morphology import PARSE_SLOTS, POS_LABELS
+from phrase_index import normalize_word
+from strongs_lexicon import inline_text, iter_strongs_entries, reference_id
+
+# Most frequent forms kept per entry
+SAMPLE_FORMS = 10
+
+# Morphology key of each parse slot, in LexiconEntry order (degree is not reported)
+FEATURE_KEYS = {
+    "tense": "tenses",
+    "voice": "voices",
+    "mood": "moods",
+    "case": "cases",
+    "number": "numbers",
+    "gender": "genders",
+    "person": "persons",
+}
+
+# (lemma, POS code, parse code, normalised form)
+TokenKey = Tuple[str, str, str, str]
+
+
+def thayer_entry(element: ET.Element) -> dict:
+    """Enhanced-lexicon entry (without morphology) for one Strong's ``<entry>``."""
+    number = int(element.get("strongs", "0"))
+    greek = element.find("greek")
+    pronunciation = element.find("pronunciation")
+
+    kjv_def = inline_text(element.find("kjv_def"))
+    if kjv_def.startswith(":--"):
+        kjv_def = kjv_def[3:]
+
+    return {
+        "strongs": f"G{number}",
+        "strongs_num": number,
+        "lemma": unicodedata.normalize("NFC", greek.get("unicode", "")) if greek is not None else "",
+        "transliteration": greek.get("translit", "") if greek is not None else "",
+        "pronunciation": pronunciation.get("strongs", "") if pronunciation is not None else "",
+        "definition_strongs": unicodedata.normalize("NFC", inline_text(element.find("strongs_def"))),
+        "definition_kjv": kjv_def.rstrip("."),
+        "derivation": unicodedata.normalize("NFC", inline_text(element.find("strongs_derivation"))).rstrip(";"),
+        "cross_refs": list(dict.fromkeys(reference_id(see) for see in element.iter("see"))),
+    }
+
+
+def count_book(file_path: str) -> Counter:
+    """Occurrences of every (lemma, POS, parse, form) in one morphgnt file."""
+    return Counter(
+        (unicodedata.normalize("NFC", token.lemma), token.pos, token.parse, token.norm)
+        for token in iter_morphgnt_tokens(file_path)
+    )
+
+
+def count_sblgnt(gnt_path: str, workers: Optional[int] = None,
+                 book_codes: Optional[Dict[int, str]] = None) -> Counter:
+    """
+    Token counts of every morphgnt file in ``gnt_path``, counted one book per
+    worker process and merged in book order.
+    """
+    files = list(sblgnt_book_files(gnt_path, book_codes).values())
+    counts = Counter()
+    if workers == 1 or len(files) < 2:
+        for book in map(count_book, files):
+            counts.update(book)
+        return counts
+
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        for book in pool.map(count_book, files):
+            counts.update(book)
+    return counts
+
+
+def lemma_resolver(entries: Iterable[dict]):
+    """
+    Map an SBLGNT lemma to a Strong's ID: the first entry with the same
+    lemma, otherwise the first with the same unaccented lemma.
+    """
+    exact: Dict[str, str] = {}
+    unaccented: Dict[str, str] = {}
+    for entry in entries:
+        if entry["lemma"]:
+            exact.setdefault(entry["lemma"], entry["strongs"])
+            unaccented.setdefault(normalize_word(entry["lemma"]), entry["strongs"])
+
+    def resolve(lemma: str) -> Optional[str]:
+        return exact.get(lemma) or unaccented.get(normalize_word(lemma))
+
+    return resolve
+
+
+def morphology_stats(counts: Iterable[Tuple[TokenKey, int]]) -> Tuple[str, dict]:
+    """
+    Part of speech and morphology of one entry from its token counts:
+    total, one distribution per feature (most frequent first) and the
+    ``SAMPLE_FORMS`` most frequent (form, POS, parse) triples.
+    """
+    total = 0
+    pos_counts = Counter()
+    parse_counts = Counter()
+    forms = Counter()
+    for (_lemma, pos, parse, form), count in counts:
+        total += count
+        pos_counts[pos] += count
+        parse_counts[parse] += count
+        forms[form, pos, parse] += count
+
+    features = {field: Counter() for field in FEATURE_KEYS}
+    for parse, count in parse_counts.items():
+        for (field, labels), letter in zip(PARSE_SLOTS, parse):
+            label = labels.get(letter)
+            if label and field in features:
+                features[field][label] += count
+
+    morphology = {"total_occurrences": total}
+    for field, key in FEATURE_KEYS.items():
+        if features[field]:
+            morphology[key] = dict(features[field].most_common())
+    morphology["sample_forms"] = [
+        {"form": form, "pos": pos, "parse": parse, "count": count}
+        for (form, pos, parse), count in forms.most_common(SAMPLE_FORMS)
+    ]
+
+    top_pos = pos_counts.most_common(1)[0][0]
+    return POS_LABELS.get(top_pos, top_pos), morphology
+
+
+def build_enhanced_lexicon(thayers_xml: str, sblgnt_path: str, workers: Optional[int] = None,
+                           book_codes: Optional[Dict[int, str]] = CODE_TO_BOOK) -> Dict[str, dict]:
+    """
+    Build the enhanced lexicon.
+
+    Args:
+        thayers_xml: Strong's/Thayer dictionary XML (e.g. strongsgreek.xml)
+        sblgnt_path: Directory containing the SBLGNT morphgnt files
+        workers: Processes counting books (default: one per CPU; 1 counts in-process)
+        book_codes: Books to include (default: the whole NT)
+
+    Returns:
+        Dict of Strong's ID ("G25") -> entry, in Strong's number order.
+        Entries whose lemma occurs in the SBLGNT have ``part_of_speech`` and
+        ``morphology``.
+    """
+    start = time.perf_counter()
+    print(f"Reading lexicon: {thayers_xml}")
+    lexicon = {entry["strongs"]: entry for entry in iter_strongs_entries(thayers_xml, thayer_entry)}
+
+    print(f"Counting morphology: {sblgnt_path}")
+    counts = count_sblgnt(sblgnt_path, workers, book_codes)
+
+    resolve = lemma_resolver(lexicon.values())
+    by_strongs: Dict[str, List[Tuple[TokenKey, int]]] = defaultdict(list)
+    unmatched = set()
+    for key, count in counts.items():
+        strongs = resolve(key[0])
+        if strongs is None:
+            unmatched.add(key[0])
+        else:
+            by_strongs[strongs].append((key, count))
+
+    for strongs, entry_counts in by_strongs.items():
+        part_of_speech, morphology = morphology_stats(entry_counts)
+        lexicon[strongs]["part_of_speech"] = part_of_speech
+        lexicon[strongs]["morphology"] = morphology
+
+    print(f"  -> {len(lexicon)} entries, {len(by_strongs)} with SBLGNT morphology "
+          f"({len(unmatched)} SBLGNT lemmas not in the lexicon) in {time.perf_counter() - start:.1f}s")
+    return lexicon
+
+
+if __name__ == "__main__":
+    import json
+    import sys
+
+    xml_path = sys.argv[1] if len(sys.argv) > 1 else "strongsgreek.xml"
+    gnt_path = sys.argv[2] if len(sys.argv) > 2 else "sblgnt"
+    if not os.path.exists(xml_path):
+        sys.exit(f"Lexicon not found: {xml_path}")
+    result = build_enhanced_lexicon(xml_path, gnt_path)
+    print(json.dumps(result.get("G3056"), ensure_ascii=False, indent=2))
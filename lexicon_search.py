@@ -0,0 +1,211 @@
+#!/usr/bin/env python3
+"""
+Lexicon Search - BM25 Inverted Index over Lexicon Entries
+=========================================================
+Full-text search over the enhanced lexicon (lemma, transliteration,
+Strong's and KJV definitions, derivation) without scanning the entries.
+
+Every field is tokenised the same way: accents and case are folded (see
+greek_text.fold_greek), final sigma is written σ and the text is split
+into words, so ``agape``, ``ἀγαπη`` and ``ἀγάπη`` all match. For each term
+the index keeps the entries containing it and, per entry, the term's
+precomputed field-weighted BM25 score (the BM25 term score of each field,
+with the term's idf, weighted by FIELD_WEIGHTS and summed). A query adds
+up the postings of its terms and keeps the best ``limit`` entries. A query
+term that is not a word of the lexicon matches the words it is a prefix
+of, so partial words still find entries.
+
+A query that is a Strong's number (``G25``, ``25``) returns that entry
+first.
+
+Postings are kept as flat columns (see SearchPostings), so the compiled
+lexicon store can hold them next to its other indexes: every process then
+maps one copy instead of tokenising every entry (see
+``LexiconStore.search_index``).
+
+Usage:
+    from lexicon_search import LexiconSearchIndex
+
+    index = LexiconSearchIndex(lexicon.items())
+    index.search("love feast", limit=10)  # [("G26", 7.3), ...]
+"""
+
+import math
+import re
+from bisect import bisect_left
+from collections import Counter
+from typing import Callable, Dict, Iterable, List, NamedTuple, Optional, Sequence, Tuple
+
+import numpy as np
+
+from greek_text import fold_greek
+
+# Weight of each searched field (lemma and transliteration matches rank first)
+FIELD_WEIGHTS = {
+    "lemma": 5.0,
+    "transliteration": 4.0,
+    "definition_strongs": 2.0,
+    "definition_kjv": 1.5,
+    "derivation": 0.5,
+}
+
+# BM25 term-frequency saturation and length normalisation
+K1 = 1.2
+B = 0.75
+
+# Score added to the entry a Strong's number query names
+STRONGS_MATCH_SCORE = 100.0
+
+# Vocabulary words a non-word query term may expand to
+MAX_PREFIX_EXPANSIONS = 50
+
+_WORD_RE = re.compile(r"\w+")
+_STRONGS_RE = re.compile(r"^\s*[gG]?0*(\d+)\s*$")
+
+
+def tokenize(text: str) -> List[str]:
+    """Accent- and case-folded words of ``text``."""
+    return [word.replace("ς", "σ") for word in _WORD_RE.findall(fold_greek(text))]
+
+
+class SearchPostings(NamedTuple):
+    """Postings of every term, flattened: term i owns ``numbers``/``scores[starts[i]:starts[i + 1]]``."""
+    terms: Sequence[str]  # sorted
+    starts: Sequence[int]  # len(terms) + 1
+    numbers: Sequence[int]  # uint32 entry numbers, ascending per term
+    scores: Sequence[float]  # float32 field-weighted BM25 term scores (idf included)
+
+
+def build_postings(entries: Iterable[Tuple[str, dict]], field_weights: Dict[str, float] = FIELD_WEIGHTS,
+                   k1: float = K1, b: float = B) -> Tuple[List[str], SearchPostings]:
+    """
+    Tokenise (Strong's ID, entry) pairs and score every term.
+
+    Returns:
+        Tuple of (Strong's IDs in entry order, postings)
+    """
+    keys: List[str] = []
+    field_counts: List[Dict[str, Counter]] = []
+    lengths: Dict[str, List[int]] = {field: [] for field in field_weights}
+    for strongs, entry in entries:
+        keys.append(strongs)
+        counts = {}
+        for field in field_weights:
+            tokens = tokenize(entry.get(field) or "")
+            counts[field] = Counter(tokens)
+            lengths[field].append(len(tokens))
+        field_counts.append(counts)
+
+    n_docs = len(keys)
+    average = {field: (sum(values) / n_docs if n_docs else 0.0) for field, values in lengths.items()}
+
+    # term -> {entry number: weighted BM25 term frequency part}
+    impacts: Dict[str, Dict[int, float]] = {}
+    for number, counts in enumerate(field_counts):
+        for field, weight in field_weights.items():
+            if not counts[field]:
+                continue
+            norm = k1 * (1 - b + b * lengths[field][number] / average[field])
+            for term, tf in counts[field].items():
+                doc_impacts = impacts.setdefault(term, {})
+                doc_impacts[number] = doc_impacts.get(number, 0.0) + weight * tf * (k1 + 1) / (tf + norm)
+
+    terms = sorted(impacts)
+    starts = np.zeros(len(terms) + 1, dtype=np.uint32)
+    numbers = []
+    scores = []
+    for i, term in enumerate(terms):
+        doc_impacts = impacts[term]
+        df = len(doc_impacts)
+        idf = math.log(1 + (n_docs - df + 0.5) / (df + 0.5))
+        numbers.append(np.fromiter(doc_impacts.keys(), dtype=np.uint32, count=df))
+        scores.append(np.fromiter(doc_impacts.values(), dtype=np.float32, count=df) * np.float32(idf))
+        starts[i + 1] = starts[i] + df
+
+    return keys, SearchPostings(
+        terms,
+        starts,
+        np.concatenate(numbers) if numbers else np.zeros(0, dtype=np.uint32),
+        np.concatenate(scores) if scores else np.zeros(0, dtype=np.float32),
+    )
+
+
+class LexiconSearchIndex:
+    """
+    Inverted index of lexicon entries scored with field-weighted BM25.
+
+    Built once from (Strong's ID, entry) pairs, or wrapped around postings
+    read from a compiled store (``from_postings``); entries are not kept.
+    """
+
+    def __init__(self, entries: Iterable[Tuple[str, dict]], field_weights: Dict[str, float] = FIELD_WEIGHTS,
+                 k1: float = K1, b: float = B):
+        keys, postings = build_postings(entries, field_weights, k1, b)
+        numbers = {strongs: number for number, strongs in enumerate(keys)}
+        self._init(keys, numbers.get, postings)
+
+    @classmethod
+    def from_postings(cls, keys: Sequence[str], number_of: Callable[[str], Optional[int]],
+                      postings: SearchPostings) -> "LexiconSearchIndex":
+        """
+        Wrap prebuilt postings.
+
+        Args:
+            keys: Strong's ID of each entry number
+            number_of: Entry number of a Strong's ID, or None
+            postings: Postings as returned by ``build_postings``
+        """
+        index = cls.__new__(cls)
+        index._init(keys, number_of, postings)
+        return index
+
+    def _init(self, keys: Sequence[str], number_of: Callable[[str], Optional[int]], postings: SearchPostings):
+        self.keys = keys
+        self._number_of = number_of
+        self._postings = postings
+
+    def __len__(self) -> int:
+        return len(self.keys)
+
+    def _term_postings(self, term: str) -> List[Tuple[np.ndarray, np.ndarray]]:
+        """Postings of a query term: its own, or those of the words it prefixes."""
+        terms, starts, numbers, scores = self._postings
+        first = bisect_left(terms, term)
+        found = []
+        for i in range(first, min(first + MAX_PREFIX_EXPANSIONS, len(terms))):
+            word = terms[i]
+            if not word.startswith(term):
+                break
+            found.append(i)
+            if word == term:
+                break
+        # Columns may be memoryviews of a mapped store: view each slice as an array
+        return [
+            (np.asarray(numbers[starts[i]:starts[i + 1]]), np.asarray(scores[starts[i]:starts[i + 1]]))
+            for i in found
+        ]
+
+    def _strongs_match(self, query: str) -> Optional[int]:
+        match = _STRONGS_RE.match(query)
+        return self._number_of(f"G{match.group(1)}") if match else None
+
+    def search(self, query: str, limit: int = 20) -> List[Tuple[str, float]]:
+        """
+        Best entries for ``query``, as (Strong's ID, score) sorted by score
+        (ties in lexicon order).
+        """
+        scores = np.zeros(len(self.keys), dtype=np.float32)
+        for term in dict.fromkeys(tokenize(query)):
+            term_scores = np.zeros_like(scores)
+            for numbers, impacts in self._term_postings(term):
+                # A prefix counts once per entry: its best-scoring expansion
+                np.maximum.at(term_scores, numbers, impacts)
+            scores += term_scores
+
+        strongs_number = self._strongs_match(query)
+        if strongs_number is not None:
+            scores[strongs_number] += STRONGS_MATCH_SCORE
+
+        hits = np.flatnonzero(scores > 0)
+        hits = hits[np.lexsort((hits, -scores[hits]))][:limit]
+        return [(self.keys[number], float(scores[number])) for number in hits.tolist()]
@@ -0,0 +1,467 @@
+#!/usr/bin/env python3
+"""
+Lexicon Store - Memory-Mapped Compiled Enhanced Lexicon
+=======================================================
+Compiles ``enhanced_lexicon.json`` into one binary file with its lookup
+indexes prebuilt, and reads it back through ``mmap``. ``ThayersLexicon``,
+``EnhancedLexiconHelper`` and the backend's ``LexiconService`` all open
+the same file: opening it costs a header read, entries are decoded from
+their JSON blob only when accessed, and every process (and uvicorn
+worker) shares the file's pages through the OS page cache instead of
+holding its own parsed copy of the lexicon and its indexes.
+
+File layout (all integers little-endian, sections 8-byte aligned):
+
+    header        MAGIC, version, counts, source JSON fingerprint and
+                  section offsets (HEADER)
+    entry keys    n_entries uint32 string ids of the Strong's IDs, in file order
+    entry offs    n_entries + 1 uint32 byte offsets into the entry blob
+    entry blob    compact UTF-8 JSON of each entry
+    string offs   n_strings + 1 uint32 byte offsets into the string blob
+    string blob   UTF-8 keys of the entries and indexes, deduplicated
+    indexes       one hash index per INDEXES name:
+                  n_keys uint32 (+ 4 padding bytes),
+                  n_keys uint64 key hashes, sorted,
+                  n_keys uint32 string ids of the keys,
+                  n_keys + 1 uint32 starts into the postings,
+                  uint32 entry numbers (postings), in file order per key
+    search        BM25 postings of the full-text search (lexicon_search.py):
+                  n_terms uint32 (+ 4 padding bytes),
+                  n_terms uint32 string ids of the terms, sorted by term,
+                  n_terms + 1 uint32 starts into the postings,
+                  uint32 entry numbers, then float32 scores (postings)
+
+A lookup hashes the key, bisects the hash column and checks the stored
+key of each matching slot, so hash collisions cannot return wrong entries.
+
+Usage:
+    from lexicon_store import LexiconStore, build_lexicon_store
+
+    build_lexicon_store("enhanced_lexicon.json", "corpus_data/enhanced_lexicon.lex")
+
+    lexicon = LexiconStore.load("corpus_data/enhanced_lexicon.lex", "enhanced_lexicon.json")
+    lexicon["G25"]["lemma"]
+    lexicon.lookup("greek", fold_greek("αγαπαω"))
+    lexicon.search_index().search("love feast")
+"""
+
+import hashlib
+import json
+import mmap
+import os
+import struct
+import sys
+import unicodedata
+from array import array
+from bisect import bisect_left
+from collections.abc import Mapping, Sequence
+from typing import Callable, Dict, Iterator, List, Optional, Tuple, Union
+
+from corpus import u32_column
+from greek_text import fold_greek
+from lexicon_search import LexiconSearchIndex, SearchPostings, build_postings
+
+# --- FILE FORMAT ---
+
+# Default locations, relative to the project root
+LEXICON_JSON_PATH = "enhanced_lexicon.json"
+LEXICON_STORE_PATH = "corpus_data/enhanced_lexicon.lex"
+
+MAGIC = b"LEXS"
+VERSION = 2  # 2: search postings
+
+# magic, version, reserved, n_entries, n_strings, source JSON SHA-1, size
+# and mtime (ns), then byte offsets of: entry keys, entry offsets, entry
+# blob, string offsets, string blob, one per index, and the search postings
+INDEXES = ("strongs", "lemma", "greek", "translit")
+HEADER = struct.Struct(f"<4sHHII20sQQ{6 + len(INDEXES)}Q")
+
+INDEX_HEADER = struct.Struct("<I4x")
+
+# (sha1 hex, size, mtime_ns) of the JSON a store was compiled from
+SourceInfo = Tuple[str, int, int]
+
+
+# Key of an entry in each index ("" = not indexed)
+INDEX_KEYS: Dict[str, Callable[[str, dict], str]] = {
+    "strongs": lambda strongs, entry: strongs,
+    "lemma": lambda strongs, entry: unicodedata.normalize('NFC', entry.get('lemma', '')),
+    "greek": lambda strongs, entry: fold_greek(entry.get('lemma', '')),
+    "translit": lambda strongs, entry: entry.get('transliteration', '').lower().strip(),
+}
+
+
+def key_hash(key: str) -> int:
+    """Stable 64-bit hash of an index key (the same in every process)."""
+    return int.from_bytes(hashlib.blake2b(key.encode('utf-8'), digest_size=8).digest(), 'little')
+
+
+def source_info(json_path: str, raw: Optional[bytes] = None) -> SourceInfo:
+    """Fingerprint of a lexicon JSON file: SHA-1 of its bytes, size and mtime."""
+    if raw is None:
+        with open(json_path, 'rb') as f:
+            raw = f.read()
+    stat = os.stat(json_path)
+    return hashlib.sha1(raw).hexdigest(), stat.st_size, stat.st_mtime_ns
+
+
+# --- BUILDER ---
+
+def _le(column: array) -> bytes:
+    """Little-endian bytes of an array column."""
+    if sys.byteorder != "little":
+        column = array(column.typecode, column)
+        column.byteswap()
+    return column.tobytes()
+
+
+def _align(data: bytearray):
+    data.extend(b"\0" * (-len(data) % 8))
+
+
+def build_lexicon_store_bytes(lexicon: Dict[str, dict], source: SourceInfo = ("0" * 40, 0, 0)) -> bytes:
+    """
+    Compile a lexicon (Strong's ID -> entry, as in enhanced_lexicon.json)
+    into the bytes of a store file.
+    """
+    strings: Dict[str, int] = {}
+
+    def intern(value: str) -> int:
+        if value not in strings:
+            strings[value] = len(strings)
+        return strings[value]
+
+    entry_keys = array('I')
+    entry_offsets = array('I', [0])
+    entry_blob = bytearray()
+    postings: Dict[str, Dict[str, List[int]]] = {name: {} for name in INDEXES}
+    for number, (strongs, entry) in enumerate(lexicon.items()):
+        entry_keys.append(intern(strongs))
+        entry_blob += json.dumps(entry, ensure_ascii=False, separators=(',', ':')).encode('utf-8')
+        entry_offsets.append(len(entry_blob))
+        for name in INDEXES:
+            key = INDEX_KEYS[name](strongs, entry)
+            if key:
+                postings[name].setdefault(key, []).append(number)
+
+    index_sections = []
+    for name in INDEXES:
+        keys = sorted(postings[name], key=key_hash)
+        section = bytearray(INDEX_HEADER.pack(len(keys)))
+        section += _le(array('Q', [key_hash(key) for key in keys]))
+        section += _le(array('I', [intern(key) for key in keys]))
+        starts = array('I', [0])
+        entries = array('I')
+        for key in keys:
+            entries.extend(postings[name][key])
+            starts.append(len(entries))
+        section += _le(starts) + _le(entries)
+        index_sections.append(section)
+
+    _keys, postings = build_postings(lexicon.items())
+    search_section = bytearray(INDEX_HEADER.pack(len(postings.terms)))
+    search_section += _le(array('I', [intern(term) for term in postings.terms]))
+    search_section += postings.starts.astype('<u4').tobytes()
+    search_section += postings.numbers.astype('<u4').tobytes()
+    search_section += postings.scores.astype('<f4').tobytes()
+
+    string_offsets = array('I', [0])
+    string_blob = bytearray()
+    for value in strings:
+        string_blob += value.encode('utf-8')
+        string_offsets.append(len(string_blob))
+
+    data = bytearray(HEADER.size)
+    offsets = []
+    for section in (_le(entry_keys), _le(entry_offsets), entry_blob,
+                    _le(string_offsets), string_blob, *index_sections, search_section):
+        _align(data)
+        offsets.append(len(data))
+        data += section
+
+    sha1, size, mtime_ns = source
+    HEADER.pack_into(data, 0, MAGIC, VERSION, 0, len(lexicon), len(strings),
+                     bytes.fromhex(sha1), size, mtime_ns, *offsets)
+    return bytes(data)
+
+
+def build_lexicon_store(json_path: str, output_path: str) -> int:
+    """
+    Compile ``enhanced_lexicon.json`` into a store file.
+
+    The file is written next to ``output_path`` and moved into place
+    atomically, so processes that already have the old store mapped keep a
+    valid view.
+
+    Returns:
+        Number of entries
+    """
+    with open(json_path, 'rb') as f:
+        raw = f.read()
+    lexicon = json.loads(raw)
+    data = build_lexicon_store_bytes(lexicon, source_info(json_path, raw))
+
+    output_dir = os.path.dirname(output_path)
+    if output_dir:
+        os.makedirs(output_dir, exist_ok=True)
+
+    tmp_path = f"{output_path}.{os.getpid()}.tmp"
+    with open(tmp_path, 'wb') as f:
+        f.write(data)
+    os.replace(tmp_path, output_path)
+    return len(lexicon)
+
+
+# --- READER ---
+
+def _u64_column(view: memoryview, offset: int, count: int):
+    """View ``count`` little-endian uint64 values (see corpus.u32_column)."""
+    raw = view[offset:offset + count * 8]
+    if sys.byteorder == "little":
+        return raw.cast('Q')
+    column = array('Q', raw.tobytes())
+    column.byteswap()
+    return column
+
+
+def _f32_column(view: memoryview, offset: int, count: int):
+    """View ``count`` little-endian float32 values (see corpus.u32_column)."""
+    raw = view[offset:offset + count * 4]
+    if sys.byteorder == "little":
+        return raw.cast('f')
+    column = array('f', raw.tobytes())
+    column.byteswap()
+    return column
+
+
+class _LazyColumn(Sequence):
+    """Sequence decoding item ``i`` with ``decode(i)`` on access."""
+
+    def __init__(self, decode: Callable[[int], str], length: int):
+        self._decode = decode
+        self._length = length
+
+    def __len__(self) -> int:
+        return self._length
+
+    def __getitem__(self, i: int) -> str:
+        if not 0 <= i < self._length:
+            raise IndexError(i)
+        return self._decode(i)
+
+
+class LexiconStore(Mapping):
+    """
+    Read-only mapping of Strong's ID -> entry dict over a compiled store,
+    memory-mapped from a file or wrapping an in-memory buffer.
+
+    Iterates in the order of the source JSON. Every access decodes a new
+    dict, so callers may modify what they get back.
+    """
+
+    def __init__(self, source: Union[str, bytes]):
+        """
+        Map a store file built by ``build_lexicon_store``, or wrap the bytes
+        returned by ``build_lexicon_store_bytes``.
+
+        Raises:
+            ValueError: If the data is not a lexicon store of a supported version
+        """
+        if isinstance(source, str):
+            self.path = path = source
+            with open(path, 'rb') as f:
+                self._buffer = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        else:
+            self.path = path = "<memory>"
+            self._buffer = source
+        self._view = memoryview(self._buffer)
+
+        if len(self._buffer) < HEADER.size:
+            self.close()
+            raise ValueError(f"Not a lexicon store: {path}")
+
+        (magic, version, _reserved, self.n_entries, n_strings,
+         sha1, self.source_size, self.source_mtime_ns,
+         entry_keys_offset, entry_offsets_offset, self._entry_blob_offset,
+         string_offsets_offset, self._string_blob_offset,
+         *index_offsets, search_offset) = HEADER.unpack_from(self._buffer, 0)
+
+        if magic != MAGIC or version != VERSION:
+            self.close()
+            raise ValueError(f"Unsupported lexicon store (magic={magic!r}, version={version}): {path}")
+
+        self.source_sha1 = sha1.hex()
+        self._entry_keys = u32_column(self._view, entry_keys_offset, self.n_entries)
+        self._entry_offsets = u32_column(self._view, entry_offsets_offset, self.n_entries + 1)
+        self._string_offsets = u32_column(self._view, string_offsets_offset, n_strings + 1)
+
+        self._indexes = {}
+        for name, offset in zip(INDEXES, index_offsets):
+            (n_keys,) = INDEX_HEADER.unpack_from(self._buffer, offset)
+            hashes_offset = offset + INDEX_HEADER.size
+            key_ids_offset = hashes_offset + n_keys * 8
+            starts_offset = key_ids_offset + n_keys * 4
+            postings_offset = starts_offset + (n_keys + 1) * 4
+            starts = u32_column(self._view, starts_offset, n_keys + 1)
+            self._indexes[name] = (
+                _u64_column(self._view, hashes_offset, n_keys),
+                u32_column(self._view, key_ids_offset, n_keys),
+                starts,
+                u32_column(self._view, postings_offset, starts[n_keys]),
+            )
+
+        (n_terms,) = INDEX_HEADER.unpack_from(self._buffer, search_offset)
+        term_ids_offset = search_offset + INDEX_HEADER.size
+        starts_offset = term_ids_offset + n_terms * 4
+        numbers_offset = starts_offset + (n_terms + 1) * 4
+        starts = u32_column(self._view, starts_offset, n_terms + 1)
+        n_postings = starts[n_terms]
+        self._search_columns = (
+            u32_column(self._view, term_ids_offset, n_terms),
+            starts,
+            u32_column(self._view, numbers_offset, n_postings),
+            _f32_column(self._view, numbers_offset + n_postings * 4, n_postings),
+        )
+
+    @classmethod
+    def from_json(cls, json_path: str) -> "LexiconStore":
+        """Compile ``enhanced_lexicon.json`` in memory."""
+        with open(json_path, 'rb') as f:
+            raw = f.read()
+        return cls(build_lexicon_store_bytes(json.loads(raw), source_info(json_path, raw)))
+
+    @classmethod
+    def load(cls, store_path: Optional[str], json_path: str) -> "LexiconStore":
+        """
+        Map the compiled store if it exists and was compiled from the
+        current ``json_path``, otherwise compile the JSON in memory.
+
+        Either way the result is identical, so callers never need to care
+        whether the store has been built. A store from an older format
+        version, or from a different JSON file, is ignored the same way.
+
+        Raises:
+            FileNotFoundError: If neither the store nor the JSON exists
+        """
+        if store_path and os.path.exists(store_path):
+            try:
+                store = cls(store_path)
+            except ValueError as e:
+                print(f"[!] {e} - compiling {json_path} in memory (run build_corpus.py to update it)")
+            else:
+                if not os.path.exists(json_path) or store.matches(json_path):
+                    return store
+                print(f"[!] {store_path} is out of date - compiling {json_path} in memory "
+                      f"(run build_corpus.py to update it)")
+                store.close()
+        return cls.from_json(json_path)
+
+    def matches(self, json_path: str) -> bool:
+        """Whether this store was compiled from the current contents of ``json_path``."""
+        stat = os.stat(json_path)
+        if stat.st_size != self.source_size:
+            return False
+        if stat.st_mtime_ns == self.source_mtime_ns:
+            return True
+        # Same size, touched or copied since: compare contents
+        return source_info(json_path)[0] == self.source_sha1
+
+    def close(self):
+        """Release the memory mapping."""
+        columns = [getattr(self, name, None) for name in ("_entry_keys", "_entry_offsets", "_string_offsets")]
+        for index in getattr(self, "_indexes", {}).values():
+            columns.extend(index)
+        columns.extend(getattr(self, "_search_columns", ()))
+        for column in columns:
+            if isinstance(column, memoryview):
+                column.release()
+        self._view.release()
+        if isinstance(self._buffer, mmap.mmap):
+            self._buffer.close()
+
+    def __enter__(self) -> "LexiconStore":
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    # --- Entries ---
+
+    def _string(self, string_id: int) -> str:
+        start = self._string_blob_offset + self._string_offsets[string_id]
+        end = self._string_blob_offset + self._string_offsets[string_id + 1]
+        return str(self._view[start:end], 'utf-8')
+
+    def key_at(self, number: int) -> str:
+        """Strong's ID of the entry at position ``number``."""
+        return self._string(self._entry_keys[number])
+
+    def entry_at(self, number: int) -> dict:
+        """Decode the entry at position ``number``."""
+        start = self._entry_blob_offset + self._entry_offsets[number]
+        end = self._entry_blob_offset + self._entry_offsets[number + 1]
+        return json.loads(str(self._view[start:end], 'utf-8'))
+
+    def __len__(self) -> int:
+        return self.n_entries
+
+    def __iter__(self) -> Iterator[str]:
+        return (self.key_at(number) for number in range(self.n_entries))
+
+    def __getitem__(self, strongs: str) -> dict:
+        numbers = self.lookup_numbers("strongs", strongs) if isinstance(strongs, str) else []
+        if not numbers:
+            raise KeyError(strongs)
+        return self.entry_at(numbers[0])
+
+    def __contains__(self, strongs) -> bool:
+        return isinstance(strongs, str) and bool(self.lookup_numbers("strongs", strongs))
+
+    def values(self) -> Iterator[dict]:
+        return (self.entry_at(number) for number in range(self.n_entries))
+
+    def items(self) -> Iterator[Tuple[str, dict]]:
+        return ((self.key_at(number), self.entry_at(number)) for number in range(self.n_entries))
+
+    # --- Indexes ---
+
+    def lookup_numbers(self, index: str, key: str) -> List[int]:
+        """
+        Positions of the entries whose ``index`` key (see INDEX_KEYS) is
+        ``key``, in file order.
+        """
+        hashes, key_ids, starts, postings = self._indexes[index]
+        target = key_hash(key)
+        slot = bisect_left(hashes, target)
+        while slot < len(hashes) and hashes[slot] == target:
+            if self._string(key_ids[slot]) == key:
+                return list(postings[starts[slot]:starts[slot + 1]])
+            slot += 1
+        return []
+
+    def lookup(self, index: str, key: str) -> List[dict]:
+        """Entries whose ``index`` key is ``key`` (e.g. ``lookup("greek", fold_greek(word))``)."""
+        return [self.entry_at(number) for number in self.lookup_numbers(index, key)]
+
+    def lookup_keys(self, index: str, key: str) -> List[str]:
+        """Strong's IDs of the entries whose ``index`` key is ``key``."""
+        return [self.key_at(number) for number in self.lookup_numbers(index, key)]
+
+    def search_index(self) -> LexiconSearchIndex:
+        """
+        BM25 full-text index over the stored postings (see lexicon_search.py).
+
+        Nothing is tokenised or copied: terms, postings and keys are read
+        from the store on each query.
+        """
+        term_ids, starts, numbers, scores = self._search_columns
+
+        def number_of(strongs: str) -> Optional[int]:
+            numbers_found = self.lookup_numbers("strongs", strongs)
+            return numbers_found[0] if numbers_found else None
+
+        return LexiconSearchIndex.from_postings(
+            _LazyColumn(self.key_at, self.n_entries),
+            number_of,
+            SearchPostings(_LazyColumn(lambda i: self._string(term_ids[i]), len(term_ids)), starts, numbers, scores),
+        )
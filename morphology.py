@@ -0,0 +1,330 @@
+#!/usr/bin/env python3
+"""
+Morphology - Columnar Token Arrays
+==================================
+NumPy views over the token records of a compiled corpus (see corpus.py).
+
+The token section of the corpus is already a packed array of fixed-width
+records, so ``numpy.frombuffer`` reads it in place with a structured dtype.
+The key, lemma and parse columns are then copied once into contiguous arrays:
+
+    keys        uint32 packed verse key per token (sorted)
+    lemma_ids   uint32 corpus string id of each token's lemma
+    form_ids    uint32 string id of the surface form (with punctuation)
+    norm_ids    uint32 string id of the normalised form
+    pos_ids     uint8 index into ``pos_codes``
+    parse       (n, 8) uint8 parse code bytes
+
+Slicing a verse, a range or a whole chapter is one ``searchsorted`` on the
+key column, and decoding its parse codes is one table lookup per parse slot
+for the whole slice. An inverted index (``lemma_postings``) lists the sorted
+token positions of every lemma for concordance lookups. MorphIndex adds packed bitmap indexes per feature value
+for morphological queries over the whole corpus.
+
+Usage:
+    from morphology import MorphologyColumns
+
+    columns = MorphologyColumns(corpus)
+    start, stop = columns.token_range(pack_key(64, 3, 1), pack_key(64, 3, 99))
+    words = columns.decode(start, stop)
+
+    index = MorphIndex(columns)
+    hits = index.query({"tense": ["aorist"], "voice": ["passive"], "mood": ["participle"]})
+"""
+
+from typing import Callable, Dict, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+from corpus import Corpus, TOKEN_RECORD
+from verse_store import BOOK_STRIDE
+
+# Same layout as corpus.TOKEN_RECORD
+TOKEN_DTYPE = np.dtype({
+    "names": ["key", "lemma_id", "form_id", "norm_id", "pos", "parse"],
+    "formats": ["<u4", "<u4", "<u4", "<u4", "S2", "S8"],
+    "offsets": [0, 4, 8, 12, 16, 18],
+    "itemsize": TOKEN_RECORD.size,
+})
+
+POS_LABELS = {
+    "A-": "Adjective",
+    "C-": "Conjunction",
+    "D-": "Adverb",
+    "I-": "Interjection",
+    "N-": "Noun",
+    "P-": "Preposition",
+    "RA": "Definite Article",
+    "RD": "Demonstrative Pronoun",
+    "RI": "Interrogative/Indefinite Pronoun",
+    "RP": "Personal Pronoun",
+    "RR": "Relative Pronoun",
+    "V-": "Verb",
+    "X-": "Particle",
+}
+
+# One (field, {code letter: label}) per position of the 8-character parse code
+PARSE_SLOTS: Tuple[Tuple[str, Dict[str, str]], ...] = (
+    ("person", {"1": "1st", "2": "2nd", "3": "3rd"}),
+    ("tense", {"P": "Present", "I": "Imperfect", "F": "Future", "A": "Aorist", "X": "Perfect", "Y": "Pluperfect"}),
+    ("voice", {"A": "Active", "M": "Middle", "P": "Passive"}),
+    ("mood", {"I": "Indicative", "D": "Imperative", "S": "Subjunctive", "O": "Optative",
+              "N": "Infinitive", "P": "Participle"}),
+    ("case", {"N": "Nominative", "G": "Genitive", "D": "Dative", "A": "Accusative", "V": "Vocative"}),
+    ("number", {"S": "Singular", "P": "Plural"}),
+    ("gender", {"M": "Masculine", "F": "Feminine", "N": "Neuter"}),
+    ("degree", {"C": "Comparative", "S": "Superlative"}),
+)
+
+PARSE_FIELDS = tuple(field for field, _labels in PARSE_SLOTS)
+
+
+def _byte_table(labels: Dict[str, str]) -> np.ndarray:
+    """256-entry object array mapping a code byte to its label (None if unset)."""
+    table = np.full(256, None, dtype=object)
+    for code, label in labels.items():
+        table[ord(code)] = label
+    return table
+
+
+_SLOT_TABLES = tuple(_byte_table(labels) for _field, labels in PARSE_SLOTS)
+
+
+class MorphologyColumns:
+    """
+    Columnar morphology of every token in a corpus.
+
+    Built once per corpus; all per-request work is array slicing and
+    vectorised table lookups.
+    """
+
+    def __init__(self, corpus: Corpus):
+        self.corpus = corpus
+        self.n_tokens = corpus.n_tokens
+
+        records = np.frombuffer(
+            corpus.buffer, dtype=TOKEN_DTYPE, count=corpus.n_tokens, offset=corpus.tokens_offset
+        )
+        self.keys = np.ascontiguousarray(records["key"], dtype=np.uint32)
+        self.lemma_ids = np.ascontiguousarray(records["lemma_id"], dtype=np.uint32)
+        self.form_ids = np.ascontiguousarray(records["form_id"], dtype=np.uint32)
+        self.norm_ids = np.ascontiguousarray(records["norm_id"], dtype=np.uint32)
+        self.parse = np.ascontiguousarray(records["parse"]).view(np.uint8).reshape(-1, 8)
+
+        pos_codes, pos_ids = np.unique(records["pos"], return_inverse=True)
+        self.pos_codes = [code.decode("ascii") for code in pos_codes]
+        self.pos_ids = pos_ids.astype(np.uint8).reshape(-1)
+        self._pos_labels = np.array([POS_LABELS.get(code) for code in self.pos_codes], dtype=object)
+
+        # Inverted index: token positions grouped by lemma id, in corpus order
+        # within each lemma (lemma i owns lemma_postings[lemma_offsets[i]:lemma_offsets[i + 1]])
+        self.lemma_postings = np.argsort(self.lemma_ids, kind="stable")
+        self.lemma_offsets = np.zeros(corpus.n_strings + 1, dtype=np.int64)
+        np.cumsum(np.bincount(self.lemma_ids, minlength=corpus.n_strings), out=self.lemma_offsets[1:])
+
+        self._strongs: Optional[Tuple[str, np.ndarray]] = None
+
+    def __len__(self) -> int:
+        return self.n_tokens
+
+    def token_range(self, start_key: int, end_key: int) -> Tuple[int, int]:
+        """Token index range [start, stop) of every token with start_key <= key <= end_key."""
+        start = int(np.searchsorted(self.keys, start_key, side="left"))
+        stop = int(np.searchsorted(self.keys, end_key, side="right"))
+        return start, stop
+
+    def occurrences(self, lemma_ids: Sequence[int]) -> np.ndarray:
+        """Sorted token positions of every occurrence of the given lemmas."""
+        postings = [self.lemma_postings[self.lemma_offsets[i]:self.lemma_offsets[i + 1]] for i in lemma_ids]
+        if not postings:
+            return np.empty(0, dtype=np.int64)
+        if len(postings) == 1:
+            return postings[0]
+        return np.sort(np.concatenate(postings))
+
+    def context(self, indexes: np.ndarray, width: int) -> Tuple[List[str], List[str]]:
+        """
+        Keyword-in-context text around the tokens at ``indexes``.
+
+        Returns the ``width`` words before and after each token (surface
+        forms, joined with spaces), without crossing into another book.
+        """
+        if not len(indexes):
+            return [], []
+
+        books = self.keys[indexes] // BOOK_STRIDE
+        book_starts = np.searchsorted(self.keys, books * BOOK_STRIDE, side="left")
+        book_stops = np.searchsorted(self.keys, (books + 1) * BOOK_STRIDE, side="left")
+        starts = np.maximum(indexes - width, book_starts).tolist()
+        stops = np.minimum(indexes + width + 1, book_stops).tolist()
+
+        string = self.corpus.string
+        form_ids = self.form_ids
+        left, right = [], []
+        for index, start, stop in zip(indexes.tolist(), starts, stops):
+            left.append(" ".join(string(i) for i in form_ids[start:index].tolist()))
+            right.append(" ".join(string(i) for i in form_ids[index + 1:stop].tolist()))
+        return left, right
+
+    def strongs_table(self, version: str, resolve: Callable[[str], Optional[str]]) -> np.ndarray:
+        """
+        Strong's number per corpus string id, for every lemma in the corpus.
+
+        ``resolve`` maps a lemma to a Strong's number (or None) and is called
+        once per distinct lemma; the table is kept until ``version`` changes.
+        """
+        if self._strongs is None or self._strongs[0] != version:
+            table = np.full(self.corpus.n_strings, None, dtype=object)
+            for lemma_id in np.unique(self.lemma_ids).tolist():
+                table[lemma_id] = resolve(self.corpus.string(lemma_id))
+            self._strongs = (version, table)
+        return self._strongs[1]
+
+    def decode(self, start: int, stop: int, strongs: Optional[np.ndarray] = None) -> List[dict]:
+        """Decode the contiguous tokens ``start:stop`` (see ``decode_tokens``)."""
+        return self.decode_tokens(np.arange(start, stop), strongs)
+
+    def decode_tokens(self, indexes: np.ndarray, strongs: Optional[np.ndarray] = None) -> List[dict]:
+        """
+        Decode the tokens at ``indexes`` into word dicts.
+
+        Each dict has the key, 1-based position in its verse, surface word,
+        normalised form, lemma, Strong's number (from a ``strongs_table``),
+        POS code and label, raw parse code and one entry per PARSE_FIELDS
+        slot (None where not applicable).
+        """
+        string = self.corpus.string
+        keys = self.keys[indexes]
+        parse = self.parse[indexes]
+        pos_ids = self.pos_ids[indexes]
+        lemma_ids = self.lemma_ids[indexes]
+
+        columns = {
+            "key": keys.tolist(),
+            "position": (indexes - np.searchsorted(self.keys, keys, side="left") + 1).tolist(),
+            "word": [string(i) for i in self.form_ids[indexes].tolist()],
+            "normalized": [string(i) for i in self.norm_ids[indexes].tolist()],
+            "lemma": [string(i) for i in lemma_ids.tolist()],
+            "strongs": (strongs[lemma_ids] if strongs is not None else np.full(len(keys), None)).tolist(),
+            "pos": [self.pos_codes[i] for i in pos_ids.tolist()],
+            "part_of_speech": self._pos_labels[pos_ids].tolist(),
+            "parse_code": np.char.decode(parse.view("S8").reshape(-1), "ascii").tolist(),
+        }
+        for slot, (field, table) in enumerate(zip(PARSE_FIELDS, _SLOT_TABLES)):
+            columns[field] = table[parse[:, slot]].tolist()
+
+        names = list(columns)
+        return [dict(zip(names, values)) for values in zip(*columns.values())]
+
+
+# --- QUERY ENGINE ---
+
+# Query value -> code per feature: labels, codes and POS short forms, lowercased
+FEATURE_VALUES: Dict[str, Dict[str, str]] = {
+    "pos": {
+        alias.lower(): code
+        for code, label in POS_LABELS.items()
+        for alias in {code, code.rstrip("-"), label}
+    },
+    **{
+        field: {alias.lower(): code for code, label in labels.items() for alias in (code, label)}
+        for field, labels in PARSE_SLOTS
+    },
+}
+
+
+def resolve_feature(field: str, value: str) -> str:
+    """
+    Resolve a query value ('aorist', 'A', 'participle', 'V') to its code.
+
+    Raises:
+        ValueError: If the field or value is unknown
+    """
+    values = FEATURE_VALUES.get(field)
+    if values is None:
+        raise ValueError(f"Unknown morphology feature: '{field}'")
+    code = values.get(value.strip().lower())
+    if code is None:
+        raise ValueError(f"Unknown {field} value: '{value}'")
+    return code
+
+
+class MorphIndex:
+    """
+    Bitmap indexes over MorphologyColumns.
+
+    Every (feature, value) pair - POS and each parse slot - has one packed
+    bitmap of ``n_tokens`` bits (about 17 KB for the whole NT). Lemma and
+    book filters are turned into bitmaps on demand from the lemma column
+    and the sorted key column. A query ORs the bitmaps of the values given
+    for a feature and ANDs the features together, all as whole-array
+    operations; only the final bitmap is expanded into token positions.
+    """
+
+    def __init__(self, columns: MorphologyColumns):
+        self.columns = columns
+        self.n_tokens = columns.n_tokens
+
+        self.bitmaps: Dict[str, Dict[str, np.ndarray]] = {
+            "pos": {code: np.packbits(columns.pos_ids == i) for i, code in enumerate(columns.pos_codes)},
+        }
+        for slot, (field, labels) in enumerate(PARSE_SLOTS):
+            slot_column = columns.parse[:, slot]
+            self.bitmaps[field] = {code: np.packbits(slot_column == ord(code)) for code in labels}
+
+    def empty(self) -> np.ndarray:
+        """Bitmap matching no token."""
+        return np.zeros((self.n_tokens + 7) // 8, dtype=np.uint8)
+
+    def feature(self, field: str, values: Sequence[str]) -> np.ndarray:
+        """Bitmap of tokens whose ``field`` has any of ``values`` (labels or codes)."""
+        bitmap = self.empty()
+        for value in values:
+            code = resolve_feature(field, value)
+            # POS bitmaps exist only for codes that occur in the corpus
+            code_bitmap = self.bitmaps[field].get(code)
+            if code_bitmap is not None:
+                bitmap |= code_bitmap
+        return bitmap
+
+    def lemmas(self, lemma_ids: Sequence[int]) -> np.ndarray:
+        """Bitmap of tokens whose lemma is one of ``lemma_ids``."""
+        mask = np.zeros(self.n_tokens, dtype=bool)
+        mask[self.columns.occurrences(lemma_ids)] = True
+        return np.packbits(mask)
+
+    def key_ranges(self, ranges: Sequence[Tuple[int, int]]) -> np.ndarray:
+        """Bitmap of tokens whose verse key lies in any inclusive (start, end) range."""
+        mask = np.zeros(self.n_tokens, dtype=bool)
+        for start_key, end_key in ranges:
+            start, stop = self.columns.token_range(start_key, end_key)
+            mask[start:stop] = True
+        return np.packbits(mask)
+
+    def query(self, features: Dict[str, Sequence[str]],
+              lemma_ids: Optional[Sequence[int]] = None,
+              key_ranges: Optional[Sequence[Tuple[int, int]]] = None) -> np.ndarray:
+        """
+        Token positions matching every given filter, in corpus order.
+
+        Args:
+            features: Feature name -> accepted values (ORed); features are ANDed
+            lemma_ids: Optional accepted lemma string ids
+            key_ranges: Optional accepted inclusive verse key ranges
+
+        Raises:
+            ValueError: If a feature or value is unknown
+        """
+        bitmaps = [self.feature(field, values) for field, values in features.items() if values]
+        if lemma_ids is not None:
+            bitmaps.append(self.lemmas(lemma_ids))
+        if key_ranges is not None:
+            bitmaps.append(self.key_ranges(key_ranges))
+
+        if not bitmaps:
+            return np.arange(self.n_tokens)
+
+        result = bitmaps[0].copy()
+        for bitmap in bitmaps[1:]:
+            result &= bitmap
+        return np.flatnonzero(np.unpackbits(result, count=self.n_tokens))
@@ -0,0 +1,171 @@
+#!/usr/bin/env python3
+"""
+Phrase Index - Greek Phrase Search over the Corpus
+==================================================
+Positional n-gram index over the normalised word column (NORM) of the
+SBLGNT, for exact or accent-insensitive phrase queries such as
+``εν αρχη ην``.
+
+Every normalised word is mapped to a term id twice: once keeping accents
+(exact mode) and once folded (accent-insensitive mode: accents, breathings
+and iota subscripts removed). For each mode the index keeps, for n = 1, 2
+and 3, the n-gram key starting at every token position, sorted, with the
+positions in the same order. A query looks up the rarest n-gram of the
+phrase with two ``searchsorted`` calls and verifies the remaining words of
+each candidate with one vectorised comparison; no verse text is scanned.
+
+Phrases never match across a verse boundary. Movable nu is kept as written
+in NORM ('ἠγάπησε(ν)' indexes as 'ηγαπησεν').
+
+Usage:
+    from phrase_index import PhraseIndex
+
+    index = PhraseIndex(MorphologyColumns(corpus))
+    positions, length = index.search("εν αρχη ην")
+"""
+
+import re
+from typing import Dict, List, Optional, Tuple
+
+import numpy as np
+
+from greek_text import grave_to_acute, strip_accents
+from morphology import MorphologyColumns
+
+MAX_GRAM = 3
+
+# Punctuation, critical signs and brackets that can surround a word
+_PUNCTUATION = str.maketrans("", "", ".,;:()[]'\"\u00b7\u037e\u0387\u2019\u2e00\u2e01\u2e02\u2e03\u2e04\u2e05")
+_GREEK_WORD_RE = re.compile(r'[\u0370-\u03FF\u1F00-\u1FFF\u0300-\u036F\u2019]+')
+
+
+def normalize_word(word: str, accent_sensitive: bool = False) -> str:
+    """
+    Normalise a Greek word for phrase matching.
+
+    Lowercases, removes punctuation and writes final sigma as σ. Exact
+    (accent-sensitive) terms keep their accents, with grave written as acute
+    as in NORM; otherwise every combining mark is removed.
+    """
+    word = word.translate(_PUNCTUATION)
+    word = grave_to_acute(word) if accent_sensitive else strip_accents(word)
+    return word.lower().replace("ς", "σ")
+
+
+def split_phrase(phrase: str) -> List[str]:
+    """Split a query into Greek words (everything else is ignored)."""
+    return _GREEK_WORD_RE.findall(phrase)
+
+
+class _TermIndex:
+    """Term column and sorted n-gram postings for one matching mode."""
+
+    def __init__(self, columns: MorphologyColumns, accent_sensitive: bool):
+        corpus = columns.corpus
+        self.vocabulary: Dict[str, int] = {}
+        term_of_string = np.full(corpus.n_strings, -1, dtype=np.int64)
+        for norm_id in np.unique(columns.norm_ids).tolist():
+            term = normalize_word(corpus.string(norm_id), accent_sensitive)
+            term_of_string[norm_id] = self.vocabulary.setdefault(term, len(self.vocabulary))
+
+        self.terms = term_of_string[columns.norm_ids]
+        self.base = max(len(self.vocabulary), 1)
+
+        # n -> (sorted n-gram keys, token positions in the same order)
+        self.grams: Dict[int, Tuple[np.ndarray, np.ndarray]] = {}
+        n_tokens = len(self.terms)
+        for n in range(1, MAX_GRAM + 1):
+            count = max(n_tokens - n + 1, 0)
+            keys = np.zeros(count, dtype=np.int64)
+            for offset in range(n):
+                keys = keys * self.base + self.terms[offset:offset + count]
+            order = np.argsort(keys, kind="stable")
+            self.grams[n] = (keys[order], order)
+
+    def gram_key(self, term_ids: List[int]) -> int:
+        key = 0
+        for term_id in term_ids:
+            key = key * self.base + term_id
+        return key
+
+    def postings(self, term_ids: List[int]) -> np.ndarray:
+        """Sorted start positions of an n-gram (n <= MAX_GRAM)."""
+        keys, order = self.grams[len(term_ids)]
+        key = self.gram_key(term_ids)
+        return order[np.searchsorted(keys, key, side="left"):np.searchsorted(keys, key, side="right")]
+
+
+class PhraseIndex:
+    """
+    Exact and accent-insensitive phrase search over a corpus.
+
+    Built once from MorphologyColumns; queries cost a few binary searches
+    plus work proportional to the number of candidate positions.
+    """
+
+    def __init__(self, columns: MorphologyColumns):
+        self.columns = columns
+        self._modes = {
+            True: _TermIndex(columns, accent_sensitive=True),
+            False: _TermIndex(columns, accent_sensitive=False),
+        }
+
+    def find(self, words: List[str], accent_sensitive: bool = False) -> np.ndarray:
+        """
+        Token positions where ``words`` occur consecutively within one verse.
+
+        Args:
+            words: Query words (normalised here)
+            accent_sensitive: Match accents exactly instead of folding them
+
+        Returns:
+            Sorted start positions
+        """
+        index = self._modes[accent_sensitive]
+        term_ids: List[Optional[int]] = [
+            index.vocabulary.get(normalize_word(word, accent_sensitive)) for word in words
+        ]
+        if not term_ids or None in term_ids:
+            return np.empty(0, dtype=np.int64)
+
+        # Start from the rarest n-gram window of the phrase
+        n = min(len(term_ids), MAX_GRAM)
+        windows = [(index.postings(term_ids[i:i + n]), i) for i in range(len(term_ids) - n + 1)]
+        postings, window_start = min(windows, key=lambda window: len(window[0]))
+        starts = postings - window_start
+
+        length = len(term_ids)
+        n_tokens = len(index.terms)
+        starts = starts[(starts >= 0) & (starts + length <= n_tokens)]
+
+        if length > n:
+            offsets = np.arange(length)
+            matches = index.terms[starts[:, None] + offsets] == np.asarray(term_ids)
+            starts = starts[matches.all(axis=1)]
+
+        keys = self.columns.keys
+        return starts[keys[starts] == keys[starts + length - 1]]
+
+    def search(self, phrase: str, accent_sensitive: bool = False) -> Tuple[np.ndarray, int]:
+        """
+        Find a phrase given as free text.
+
+        Returns:
+            Tuple of (sorted start positions, phrase length in words)
+        """
+        words = split_phrase(phrase)
+        return self.find(words, accent_sensitive), len(words)
+
+    def highlight(self, position: int, length: int) -> Tuple[int, int]:
+        """
+        Character offsets [start, end) of a match within its verse text.
+
+        The verse text is the verse's surface forms joined with single
+        spaces, as stored in the verse store.
+        """
+        columns = self.columns
+        verse_start = int(np.searchsorted(columns.keys, columns.keys[position], side="left"))
+        forms = [columns.corpus.string(i) for i in columns.form_ids[verse_start:position + length].tolist()]
+        before = position - verse_start
+        start = sum(len(form) + 1 for form in forms[:before])
+        return start, start + len(" ".join(forms[before:]))
@@ -0,0 +1,612 @@
+#!/usr/bin/env python3
+"""
+Seeding - Parallel Document Pipeline for the ChromaDB Collection
+================================================================
+Builds the documents of the CLI's semantic-search collection (one per
+Thayer lexicon entry and one per verse) and inserts them into ChromaDB.
+
+The parsers are generators, and ``write_batches`` feeds any document
+stream to ``collection.add``/``upsert`` in fixed-size chunks. The lexicon
+XML is streamed one entry at a time by ``strongs_lexicon``.
+
+Sources are parsed in a ``ProcessPoolExecutor``, one task per book plus
+one for the lexicon. Parsed books flow through a bounded queue to a writer
+thread that cuts them into fixed-size ``collection.upsert`` batches, so
+parsing, embedding (done by Chroma inside ``upsert``) and inserting
+overlap. At most ``2 * workers`` tasks are in flight and ``queue_size``
+parsed tasks wait for the writer, so peak memory is bounded by a few books
+(the largest task), not by the size of the corpus.
+
+Seeding is incremental. Documents have stable IDs (the reference ID of a
+verse, the Strong's number of a lexicon entry) and are upserted. A
+manifest next to the database records a content hash of the source files
+behind each task (lexicon XML, a book's morphgnt or LXX files and its WEB
+JSON). Only tasks whose hash changed are parsed, embedded and written;
+documents of those sources that no longer exist are deleted. Books are
+read from the prebuilt corpus only while it matches those files (see
+``Corpus.changed_books``), so the hash always describes the documents.
+
+With an ``embedder`` (embedding_cache.CachedEmbedder), vectors are looked
+up in the on-disk embedding cache and passed to Chroma as ``embeddings=``;
+only texts never embedded before reach the embedding model.
+
+Usage:
+    from seeding import seed_tasks, sync_collection
+
+    tasks = seed_tasks("strongsgreek.xml", "corpus_data/sblgnt.corpus", "sblgnt/", CODE_TO_BOOK,
+                       web_path="web_bible_json/")
+    sync_collection(collection, tasks, "chroma_db_interlinear/seed_manifest.json",
+                    "corpus_data/sblgnt.corpus", "corpus_data/web_english.idx", "web_bible_json/")
+"""
+
+import hashlib
+import json
+import os
+import queue
+import threading
+from bisect import bisect_left
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from itertools import islice
+from typing import Dict, Iterable, Iterator, List, NamedTuple, Optional, Tuple
+
+from bible_references import CODE_TO_BOOK, FIRST_NT_BOOK
+from corpus import Corpus, sblgnt_book_files
+from english_index import EnglishIndex, web_book_files
+from septuagint import iter_lxx_books, lxx_source_files
+from strongs_lexicon import iter_strongs_entries
+from verse_store import BOOK_STRIDE, pack_key, unpack_key
+
+# Documents per collection.add/upsert call
+BATCH_SIZE = 1000
+
+# Parsed tasks waiting for the writer
+QUEUE_SIZE = 4
+
+# Bump when the documents built from the same sources change, to reseed everything
+DOCUMENT_VERSION = 2  # 2: no WEB English on Septuagint verses
+MANIFEST_VERSION = 1
+
+
+class SeedTask(NamedTuple):
+    """One unit of parsing: the lexicon or one book."""
+    key: str                  # manifest key: 'lexicon' or 'book:<code>'
+    kind: str                 # 'lexicon', 'corpus', 'morphgnt' or 'lxx'
+    args: tuple               # arguments of the parser for this kind
+    sources: Tuple[str, ...]  # files the documents are built from
+    where: dict               # Chroma filter selecting this task's documents
+
+
+def format_reference_id(book, chapter, verse):
+    """Formats a reference ID like '40-01-01' for Matthew 1:1"""
+    return f"{book:02d}-{chapter:02d}-{verse:02d}"
+
+
+# --- DOCUMENT PARSERS ---
+
+def parse_lexicon(file_path):
+    """
+    Parses the Thayer's Lexicon XML file, yielding one document per entry.
+    Entries are streamed by strongs_lexicon.iter_strongs_entries.
+    """
+    print(f"Parsing lexicon: {file_path}")
+    if not os.path.exists(file_path):
+        print(f"  [!] Lexicon file not found at {file_path}")
+        return
+
+    count = 0
+    for entry in iter_strongs_entries(file_path):
+        strongs_num = entry.key
+        full_def = f"G{strongs_num} {entry.lemma}: KJV: {entry.kjv_def}. Thayer: {entry.strongs_def}"
+
+        yield {
+            "id": f"G{strongs_num}",
+            "text": full_def,
+            "metadata": {
+                "source": "Thayer",
+                "strongs": f"G{strongs_num}",
+                "book": "Lexicon",
+                "type": "lexicon"
+            }
+        }
+        count += 1
+    print(f"  -> Parsed {count} lexicon entries.")
+
+def make_verse_document(book_code, book_name, chapter, verse, greek_text, english_lookup=None):
+    """Builds the ChromaDB document for one verse."""
+    # Get English text if available
+    english_text = ""
+    if english_lookup:
+        english_text = english_lookup.get_parallel(pack_key(book_code, chapter, verse)) or ""
+
+    reference_id = format_reference_id(book_code, chapter, verse)
+    return {
+        "id": reference_id,
+        "text": greek_text,
+        "metadata": {
+            "source": "SBLGNT" if book_code >= FIRST_NT_BOOK else "LXX (Swete)",
+            "book": book_name,
+            "chapter": chapter,
+            "verse": verse,
+            "reference": f"{book_name} {chapter}:{verse}",
+            "reference_id": reference_id,
+            "english_text": english_text,
+            "type": "verse"
+        }
+    }
+
+def parse_sblgnt_file(file_path, book_code, book_name, english_lookup=None):
+    """
+    Parses SBLGNT morphology files like '64-Jn-morphgnt.txt', yielding
+    one document per verse.
+    Format: BBCCVV POS MORPH WORD NORM LEMMA LEMMA_FULL
+    """
+    print(f"  Parsing {book_name}...")
+
+    if not os.path.exists(file_path):
+        print(f"    [!] File not found: {file_path}")
+        return
+
+    current_verse = None
+    verse_words = []
+
+    with open(file_path, 'r', encoding='utf-8') as f:
+        for line in f:
+            line = line.strip()
+            if not line:
+                continue
+
+            parts = line.split()
+            if len(parts) < 7:
+                continue
+
+            # Parse reference: BBCCVV
+            ref_id = parts[0]
+            try:
+                chapter = int(ref_id[2:4])
+                verse = int(ref_id[4:6])
+            except:
+                continue
+
+            # Word is at index 3 (with punctuation)
+            word = parts[3]
+
+            verse_ref = (chapter, verse)
+
+            # If we're starting a new verse, save the previous one
+            if current_verse != verse_ref and verse_words:
+                prev_chapter, prev_verse = current_verse
+                yield make_verse_document(
+                    book_code, book_name, prev_chapter, prev_verse, " ".join(verse_words), english_lookup
+                )
+                verse_words = []
+
+            current_verse = verse_ref
+            verse_words.append(word)
+
+    # Don't forget the last verse
+    if verse_words and current_verse:
+        chapter, verse = current_verse
+        yield make_verse_document(
+            book_code, book_name, chapter, verse, " ".join(verse_words), english_lookup
+        )
+
+def parse_lxx_book(lxx_path, book_code, book_name, english_lookup=None):
+    """
+    Parses one Septuagint book from the Swete TEI files, yielding one
+    document per verse. Only used when the corpus has not been built.
+    """
+    print(f"  Parsing {book_name}...")
+
+    for _, verses in iter_lxx_books(lxx_path, {book_code: book_name}):
+        for chapter, verse, words in verses:
+            yield make_verse_document(book_code, book_name, chapter, verse, " ".join(words), english_lookup)
+
+def parse_corpus_book(corpus, book_code, book_name, english_lookup=None):
+    """
+    Reads the verses of one book from the binary corpus built by
+    build_corpus.py, yielding one document per verse. Much faster than
+    re-splitting the morphgnt text files.
+    """
+    first = bisect_left(corpus.verse_keys, book_code * BOOK_STRIDE)
+    last = bisect_left(corpus.verse_keys, (book_code + 1) * BOOK_STRIDE)
+
+    for verse_index in range(first, last):
+        _, chapter, verse = unpack_key(corpus.verse_keys[verse_index])
+        yield make_verse_document(
+            book_code, book_name, chapter, verse, " ".join(corpus.verse_words(verse_index)), english_lookup
+        )
+
+def parse_sblgnt_corpus(corpus_path, english_lookup=None, book_codes=CODE_TO_BOOK):
+    """
+    Reads all verses (SBLGNT and, when built in, the LXX) from the binary
+    corpus built by build_corpus.py, in one process, yielding one document
+    per verse.
+    """
+    with Corpus(corpus_path) as corpus:
+        for book_code in corpus_books(corpus, book_codes):
+            yield from parse_corpus_book(corpus, book_code, book_codes[book_code], english_lookup)
+
+def corpus_books(corpus, book_codes):
+    """Codes of the books in ``book_codes`` that have verses in the corpus, in order."""
+    present = {key // BOOK_STRIDE for key in corpus.verse_keys}
+    return [code for code in sorted(present) if code in book_codes]
+
+
+# --- TASKS ---
+
+def _book_task(kind: str, args: tuple, book_code: int, book_name: str, sources: List[str]) -> SeedTask:
+    where = {"$and": [{"type": "verse"}, {"book": book_name}]}
+    return SeedTask(f"book:{book_code}", kind, args, tuple(sources), where)
+
+
+def seed_tasks(lexicon_path: str, corpus_path: str, gnt_path: str, book_codes: Dict[int, str],
+               lxx_path: Optional[str] = None, web_path: Optional[str] = None) -> List[SeedTask]:
+    """
+    Parse tasks for a full seed: the lexicon, then every book in order.
+
+    Books are read from the prebuilt corpus when it exists and matches the
+    morphgnt and LXX files, otherwise from those files. A book's sources are
+    its morphgnt (or LXX) files and its WEB JSON file; a corpus book whose
+    text files are missing falls back to the corpus file itself.
+    """
+    tasks = [SeedTask("lexicon", "lexicon", (lexicon_path,), (lexicon_path,), {"type": "lexicon"})]
+
+    gnt_files = sblgnt_book_files(gnt_path, book_codes)
+    lxx_files = {code: paths for code, paths in lxx_source_files(lxx_path).items()
+                 if code in book_codes} if lxx_path else {}
+    english_files = web_book_files(web_path) if web_path else {}
+
+    def sources(book_code: int, text_files: List[str]) -> List[str]:
+        english = [english_files[book_code]] if book_code in english_files else []
+        return text_files + english
+
+    corpus = open_current_corpus(corpus_path, gnt_path, book_codes, lxx_path)
+    if corpus is not None:
+        with corpus:
+            for code in corpus_books(corpus, book_codes):
+                text_files = [gnt_files[code]] if code in gnt_files else lxx_files.get(code, [corpus_path])
+                tasks.append(_book_task("corpus", (code, book_codes[code]), code, book_codes[code],
+                                        sources(code, text_files)))
+        return tasks
+
+    # Septuagint books (codes 1-54) come before the NT, as in the corpus
+    for code, text_files in sorted(lxx_files.items()):
+        tasks.append(_book_task("lxx", (lxx_path, code, book_codes[code]), code, book_codes[code],
+                                sources(code, text_files)))
+    for code, file_path in gnt_files.items():
+        tasks.append(_book_task("morphgnt", (file_path, code, book_codes[code]), code, book_codes[code],
+                                sources(code, [file_path])))
+    if not gnt_files:
+        print(f"  [!] SBLGNT directory not found at {gnt_path}")
+
+    return tasks
+
+
+def open_current_corpus(corpus_path: str, gnt_path: str, book_codes: Dict[int, str],
+                        lxx_path: Optional[str] = None) -> Optional[Corpus]:
+    """
+    Open the prebuilt corpus if it exists and was compiled from the current
+    morphgnt and LXX files, otherwise return None.
+
+    Unlike ``Corpus.load`` this never compiles in memory: pool workers map
+    the file themselves, so an out-of-date corpus is skipped in favour of
+    the source files.
+    """
+    if not os.path.exists(corpus_path):
+        return None
+    try:
+        corpus = Corpus(corpus_path)
+    except ValueError as e:
+        print(f"  [!] {e} - parsing the source files (run build_corpus.py to update it)")
+        return None
+
+    changed = corpus.changed_books(gnt_path, book_codes, lxx_path)
+    if changed:
+        print(f"  [!] {corpus_path} is out of date ({len(changed)} changed books) - "
+              f"parsing the source files (run build_corpus.py to update it)")
+        corpus.close()
+        return None
+    return corpus
+
+
+def task_digest(task: SeedTask) -> str:
+    """
+    SHA-256 of a task's source files (names and contents) and the document version.
+
+    The task kind is left out: a book read from a current corpus gives the
+    same documents as one parsed from its morphgnt or LXX files.
+    """
+    digest = hashlib.sha256(f"{DOCUMENT_VERSION}".encode())
+    for path in task.sources:
+        digest.update(os.path.basename(path).encode() + b"\0")
+        if os.path.exists(path):
+            with open(path, 'rb') as f:
+                for chunk in iter(lambda: f.read(1 << 20), b""):
+                    digest.update(chunk)
+        digest.update(b"\0")
+    return digest.hexdigest()
+
+
+# Per-process state of pool workers, opened once by _init_worker
+_worker_corpus: Optional[Corpus] = None
+_worker_english: Optional[EnglishIndex] = None
+
+
+def _init_worker(corpus_path: Optional[str], english_index_path: Optional[str], web_path: Optional[str]):
+    """Open the corpus and English index once per worker process (both are mmapped)."""
+    global _worker_corpus, _worker_english
+    if corpus_path and os.path.exists(corpus_path):
+        try:
+            _worker_corpus = Corpus(corpus_path)
+        except ValueError:
+            pass  # older format: seed_tasks made no corpus tasks
+    if (english_index_path and os.path.exists(english_index_path)) or (web_path and os.path.exists(web_path)):
+        _worker_english = EnglishIndex.load(english_index_path, web_path)
+
+
+def iter_task_documents(task: SeedTask, corpus: Optional[Corpus] = None,
+                        english_lookup: Optional[EnglishIndex] = None) -> Iterator[dict]:
+    """Documents of one seed task, as a generator."""
+    if task.kind == "lexicon":
+        return parse_lexicon(*task.args)
+    if task.kind == "corpus":
+        return parse_corpus_book(corpus, *task.args, english_lookup)
+    if task.kind == "morphgnt":
+        return parse_sblgnt_file(*task.args, english_lookup)
+    if task.kind == "lxx":
+        return parse_lxx_book(*task.args, english_lookup)
+    raise ValueError(f"Unknown seed task: {task.kind!r}")
+
+
+def run_task(task: SeedTask) -> List[dict]:
+    """
+    Parse one seed task into its documents (runs in a pool worker).
+
+    Results cross the process boundary in one piece, so a task's documents
+    are materialised here; a task is at most one book.
+    """
+    return list(iter_task_documents(task, _worker_corpus, _worker_english))
+
+
+# --- MANIFEST ---
+
+def load_manifest(path: str) -> Dict[str, dict]:
+    """Source digests of the last seed ({task key: {"digest", "where"}}), or {} if none."""
+    try:
+        with open(path, 'r', encoding='utf-8') as f:
+            manifest = json.load(f)
+    except (OSError, ValueError):
+        return {}
+    if manifest.get("version") != MANIFEST_VERSION:
+        return {}
+    return manifest.get("sources", {})
+
+
+def save_manifest(path: str, sources: Dict[str, dict]):
+    """Write the manifest atomically."""
+    manifest_dir = os.path.dirname(path)
+    if manifest_dir:
+        os.makedirs(manifest_dir, exist_ok=True)
+
+    tmp_path = path + ".tmp"
+    with open(tmp_path, 'w', encoding='utf-8') as f:
+        json.dump({"version": MANIFEST_VERSION, "sources": sources}, f, ensure_ascii=False, indent=1)
+    os.replace(tmp_path, path)
+
+
+# --- WRITER ---
+
+def batched(documents: Iterable[dict], size: int = BATCH_SIZE) -> Iterator[List[dict]]:
+    """Group a document stream into lists of at most ``size``."""
+    documents = iter(documents)
+    while True:
+        batch = list(islice(documents, size))
+        if not batch:
+            return
+        yield batch
+
+
+def write_batch(collection, batch: List[dict], upsert: bool = True, embedder=None):
+    """
+    Add or upsert one batch of documents under their IDs. With an
+    ``embedder`` the embeddings are precomputed (through its cache)
+    instead of by the collection's embedding function.
+    """
+    write = collection.upsert if upsert else collection.add
+    texts = [doc["text"] for doc in batch]
+    extra = {"embeddings": embedder.embed(texts)} if embedder is not None else {}
+    write(
+        documents=texts,
+        metadatas=[doc["metadata"] for doc in batch],
+        ids=[doc["id"] for doc in batch],
+        **extra
+    )
+
+
+def write_batches(collection, documents: Iterable[dict], batch_size: int = BATCH_SIZE,
+                  upsert: bool = True, embedder=None) -> int:
+    """
+    Feed a document stream to ChromaDB in fixed-size batches, consuming it
+    lazily: only one batch is held at a time.
+
+    Returns:
+        Number of documents written
+    """
+    written = 0
+    for batch in batched(documents, batch_size):
+        write_batch(collection, batch, upsert, embedder)
+        written += len(batch)
+    return written
+
+
+class BatchWriter(threading.Thread):
+    """
+    Writer thread between the parse pool and ChromaDB.
+
+    Takes (task, documents) from a bounded queue and upserts the documents
+    in batches of ``batch_size`` under their stable IDs. With ``prune``,
+    documents of the task's source that it no longer produces are deleted
+    as soon as the task arrives, so no IDs are kept across tasks. An error
+    stops writing; the queue is still drained so the producer never
+    blocks, and ``close`` re-raises it.
+    """
+
+    def __init__(self, collection, batch_size: int = BATCH_SIZE, queue_size: int = QUEUE_SIZE,
+                 prune: bool = False, embedder=None):
+        super().__init__(name="seed-writer", daemon=True)
+        self.collection = collection
+        self.batch_size = batch_size
+        self.prune = prune
+        self.embedder = embedder
+        self.queue: "queue.Queue" = queue.Queue(maxsize=queue_size)
+        self.written = 0
+        self.deleted = 0
+        self.batches = 0
+        self.error: Optional[BaseException] = None
+        self._pending: List[dict] = []
+
+    def put(self, documents: List[dict], task: Optional[SeedTask] = None):
+        """Queue parsed documents (of ``task``), blocking while the queue is full."""
+        self.queue.put((task, documents))
+
+    def close(self) -> int:
+        """
+        Flush the last partial batch and wait for the writer to finish.
+
+        Returns:
+            Number of documents written
+        """
+        self.queue.put(None)
+        self.join()
+        if self.error is not None:
+            raise self.error
+        return self.written
+
+    def run(self):
+        while True:
+            item = self.queue.get()
+            if item is None:
+                break
+            if self.error is not None:
+                continue
+            task, documents = item
+            try:
+                if self.prune and task is not None:
+                    self.deleted += _delete_stale(self.collection, task.where, (doc["id"] for doc in documents))
+                self._pending.extend(documents)
+                self._write(full_only=True)
+            except Exception as e:
+                self.error = e
+        if self.error is None:
+            try:
+                self._write(full_only=False)
+            except Exception as e:
+                self.error = e
+
+    def _write(self, full_only: bool):
+        while len(self._pending) >= self.batch_size or (self._pending and not full_only):
+            batch = self._pending[:self.batch_size]
+            del self._pending[:self.batch_size]
+            write_batch(self.collection, batch, embedder=self.embedder)
+            self.written += len(batch)
+            self.batches += 1
+            print(f"  Upserted batch {self.batches} ({self.written} documents)")
+
+
+# --- PIPELINE ---
+
+def seed_collection(collection, tasks: Iterable[SeedTask], corpus_path: Optional[str] = None,
+                    english_index_path: Optional[str] = None, web_path: Optional[str] = None,
+                    workers: Optional[int] = None, batch_size: int = BATCH_SIZE,
+                    queue_size: int = QUEUE_SIZE, prune: bool = False, embedder=None) -> int:
+    """
+    Parse ``tasks`` in a process pool and upsert their documents into ``collection``.
+
+    Args:
+        collection: ChromaDB collection
+        tasks: Parse tasks, see ``seed_tasks``
+        corpus_path: Prebuilt corpus read by "corpus" tasks
+        english_index_path: Prebuilt WEB English index (optional)
+        web_path: WEB JSON directory, used when the English index is not built
+        workers: Parse processes (default: CPU count)
+        batch_size: Documents per ``collection.upsert``
+        queue_size: Parsed tasks that may wait for the writer
+        prune: Delete documents of each task's source that it no longer produces
+        embedder: Optional CachedEmbedder supplying the embeddings
+
+    Returns:
+        Number of documents written
+    """
+    tasks = list(tasks)
+    if not tasks:
+        return 0
+    workers = max(1, min(workers or os.cpu_count() or 1, len(tasks)))
+
+    writer = BatchWriter(collection, batch_size, queue_size, prune, embedder)
+    writer.start()
+    try:
+        with ProcessPoolExecutor(
+            max_workers=workers, initializer=_init_worker,
+            initargs=(corpus_path, english_index_path, web_path)
+        ) as pool:
+            # Keep a couple of tasks per worker in flight, consumed in order
+            remaining = iter(tasks)
+            pending = deque(
+                (task, pool.submit(run_task, task)) for task in islice(remaining, 2 * workers)
+            )
+            while pending:
+                task, future = pending.popleft()
+                documents = future.result()
+                for next_task in islice(remaining, 1):
+                    pending.append((next_task, pool.submit(run_task, next_task)))
+                writer.put(documents, task)
+                del documents  # held by the writer now, not while waiting for the next task
+    finally:
+        written = writer.close()
+    return written
+
+
+def _delete_stale(collection, where: dict, keep: Iterable[str]) -> int:
+    """Delete the documents matching ``where`` whose IDs are not in ``keep``."""
+    keep = set(keep)
+    stale = [doc_id for doc_id in collection.get(where=where, include=[])["ids"] if doc_id not in keep]
+    for batch in batched(stale):
+        collection.delete(ids=batch)
+    return len(stale)
+
+
+def sync_collection(collection, tasks: Iterable[SeedTask], manifest_path: str,
+                    corpus_path: Optional[str] = None, english_index_path: Optional[str] = None,
+                    web_path: Optional[str] = None, workers: Optional[int] = None,
+                    batch_size: int = BATCH_SIZE, embedder=None) -> Tuple[int, int]:
+    """
+    Bring ``collection`` up to date with the sources of ``tasks``.
+
+    Tasks whose source digest matches the manifest are skipped. Changed
+    tasks are reparsed and upserted, their documents that no longer exist
+    are deleted, and so are the documents of tasks that disappeared. The
+    manifest is only updated once everything is written, so an interrupted
+    run redoes the unfinished tasks.
+
+    Returns:
+        Tuple of (tasks reseeded, documents upserted)
+    """
+    tasks = list(tasks)
+    previous = load_manifest(manifest_path) if collection.count() else {}
+    digests = {task.key: task_digest(task) for task in tasks}
+    changed = [task for task in tasks if previous.get(task.key, {}).get("digest") != digests[task.key]]
+    removed = [entry for key, entry in previous.items() if key not in digests]
+
+    if not changed and not removed:
+        return 0, 0
+
+    written = seed_collection(collection, changed, corpus_path, english_index_path, web_path,
+                              workers, batch_size, prune=True, embedder=embedder)
+    for entry in removed:
+        _delete_stale(collection, entry["where"], ())
+
+    save_manifest(manifest_path, {
+        task.key: {"digest": digests[task.key], "where": task.where} for task in tasks
+    })
+    return len(changed), written
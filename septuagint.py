@@ -0,0 +1,259 @@
+#!/usr/bin/env python3
+"""
+Septuagint - Streaming Reader for the Swete LXX (First1KGreek TEI)
+==================================================================
+Reads the raw First1KGreek TEI XML files of the LXX-Swete submodule
+(``LXX-Swete/src/First1KGreek-LXX-RAW/``) verse by verse, for compilation
+into the same corpus, verse store and search indexes as the SBLGNT (see
+corpus.py).
+
+The files are parsed incrementally with a SAX parser fed fixed-size chunks,
+so memory never holds a whole document tree: only the current verse and,
+for ordering, the verses of the current book are kept. The LXX is several
+times the size of the NT, and a full ``ElementTree`` of every book would
+be built and thrown away just to read its text.
+
+Chapters and verses come from CTS text parts
+(``<div type="textpart" subtype="chapter|verse" n="...">``) or, in files
+that mark them with milestones, from ``<milestone unit="chapter|verse"/>``.
+Notes, headings and the TEI header are skipped. Verse numbers with a letter
+suffix (Esther's additions, '1a') are folded into the numbered verse.
+Numbering is Swete's, so Psalms follow the LXX count (Psalm 22 MT is 21).
+The WEB's English is therefore not joined to these verses (see
+english_index.FIRST_PARALLEL_KEY).
+
+Files are mapped to book codes (see bible_references.BIBLE_BOOKS) by their
+TLG work number (Septuaginta is TLG 0527, works in Rahlfs order); 2 Esdras
+is split into Ezra (chapters 1-10) and Nehemiah (chapters 11-23). When
+two files give the same verse (books transmitted in two text forms), the
+first one read is kept.
+
+Usage:
+    from septuagint import iter_lxx_books
+
+    for book_code, verses in iter_lxx_books("LXX-Swete/src/First1KGreek-LXX-RAW/"):
+        for chapter, verse, words in verses:
+            print(book_code, chapter, verse, " ".join(words))
+"""
+
+import os
+import re
+import xml.sax
+from typing import Dict, Iterator, List, Optional, Tuple
+
+# Bytes handed to the SAX parser at a time
+CHUNK_SIZE = 64 * 1024
+
+# TLG 0527 work number -> book code
+LXX_WORKS = {
+    1: 1, 2: 2, 3: 3, 4: 4, 5: 5,            # Genesis - Deuteronomy
+    6: 6, 7: 7, 8: 8,                        # Joshua, Judges, Ruth
+    9: 9, 10: 10, 11: 11, 12: 12,            # 1-4 Kingdoms
+    13: 13, 14: 14,                          # 1-2 Chronicles (Paralipomenon)
+    15: 40, 16: 15,                          # 1 Esdras, 2 Esdras (Ezra-Nehemiah)
+    17: 17, 18: 42, 19: 41,                  # Esther, Judith, Tobit
+    20: 43, 21: 44, 22: 45, 23: 46,          # 1-4 Maccabees
+    24: 19, 25: 47, 26: 20, 27: 21, 28: 22,  # Psalms, Odes, Proverbs, Ecclesiastes, Song
+    29: 18, 30: 48, 31: 49, 32: 50,          # Job, Wisdom, Sirach, Psalms of Solomon
+    33: 28, 34: 30, 35: 33, 36: 29, 37: 31, 38: 32,
+    39: 34, 40: 35, 41: 36, 42: 37, 43: 38, 44: 39,  # the Twelve, in LXX order
+    45: 23, 46: 24, 47: 51, 48: 25, 49: 52,  # Isaiah, Jeremiah, Baruch, Lamentations, Ep. Jeremiah
+    50: 26, 51: 53, 52: 27, 53: 54,          # Ezekiel, Susanna, Daniel, Bel and the Dragon
+}
+
+# Book code -> (first chapter moved, code it moves to): 2 Esdras 11-23 is Nehemiah 1-13
+SPLIT_BOOKS = {15: (11, 16)}
+
+_TLG_FILE_RE = re.compile(r'tlg0527\.tlg(\d{3})\.')
+_LEADING_NUMBER_RE = re.compile(r'^\s*(\d+)')
+
+# Elements whose text is not part of the biblical text
+_SKIPPED_ELEMENTS = {"teiHeader", "note", "head", "bibl", "ref"}
+
+# Punctuation removed from a printed word to form its normalised form
+_PUNCTUATION = str.maketrans("", "", ".,;:!()[]\u00b7\u037e\u0387\u201c\u201d\u2014")
+
+VerseWords = Tuple[int, int, List[str]]
+
+
+def normalize_form(word: str) -> str:
+    """Printed word without punctuation (the NORM column of the corpus)."""
+    return word.translate(_PUNCTUATION)
+
+
+def _number(value: Optional[str]) -> Optional[int]:
+    """Leading integer of a chapter/verse number ('12', '1a'), or None."""
+    match = _LEADING_NUMBER_RE.match(value or "")
+    return int(match.group(1)) if match else None
+
+
+class _VerseHandler(xml.sax.ContentHandler):
+    """Collects (chapter, verse, words) as the parser reaches each verse end."""
+
+    def __init__(self):
+        super().__init__()
+        self.verses: List[VerseWords] = []
+        self.chapter: Optional[int] = None
+        self.verse: Optional[int] = None
+        self.text: List[str] = []
+        self.skip_depth = 0
+        # (subtype, previous number) per open textpart div, None for other divs
+        self.divs: List[Optional[Tuple[str, Optional[int]]]] = []
+
+    def flush(self):
+        """Emit the words collected for the current verse."""
+        words = "".join(self.text).split()
+        if words and self.chapter is not None and self.verse is not None:
+            self.verses.append((self.chapter, self.verse, words))
+        self.text = []
+
+    def startElement(self, name, attrs):
+        name = name.rsplit(":", 1)[-1]
+        if self.skip_depth or name in _SKIPPED_ELEMENTS:
+            self.skip_depth += 1
+            return
+
+        if name == "div":
+            subtype = (attrs.get("subtype") or "").lower()
+            if attrs.get("type") == "textpart" and subtype in ("chapter", "verse"):
+                self.flush()
+                number = _number(attrs.get("n"))
+                if subtype == "chapter":
+                    self.divs.append(("chapter", self.chapter))
+                    self.chapter, self.verse = number, None
+                else:
+                    self.divs.append(("verse", self.verse))
+                    self.verse = number
+            else:
+                self.divs.append(None)
+        elif name == "milestone":
+            unit = (attrs.get("unit") or "").lower()
+            if unit in ("chapter", "verse"):
+                self.flush()
+                number = _number(attrs.get("n"))
+                if unit == "chapter":
+                    self.chapter, self.verse = number, None
+                else:
+                    self.verse = number
+
+    def endElement(self, name):
+        name = name.rsplit(":", 1)[-1]
+        if self.skip_depth:
+            self.skip_depth -= 1
+            return
+
+        if name == "div" and self.divs:
+            textpart = self.divs.pop()
+            if textpart is not None:
+                self.flush()
+                subtype, previous = textpart
+                if subtype == "verse":
+                    self.verse = previous
+
+    def characters(self, content):
+        if not self.skip_depth and self.verse is not None:
+            self.text.append(content)
+
+
+def iter_tei_verses(file_path: str, chunk_size: int = CHUNK_SIZE) -> Iterator[VerseWords]:
+    """
+    Yield (chapter, verse, words) for every verse of a TEI file, in file order.
+
+    The file is fed to the parser ``chunk_size`` bytes at a time and verses
+    are yielded as soon as they end.
+    """
+    handler = _VerseHandler()
+    parser = xml.sax.make_parser()
+    parser.setFeature(xml.sax.handler.feature_external_ges, False)
+    parser.setContentHandler(handler)
+
+    with open(file_path, 'rb') as f:
+        while True:
+            chunk = f.read(chunk_size)
+            if not chunk:
+                break
+            parser.feed(chunk)
+            yield from handler.verses
+            handler.verses.clear()
+
+    parser.close()
+    handler.flush()
+    yield from handler.verses
+
+
+def lxx_book_files(lxx_path: str) -> List[Tuple[int, str]]:
+    """
+    (book code, path) of every recognised TEI file in ``lxx_path``,
+    sorted by book code (then file name).
+    """
+    if not os.path.isdir(lxx_path):
+        return []
+
+    files = []
+    for filename in sorted(os.listdir(lxx_path)):
+        match = _TLG_FILE_RE.search(filename)
+        if not filename.endswith(".xml") or not match:
+            continue
+        book_code = LXX_WORKS.get(int(match.group(1)))
+        if book_code is not None:
+            files.append((book_code, os.path.join(lxx_path, filename)))
+    return sorted(files)
+
+
+def lxx_source_files(lxx_path: str) -> Dict[int, List[str]]:
+    """Paths of the TEI files each book code is read from (split books share theirs)."""
+    sources: Dict[int, List[str]] = {}
+    for book_code, file_path in lxx_book_files(lxx_path):
+        sources.setdefault(book_code, []).append(file_path)
+        split = SPLIT_BOOKS.get(book_code)
+        if split:
+            sources.setdefault(split[1], []).append(file_path)
+    return sources
+
+
+def iter_lxx_books(lxx_path: str, book_codes: Optional[Dict[int, str]] = None) -> Iterator[Tuple[int, List[VerseWords]]]:
+    """
+    Yield (book code, verses) for every LXX book, in book code order.
+
+    Verses of a book are sorted by (chapter, verse), so the packed keys of
+    the whole stream increase; only one book (or split book) is held in
+    memory at a time.
+
+    Args:
+        lxx_path: Directory of the First1KGreek LXX TEI files
+        book_codes: Optional mapping of book code -> name; other books are skipped
+    """
+    files = lxx_book_files(lxx_path)
+    i = 0
+    while i < len(files):
+        book_code = files[i][0]
+        books: Dict[int, Dict[Tuple[int, int], List[str]]] = {book_code: {}}
+        split = SPLIT_BOOKS.get(book_code)
+        if split:
+            books[split[1]] = {}
+
+        # Every file of this book. Consecutive pieces of one verse ('1a',
+        # '1b') are joined; otherwise the first text of a verse wins.
+        while i < len(files) and files[i][0] == book_code:
+            last = None
+            for chapter, verse, words in iter_tei_verses(files[i][1]):
+                code = book_code
+                if split and chapter >= split[0]:
+                    code, chapter = split[1], chapter - split[0] + 1
+                position = (code, chapter, verse)
+                verses = books[code]
+                if position == last:
+                    verses[(chapter, verse)].extend(words)
+                elif (chapter, verse) not in verses:
+                    verses[(chapter, verse)] = words
+                    last = position
+                else:
+                    last = None
+            i += 1
+
+        for code in sorted(books):
+            if book_codes is not None and code not in book_codes:
+                continue
+            verses = books[code]
+            if verses:
+                yield code, [(chapter, verse, verses[(chapter, verse)]) for chapter, verse in sorted(verses)]
@@ -0,0 +1,125 @@
+#!/usr/bin/env python3
+"""
+Strong's Lexicon - Streaming Reader for the Strong's/Thayer XML
+================================================================
+Reads the OpenScriptures Strong's Greek dictionary (``strongsgreek.xml``,
+also downloaded as ``reference_texts/thayer_lexicon/thayer_strongs.xml``)
+one ``<entry>`` at a time with ``iterparse``. Each entry is turned into a
+``StrongsEntry`` and then cleared and detached from ``<entries>``, so
+memory stays at one entry whatever the size of the file. Larger lexica in
+the same format stream the same way.
+
+Usage:
+    from strongs_lexicon import iter_strongs_entries
+
+    for entry in iter_strongs_entries("strongsgreek.xml"):
+        print(entry.strongs, entry.lemma, entry.strongs_def)
+"""
+
+import xml.etree.ElementTree as ET
+from typing import Callable, Iterator, NamedTuple, Optional, Tuple, TypeVar
+
+T = TypeVar("T")
+
+# Prefix of cross-reference numbers by their ``language`` attribute
+LANGUAGE_PREFIXES = {"GREEK": "G", "HEBREW": "H"}
+
+
+class StrongsEntry(NamedTuple):
+    """One dictionary entry; text fields are stripped but keep the file's line breaks."""
+    key: str  # ``strongs`` attribute as written in the file, e.g. "03056"
+    number: int  # 3056
+    lemma: str  # λόγος (as written: accents may be the Greek Extended oxia forms)
+    translit: str  # lógos
+    beta: str  # LO/GOS
+    pronunciation: str  # log'-os
+    strongs_def: str
+    derivation: str
+    kjv_def: str
+    see: Tuple[str, ...]  # Strong's numbers of related entries, e.g. ("3004",)
+
+    @property
+    def strongs(self) -> str:
+        """Strong's ID without zero padding, e.g. "G3056"."""
+        return f"G{self.number}"
+
+
+def element_text(node: Optional[ET.Element]) -> str:
+    """All text inside ``node``, each piece stripped, joined by single spaces."""
+    if node is None:
+        return ""
+    return " ".join(filter(None, (text.strip() for text in node.itertext())))
+
+
+def inline_text(node: Optional[ET.Element]) -> str:
+    """
+    Text of ``node`` with inline references written out: ``<greek>`` as its
+    Greek word and ``<strongsref>`` as its Strong's ID (e.g. "G3004"), with
+    runs of whitespace collapsed.
+    """
+    if node is None:
+        return ""
+    parts = [node.text or ""]
+    for child in node:
+        if child.tag == "greek":
+            parts.append(child.get("unicode", ""))
+        elif child.tag == "strongsref":
+            parts.append(reference_id(child))
+        else:
+            parts.append(inline_text(child))
+        parts.append(child.tail or "")
+    return " ".join("".join(parts).split())
+
+
+def reference_id(node: ET.Element) -> str:
+    """Strong's ID of a ``<strongsref>`` or ``<see>`` element, e.g. "G3004" or "H5689"."""
+    prefix = LANGUAGE_PREFIXES.get(node.get("language", "GREEK"), "G")
+    number = node.get("strongs", "").lstrip("0")
+    return f"{prefix}{number}"
+
+
+def read_entry(entry: ET.Element) -> StrongsEntry:
+    """Convert a parsed ``<entry>`` element."""
+    key = entry.get("strongs", "")
+    greek = entry.find("greek")
+    greek = greek.attrib if greek is not None else {}
+    pronunciation = entry.find("pronunciation")
+    kjv_def = entry.find("kjv_def")
+
+    return StrongsEntry(
+        key=key,
+        number=int(key) if key.isdigit() else 0,
+        lemma=greek.get("unicode", ""),
+        translit=greek.get("translit", ""),
+        beta=greek.get("BETA", ""),
+        pronunciation=pronunciation.get("strongs", "") if pronunciation is not None else "",
+        strongs_def=element_text(entry.find("strongs_def")),
+        derivation=element_text(entry.find("strongs_derivation")),
+        kjv_def=(kjv_def.text or "").strip() if kjv_def is not None else "",
+        see=tuple(see.get("strongs", "") for see in entry.iter("see")),
+    )
+
+
+def iter_strongs_entries(file_path: str, convert: Callable[[ET.Element], T] = read_entry) -> Iterator[T]:
+    """
+    Stream the entries of a Strong's dictionary XML file, in file order.
+
+    Each complete ``<entry>`` element is passed to ``convert`` (by default
+    ``read_entry``); the element must not be kept, as it is emptied next.
+
+    Each ``<entry>`` element is released once converted: cleared, and
+    removed from its parent so ``<entries>`` does not keep thousands of
+    empty children.
+    """
+    parents = []
+    for event, element in ET.iterparse(file_path, events=("start", "end")):
+        if event == "start":
+            parents.append(element)
+            continue
+        parents.pop()
+        if element.tag != "entry":
+            continue
+        yield convert(element)
+        element.clear()
+        if parents:
+            parents[-1].remove(element)
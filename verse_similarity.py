@@ -0,0 +1,306 @@
+#!/usr/bin/env python3
+"""
+Verse Similarity - Precomputed "More Like This" Neighbour Table
+===============================================================
+Every verse is a TF-IDF vector over its lemmas (sublinear term frequency,
+``log(N / df)`` inverse document frequency, L2-normalised). Unlemmatised
+tokens (the LXX text) contribute their normalised form instead.
+The k most cosine-similar verses of each verse are computed once and stored
+as a compact table, so a "similar verses" lookup is an array read: no
+embedding model and no vector database are involved.
+
+The all-pairs similarity is computed in blocks of verses. The most frequent
+lemmas form a small dense matrix and their contribution is one BLAS matrix
+multiply per block; the long tail of rarer lemmas is added from the sparse
+lemma -> verses lists with ``bincount``. Lemmas occurring in a single verse
+cannot make two verses similar and only contribute to the vector norms.
+
+File layout (all integers little-endian):
+
+    header      MAGIC, version, k, n_verses (HEADER)
+    verse keys  n_verses uint32 packed verse keys, sorted (as in the corpus)
+    neighbours  n_verses x k int32 verse indexes, most similar first,
+                -1 where fewer than k verses share a lemma with it
+    scores      n_verses x k float16 cosine similarities
+
+Usage:
+    from verse_similarity import SimilarityTable, build_similarity_table
+
+    build_similarity_table(MorphologyColumns(corpus), "corpus_data/sblgnt.similar")
+
+    table = SimilarityTable.load("corpus_data/sblgnt.similar", MorphologyColumns(corpus))
+    for key, score in table.similar(pack_key(64, 3, 16), limit=5):
+        print(unpack_key(key), score)
+"""
+
+import mmap
+import os
+import struct
+from typing import List, Optional, Tuple, Union
+
+import numpy as np
+
+from morphology import MorphologyColumns
+
+# --- FILE FORMAT ---
+
+MAGIC = b"GNTS"
+VERSION = 1
+
+# magic, version, k, n_verses
+HEADER = struct.Struct("<4sHHI")
+
+DEFAULT_K = 20
+
+# Lemmas handled by the dense matrix multiply (the rest go through the sparse lists)
+DENSE_LEMMAS = 1024
+
+
+def tfidf_vectors(columns: MorphologyColumns) -> Tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+    """
+    L2-normalised lemma TF-IDF vectors of every verse, as a CSR matrix.
+
+    Returns:
+        Tuple of (sorted verse keys, row starts, lemma ids, weights) where
+        verse i has weights[starts[i]:starts[i + 1]] for those lemma ids
+    """
+    verse_keys, verse_of_token = np.unique(columns.keys, return_inverse=True)
+    n_verses = len(verse_keys)
+    n_lemmas = columns.corpus.n_strings
+
+    terms = np.where(columns.lemma_ids == columns.corpus.string_id(""), columns.norm_ids, columns.lemma_ids)
+    pairs, term_counts = np.unique(
+        verse_of_token.astype(np.int64) * n_lemmas + terms, return_counts=True
+    )
+    rows = pairs // n_lemmas
+    lemmas = pairs % n_lemmas
+
+    df = np.bincount(lemmas, minlength=n_lemmas)
+    idf = np.log(n_verses / np.maximum(df, 1))
+    weights = (1.0 + np.log(term_counts)) * idf[lemmas]
+
+    norms = np.sqrt(np.bincount(rows, weights * weights, minlength=n_verses))
+    weights = weights / np.where(norms > 0, norms, 1.0)[rows]
+
+    starts = np.searchsorted(rows, np.arange(n_verses + 1))
+    return verse_keys.astype(np.uint32), starts, lemmas, weights.astype(np.float32)
+
+
+def nearest_neighbours(columns: MorphologyColumns, k: int = DEFAULT_K,
+                       block_size: int = 512) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Top-k cosine neighbours of every verse (a verse is never its own neighbour).
+
+    Args:
+        columns: Morphology columns of the corpus
+        k: Neighbours kept per verse
+        block_size: Verses scored per block (memory is block_size x n_verses floats)
+
+    Returns:
+        Tuple of (verse keys, int32 neighbour indexes (n x k), float32 scores (n x k))
+    """
+    verse_keys, starts, lemmas, weights = tfidf_vectors(columns)
+    n_verses = len(verse_keys)
+    rows = np.repeat(np.arange(n_verses), np.diff(starts))
+
+    # Split the vocabulary: frequent lemmas dense, the rest sparse by lemma (CSC)
+    df = np.bincount(lemmas, minlength=columns.corpus.n_strings)
+    frequent = np.argsort(-df, kind="stable")[:min(DENSE_LEMMAS, int((df > 1).sum()))]
+    dense_column = np.full(len(df), -1, dtype=np.int64)
+    dense_column[frequent] = np.arange(len(frequent))
+
+    in_dense = dense_column[lemmas] >= 0
+    dense = np.zeros((n_verses, len(frequent)), dtype=np.float32)
+    dense[rows[in_dense], dense_column[lemmas[in_dense]]] = weights[in_dense]
+
+    in_sparse = ~in_dense & (df[lemmas] > 1)
+    sparse_rows, sparse_lemmas, sparse_weights = rows[in_sparse], lemmas[in_sparse], weights[in_sparse]
+    sparse_starts = np.searchsorted(sparse_rows, np.arange(n_verses + 1))
+    order = np.argsort(sparse_lemmas, kind="stable")
+    lemma_verses, lemma_weights = sparse_rows[order], sparse_weights[order]
+    lemma_starts = np.zeros(len(df) + 1, dtype=np.int64)
+    np.cumsum(np.bincount(sparse_lemmas, minlength=len(df)), out=lemma_starts[1:])
+
+    k_kept = min(k, max(n_verses - 1, 0))
+    neighbours = np.full((n_verses, k), -1, dtype=np.int32)
+    scores = np.zeros((n_verses, k), dtype=np.float32)
+
+    for block_start in range(0, n_verses, block_size):
+        block_stop = min(block_start + block_size, n_verses)
+        block_rows = block_stop - block_start
+
+        similarity = dense[block_start:block_stop] @ dense.T
+
+        # Sparse part: every (verse in block, rare lemma) meets the other verses of that lemma
+        first, last = sparse_starts[block_start], sparse_starts[block_stop]
+        query_lemmas = sparse_lemmas[first:last]
+        list_starts = lemma_starts[query_lemmas]
+        lengths = lemma_starts[query_lemmas + 1] - list_starts
+        gather = np.repeat(list_starts - np.cumsum(lengths) + lengths, lengths) + np.arange(lengths.sum())
+        cells = np.repeat(sparse_rows[first:last] - block_start, lengths) * n_verses + lemma_verses[gather]
+        products = np.repeat(sparse_weights[first:last], lengths) * lemma_weights[gather]
+        similarity += np.bincount(cells, products, minlength=block_rows * n_verses).reshape(
+            block_rows, n_verses
+        ).astype(np.float32)
+
+        similarity[np.arange(block_rows), np.arange(block_start, block_stop)] = -np.inf
+        if not k_kept:
+            continue
+
+        top = np.argpartition(-similarity, k_kept - 1, axis=1)[:, :k_kept]
+        top_scores = np.take_along_axis(similarity, top, axis=1)
+        ranked = np.argsort(-top_scores, axis=1, kind="stable")
+        top = np.take_along_axis(top, ranked, axis=1)
+        top_scores = np.take_along_axis(top_scores, ranked, axis=1)
+        neighbours[block_start:block_stop, :k_kept] = np.where(top_scores > 0, top, -1)
+        scores[block_start:block_stop, :k_kept] = np.maximum(top_scores, 0)
+
+    return verse_keys, neighbours, scores
+
+
+def build_similarity_bytes(columns: MorphologyColumns, k: int = DEFAULT_K) -> bytes:
+    """Compute the neighbour table and encode it in the file layout."""
+    verse_keys, neighbours, scores = nearest_neighbours(columns, k)
+    return b"".join([
+        HEADER.pack(MAGIC, VERSION, k, len(verse_keys)),
+        verse_keys.astype("<u4").tobytes(),
+        neighbours.astype("<i4").tobytes(),
+        scores.astype("<f2").tobytes(),
+    ])
+
+
+def build_similarity_table(columns: MorphologyColumns, output_path: str, k: int = DEFAULT_K) -> int:
+    """
+    Compute the neighbour table of a corpus and write it to ``output_path``.
+
+    The file is moved into place atomically, like the corpus file.
+
+    Returns:
+        Number of verses
+    """
+    data = build_similarity_bytes(columns, k)
+
+    output_dir = os.path.dirname(output_path)
+    if output_dir:
+        os.makedirs(output_dir, exist_ok=True)
+
+    tmp_path = output_path + ".tmp"
+    with open(tmp_path, 'wb') as f:
+        f.write(data)
+    os.replace(tmp_path, output_path)
+
+    return HEADER.unpack_from(data, 0)[3]
+
+
+class SimilarityTable:
+    """
+    Read-only neighbour table, memory-mapped from a file or wrapping the
+    bytes returned by ``build_similarity_bytes``.
+    """
+
+    def __init__(self, source: Union[str, bytes]):
+        """
+        Raises:
+            ValueError: If the data is not a similarity table of a supported version
+        """
+        if isinstance(source, str):
+            self.path = path = source
+            with open(path, 'rb') as f:
+                self._buffer = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        else:
+            self.path = path = "<memory>"
+            self._buffer = source
+
+        if len(self._buffer) < HEADER.size:
+            self.close()
+            raise ValueError(f"Not a similarity table: {path}")
+
+        magic, version, self.k, n_verses = HEADER.unpack_from(self._buffer, 0)
+        if magic != MAGIC or version != VERSION:
+            self.close()
+            raise ValueError(f"Unsupported similarity table (magic={magic!r}, version={version}): {path}")
+
+        if len(self._buffer) < HEADER.size + n_verses * (4 + self.k * 6):
+            self.close()
+            raise ValueError(f"Truncated similarity table: {path}")
+
+        offset = HEADER.size
+        self.keys = np.frombuffer(self._buffer, dtype="<u4", count=n_verses, offset=offset)
+        offset += n_verses * 4
+        self.neighbours = np.frombuffer(
+            self._buffer, dtype="<i4", count=n_verses * self.k, offset=offset
+        ).reshape(n_verses, self.k)
+        offset += n_verses * self.k * 4
+        self.scores = np.frombuffer(
+            self._buffer, dtype="<f2", count=n_verses * self.k, offset=offset
+        ).reshape(n_verses, self.k)
+
+    @classmethod
+    def from_columns(cls, columns: MorphologyColumns, k: int = DEFAULT_K) -> "SimilarityTable":
+        """Compute the table in memory."""
+        return cls(build_similarity_bytes(columns, k))
+
+    @classmethod
+    def load(cls, path: Optional[str], columns: MorphologyColumns, k: int = DEFAULT_K) -> "SimilarityTable":
+        """
+        Map the prebuilt table if it exists, holds ``k`` neighbours per verse
+        and covers exactly the verses of ``columns``, otherwise compute it in
+        memory.
+
+        A file from an older format version, or a truncated one, is ignored
+        the same way.
+        """
+        if path and os.path.exists(path):
+            try:
+                table = cls(path)
+            except ValueError as e:
+                print(f"[!] {e} - computing in memory (run build_corpus.py to update it)")
+            else:
+                if table.k != k:
+                    print(f"[!] {path} holds {table.k} neighbours per verse, not {k} - "
+                          f"computing in memory (run build_corpus.py to update it)")
+                elif np.array_equal(table.keys, np.unique(columns.keys)):
+                    return table
+                else:
+                    print(f"[!] {path} does not match the corpus - computing in memory "
+                          f"(run build_corpus.py to update it)")
+                table.close()
+        return cls.from_columns(columns, k)
+
+    def close(self):
+        """Release the memory mapping."""
+        for name in ("keys", "neighbours", "scores"):
+            self.__dict__.pop(name, None)
+        if isinstance(self._buffer, mmap.mmap):
+            self._buffer.close()
+
+    def __enter__(self) -> "SimilarityTable":
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    def __len__(self) -> int:
+        return len(self.keys)
+
+    def similar(self, key: int, limit: int = 10) -> Optional[List[Tuple[int, float]]]:
+        """
+        Most similar verses of a verse.
+
+        Args:
+            key: Packed verse key
+            limit: Maximum number of verses (at most k)
+
+        Returns:
+            List of (packed verse key, cosine similarity), most similar
+            first, or None if the verse is not in the table
+        """
+        row = int(np.searchsorted(self.keys, key))
+        if row == len(self.keys) or self.keys[row] != key:
+            return None
+        neighbours = self.neighbours[row, :limit]
+        found = neighbours >= 0
+        return [
+            (int(neighbour_key), float(score))
+            for neighbour_key, score in zip(self.keys[neighbours[found]], self.scores[row, :limit][found])
+        ]
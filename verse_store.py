@@ -0,0 +1,262 @@
+#!/usr/bin/env python3
+"""
+Verse Store - Compact In-Memory Verse Lookups
+==============================================
+Loads every SBLGNT verse once at startup so that exact verse lookups never
+have to go through a ChromaDB metadata scan. ChromaDB is then only needed
+for semantic search.
+
+Verses are keyed by a packed integer (book * 1000000 + chapter * 1000 + verse),
+so John 3:16 (book 64) becomes 64003016. Three digits per field are needed
+for the Septuagint: Psalms has 151 chapters and Psalm 118 (119 in the
+Hebrew numbering) has 176 verses. Keys are kept sorted in an ``array``,
+which gives O(1) exact lookups through a key -> row dict and bisect-based
+slicing for ranges. Greek text and reference strings are stored
+as two concatenated strings with offset arrays instead of one Python object
+per verse.
+
+Usage:
+    from verse_store import VerseStore, pack_key
+
+    store = VerseStore.from_sblgnt("sblgnt/", CODE_TO_BOOK)
+    # or, from the binary corpus built by build_corpus.py:
+    store = VerseStore.from_corpus(Corpus("corpus_data/sblgnt.corpus"), CODE_TO_BOOK)
+    verse = store.get(pack_key(64, 3, 16))
+    if verse:
+        greek_text, reference = verse
+"""
+
+import hashlib
+import os
+from array import array
+from bisect import bisect_left, bisect_right
+from typing import Dict, Iterable, Iterator, List, Optional, Tuple
+
+# --- PACKED VERSE KEYS ---
+
+# Room for chapter and verse numbers up to 999; the largest key
+# (87999999) still fits the uint32 key columns of the corpus files
+BOOK_STRIDE = 1000000
+CHAPTER_STRIDE = 1000
+
+
+def pack_key(book: int, chapter: int, verse: int) -> int:
+    """Pack (book, chapter, verse) into a single sortable integer."""
+    return book * BOOK_STRIDE + chapter * CHAPTER_STRIDE + verse
+
+
+def unpack_key(key: int) -> Tuple[int, int, int]:
+    """Unpack a packed verse key into (book, chapter, verse)."""
+    book, rest = divmod(key, BOOK_STRIDE)
+    chapter, verse = divmod(rest, CHAPTER_STRIDE)
+    return book, chapter, verse
+
+
+def key_from_reference_id(reference_id: str) -> int:
+    """Convert a reference ID like '64-03-16' into a packed key."""
+    book, chapter, verse = reference_id.split("-")
+    return pack_key(int(book), int(chapter), int(verse))
+
+
+# --- MORPHGNT READER ---
+
+def iter_morphgnt_verses(file_path: str) -> Iterator[Tuple[int, int, List[str]]]:
+    """
+    Yield (chapter, verse, words) for each verse in a morphgnt file.
+
+    Words keep their punctuation (column 4 of the morphgnt format), matching
+    the text stored in ChromaDB by ``seeding.parse_sblgnt_file``.
+    """
+    current_verse = None
+    verse_words: List[str] = []
+
+    with open(file_path, 'r', encoding='utf-8') as f:
+        for line in f:
+            parts = line.split()
+            if len(parts) < 7:
+                continue
+
+            ref_id = parts[0]
+            try:
+                verse_ref = (int(ref_id[2:4]), int(ref_id[4:6]))
+            except ValueError:
+                continue
+
+            if verse_ref != current_verse and verse_words:
+                yield current_verse[0], current_verse[1], verse_words
+                verse_words = []
+
+            current_verse = verse_ref
+            verse_words.append(parts[3])
+
+    if verse_words:
+        yield current_verse[0], current_verse[1], verse_words
+
+
+# --- VERSE STORE ---
+
+class VerseStore:
+    """
+    Sorted, array-backed store of verse text keyed by packed verse keys.
+
+    Row ``i`` holds ``keys[i]``, with its Greek text at
+    ``_text[text_offsets[i]:text_offsets[i + 1]]`` and its reference string
+    at ``_refs[ref_offsets[i]:ref_offsets[i + 1]]``.
+    """
+
+    def __init__(self, rows: Iterable[Tuple[int, str, str]] = ()):
+        """
+        Build the store from (key, reference, greek_text) rows.
+
+        Args:
+            rows: Iterable of rows in any order; duplicate keys keep the last row
+        """
+        by_key = {key: (reference, text) for key, reference, text in rows}
+
+        self.keys = array('i')
+        self.text_offsets = array('i', [0])
+        self.ref_offsets = array('i', [0])
+        text_parts = []
+        ref_parts = []
+        text_pos = 0
+        ref_pos = 0
+
+        for key in sorted(by_key):
+            reference, text = by_key[key]
+            self.keys.append(key)
+            text_parts.append(text)
+            ref_parts.append(reference)
+            text_pos += len(text)
+            ref_pos += len(reference)
+            self.text_offsets.append(text_pos)
+            self.ref_offsets.append(ref_pos)
+
+        self._text = "".join(text_parts)
+        self._refs = "".join(ref_parts)
+        self._rows: Dict[int, int] = {key: i for i, key in enumerate(self.keys)}
+
+    @classmethod
+    def from_sblgnt(cls, gnt_path: str, code_to_book: Dict[int, str]) -> "VerseStore":
+        """
+        Build the store from the SBLGNT ``*-morphgnt.txt`` files.
+
+        Args:
+            gnt_path: Directory containing the morphgnt files
+            code_to_book: Mapping of SBLGNT book code -> display name
+
+        Returns:
+            Populated VerseStore (empty if the directory is missing)
+        """
+        if not os.path.isdir(gnt_path):
+            return cls()
+
+        def rows():
+            for filename in sorted(os.listdir(gnt_path)):
+                if not filename.endswith("-morphgnt.txt"):
+                    continue
+                try:
+                    book_code = int(filename.split("-")[0])
+                except ValueError:
+                    continue
+                book_name = code_to_book.get(book_code)
+                if book_name is None:
+                    continue
+
+                file_path = os.path.join(gnt_path, filename)
+                for chapter, verse, words in iter_morphgnt_verses(file_path):
+                    yield (
+                        pack_key(book_code, chapter, verse),
+                        f"{book_name} {chapter}:{verse}",
+                        " ".join(words),
+                    )
+
+        return cls(rows())
+
+    @classmethod
+    def from_corpus(cls, corpus, code_to_book: Dict[int, str]) -> "VerseStore":
+        """
+        Build the store from a memory-mapped binary corpus (see corpus.py).
+
+        Args:
+            corpus: Open ``corpus.Corpus``
+            code_to_book: Mapping of SBLGNT book code -> display name
+        """
+        def rows():
+            for key, words in corpus.iter_verses():
+                book_code, chapter, verse = unpack_key(key)
+                book_name = code_to_book.get(book_code)
+                if book_name is not None:
+                    yield key, f"{book_name} {chapter}:{verse}", " ".join(words)
+
+        return cls(rows())
+
+    @classmethod
+    def from_collection(cls, collection) -> "VerseStore":
+        """
+        Build the store from an existing ChromaDB collection.
+
+        Fetches every verse document in a single ``get`` call, so this costs
+        one scan at startup instead of one scan per lookup.
+        """
+        results = collection.get(where={"type": "verse"}, include=["documents", "metadatas"])
+
+        return cls(
+            (key_from_reference_id(metadata["reference_id"]), metadata["reference"], text)
+            for text, metadata in zip(results["documents"], results["metadatas"])
+        )
+
+    def __len__(self) -> int:
+        return len(self.keys)
+
+    def fingerprint(self) -> str:
+        """Content hash of every key, reference and verse text in the store."""
+        digest = hashlib.sha1(self.keys.tobytes())
+        digest.update(self._refs.encode('utf-8'))
+        digest.update(self._text.encode('utf-8'))
+        return digest.hexdigest()
+
+    def __contains__(self, key: int) -> bool:
+        return key in self._rows
+
+    def row_of(self, key: int) -> Optional[int]:
+        """Get the row index for a packed key, or None if absent."""
+        return self._rows.get(key)
+
+    def text_at(self, row: int) -> str:
+        """Greek text of the verse stored at ``row``."""
+        return self._text[self.text_offsets[row]:self.text_offsets[row + 1]]
+
+    def reference_at(self, row: int) -> str:
+        """Reference string (e.g. 'John 3:16') of the verse stored at ``row``."""
+        return self._refs[self.ref_offsets[row]:self.ref_offsets[row + 1]]
+
+    def get(self, key: int) -> Optional[Tuple[str, str]]:
+        """
+        Look up a verse by packed key.
+
+        Returns:
+            Tuple of (greek_text, reference) or None if not found
+        """
+        row = self._rows.get(key)
+        if row is None:
+            return None
+        return self.text_at(row), self.reference_at(row)
+
+    def book_codes(self) -> List[int]:
+        """Codes of the books with at least one verse in the store, in order."""
+        codes = []
+        row = 0
+        while row < len(self.keys):
+            book = self.keys[row] // BOOK_STRIDE
+            codes.append(book)
+            row = bisect_left(self.keys, (book + 1) * BOOK_STRIDE, row)
+        return codes
+
+    def span(self, start_key: int, end_key: int) -> range:
+        """
+        Get the rows whose keys fall within [start_key, end_key].
+
+        Because keys are sorted, any verse range (including one that crosses
+        chapters) is a contiguous slice found with two bisects.
+        """
+        return range(bisect_left(self.keys, start_key), bisect_right(self.keys, end_key))